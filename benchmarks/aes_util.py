@@ -0,0 +1,85 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import os
+
+import common
+
+import colony
+
+
+def bench_stream(size=16777216):
+    """
+    Throughput benchmark of the streaming (authenticated) mode of
+    the aes cipher, both for file-like objects and for iterables
+    providing the complete contents as a single chunk.
+
+    :type size: int
+    :param size: The number of bytes to be encrypted and decrypted.
+    """
+
+    cipher = colony.AesCipher(key=os.urandom(32))
+    data = os.urandom(size)
+    sink = colony.legacy.BytesIO()
+    cipher.encrypt_stream(colony.legacy.BytesIO(data), sink)
+    encrypted = sink.getvalue()
+
+    def encrypt_file():
+        cipher.encrypt_stream(colony.legacy.BytesIO(data), lambda data: None)
+
+    def encrypt_chunk():
+        cipher.encrypt_stream([data], lambda data: None)
+
+    def decrypt_file():
+        cipher.decrypt_stream(colony.legacy.BytesIO(encrypted), lambda data: None)
+
+    def decrypt_chunk():
+        cipher.decrypt_stream([encrypted], lambda data: None)
+
+    for name, function in (
+        ("encrypt_stream (file)", encrypt_file),
+        ("encrypt_stream (single chunk)", encrypt_chunk),
+        ("decrypt_stream (file)", decrypt_file),
+        ("decrypt_stream (single chunk)", decrypt_chunk),
+    ):
+        elapsed = common.measure(function)
+        common.report(name, elapsed, size=size)
+
+
+def main():
+    if not colony.libs.aes_util.Crypto:
+        print("PyCrypto unavailable, skipping")
+        return
+    bench_stream()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import random
+
+import common
+
+import colony
+
+
+def bench_many(count=10000):
+    """
+    Throughput benchmark of the batch barcode generation functions
+    compared against the (looped) single value functions.
+
+    :type count: int
+    :param count: The number of values to be encoded.
+    """
+
+    digits = [
+        "".join(random.choice("0123456789") for _index in range(20))
+        for _index in range(count)
+    ]
+    characters = [
+        "".join(random.choice("ABCXYZ 0123456789") for _index in range(20))
+        for _index in range(count)
+    ]
+
+    baseline = common.measure(lambda: [colony.encode_2_of_5(value) for value in digits])
+    common.report("encode_2_of_5 (loop)", baseline, count=count)
+    elapsed = common.measure(lambda: colony.encode_2_of_5_many(digits))
+    common.report("encode_2_of_5_many", elapsed, count=count, baseline=baseline)
+
+    for code_set in ("A", "B", "C"):
+        values = characters if code_set in ("A", "B") else digits
+        baseline = common.measure(
+            lambda: [colony.encode_code_128(value, code_set) for value in values]
+        )
+        common.report("encode_code_128 %s (loop)" % code_set, baseline, count=count)
+        elapsed = common.measure(lambda: colony.encode_code_128_many(values, code_set))
+        common.report(
+            "encode_code_128_many %s" % code_set,
+            elapsed,
+            count=count,
+            baseline=baseline,
+        )
+
+    baseline = common.measure(
+        lambda: [colony.encode_code_39(value) for value in characters]
+    )
+    common.report("encode_code_39 (loop)", baseline, count=count)
+    elapsed = common.measure(lambda: colony.encode_code_39_many(characters))
+    common.report("encode_code_39_many", elapsed, count=count, baseline=baseline)
+
+
+def main():
+    bench_many()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import os
+import sys
+import time
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+""" The path to the source directory of the repository, added
+to the system path so that the benchmarks run against the local
+(development) version of the colony package """
+
+REPEAT = 3
+""" The default number of times each benchmark is run, the
+best (minimum) of the measured times is the one reported """
+
+if not SOURCE_PATH in sys.path:
+    sys.path.insert(0, SOURCE_PATH)
+
+
+def measure(function, setup=None, repeat=REPEAT):
+    """
+    Measures the (wall clock) time taken by the provided function
+    returning the best of the multiple runs, the (optional) setup
+    function runs before each run and its result is passed to the
+    function, its time is not measured.
+
+    :type function: Function
+    :param function: The function to be measured.
+    :type setup: Function
+    :param setup: The (optional) function that prepares the value
+    passed to the function, called before each of the runs.
+    :type repeat: int
+    :param repeat: The number of times the function is run.
+    :rtype: float
+    :return: The best (minimum) time in seconds of the runs.
+    """
+
+    best = None
+    for _index in range(repeat):
+        value = setup() if setup else None
+        initial = time.time()
+        if setup:
+            function(value)
+        else:
+            function()
+        elapsed = time.time() - initial
+        best = elapsed if best == None else min(best, elapsed)
+    return best
+
+
+def report(name, elapsed, count=None, size=None, baseline=None):
+    """
+    Prints a line with the result of a benchmark, including the
+    time per operation, the throughput and the speedup against a
+    baseline time (eg: of the previous implementation) when they
+    are provided.
+
+    :type name: String
+    :param name: The name of the benchmark being reported.
+    :type elapsed: float
+    :param elapsed: The time in seconds taken by the benchmark.
+    :type count: int
+    :param count: The (optional) number of operations performed.
+    :type size: int
+    :param size: The (optional) number of bytes processed.
+    :type baseline: float
+    :param baseline: The (optional) time in seconds of the baseline.
+    """
+
+    line = "%-44s %10.3f ms" % (name, elapsed * 1000.0)
+    if count:
+        line += " %10.3f us/op" % (elapsed * 1000000.0 / count)
+    if size:
+        megabytes = size / (1024.0 * 1024.0)
+        rate = megabytes / elapsed if elapsed > 0.0 else 0.0
+        line += " %10.2f MB/s" % rate
+    if baseline:
+        speedup = baseline / elapsed if elapsed > 0.0 else 0.0
+        line += " %8.1fx" % speedup
+    print(line)
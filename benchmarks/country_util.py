@@ -0,0 +1,88 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import common
+
+import colony
+
+
+def bench_get_many(count=100000):
+    """
+    Benchmark of the batch get country function in the fuzzy mode
+    compared against the (looped) single value function, both for
+    repeated (known) values and for unique (unknown) values.
+
+    :type count: int
+    :param count: The number of values to be resolved.
+    """
+
+    repeated = ["Portugal", "pt", "Spain ", "FRANCE", "germany!"] * (count // 5)
+    unique = ["country-%d" % index for index in range(count)]
+
+    for name, values in (("repeated", repeated), ("unique", unique)):
+        baseline = common.measure(
+            lambda: [colony.country_get(value, fuzzy=True) for value in values]
+        )
+        common.report("country_get %s (fuzzy, loop)" % name, baseline, count=count)
+        elapsed = common.measure(lambda: colony.country_get_many(values, fuzzy=True))
+        common.report(
+            "country_get_many %s (fuzzy)" % name,
+            elapsed,
+            count=count,
+            baseline=baseline,
+        )
+
+
+def bench_complete(count=10000):
+    """
+    Benchmark of the prefix completion of country names.
+
+    :type count: int
+    :param count: The number of completions performed.
+    """
+
+    prefixes = ["p", "por", "united", "bo", "atlantis"]
+
+    def complete():
+        for index in range(count):
+            colony.country_complete(prefixes[index % len(prefixes)])
+
+    elapsed = common.measure(complete)
+    common.report("country_complete", elapsed, count=count)
+
+
+def main():
+    bench_get_many()
+    bench_complete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import os
+import tempfile
+
+import common
+
+import colony
+
+
+def is_removed_linear(context, file_path):
+    # previous implementation of the removal check, that scans
+    # the complete list of path tuples of the context (linear)
+    for path_tuple in context.path_tuples_list:
+        if not path_tuple[0] == colony.libs.file_util.REMOVE_OPERATION:
+            continue
+        _operation, _file_path, _handle_exception, recursive = path_tuple
+        if not recursive and not file_path == _file_path:
+            continue
+        if not colony.is_parent_path(file_path, _file_path):
+            continue
+        return True
+    return False
+
+
+def bench_transaction(count):
+    """
+    Benchmark of the existence checks of a file transaction context
+    with the provided number of pending removals, comparing the path
+    trie with the previous linear scan of the path tuples.
+
+    :type count: int
+    :param count: The number of pending removals (and checks).
+    """
+
+    base_path = tempfile.mkdtemp()
+    context = colony.FileTransactionContext()
+    context.open()
+    try:
+        paths = [
+            os.path.join(base_path, "directory-%d" % (index % 100), "file-%d" % index)
+            for index in range(count)
+        ]
+        for path in paths:
+            context.remove_file(path, handle_exception=True)
+
+        def check_linear():
+            for path in paths:
+                is_removed_linear(context, path)
+
+        def check_trie():
+            for path in paths:
+                context._is_removed_file_path(path)
+
+        baseline = common.measure(check_linear, repeat=1)
+        common.report("removal check linear (%d)" % count, baseline, count=count)
+        elapsed = common.measure(check_trie)
+        common.report(
+            "removal check trie (%d)" % count, elapsed, count=count, baseline=baseline
+        )
+    finally:
+        context.rollback()
+        colony.remove_directory(base_path)
+
+
+def main():
+    for count in (1000, 5000):
+        bench_transaction(count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import os
+import re
+import sys
+import subprocess
+
+import common
+
+TOP = 10
+""" The default number of modules listed in each of the top
+(self and cumulative) import time rankings """
+
+IMPORT_TIME_REGEX = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+""" The regular expression that matches each of the lines
+printed (to stderr) by python when run with `-X importtime`,
+capturing the self and cumulative times (in microseconds),
+the indentation (nesting) and the name of the module """
+
+
+def import_times(module="colony"):
+    """
+    Runs the import of the provided module in a fresh interpreter
+    (`python -X importtime`) and parses the import time lines that
+    it prints, against the local (development) sources.
+
+    :type module: String
+    :param module: The name of the module to be imported.
+    :rtype: Dictionary
+    :return: The map associating the name of each imported module
+    with the tuple containing its self and cumulative times (in seconds).
+    """
+
+    env = dict(os.environ)
+    path = env.get("PYTHONPATH", None)
+    env["PYTHONPATH"] = (
+        common.SOURCE_PATH + os.pathsep + path if path else common.SOURCE_PATH
+    )
+
+    process = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-c", "import %s" % module],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    _stdout, stderr = process.communicate()
+    if process.returncode:
+        raise RuntimeError("failed to import '%s': %s" % (module, stderr))
+
+    times = {}
+    for line in stderr.decode("utf-8", "replace").splitlines():
+        match = IMPORT_TIME_REGEX.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, _indent, name = match.groups()
+        times[name] = (int(self_us) / 1000000.0, int(cumulative_us) / 1000000.0)
+    return times
+
+
+def bench_import(module="colony", top=TOP, repeat=common.REPEAT):
+    """
+    Benchmark of the (cold) import time of the provided module, the
+    best of the runs is reported (cumulative time of the module)
+    followed by the top modules by self and by cumulative time.
+
+    :type module: String
+    :param module: The name of the module to be imported.
+    :type top: int
+    :param top: The number of modules listed in each ranking.
+    :type repeat: int
+    :param repeat: The number of (fresh interpreter) runs.
+    """
+
+    best = None
+    for _index in range(repeat):
+        times = import_times(module=module)
+        if best == None or times[module][1] < best[module][1]:
+            best = times
+
+    common.report("import %s (cumulative)" % module, best[module][1])
+
+    ranking = sorted(best.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (self_time, _cumulative) in ranking[:top]:
+        common.report("  self %s" % name, self_time)
+
+    ranking = sorted(best.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (_self, cumulative) in ranking[:top]:
+        common.report("  cumulative %s" % name, cumulative)
+
+
+def main():
+    # the import time option is only available from python 3.7
+    # onwards, older interpreters are not able to run the benchmark
+    if sys.version_info < (3, 7):
+        print("import time benchmark requires python 3.7 or newer")
+        return
+
+    top = int(sys.argv[1]) if len(sys.argv) > 1 else TOP
+    bench_import(top=top)
+
+
+if __name__ == "__main__":
+    main()
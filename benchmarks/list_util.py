@@ -0,0 +1,115 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import sys
+
+import common
+
+import colony
+
+QUADRATIC_LIMIT = 20000
+""" The maximum number of elements for which the previous
+(quadratic) implementations are run, above this value they
+would take minutes and are skipped (unless --full is used) """
+
+
+def list_intersect_quadratic(first_list, second_list):
+    return [value for value in first_list if value in second_list]
+
+
+def list_exclude_quadratic(base_list, exclusion_list):
+    result_list = list(base_list)
+    for exclusion_item in exclusion_list:
+        result_list.remove(exclusion_item)
+    return result_list
+
+
+def list_no_duplicates_quadratic(list):
+    result_list = []
+    for value in list:
+        if value in result_list:
+            continue
+        result_list.append(value)
+    return result_list
+
+
+def bench_list(count, limit=QUADRATIC_LIMIT):
+    """
+    Benchmark of the (hash based) list operations against the
+    previous (quadratic) implementations, for lists with the
+    provided number of elements (half of them duplicates).
+
+    :type count: int
+    :param count: The number of elements of the lists.
+    :type limit: int
+    :param limit: The maximum number of elements for which the
+    quadratic implementations are run (none for no limit).
+    """
+
+    values = [("copy", "path-%d" % (index % (count // 2))) for index in range(count)]
+    others = values[::2]
+
+    for name, function, quadratic, arguments in (
+        (
+            "list_no_duplicates",
+            colony.list_no_duplicates,
+            list_no_duplicates_quadratic,
+            (values,),
+        ),
+        (
+            "list_intersect",
+            colony.list_intersect,
+            list_intersect_quadratic,
+            (values, others),
+        ),
+        (
+            "list_exclude",
+            colony.list_exclude,
+            list_exclude_quadratic,
+            (values, others),
+        ),
+    ):
+        baseline = None
+        if limit == None or count <= limit:
+            baseline = common.measure(lambda: quadratic(*arguments), repeat=1)
+            common.report("%s quadratic (%d)" % (name, count), baseline)
+        elapsed = common.measure(lambda: function(*arguments))
+        common.report("%s (%d)" % (name, count), elapsed, baseline=baseline)
+
+
+def main():
+    limit = None if "--full" in sys.argv else QUADRATIC_LIMIT
+    for count in (1000, 10000, 20000, 100000):
+        bench_list(count, limit=limit)
+
+
+if __name__ == "__main__":
+    main()
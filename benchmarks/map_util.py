@@ -0,0 +1,102 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import copy
+
+import common
+
+import colony
+
+
+def bench_extend(count=1000):
+    """
+    Benchmark of the per request override of a large map, using
+    both the copy and the persistent (structural sharing) modes.
+
+    :type count: int
+    :param count: The number of overrides (requests) performed.
+    """
+
+    base_map = dict(
+        (
+            "section-%d" % index,
+            dict(("key-%d" % value, value) for value in range(100)),
+        )
+        for index in range(1000)
+    )
+    extension_map = {"section-10": {"key-10": -1}}
+
+    def extend(persistent):
+        for _index in range(count):
+            colony.map_extend(
+                base_map, extension_map, recursive=True, persistent=persistent
+            )
+
+    baseline = common.measure(lambda: extend(False))
+    common.report("map_extend (copy)", baseline, count=count)
+    elapsed = common.measure(lambda: extend(True))
+    common.report("map_extend (persistent)", elapsed, count=count, baseline=baseline)
+
+
+def bench_duplicate(count=10):
+    """
+    Benchmark of the duplication of a large (nested) map compared
+    against the standard library deep copy.
+
+    :type count: int
+    :param count: The number of duplications performed.
+    """
+
+    item = dict(
+        (
+            "section-%d" % index,
+            dict(("key-%d" % value, [value, (value, "x")]) for value in range(100)),
+        )
+        for index in range(100)
+    )
+
+    def duplicate(function):
+        for _index in range(count):
+            function(item)
+
+    baseline = common.measure(lambda: duplicate(copy.deepcopy))
+    common.report("copy.deepcopy", baseline, count=count)
+    elapsed = common.measure(lambda: duplicate(colony.map_duplicate))
+    common.report("map_duplicate", elapsed, count=count, baseline=baseline)
+
+
+def main():
+    bench_extend()
+    bench_duplicate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import common
+
+import colony
+
+
+def bench_flatten(count=10000):
+    """
+    Benchmark of the flattening of a large number of instances,
+    with the flattening map compiled on every call and with a
+    (re-used) compiled plan, in both the list and generator modes.
+
+    :type count: int
+    :param count: The number of (top level) instances to flatten.
+    """
+
+    instances = [
+        dict(
+            name="instance-%d" % index,
+            owner=dict(name="owner-%d" % index),
+            lines=[dict(sku="sku-%d" % value) for value in range(10)],
+        )
+        for index in range(count)
+    ]
+    flattening_map = dict(
+        name="label", owner=dict(name="owner_name"), lines=dict(sku="sku")
+    )
+    plan = colony.object_flatten_compile(flattening_map)
+    rows = count * 10
+
+    baseline = common.measure(lambda: colony.object_flatten(instances, flattening_map))
+    common.report("object_flatten (map)", baseline, count=rows)
+    elapsed = common.measure(lambda: colony.object_flatten(instances, plan))
+    common.report("object_flatten (plan)", elapsed, count=rows, baseline=baseline)
+    elapsed = common.measure(
+        lambda: sum(
+            1 for _row in colony.object_flatten(instances, plan, generator=True)
+        )
+    )
+    common.report("object_flatten (plan, generator)", elapsed, count=rows)
+
+
+def main():
+    bench_flatten()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import os
+import shutil
+import tempfile
+
+import common
+
+import colony
+
+
+def bench_copy_directory(directories=20, files=100, size=1024):
+    """
+    Benchmark of the copy of a directory tree with a large number of
+    (small) files, comparing the standard library copy with the full
+    (sequential and threaded) and the incremental modes.
+
+    :type directories: int
+    :param directories: The number of directories of the tree.
+    :type files: int
+    :param files: The number of files in each of the directories.
+    :type size: int
+    :param size: The size in bytes of each of the files.
+    """
+
+    source_path = tempfile.mkdtemp()
+    base_path = tempfile.mkdtemp()
+    count = directories * files
+
+    try:
+        for index in range(directories):
+            directory_path = os.path.join(source_path, "directory-%d" % index)
+            os.makedirs(directory_path)
+            for _index in range(files):
+                file_path = os.path.join(directory_path, "file-%d.txt" % _index)
+                with open(file_path, "wb") as file:
+                    file.write(b"x" * size)
+
+        def target():
+            target_path = os.path.join(base_path, "target")
+            if os.path.exists(target_path):
+                colony.remove_directory(target_path)
+            return target_path
+
+        baseline = common.measure(
+            lambda target_path: shutil.copytree(source_path, target_path),
+            setup=target,
+        )
+        common.report("shutil.copytree", baseline, count=count)
+
+        for workers in (1, colony.libs.path_util.COPY_WORKERS):
+            elapsed = common.measure(
+                lambda target_path: colony.copy_directory(
+                    source_path, target_path, workers=workers
+                ),
+                setup=target,
+            )
+            common.report(
+                "copy_directory (%d workers)" % workers,
+                elapsed,
+                count=count,
+                baseline=baseline,
+            )
+
+        target_path = target()
+        colony.copy_directory(source_path, target_path)
+        elapsed = common.measure(
+            lambda: colony.copy_directory(source_path, target_path, incremental=True)
+        )
+        common.report(
+            "copy_directory (incremental, unchanged)",
+            elapsed,
+            count=count,
+            baseline=baseline,
+        )
+    finally:
+        colony.remove_directory(source_path)
+        colony.remove_directory(base_path)
+
+
+def main():
+    bench_copy_directory()
+
+
+if __name__ == "__main__":
+    main()
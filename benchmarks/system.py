@@ -0,0 +1,151 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import common
+
+import colony
+
+
+def bench_inject_allowed(count):
+    """
+    Boot benchmark of the injection of the provided number of
+    allowed (controller) plugins into a single host plugin, the
+    injection is run twice (as in a reload) to cover the checks.
+
+    :type count: int
+    :param count: The number of allowed plugins to be injected.
+    """
+
+    class HostPlugin(colony.Plugin):
+        id = "pt.hive.benchmark.host"
+        name = "Host"
+        version = "1.0.0"
+        short_name = "host"
+        capabilities_allowed = ["controller"]
+
+    class ControllerPlugin(colony.Plugin):
+        name = "Controller"
+        version = "1.0.0"
+        capabilities = ["controller"]
+
+    def setup():
+        plugin_manager = colony.PluginManager()
+        host = HostPlugin(plugin_manager)
+        host.load_plugin()
+        controllers = []
+        for index in range(count):
+            controller = ControllerPlugin(plugin_manager)
+            controller.id = "pt.hive.benchmark.controller_%d" % index
+            controller.short_name = "controller_%d" % index
+            controllers.append(controller)
+        return plugin_manager, host, controllers
+
+    def run(value):
+        plugin_manager, host, controllers = value
+        for controller in controllers:
+            plugin_manager._inject_allowed(host, controller, "controller")
+        for controller in controllers:
+            plugin_manager._inject_allowed(host, controller, "controller")
+
+    elapsed = common.measure(run, setup=setup)
+    common.report("inject_allowed (%d plugins)" % count, elapsed, count=count)
+
+
+def bench_generate_event(subscribers, count=10000):
+    """
+    Microbenchmark of the generation of events by a plugin with the
+    provided number of subscribers (handler plugins), comparing the
+    permission check against the previous list based one.
+
+    :type subscribers: int
+    :param subscribers: The number of plugins handling the events.
+    :type count: int
+    :param count: The number of events to be generated.
+    """
+
+    class SourcePlugin(colony.Plugin):
+        id = "pt.hive.benchmark.source"
+        name = "Source"
+        version = "1.0.0"
+        events_fired = ["entity.changed", "entity.created", "other"]
+
+    class TargetPlugin(colony.Plugin):
+        name = "Target"
+        version = "1.0.0"
+        events_handled = ["entity"]
+
+        def event_handler(self, event_name, *event_args):
+            pass
+
+    plugin_manager = colony.PluginManager()
+    source = SourcePlugin(plugin_manager)
+    source.loaded = True
+    for index in range(subscribers):
+        target = TargetPlugin(plugin_manager)
+        target.id = "pt.hive.benchmark.target_%d" % index
+        target.loaded = True
+        target.register_all_handled_events_plugin(source)
+
+    def run():
+        for _index in range(count):
+            source.generate_event("entity.changed.save", [1])
+
+    def check_list():
+        for _index in range(count):
+            colony.base.system.is_event_or_super_event_in_list(
+                "entity.changed.save", source.events_fired
+            )
+
+    def check_set():
+        for _index in range(count):
+            colony.base.system.is_event_or_super_event_in_set(
+                "entity.changed.save", source.events_fired_set
+            )
+
+    if not subscribers:
+        baseline = common.measure(check_list)
+        common.report("event check (list)", baseline, count=count)
+        elapsed = common.measure(check_set)
+        common.report("event check (set)", elapsed, count=count, baseline=baseline)
+
+    elapsed = common.measure(run)
+    common.report("generate_event (%d subscribers)" % subscribers, elapsed, count=count)
+
+
+def main():
+    for count in (250, 500, 1000, 2000):
+        bench_inject_allowed(count)
+    for subscribers in (0, 50):
+        bench_generate_event(subscribers)
+
+
+if __name__ == "__main__":
+    main()
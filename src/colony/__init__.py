@@ -29,6 +29,31 @@ from . import base
 from . import libs
 
 from .base import *
-from .libs import *
 
 from .libs import __import__
+
+if libs.LAZY_IMPORT:
+
+    def __getattr__(name):
+        """
+        Retrieves the attribute with the provided name from the
+        libs package (loaded on demand), this is the lazy version
+        of the star import of the libs package.
+
+        :type name: String
+        :param name: The name of the attribute to be retrieved.
+        :rtype: Object
+        :return: The value of the attribute from the libs package.
+        """
+
+        if not name in libs.__all__:
+            raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+        value = getattr(libs, name)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(libs.__all__))
+
+else:
+    from .libs import *
@@ -45,6 +45,14 @@ from .config import (
     conf_d,
     conf_ctx,
     conf_override,
+    conf_bind,
+    conf_subscribe,
+    conf_unsubscribe,
+    conf_refresh,
+    conf_watch,
+    conf_unwatch,
+    ConfBind,
+    ConfWatcher,
 )
 from .decorators import (
     load_plugin,
@@ -104,8 +112,11 @@ from .system import (
     Event,
     PluginThread,
     PluginEventThread,
+    PluginExecutorThread,
+    PluginExecutor,
+    PluginTask,
 )
-from .test import Test
+from .test import Test, TimedTestResult, TestReport, ParallelTestRunner
 from .util import (
     CPYTHON_ENVIRONMENT,
     JYTHON_ENVIRONMENT,
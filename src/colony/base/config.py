@@ -31,6 +31,7 @@ __license__ = "Apache License, Version 2.0"
 import os
 import sys
 import json
+import threading
 import contextlib
 
 from . import legacy
@@ -80,6 +81,34 @@ HOMES = []
 to be the home on in terms of configuration, this value should
 be set on the initial loading of the ".home" file """
 
+BINDS = {}
+""" The map that associates the name of a configuration value
+with the sequence of compiled (bound) accessors for it, these
+accessors are refreshed whenever the value changes """
+
+INDEXES = {}
+""" The map associating a (kind, value) tuple, where kind is
+either prefix or suffix, with the set of configuration names
+that match it, used to avoid full scans of the configuration """
+
+LISTENERS = []
+""" The sequence of callables that are going to be notified
+(with name, value and previous value) on every change of a
+global configuration value """
+
+LOCK = threading.RLock()
+""" The (re-entrant) lock that guards the binds, indexes and
+listeners structures, as these may be changed concurrently by
+the configuration watcher thread and the registering threads """
+
+WATCH_INTERVAL = 1.0
+""" The default interval (in seconds) in between polling
+operations of the configuration watcher """
+
+WATCHER = None
+""" The global reference to the configuration watcher that
+is currently running for the global configuration (if any) """
+
 GLOBAL_CONFIG = {
     "logging_format": "%(asctime)s [%(levelname)s] %(message)s",
     "plugin_id_logging": True,
@@ -129,36 +158,72 @@ def conf(name, default=None, cast=None, ctx=None):
     return value
 
 
+def conf_bind(name, default=None, cast=None, ctx=None):
+    """
+    Retrieves a compiled (bound) accessor for the configuration
+    value with the provided name, the value is resolved and cast
+    only once and then cached in the accessor.
+
+    The accessor is refreshed whenever the value is changed through
+    the configuration API (eg: `conf_s`, `conf_r`, `load`) and may
+    be used to subscribe for changes in the value.
+
+    :type name: String
+    :param name: The name of the configuration value to be bound.
+    :type default: Object
+    :param default: The default value to be used in case no value
+    is found for the provided name.
+    :type cast: Type/String
+    :param cast: The cast operation to be performed in the
+    resolved value (optional).
+    :type ctx: Dictionary
+    :param ctx: The context dictionary to be used for situations
+    where a more contextual configuration is meant to be used instead
+    of the process wide global configuration.
+    :rtype: ConfBind
+    :return: The (cached) accessor for the configuration value, the
+    value may be retrieved by calling it.
+    """
+
+    cast = _cast_r(cast)
+    with LOCK:
+        binds = _binds(ctx)
+        name_binds = binds.get(name, [])
+        for bind in name_binds:
+            if not bind.cast == cast:
+                continue
+            if not bind.default == default:
+                continue
+            return bind
+        bind = ConfBind(name, default=default, cast=cast, ctx=ctx)
+        name_binds.append(bind)
+        binds[name] = name_binds
+    return bind
+
+
 def conf_prefix(prefix, ctx=None):
     configs = ctx["configs"] if ctx else CONFIGS
-    configs_prefix = dict()
-    for name, value in configs.items():
-        if not name.startswith(prefix):
-            continue
-        configs_prefix[name] = value
-    return configs_prefix
+    with LOCK:
+        names = _indexed("prefix", prefix, ctx=ctx)
+        return dict((name, configs[name]) for name in names if name in configs)
 
 
 def conf_suffix(suffix, ctx=None):
     configs = ctx["configs"] if ctx else CONFIGS
-    configs_suffix = dict()
-    for name, value in configs.items():
-        if not name.endswith(suffix):
-            continue
-        configs_suffix[name] = value
-    return configs_suffix
+    with LOCK:
+        names = _indexed("suffix", suffix, ctx=ctx)
+        return dict((name, configs[name]) for name in names if name in configs)
 
 
 def conf_s(name, value, ctx=None):
-    configs = ctx["configs"] if ctx else CONFIGS
-    configs[name] = value
+    _set(name, value, ctx=ctx)
 
 
 def conf_r(name, ctx=None):
     configs = ctx["configs"] if ctx else CONFIGS
     if not name in configs:
         return
-    del configs[name]
+    _unset(name, ctx=ctx)
 
 
 def conf_d(ctx=None):
@@ -170,6 +235,115 @@ def conf_ctx():
     return dict(configs=dict(), config_f=dict())
 
 
+def conf_subscribe(callback, ctx=None):
+    """
+    Registers the provided callback to be notified on every change
+    of a configuration value, the callback is called with the name,
+    the new value and the previous value (None for new or removed).
+
+    :type callback: Function
+    :param callback: The callback to be called on every change.
+    :type ctx: Dictionary
+    :param ctx: The context dictionary to be used for situations
+    where a more contextual configuration is meant to be used instead
+    of the process wide global configuration.
+    """
+
+    with LOCK:
+        listeners = _listeners(ctx)
+        if callback in listeners:
+            return
+        listeners.append(callback)
+
+
+def conf_unsubscribe(callback, ctx=None):
+    with LOCK:
+        listeners = _listeners(ctx)
+        if not callback in listeners:
+            return
+        listeners.remove(callback)
+
+
+def conf_watch(callback=None, interval=None, ctx=None):
+    """
+    Starts (if not already running) the background configuration
+    watcher that reloads the configuration files, used through this
+    session, whenever they change.
+
+    The provided callback is registered to be notified (with name,
+    value and previous value) of every configuration change.
+
+    :type callback: Function
+    :param callback: The callback to be registered for changes
+    in the configuration (optional).
+    :type interval: float
+    :param interval: The interval (in seconds) in between polling
+    operations, defaults to the `CONFIG_WATCH_INTERVAL` value.
+    :type ctx: Dictionary
+    :param ctx: The context dictionary to be used for situations
+    where a more contextual configuration is meant to be used instead
+    of the process wide global configuration.
+    :rtype: ConfWatcher
+    :return: The configuration watcher that is currently running.
+    """
+
+    global WATCHER
+
+    if callback:
+        conf_subscribe(callback, ctx=ctx)
+
+    watcher = ctx.get("watcher", None) if ctx else WATCHER
+    if watcher:
+        return watcher
+
+    if interval == None:
+        interval = conf("CONFIG_WATCH_INTERVAL", WATCH_INTERVAL, cast=float)
+    watcher = ConfWatcher(interval=interval, ctx=ctx)
+    watcher.start()
+
+    if ctx:
+        ctx["watcher"] = watcher
+    else:
+        WATCHER = watcher
+    return watcher
+
+
+def conf_unwatch(callback=None, ctx=None):
+    global WATCHER
+
+    if callback:
+        conf_unsubscribe(callback, ctx=ctx)
+
+    watcher = ctx.pop("watcher", None) if ctx else WATCHER
+    if not watcher:
+        return
+    watcher.stop()
+
+    if not ctx:
+        WATCHER = None
+
+
+def conf_refresh(ctx=None):
+    """
+    Refreshes the complete set of indexes and bound accessors
+    of the configuration, this is only required in case the
+    configuration map has been changed directly (eg: `conf_d`).
+
+    :type ctx: Dictionary
+    :param ctx: The context dictionary to be used for situations
+    where a more contextual configuration is meant to be used instead
+    of the process wide global configuration.
+    """
+
+    with LOCK:
+        _indexes(ctx).clear()
+        binds = [
+            bind for name_binds in legacy.values(_binds(ctx)) for bind in name_binds
+        ]
+    for bind in binds:
+        bind.refresh()
+
+
 @contextlib.contextmanager
 def conf_override(name, value):
     """
@@ -247,12 +421,12 @@ def load_file(name=FILE_NAME, path=None, encoding="utf-8", ctx=None):
     data = data.decode(encoding)
     data_j = json.loads(data)
 
-    _load_includes(base_path, data_j, encoding=encoding)
+    _load_includes(base_path, data_j, encoding=encoding, ctx=ctx)
 
     for key, value in data_j.items():
         if not _is_valid(key):
             continue
-        configs[key] = value
+        _set(key, value, ctx=ctx)
 
 
 def load_dot_env(name=".env", encoding="utf-8", ctx=None):
@@ -300,33 +474,29 @@ def load_dot_env(name=".env", encoding="utf-8", ctx=None):
             and value.endswith("'")
         ):
             value = value[1:-1].replace('\\"', '"')
-        configs[key] = value
+        _set(key, value, ctx=ctx)
 
 
 def load_env(ctx=None):
-    configs = ctx["configs"] if ctx else CONFIGS
-
     config = dict(os.environ)
     homes = get_homes()
 
     for home in homes:
-        _load_includes(home, config)
+        _load_includes(home, config, ctx=ctx)
 
     for key, value in legacy.iteritems(config):
         if not _is_valid(key):
             continue
-        configs[key] = value
         is_bytes = legacy.is_bytes(value)
-        if not is_bytes:
-            continue
-        for encoding in ENV_ENCODINGS:
-            try:
-                value = value.decode(encoding)
-            except UnicodeDecodeError:
-                pass
-            else:
-                break
-        configs[key] = value
+        if is_bytes:
+            for encoding in ENV_ENCODINGS:
+                try:
+                    value = value.decode(encoding)
+                except UnicodeDecodeError:
+                    pass
+                else:
+                    break
+        _set(key, value, ctx=ctx)
 
 
 def get_homes(file_path=HOME_FILE, default="~", encoding="utf-8", force_default=False):
@@ -385,7 +555,7 @@ def _cast_r(cast):
     return CASTS.get(cast, cast)
 
 
-def _load_includes(base_path, config, encoding="utf-8"):
+def _load_includes(base_path, config, encoding="utf-8", ctx=None):
     includes = ()
 
     for alias in IMPORT_NAMES:
@@ -395,7 +565,7 @@ def _load_includes(base_path, config, encoding="utf-8"):
         includes = includes.split(";")
 
     for include in includes:
-        load_file(name=include, path=base_path, encoding=encoding)
+        load_file(name=include, path=base_path, encoding=encoding, ctx=ctx)
 
 
 def _is_valid(key):
@@ -404,4 +574,287 @@ def _is_valid(key):
     return True
 
 
+def _set(name, value, ctx=None):
+    configs = ctx["configs"] if ctx else CONFIGS
+    with LOCK:
+        exists = name in configs
+        previous = configs.get(name, None)
+        configs[name] = value
+        if not exists:
+            _index(name, ctx=ctx)
+    if exists and previous == value:
+        return
+    _notify(name, value, previous, ctx=ctx)
+
+
+def _unset(name, ctx=None):
+    configs = ctx["configs"] if ctx else CONFIGS
+    with LOCK:
+        previous = configs.pop(name)
+        for names in legacy.values(_indexes(ctx)):
+            names.discard(name)
+    _notify(name, None, previous, ctx=ctx)
+
+
+def _notify(name, value, previous, ctx=None):
+    with LOCK:
+        binds = list(_binds(ctx).get(name, ()))
+        listeners = list(_listeners(ctx))
+    for bind in binds:
+        bind.refresh()
+    for listener in listeners:
+        listener(name, value, previous)
+
+
+def _index(name, ctx=None):
+    # the indexes are shared with the watcher thread so they
+    # must only be iterated (and changed) while holding the lock
+    with LOCK:
+        for (kind, value), names in legacy.iteritems(_indexes(ctx)):
+            if kind == "prefix" and name.startswith(value):
+                names.add(name)
+            elif kind == "suffix" and name.endswith(value):
+                names.add(name)
+
+
+def _indexed(kind, value, ctx=None):
+    configs = ctx["configs"] if ctx else CONFIGS
+    with LOCK:
+        indexes = _indexes(ctx)
+        names = indexes.get((kind, value), None)
+        if names == None:
+            if kind == "prefix":
+                names = set(name for name in configs if name.startswith(value))
+            else:
+                names = set(name for name in configs if name.endswith(value))
+            indexes[(kind, value)] = names
+        return set(names)
+
+
+def _binds(ctx):
+    return ctx.setdefault("binds", dict()) if ctx else BINDS
+
+
+def _indexes(ctx):
+    return ctx.setdefault("indexes", dict()) if ctx else INDEXES
+
+
+def _listeners(ctx):
+    return ctx.setdefault("listeners", []) if ctx else LISTENERS
+
+
+class ConfBind(object):
+    """
+    Compiled (bound) accessor for a configuration value, that
+    keeps the resolved and cast value cached until the value
+    is changed through the configuration API.
+
+    Should be created using the `conf_bind` function so that
+    it's properly registered for refreshing.
+    """
+
+    name = None
+    """ The name of the configuration value that is bound """
+
+    default = None
+    """ The default value to be used in case no value is
+    defined for the bound name """
+
+    cast = None
+    """ The (resolved) cast operation to be applied to the
+    value, once per change of the value """
+
+    value = None
+    """ The cached (already cast) value of the configuration """
+
+    callbacks = []
+    """ The sequence of callbacks to be called (with the new
+    and the previous value) when the bound value changes """
+
+    def __init__(self, name, default=None, cast=None, ctx=None):
+        self.name = name
+        self.default = default
+        self.cast = cast
+        self.ctx = ctx
+        self.callbacks = []
+        self.value = self._resolve()
+
+    def __call__(self):
+        return self.value
+
+    def get(self):
+        return self.value
+
+    def subscribe(self, callback):
+        self.callbacks.append(callback)
+
+    def unsubscribe(self, callback):
+        if not callback in self.callbacks:
+            return
+        self.callbacks.remove(callback)
+
+    def refresh(self):
+        previous = self.value
+        self.value = self._resolve()
+        if self.value == previous:
+            return
+        for callback in list(self.callbacks):
+            callback(self.value, previous)
+
+    def _resolve(self):
+        configs = self.ctx["configs"] if self.ctx else CONFIGS
+        value = configs.get(self.name, self.default)
+        if self.cast and not value == None:
+            value = self.cast(value)
+        return value
+
+
+class ConfWatcher(threading.Thread):
+    """
+    Background (daemon) thread that polls the configuration files
+    used through the session (`CONFIG_F`) for changes, using their
+    modification time and size, and reloads only the changed ones.
+
+    The values of a reloaded file are compared against the ones
+    it previously defined, so that only the changed names are set
+    (and notified), the names no longer defined fall back to the
+    remaining watched files (in precedence order) or are removed,
+    note that environment variables keep their precedence.
+    """
+
+    interval = WATCH_INTERVAL
+    """ The interval (in seconds) in between polling operations """
+
+    stats = {}
+    """ The map associating the path of each watched file with
+    its last known (modification time, size) tuple """
+
+    values = {}
+    """ The map associating the path of each watched file with
+    the configuration values it defined on its last load """
+
+    def __init__(self, interval=WATCH_INTERVAL, ctx=None):
+        threading.Thread.__init__(self, name="ConfWatcher")
+        self.daemon = True
+        self.interval = interval
+        self.ctx = ctx
+        self.stats = dict()
+        self.values = dict()
+        self._event = threading.Event()
+        for path in self._paths():
+            self.stats[path] = self._stat(path)
+            self.values[path] = self._parse(path)
+
+    def run(self):
+        while not self._event.is_set():
+            self.check()
+            self._event.wait(self.interval)
+
+    def stop(self):
+        self._event.set()
+
+    def check(self):
+        """
+        Checks the complete set of watched files for changes, reloading
+        the ones that have been changed since the last check.
+
+        :rtype: List
+        :return: The list with the paths of the files that have
+        been reloaded as part of the check.
+        """
+
+        changed = []
+        for path in self._paths():
+            stat = self._stat(path)
+            if stat == self.stats.get(path, None):
+                continue
+            self.stats[path] = stat
+            self.reload(path)
+            changed.append(path)
+        return changed
+
+    def reload(self, path):
+        """
+        Reloads the configuration file in the provided path, only the
+        names whose value changed in the file (or that are no longer
+        defined by it) are (re-)resolved against the complete set of
+        watched files, respecting their precedence order.
+
+        :type path: String
+        :param path: The path of the configuration file to be reloaded.
+        """
+
+        configs = self.ctx["configs"] if self.ctx else CONFIGS
+        previous = self.values.get(path, {})
+        values = self._parse(path)
+        _values = dict(self.values)
+        self.values[path] = values
+
+        # gathers the names that have been changed in the file, either
+        # with a new value, newly defined or no longer defined
+        names = [
+            name
+            for name, value in legacy.iteritems(values)
+            if not name in previous or not previous[name] == value
+        ]
+        names += [name for name in previous if not name in values]
+
+        for name in names:
+            # the environment variables always take precedence over
+            # the values defined in the configuration files
+            if name in os.environ:
+                continue
+
+            # resolves the effective value of the name (according to
+            # the precedence of the files) before and after the change
+            # in case it's the same there's nothing to be done
+            exists, value = self._resolve(name, _values)
+            _exists, _value = self._resolve(name, self.values)
+            if exists == _exists and value == _value:
+                continue
+
+            # in case the current value is not the one that came from
+            # the files, it has been changed by other means and must
+            # be kept (no override)
+            if exists and not configs.get(name, None) == value:
+                continue
+
+            if _exists:
+                _set(name, _value, ctx=self.ctx)
+            elif name in configs:
+                _unset(name, ctx=self.ctx)
+
+    def _paths(self):
+        config_f = self.ctx["config_f"] if self.ctx else CONFIG_F
+        return list(config_f)
+
+    def _resolve(self, name, values):
+        # iterates over the watched files from the one with the
+        # highest precedence (last loaded) to the lowest one, to
+        # find the effective value of the name
+        for path in reversed(self._paths()):
+            _values = values.get(path, {})
+            if not name in _values:
+                continue
+            return True, _values[name]
+        return False, None
+
+    def _stat(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    def _parse(self, path):
+        ctx = dict(configs=dict(), config_f=[])
+        if not os.path.exists(path):
+            return ctx["configs"]
+        if path.endswith(".json"):
+            load_file(name=path, ctx=ctx)
+        else:
+            load_dot_env(name=path, ctx=ctx)
+        return ctx["configs"]
+
+
 load()
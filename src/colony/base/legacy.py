@@ -42,6 +42,25 @@ import urllib  # @UnusedImport
 
 ArgSpec = collections.namedtuple("ArgSpec", ["args", "varargs", "keywords", "defaults"])
 
+LAZY_IMPORT = sys.version_info >= (3, 7)
+""" If the (heavy) network, parsing and serialization modules
+should be imported on demand using the module level attribute
+retrieval (PEP 562), only available for python 3.7+ """
+
+LAZY_ATTRIBUTES = dict(
+    http=("http.client", "http"),
+    HTMLParser=("html.parser", "html.parser"),
+    cPickle=("pickle", "pickle"),
+    Request=("urllib.request", "urllib.request.Request"),
+    HTTPHandler=("urllib.request", "urllib.request.HTTPHandler"),
+    HTTPError=("urllib.error", "urllib.error.HTTPError"),
+    HTTPConnection=("http.client", "http.client.HTTPConnection"),
+    HTTPSConnection=("http.client", "http.client.HTTPSConnection"),
+)
+""" The map associating the names of the attributes that are lazily
+loaded (when lazy import is enabled) with the name of the module to
+be imported and the (dotted) path to the value of the attribute """
+
 
 @contextlib.contextmanager
 def ctx_absolute():
@@ -64,11 +83,12 @@ with ctx_absolute():
     except ImportError:
         httplib = None
 
-with ctx_absolute():
-    try:
-        import http
-    except ImportError:
-        http = None
+if not LAZY_IMPORT:
+    with ctx_absolute():
+        try:
+            import http
+        except ImportError:
+            http = None
 
 with ctx_absolute():
     try:
@@ -76,23 +96,24 @@ with ctx_absolute():
     except ImportError:
         types = None
 
-with ctx_absolute():
-    try:
-        import urllib.error
-    except ImportError:
-        pass
+if not LAZY_IMPORT:
+    with ctx_absolute():
+        try:
+            import urllib.error
+        except ImportError:
+            pass
 
-with ctx_absolute():
-    try:
-        import urllib.request
-    except ImportError:
-        pass
+    with ctx_absolute():
+        try:
+            import urllib.request
+        except ImportError:
+            pass
 
-with ctx_absolute():
-    try:
-        import http.client
-    except ImportError:
-        pass
+    with ctx_absolute():
+        try:
+            import http.client
+        except ImportError:
+            pass
 
 with ctx_absolute():
     try:
@@ -100,19 +121,20 @@ with ctx_absolute():
     except ImportError:
         pass
 
-try:
-    import HTMLParser
-except ImportError:
-    import html.parser
+if not LAZY_IMPORT:
+    try:
+        import HTMLParser
+    except ImportError:
+        import html.parser
 
-    HTMLParser = html.parser
+        HTMLParser = html.parser
 
-try:
-    import cPickle
-except ImportError:
-    import pickle
+    try:
+        import cPickle
+    except ImportError:
+        import pickle
 
-    cPickle = pickle
+        cPickle = pickle
 
 try:
     import imp
@@ -232,29 +254,19 @@ try:
 except Exception:
     _xrange = None
 
-if PYTHON_3:
+if LAZY_IMPORT:
+    pass
+elif PYTHON_3:
     Request = urllib.request.Request
-else:
-    Request = urllib2.Request
-
-if PYTHON_3:
     HTTPHandler = urllib.request.HTTPHandler
-else:
-    HTTPHandler = urllib2.HTTPHandler
-
-if PYTHON_3:
     HTTPError = urllib.error.HTTPError
-else:
-    HTTPError = urllib2.HTTPError
-
-if PYTHON_3:
     HTTPConnection = http.client.HTTPConnection  # @UndefinedVariable
-else:
-    HTTPConnection = httplib.HTTPConnection
-
-if PYTHON_3:
     HTTPSConnection = http.client.HTTPSConnection  # @UndefinedVariable
 else:
+    Request = urllib2.Request
+    HTTPHandler = urllib2.HTTPHandler
+    HTTPError = urllib2.HTTPError
+    HTTPConnection = httplib.HTTPConnection
     HTTPSConnection = httplib.HTTPSConnection
 
 try:
@@ -278,6 +290,30 @@ except Exception:
     _unichr = None
 
 
+def __getattr__(name):
+    """
+    Retrieves the lazily loaded attribute with the provided name,
+    importing the module that defines it on demand and caching the
+    value in the module for further access (python 3.7+ only).
+
+    :type name: String
+    :param name: The name of the attribute to be retrieved.
+    :rtype: Object
+    :return: The value of the lazily loaded attribute.
+    """
+
+    if not name in LAZY_ATTRIBUTES:
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+    module_name, path = LAZY_ATTRIBUTES[name]
+    importlib.import_module(module_name)
+    parts = path.split(".")
+    value = sys.modules[parts[0]]
+    for part in parts[1:]:
+        value = getattr(value, part)
+    globals()[name] = value
+    return value
+
+
 def with_meta(meta, *bases):
     return meta("Class", bases, {})
 
@@ -532,14 +568,14 @@ def unichr(*args, **kwargs):
 
 def urlopen(*args, **kwargs):
     if PYTHON_3:
-        return urllib.request.urlopen(*args, **kwargs)
+        return importlib.import_module("urllib.request").urlopen(*args, **kwargs)
     else:
         return urllib2.urlopen(*args, **kwargs)  # @UndefinedVariable
 
 
 def build_opener(*args, **kwargs):
     if PYTHON_3:
-        return urllib.request.build_opener(*args, **kwargs)
+        return importlib.import_module("urllib.request").build_opener(*args, **kwargs)
     else:
         return urllib2.build_opener(*args, **kwargs)  # @UndefinedVariable
 
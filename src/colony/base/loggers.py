@@ -64,6 +64,11 @@ TIMEOUT_LOGSTASH = 30.0
 """ The maximum amount of time in between flush
 operations in the logstash handler """
 
+LOGSTASH = config.conf_bind("LOGGING_LOGSTASH", False, cast=bool)
+""" The compiled accessor for the configuration value that
+controls if the logstash logging is enabled, avoids the
+resolution and cast of the value on every check """
+
 LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
 """ The sequence of levels from the least sever to the
 most sever this sequence may be used to find all the
@@ -275,7 +280,7 @@ class LogstashHandler(logging.Handler):
             import logstash
         except ImportError:
             return False
-        if not config.conf("LOGGING_LOGSTASH", False, cast=bool):
+        if not LOGSTASH():
             return False
         return True
 
@@ -377,7 +382,7 @@ class LogstashHandler(logging.Handler):
         except ImportError:
             return None
 
-        if not config.conf("LOGGING_LOGSTASH", False, cast=bool):
+        if not LOGSTASH():
             return None
 
         return logstash.API()
@@ -43,11 +43,13 @@ import warnings
 import threading
 import traceback
 import subprocess
+import collections
 
 import logging.handlers
 
 import colony.libs
 
+from . import test
 from . import util
 from . import legacy
 from . import config
@@ -132,6 +134,15 @@ under the workspace path (eg: ~/.colony_workspace/<plugin_id>) """
 DEFAULT_UNLOAD_SYSTEM_TIMEOUT = 600.0
 """ The default unload system timeout """
 
+DEFAULT_EXECUTOR_SIZE = 8
+""" The default maximum number of idle worker threads to be
+kept by the (shared) plugin executor for re-usage """
+
+MAIN_LOOP_TIMEOUT = 1.0
+""" The timeout (in seconds) to be used in the waiting for events
+in the main loop under windows and python 2, where a blocking wait
+on a condition is not interrupted by signals """
+
 EAGER_LOADING_TYPE = "eager_loading"
 """ The eager loading plugin loading type """
 
@@ -193,6 +204,20 @@ ALIAS_MAP = dict(devel="development", prod="production", runtime="production")
 of the layout/run modes, this is used so that shorter names
 may be used for this modes (simplified execution) """
 
+INTERN_CACHE_SIZE = 4096
+""" The maximum number of interned capability and event
+structures to be kept in each of the caches, once the limit
+is reached new structures are no longer cached (bounded memory
+usage) while the already interned ones remain shared """
+
+CAPABILITY_CACHE = {}
+""" The cache map associating the capability string values
+with the interned capability structures """
+
+EVENT_CACHE = {}
+""" The cache map associating the event string values
+with the interned event structures """
+
 
 class System(object):
     """
@@ -334,10 +359,20 @@ class Plugin(object):
     set in case the plugin is not loaded """
 
     dependencies_loaded = []
-    """ The list of dependency plugins loaded """
+    """ The ordered set of dependency plugins loaded, the
+    list like interface is kept for compatibility """
 
     allowed_loaded_capability = []
-    """ The list of allowed plugins loaded with capability """
+    """ The ordered set of allowed plugins loaded with capability
+    (as tuples), allows constant time duplicate verification """
+
+    events_fired_set = frozenset()
+    """ The compiled (frozen) set of the events fired by
+    the plugin, used for fast event permission checking """
+
+    events_handled_set = frozenset()
+    """ The compiled (frozen) set of the events handled by
+    the plugin, used for fast handler matching """
 
     event_plugins_fired_loaded_map = {}
     """ The map with the plugin associated with
@@ -400,8 +435,9 @@ class Plugin(object):
         self.ready_semaphore_release_count = 0
 
         self.logger = logging.getLogger(DEFAULT_LOGGER)
-        self.dependencies_loaded = []
-        self.allowed_loaded_capability = []
+        self.compile_events()
+        self.dependencies_loaded = colony.libs.OrderedSet()
+        self.allowed_loaded_capability = colony.libs.OrderedSet()
         self.event_plugins_fired_loaded_map = {}
         self.event_plugins_registered_loaded_map = {}
         self.event_plugin_manager_registered_loaded_list = []
@@ -436,9 +472,12 @@ class Plugin(object):
         # current plugin, so we can change the internal values of structures
         for capability in self.capabilities_allowed:
             setattr(self, capability, {})
-            setattr(self, capability + "_plugins", [])
+            setattr(self, capability + "_plugins", colony.libs.OrderedSet())
 
-        # registers all the plugin manager events
+        # re-compiles the events so that any change in the events
+        # fired and handled (since construction) is taken into account
+        # and then registers all the plugin manager events
+        self.compile_events()
         self.register_all_plugin_manager_events()
 
         # sets the values of a series of flags that control the state of the
@@ -465,7 +504,8 @@ class Plugin(object):
         Method called at the beginning of the lazy plugin loading process.
         """
 
-        # registers all the plugin manager events
+        # re-compiles the events and registers all the plugin manager events
+        self.compile_events()
         self.register_all_plugin_manager_events()
 
         # sets the values of a series of flags that control the state of the
@@ -516,11 +556,11 @@ class Plugin(object):
 
         # resets the dependencies loaded (no dependencies
         # are loaded in the plugin at the end of the unload)
-        self.dependencies_loaded = []
+        self.dependencies_loaded = colony.libs.OrderedSet()
 
         # resets the allowed loaded capability (no allowed
         # are loaded in the plugin at the end of the unload)
-        self.allowed_loaded_capability = []
+        self.allowed_loaded_capability = colony.libs.OrderedSet()
 
         # generates the load plugin event
         self.manager.generate_event(
@@ -580,11 +620,11 @@ class Plugin(object):
         allowed = getattr(self, capability)
         allowed[plugin.short_name] = plugin
 
-        # verifies if the current plugin already has the plugins list for
-        # the current capability created and if that's not the case creates
-        # a new list and then appends the current allowed plugin to the list
+        # verifies if the current plugin already has the plugins (ordered)
+        # set for the current capability created and if that's not the case
+        # creates a new one and then appends the current allowed plugin to it
         if not hasattr(self, capability + "_plugins"):
-            setattr(self, capability + "_plugins", [])
+            setattr(self, capability + "_plugins", colony.libs.OrderedSet())
         allowed_list = getattr(self, capability + "_plugins")
         allowed_list.append(plugin)
 
@@ -677,6 +717,20 @@ class Plugin(object):
             % (self.name, self.version)
         )
 
+    def compile_events(self):
+        """
+        Compiles the events fired and handled by the plugin into
+        sets so that the permission check (on generation) and the
+        handler match may be performed as a series of (per depth)
+        set lookups instead of a complete scan of the lists.
+
+        This method should be called again in case the events fired
+        or handled lists are changed at runtime.
+        """
+
+        self.events_fired_set = frozenset(self.events_fired)
+        self.events_handled_set = frozenset(self.events_handled)
+
     def register_all_handled_events_plugin(self, plugin):
         """
         Registers all the allowed events from a given plugin in self.
@@ -688,7 +742,7 @@ class Plugin(object):
         event_names_handled = [
             event_name
             for event_name in plugin.events_fired
-            if is_event_or_super_event_in_list(event_name, self.events_handled)
+            if is_event_or_super_event_in_set(event_name, self.events_handled_set)
         ]
 
         for event_name_handled in event_names_handled:
@@ -885,16 +939,12 @@ class Plugin(object):
         :param event_args: The arguments to be passed to the handler.
         """
 
-        # the names of the events fired by self
-        event_names_list = legacy.keys(self.event_plugins_fired_loaded_map)
-
-        # retrieves all the events and super events that match the generated event
-        events_or_super_events_list = get_all_events_or_super_events_in_list(
-            event_name, event_names_list
-        )
+        # retrieves the event and all of its super events, these are the
+        # only possible keys of the map that may match the generated event
+        event_and_super_events_list = event_and_super_events(event_name)
 
         # iterates over all the events and super events for notification
-        for event_or_super_event in events_or_super_events_list:
+        for event_or_super_event in event_and_super_events_list:
             if not event_or_super_event in self.event_plugins_fired_loaded_map:
                 continue
 
@@ -928,7 +978,7 @@ class Plugin(object):
         :param event_args: The arguments to be passed to the handler.
         """
 
-        if not is_event_or_super_event_in_list(event_name, self.events_fired):
+        if not is_event_or_super_event_in_set(event_name, self.events_fired_set):
             return
 
         # prints a debug message
@@ -1579,6 +1629,24 @@ class PluginManager(object):
     that event if the tests are ready to be executed should not
     be executed on user request (blacklisted) """
 
+    config_watcher = None
+    """ The configuration watcher that has been started for the
+    plugin manager, reloading the configuration files at runtime """
+
+    modules_cache = {}
+    """ The map associating the path (and suffix) of a directory
+    with the tuple containing its modification time and the list
+    of modules found in it, may be restored from a snapshot """
+
+    test_workers = 1
+    """ The number of worker processes (forked from the booted
+    manager) to be used in the execution of the plugin tests, in
+    case the value is larger than one the parallel mode is used """
+
+    test_report = None
+    """ The path to the file to which the JUnit XML report of the
+    plugin tests execution is going to be written (if any) """
+
     init_complete_handlers = []
     """ The list of handlers to be called at the end of
     the plugin manager initialization """
@@ -1681,7 +1749,15 @@ class PluginManager(object):
     be returned as the result of process execution """
 
     event_queue = []
-    """ The queue of events to be processed """
+    """ The queue (deque) of events to be processed """
+
+    dispatch_latency = 0.0
+    """ The latency (in seconds) between the adding of the last
+    dispatched event and the start of its processing """
+
+    dispatch_latency_max = 0.0
+    """ The maximum dispatch latency (in seconds) registered
+    for the events processed in the main loop """
 
     manager_path = None
     """ The manager base path for execution """
@@ -1704,7 +1780,7 @@ class PluginManager(object):
     """ The referred modules """
 
     loaded_plugins = []
-    """ The loaded plugins """
+    """ The ordered set of loaded plugins (classes) """
 
     loaded_plugins_map = {}
     """ The map with classes associated with strings
@@ -1759,6 +1835,11 @@ class PluginManager(object):
     """ The map associating the active running threads
     with the id of the plugin """
 
+    executor = None
+    """ The shared executor to be used for the running of the
+    lifecycle calls of the thread based plugins, in case it's
+    not set a dedicated thread is used for each call """
+
     plugin_dependent_plugins_map = {}
     """ The map associating the plugins that
     depend on the plugin with the id of the plugin """
@@ -1880,15 +1961,26 @@ class PluginManager(object):
         self.blacklist = config.conf("BLACKLIST", [], cast=list)
         self.blacktest = config.conf("BLACKTEST", [], cast=list)
         self.whitetest = config.conf("WHITETEST", [], cast=list)
+        self.test_workers = config.conf("TEST_WORKERS", 1, cast=int)
+        self.test_report = config.conf("TEST_REPORT", None)
         self.exec_delay = config.conf("EXEC_DELAY", 0.0, cast=float)
 
+        executor = config.conf("PLUGIN_EXECUTOR", False, cast=bool)
+        executor_size = config.conf(
+            "PLUGIN_EXECUTOR_SIZE", DEFAULT_EXECUTOR_SIZE, cast=int
+        )
+        self.executor = PluginExecutor(executor_size) if executor else None
+
         self.plugins = util.Plugins()
         self.retrieve_lock = threading.RLock()
         self.current_id = 0
         self.logger_handlers = {}
-        self.event_queue = []
+        self.event_queue = collections.deque()
+        self.dispatch_latency = 0.0
+        self.dispatch_latency_max = 0.0
         self.referred_modules = []
-        self.loaded_plugins = []
+        self.modules_cache = {}
+        self.loaded_plugins = colony.libs.OrderedSet()
         self.loaded_plugins_map = {}
         self.loaded_plugins_id_map = {}
         self.id_loaded_plugins_map = {}
@@ -2347,6 +2439,41 @@ class PluginManager(object):
         self.logger_handlers["memory"] = memory_handler
         self.logger_handlers["logstash"] = logstash_handler
 
+    def config_changed(self, name, value, previous):
+        """
+        Callback to be called whenever a configuration value changes
+        at runtime (eg: reloaded by the configuration watcher), that
+        applies the changes that are supported without restart.
+
+        The supported changes are the logging level and the black
+        and white lists of plugins and tests.
+
+        :type name: String
+        :param name: The name of the configuration value that changed.
+        :type value: Object
+        :param value: The new value of the configuration (None in case
+        it has been removed).
+        :type previous: Object
+        :param previous: The previous value of the configuration.
+        """
+
+        # in case the changed value is the logging level and the logger
+        # is already started updates the level of it and of the stream
+        # handler (that is the one filtered by the selected level)
+        if name == "LEVEL" and self.logger:
+            level = colony.getLevelInt(value or "INFO")
+            minimal_level = min(DEFAULT_LOGGING_LEVEL, level)
+            self.logger.setLevel(minimal_level)
+            for handler in self.logger.handlers:
+                if not type(handler) == logging.StreamHandler:
+                    continue
+                handler.setLevel(level)
+
+        # in case the changed value is one of the black or white lists
+        # re-loads its value (in the proper list structure)
+        if name in ("BLACKLIST", "BLACKTEST", "WHITETEST"):
+            setattr(self, name.lower(), config.conf(name, [], cast=list))
+
     def load_system(self, mode=None, args=None, callback=None):
         """
         Starts the process of loading the plugin system.
@@ -2406,6 +2533,12 @@ class PluginManager(object):
             # of execution of the plugin system
             self.apply_fixes()
 
+            # in case the configuration watching is enabled starts the
+            # watcher so that changes in the configuration files are
+            # applied at runtime (eg: logging level and black lists)
+            if config.conf("CONFIG_WATCH", False, cast=bool):
+                self.config_watcher = config.conf_watch(callback=self.config_changed)
+
             # updates the workspace path and then checks the standard
             # input, replacing it with a non blocking support if required
             self.update_workspace_path()
@@ -2535,8 +2668,16 @@ class PluginManager(object):
             exit_event = util.QueueEvent("exit")
             self.add_event(exit_event)
         else:
-            # unloads the thread based plugins
+            # unloads the thread based plugins and stops the main
+            # loop (in case it's running) as no exit event is sent
             self._unload_thread_plugins()
+            self._stop_main_loop()
+
+        # stops the configuration watcher in case it has been
+        # started for the current plugin manager (no more reloads)
+        if self.config_watcher:
+            config.conf_unwatch(callback=self.config_changed)
+            self.config_watcher = None
 
         # cancels the kill system timer, in case it has been
         # defined (no need to kill the system anymore)
@@ -2560,17 +2701,28 @@ class PluginManager(object):
         # new settings)
         self._relaunch_system()
 
-    def main_loop(self, timeout=1.0):
+    def main_loop(self, timeout=None):
         """
         The main loop for the plugin manager, this is the call that
         is considered to be blocking most of the manager's time.
 
+        The loop only wakes up when events are added to the queue,
+        processing all of the pending events in batch, or when it's
+        stopped (`_stop_main_loop`), except for windows and python 2
+        where a timeout is used so that external interrupts (signals)
+        may be processed.
+
         :type timeout: float
-        :param timeout: The timeout that is going to be used as part
-        of the wait condition for the event queue of the main loop
-        the bigger this value the greater time to respond.
+        :param timeout: The (optional) timeout that is going to be used
+        as part of the wait condition for the event queue of the main loop
+        the bigger this value the greater time to respond to interrupts.
         """
 
+        # under windows and python 2 a blocking wait on the condition
+        # would not be interrupted by signals so a timeout must be used
+        if timeout == None and (os.name == "nt" or not legacy.PYTHON_3):
+            timeout = MAIN_LOOP_TIMEOUT
+
         # runs the plugin manager's main loop while the proper
         # active flag is set, this is used as the primary control
         # structure to be used for disabling the manager
@@ -2581,39 +2733,76 @@ class PluginManager(object):
 
             try:
                 # iterates while the event queue has no items waiting
-                # for new items to arrive and be processed
-                while not len(self.event_queue):
+                # for new items to arrive and be processed, returning
+                # the control flow in case the main loop is deactivated
+                while not self.event_queue and self.main_loop_active:
                     try:
-                        # waits for the condition to be notified
-                        # this wait releases after the defined timeout
-                        # in order to provide a away to process external interrupts
+                        # waits for the condition to be notified, this
+                        # wait only releases on timeout in case one is set
                         self.condition.wait(timeout)
                     except RuntimeError:
                         pass
 
-                # pops the top item from the event queue and "redirect"
-                # it for the processing phase of the workflow
-                event = self.event_queue.pop(0)
-
-                # in case the event is of type execute a method should
-                # be executed with the argument that are part of the event
-                if event.event_name == "execute":
-                    method = event.event_args[0]
-                    args = event.event_args[1:]
-                    method(*args)
-
-                # in case the event is of type exit, the unloading
-                # of the plugin system should be triggered
-                elif event.event_name == "exit":
-                    # unloads the thread based plugins and then
-                    # returns the current control flow to caller
-                    self._unload_thread_plugins()
-                    return
+                # drains the complete set of pending events from the queue
+                # so that they're processed in batch outside of the lock
+                events = list(self.event_queue)
+                self.event_queue.clear()
             finally:
                 # releases the condition, so that other threads
                 # can access the event queue
                 self.condition.release()
 
+            # processes the batch of events to "redirect" them for the
+            # processing phase of the workflow, in case the exit event
+            # is processed the control flow is returned to the caller
+            if _process_events(self, events):
+                return
+
+    def process_event(self, event):
+        """
+        Processes the given queue event in the current (main) thread
+        updating the dispatch latency values of the manager.
+
+        :type event: QueueEvent
+        :param event: The event to be processed.
+        :rtype: bool
+        :return: If the main loop should be terminated.
+        """
+
+        # updates the dispatch latency values using the timestamp
+        # of the creation of the event (time in queue)
+        if event.timestamp:
+            self.dispatch_latency = time.time() - event.timestamp
+            self.dispatch_latency_max = max(
+                self.dispatch_latency_max, self.dispatch_latency
+            )
+
+        # in case the event is of type execute a method should
+        # be executed with the argument that are part of the event
+        # and the (optional) callback notified with the result
+        if event.event_name == "execute":
+            method = event.event_args[0]
+            args = event.event_args[1:]
+            if not event.callback:
+                method(*args)
+                return False
+            try:
+                result = method(*args)
+            except Exception as exception:
+                event.callback(None, exception)
+            else:
+                event.callback(result, None)
+
+        # in case the event is of type exit, the unloading
+        # of the plugin system should be triggered
+        elif event.event_name == "exit":
+            # unloads the thread based plugins and then
+            # notifies the caller to return the control flow
+            self._unload_thread_plugins()
+            return True
+
+        return False
+
     def add_event(self, event):
         """
         Adds an event to the list of events in the plugin manager.
@@ -2635,6 +2824,63 @@ class PluginManager(object):
         self.condition.notify()
         self.condition.release()
 
+    def add_event_async(self, event, loop=None):
+        """
+        Adds an event to the list of events in the plugin manager
+        returning an asyncio future that is going to be resolved with
+        the result of the processing of the event in the main thread.
+
+        This allows the execution of methods in the main thread to
+        be awaited from coroutine code (eg: execute events).
+
+        :type event: QueueEvent
+        :param event: The event to add to the list of events in
+        the plugin manager.
+        :type loop: EventLoop
+        :param loop: The asyncio event loop that is going to be used
+        for the resolution of the future, if not provided the current
+        event loop is used.
+        :rtype: Future
+        :return: The future that is going to be resolved with the
+        result of the processing of the event.
+        """
+
+        import asyncio
+
+        loop = loop or asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def set_result(result, exception):
+            if future.done():
+                return
+            if exception:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+        def callback(result, exception):
+            loop.call_soon_threadsafe(set_result, result, exception)
+
+        event.callback = callback
+        self.add_event(event)
+        return future
+
+    def execute_async(self, method, *args):
+        """
+        Schedules the execution of the provided method in the main
+        thread of the plugin manager returning an asyncio future that
+        may be awaited for the result of the method.
+
+        :type method: Function
+        :param method: The method to be executed in the main thread.
+        :rtype: Future
+        :return: The future that is going to be resolved with the
+        result of the method execution.
+        """
+
+        event = util.QueueEvent("execute", [method] + list(args))
+        return self.add_event_async(event)
+
     def expand_workspace_path(self):
         """
         Expands the workspace path, in order to
@@ -2728,6 +2974,15 @@ class PluginManager(object):
             self.warning("Path '%s' does not exist in the current filesystem" % (path))
             return modules
 
+        # in case there's a cached list of modules for the path (and
+        # suffix) and the directory has not changed since its creation
+        # (same modification time) returns a copy of it immediately
+        mtime = os.stat(path).st_mtime
+        cache_key = path + ":" + (suffix or "")
+        cached = self.modules_cache.get(cache_key, None)
+        if cached and cached[0] == mtime:
+            return list(cached[1])
+
         # retrieves the directory list for the path, this should
         # provide the complete set of file names in the directory
         dir_list = os.listdir(path)
@@ -2764,6 +3019,10 @@ class PluginManager(object):
             if not module_name in modules:
                 modules.append(module_name)
 
+        # caches the modules list for the path (and suffix) together
+        # with the modification time of the directory, for re-usage
+        self.modules_cache[cache_key] = (mtime, list(modules))
+
         # returns the modules list, containing the complete set of
         # modules that respect the provided set of rules
         return modules
@@ -3537,7 +3796,7 @@ class PluginManager(object):
         # unsets the main loop as active so that the current execution workflow
         # is stopped and the system unloaded and then sets the auto unload flag
         # so that the plugin system is properly unloaded afterwards
-        self.main_loop_active = False
+        self._stop_main_loop()
         self.auto_unload = True
 
     def run_test(self, verbosity=2, raise_e=True, args=[]):
@@ -3567,7 +3826,15 @@ class PluginManager(object):
 
         # starts the initial result value of the execution with the valid
         # value as the execution is considered to be successful by default
+        # and creates the report that is going to aggregate the records
         result = True
+        report = test.TestReport()
+        initial = time.time()
+
+        # creates the sequence that is going to hold the individual test
+        # instances in case the parallel mode is enabled (multiple workers)
+        parallel = self.test_workers > 1 and test.ParallelTestRunner.is_available()
+        tests = []
 
         # verifies if any (command line) argument was provided if that's the
         # case tries to retrieve the associated plugins, otherwise retrieves
@@ -3628,18 +3895,50 @@ class PluginManager(object):
                 partial = loader.loadTestsFromTestCase(test_case)
                 suite.addTest(partial)
 
+            # in case the parallel mode is enabled the individual tests are
+            # gathered so that they're latter partitioned across the workers
+            if parallel:
+                tests.extend(test.flatten_suite(suite))
+                continue
+
             # creates the unit test runner and then runs the created suite
             # retrieving the final execution result that is used to compute
             # the result boolean value for the test execution
-            runner = unittest.TextTestRunner(verbosity=verbosity)
+            runner = unittest.TextTestRunner(
+                verbosity=verbosity, resultclass=test.TimedTestResult
+            )
             run_result = runner.run(suite)
             result = result and not run_result.errors
             result = result and not run_result.failures
+            report.extend(run_result.records)
+
+        # in case the parallel mode is enabled runs the gathered tests in
+        # the worker processes, forked from the current (booted) process,
+        # and uses the aggregated report to compute the result
+        if parallel:
+            runner = test.ParallelTestRunner(
+                workers=self.test_workers, verbosity=verbosity
+            )
+            report = runner.run(tests)
+            result = report.was_successful()
+        else:
+            report.duration = time.time() - initial
+            sys.stderr.write(report.summary() + "\n")
+            sys.stderr.flush()
+
+        # in case a report file path is defined writes the JUnit XML
+        # representation of the report (aggregated results) to it
+        if self.test_report:
+            file = open(self.test_report, "wb")
+            try:
+                file.write(legacy.bytes(report.junit(), encoding="utf-8"))
+            finally:
+                file.close()
 
         # unsets the main loop as active so that the current execution workflow
         # is avoided and the process workflow returned to the caller process
         # and then sets the auto unload flag so that the plugin system is unloaded
-        self.main_loop_active = False
+        self._stop_main_loop()
         self.auto_unload = True
 
         # in case the raise (exception) flag is set and the result is invalid
@@ -3782,8 +4081,13 @@ class PluginManager(object):
                     % (plugin.name, plugin.version)
                 )
             else:
-                # creates a new tread to run the main plugin
-                plugin_thread = PluginThread(plugin)
+                # creates a new tread to run the main plugin, in case
+                # the executor mode is enabled no dedicated thread is
+                # created and the shared executor is used instead
+                if self.executor:
+                    plugin_thread = PluginExecutorThread(plugin, self.executor)
+                else:
+                    plugin_thread = PluginThread(plugin)
 
                 # starts the thread
                 plugin_thread.start()
@@ -4063,6 +4367,20 @@ class PluginManager(object):
         # returns true
         return True
 
+    def _stop_main_loop(self):
+        """
+        Unsets the main loop as active, notifying the main loop (that
+        may be waiting for events with no timeout) so that it returns
+        the control flow to the caller.
+        """
+
+        self.condition.acquire()
+        try:
+            self.main_loop_active = False
+            self.condition.notify_all()
+        finally:
+            self.condition.release()
+
     def _unload_thread_plugins(self):
         """
         Unloads all the thread based plugins, unblocking them
@@ -4083,6 +4401,11 @@ class PluginManager(object):
             plugin_thread.add_event(exit_event)
             plugin_thread.join(DEFAULT_UNLOAD_SYSTEM_TIMEOUT)
 
+        # in case there's a shared executor defined stops it
+        # releasing the complete set of idle worker threads
+        if self.executor:
+            self.executor.shutdown()
+
     def test_plugin_load(self, plugin):
         """
         Tests the given plugin, to check if the loading is possible.
@@ -4573,9 +4896,9 @@ class PluginManager(object):
         # in case the capability does not exist in the
         # capabilities plugins map
         if not capability in self.capabilities_plugins_map:
-            # sets an empty list as value for the capability in
-            # the capabilities plugins map
-            self.capabilities_plugins_map[capability] = []
+            # sets an empty ordered set as value for the capability in
+            # the capabilities plugins map (constant time removal)
+            self.capabilities_plugins_map[capability] = colony.libs.OrderedSet()
 
         # adds the plugin to the capabilities plugins map for the given
         # capability
@@ -4611,7 +4934,7 @@ class PluginManager(object):
         plugins map.
         """
 
-        self.capabilities_plugins_map[capability] = []
+        self.capabilities_plugins_map[capability] = colony.libs.OrderedSet()
 
     def clear_capabilities_plugins_map_for_plugin(self, plugin_id):
         """
@@ -4948,7 +5271,7 @@ class PluginManager(object):
         result = []
 
         # the capability converted to internal capability structure
-        capability_structure = Capability(capability)
+        capability_structure = Capability.intern(capability)
 
         # iterates over all the plugin instances
         for plugin in self.plugin_instances:
@@ -5027,7 +5350,7 @@ class PluginManager(object):
         result = []
 
         # the capability converter to internal capability structure
-        capability_structure = Capability(capability)
+        capability_structure = Capability.intern(capability)
 
         for plugin in self.plugin_instances:
             plugin_capabilities_structure = convert_to_capability_list(
@@ -5074,7 +5397,7 @@ class PluginManager(object):
         result = []
 
         # the capability converter to internal capability structure
-        capability_structure = Capability(capability_allowed)
+        capability_structure = Capability.intern(capability_allowed)
 
         for plugin in self.plugin_instances:
             plugin_capabilities_structure = convert_to_capability_list(
@@ -5106,7 +5429,7 @@ class PluginManager(object):
         result = []
 
         # the capability converter to internal capability structure
-        capability_structure = Capability(capability_allowed)
+        capability_structure = Capability.intern(capability_allowed)
 
         for plugin in self.plugin_instances:
             plugin_capabilities_structure = convert_to_capability_list(
@@ -5228,7 +5551,7 @@ class PluginManager(object):
         result = []
 
         # the capability converter to internal capability structure
-        capability_structure = Capability(capability)
+        capability_structure = Capability.intern(capability)
 
         for plugin in self.plugin_instances:
             plugin_capabilities_structure = convert_to_capability_list(
@@ -5257,7 +5580,7 @@ class PluginManager(object):
         result = []
 
         # the capability converter to internal capability structure
-        capability_structure = Capability(capability)
+        capability_structure = Capability.intern(capability)
 
         for plugin in self.plugin_instances:
             plugin_capabilities_structure = convert_to_capability_list(
@@ -5780,16 +6103,12 @@ class PluginManager(object):
         :param event_args: The arguments to be passed to the handler.
         """
 
-        # the names of the events fired by self
-        event_names_list = legacy.keys(self.event_plugins_fired_loaded_map)
-
-        # retrieves all the events and super events that match the generated event
-        events_or_super_events_list = get_all_events_or_super_events_in_list(
-            event_name, event_names_list
-        )
+        # retrieves the event and all of its super events, these are the
+        # only possible keys of the map that may match the generated event
+        event_and_super_events_list = event_and_super_events(event_name)
 
         # iterates over all the events and super events for notification
-        for event_or_super_event in events_or_super_events_list:
+        for event_or_super_event in event_and_super_events_list:
             if not event_or_super_event in self.event_plugins_fired_loaded_map:
                 continue
 
@@ -7264,11 +7583,15 @@ class OperativeSystemCondition(Condition):
 
 class Capability(object):
     """
-    Class that describes a neutral structure for a capability.
+    Class that describes a neutral (and immutable) structure
+    for a capability.
+
+    Instances should be retrieved using the ``intern`` method
+    so that the parsing of the string value is only done once
+    per capability and the (shared) instance is re-used.
     """
 
-    list_value = []
-    """ The value of the capability described as a list """
+    __slots__ = ("string_value", "tuple_value", "_hash", "_super_values")
 
     def __init__(self, string_value=None):
         """
@@ -7278,50 +7601,83 @@ class Capability(object):
         :param string_value: The capability string value.
         """
 
-        # in case the string value is valid
-        if string_value:
-            # splits the string value to retrieve the list value
-            self.list_value = string_value.split(".")
-        else:
-            # sets the list value as an empty list
-            self.list_value = []
+        # splits the string value to retrieve the tuple value (in
+        # case it's valid) and pre-computes the hash of the tuple
+        tuple_value = tuple(string_value.split(".")) if string_value else ()
+        object.__setattr__(self, "string_value", string_value or "")
+        object.__setattr__(self, "tuple_value", tuple_value)
+        object.__setattr__(self, "_hash", hash(tuple_value))
+        object.__setattr__(self, "_super_values", None)
 
-    def __eq__(self, capability):
-        # retrieves the list value for self
-        list_value_self = self.list_value
+    def __setattr__(self, name, value):
+        raise AttributeError("'%s' is immutable" % self.__class__.__name__)
+
+    def __reduce__(self):
+        # re-creates the (immutable) structure from the string value
+        # as the setting of attributes is not allowed (pickle)
+        return (self.__class__, (self.string_value,))
 
-        # retrieves the list value for capability
-        list_value_capability = capability.list_value
+    def __copy__(self):
+        return self
 
-        # in case some of the lists is invalid
-        if not list_value_self or not list_value_capability:
-            # returns false
+    def __deepcopy__(self, memo):
+        return self
+
+    def __eq__(self, capability):
+        # in case the other value is not a capability the comparison
+        # is delegated, and in case some of the tuples is invalid
+        # returns false (invalid capability)
+        if not isinstance(capability, Capability):
+            return NotImplemented
+        if not self.tuple_value or not capability.tuple_value:
             return False
 
-        # retrieves the length of the list value for self
-        length_self = len(list_value_self)
+        # runs the comparison using the pre-computed hashes
+        # as a shortcut and then the tuples themselves
+        return self._hash == capability._hash and (
+            self.tuple_value == capability.tuple_value
+        )
 
-        # retrieves the length of the list value for capability
-        length_capability = len(list_value_capability)
+    def __ne__(self, capability):
+        # retrieves the not value of the equals method, unless
+        # the comparison is delegated (not implemented)
+        result = self.__eq__(capability)
+        if result is NotImplemented:
+            return result
+        return not result
 
-        # in case the lengths for the list are different
-        if not length_self == length_capability:
-            # returns false
-            return False
+    def __hash__(self):
+        return self._hash
 
-        # iterates over all the lists
-        for index in range(length_self):
-            # compares both values
-            if not list_value_self[index] == list_value_capability[index]:
-                # returns false
-                return False
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.string_value)
 
-        # returns true
-        return True
+    @classmethod
+    def intern(cls, string_value):
+        """
+        Retrieves the shared (interned) capability structure for
+        the provided string value, creating it in case it does not
+        exist in the bounded cache.
 
-    def __ne__(self, capability):
-        # retrieves the not value of the equals method
-        return not self.__eq__(capability)
+        :type string_value: String
+        :param string_value: The capability string value.
+        :rtype: Capability
+        :return: The interned capability structure.
+        """
+
+        return _intern(cls, CAPABILITY_CACHE, string_value)
+
+    @property
+    def list_value(self):
+        """
+        The value of the capability described as a list, kept
+        for compatibility with the previous (list based) structure.
+
+        :rtype: List
+        :return: The value of the capability as a list.
+        """
+
+        return list(self.tuple_value)
 
     def capability_and_super_capabilites(self):
         """
@@ -7331,32 +7687,21 @@ class Capability(object):
         :return: The list of the capability and all super capabilities.
         """
 
-        # creates the capability and super capabilities list
-        capability_and_super_capabilites_list = []
-
-        # retrieves the list value
-        list_value_self = self.list_value
+        return list(self.super_values())
 
-        # start the current capability value
-        curent_capability_value = None
-
-        # iterates over the list of values self
-        for value_self in list_value_self:
-            # in case the current capability value is valied
-            if curent_capability_value:
-                # appends the value self and a dot to the current capability value
-                curent_capability_value += "." + value_self
-            # otherwise (initial iteration)
-            else:
-                # sets the current capability value as the value self
-                curent_capability_value = value_self
+    def super_values(self):
+        """
+        Retrieves the (cached) tuple with the string values of the
+        capability and all of its super capabilities, ordered from
+        the most generic to the most specific one.
 
-            # adds the current capability value to the capability
-            # and super capabilities list
-            capability_and_super_capabilites_list.append(curent_capability_value)
+        :rtype: Tuple
+        :return: The tuple of the capability and all super capabilities.
+        """
 
-        # returns the capability and super capabilities list
-        return capability_and_super_capabilites_list
+        if self._super_values == None:
+            object.__setattr__(self, "_super_values", _super_values(self.tuple_value))
+        return self._super_values
 
     def is_sub_capability(self, capability):
         """
@@ -7368,38 +7713,19 @@ class Capability(object):
         :return: The result of the is sub capability test.
         """
 
-        # retrieves the list value self
-        list_value_self = self.list_value
-
-        # retrieves the list value capability
-        list_value_capability = capability.list_value
-
-        # in case any of the lists is empty or invalid
-        if not list_value_self or not list_value_capability:
-            # returns false
+        # retrieves both tuple values and in case any of them
+        # is empty or invalid returns false
+        tuple_value_self = self.tuple_value
+        tuple_value_capability = capability.tuple_value
+        if not tuple_value_self or not tuple_value_capability:
             return False
 
-        # retrieves the list value self length
-        list_value_self_length = len(list_value_self)
-
-        # retrieves the list value capability length
-        list_value_capability_length = len(list_value_capability)
-
-        # in case the list value capability length is less or
-        # equal than list value self length
-        if list_value_capability_length <= list_value_self_length:
-            # returns false
+        # the capability is a sub capability in case it's strictly
+        # longer and self is a prefix of it (tuple comparison)
+        length = len(tuple_value_self)
+        if len(tuple_value_capability) <= length:
             return False
-
-        # iterates over the list value self range
-        for index in range(list_value_self_length):
-            # in case the values of each list are different
-            if not list_value_self[index] == list_value_capability[index]:
-                # returns false
-                return False
-
-        # returns true
-        return True
+        return tuple_value_capability[:length] == tuple_value_self
 
     def is_capability_or_sub_capability(self, capability):
         """
@@ -7411,23 +7737,28 @@ class Capability(object):
         :return: The result of the is capability or sub capability test.
         """
 
-        # in case the capability is equal or sub capability
-        if self.__eq__(capability) or self.is_sub_capability(capability):
-            # returns true
-            return True
-        # otherwise
-        else:
-            # returns false
+        # retrieves both tuple values and in case any of them
+        # is empty or invalid returns false
+        tuple_value_self = self.tuple_value
+        tuple_value_capability = capability.tuple_value
+        if not tuple_value_self or not tuple_value_capability:
             return False
 
+        # self must be a prefix (or the same) of the capability
+        return tuple_value_capability[: len(tuple_value_self)] == tuple_value_self
+
 
 class Event(object):
     """
-    Class that describes a neutral structure for an event.
+    Class that describes a neutral (and immutable) structure
+    for an event.
+
+    Instances should be retrieved using the ``intern`` method
+    so that the parsing of the string value is only done once
+    per event and the (shared) instance is re-used.
     """
 
-    list_value = []
-    """ The value of the event described as a list """
+    __slots__ = ("string_value", "tuple_value", "_hash", "_super_values")
 
     def __init__(self, string_value=None):
         """
@@ -7437,49 +7768,93 @@ class Event(object):
         :param string_value: The event string value.
         """
 
-        # in case the string value is valid
-        if string_value:
-            # splits the string value to retrieve the list value
-            self.list_value = string_value.split(".")
-        else:
-            # sets the list value as an empty list
-            self.list_value = []
+        # splits the string value to retrieve the tuple value (in
+        # case it's valid) and pre-computes the hash of the tuple
+        tuple_value = tuple(string_value.split(".")) if string_value else ()
+        object.__setattr__(self, "string_value", string_value or "")
+        object.__setattr__(self, "tuple_value", tuple_value)
+        object.__setattr__(self, "_hash", hash(tuple_value))
+        object.__setattr__(self, "_super_values", None)
 
-    def __eq__(self, event):
-        # retrieves the list value for self
-        list_value_self = self.list_value
+    def __setattr__(self, name, value):
+        raise AttributeError("'%s' is immutable" % self.__class__.__name__)
 
-        # retrieves the list value for event
-        list_value_event = event.list_value
+    def __reduce__(self):
+        # re-creates the (immutable) structure from the string value
+        # as the setting of attributes is not allowed (pickle)
+        return (self.__class__, (self.string_value,))
 
-        # in case some of the lists is invalid
-        if not list_value_self or not list_value_event:
-            # returns false
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __eq__(self, event):
+        # in case the other value is not an event the comparison
+        # is delegated, and in case some of the tuples is invalid
+        # returns false (invalid event)
+        if not isinstance(event, Event):
+            return NotImplemented
+        if not self.tuple_value or not event.tuple_value:
             return False
 
-        # retrieves the length of the list value for self
-        length_self = len(list_value_self)
+        # runs the comparison using the pre-computed hashes
+        # as a shortcut and then the tuples themselves
+        return self._hash == event._hash and self.tuple_value == event.tuple_value
 
-        # retrieves the length of the list value for event
-        length_event = len(list_value_event)
+    def __ne__(self, event):
+        result = self.__eq__(event)
+        if result is NotImplemented:
+            return result
+        return not result
 
-        # in case the lengths for the list are different
-        if not length_self == length_event:
-            # returns false
-            return False
+    def __hash__(self):
+        return self._hash
 
-        # iterates over all the lists
-        for index in range(length_self):
-            # compares both values
-            if not list_value_self[index] == list_value_event[index]:
-                # returns false
-                return False
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.string_value)
 
-        # returns true
-        return True
+    @classmethod
+    def intern(cls, string_value):
+        """
+        Retrieves the shared (interned) event structure for
+        the provided string value, creating it in case it does not
+        exist in the bounded cache.
 
-    def __ne__(self, event):
-        return not self.__eq__(event)
+        :type string_value: String
+        :param string_value: The event string value.
+        :rtype: Event
+        :return: The interned event structure.
+        """
+
+        return _intern(cls, EVENT_CACHE, string_value)
+
+    @property
+    def list_value(self):
+        """
+        The value of the event described as a list, kept for
+        compatibility with the previous (list based) structure.
+
+        :rtype: List
+        :return: The value of the event as a list.
+        """
+
+        return list(self.tuple_value)
+
+    def super_values(self):
+        """
+        Retrieves the (cached) tuple with the string values of the
+        event and all of its super events, ordered from the most
+        generic to the most specific one.
+
+        :rtype: Tuple
+        :return: The tuple of the event and all super events.
+        """
+
+        if self._super_values == None:
+            object.__setattr__(self, "_super_values", _super_values(self.tuple_value))
+        return self._super_values
 
     def is_sub_event(self, event):
         """
@@ -7491,37 +7866,19 @@ class Event(object):
         :return: The result of the is sub event test.
         """
 
-        # retrieves the list value self
-        list_value_self = self.list_value
-
-        # retrieves the list value event
-        list_value_event = event.list_value
-
-        # in case any of the lists is empty or invalid
-        if not list_value_self or not list_value_event:
-            # returns false
+        # retrieves both tuple values and in case any of them
+        # is empty or invalid returns false
+        tuple_value_self = self.tuple_value
+        tuple_value_event = event.tuple_value
+        if not tuple_value_self or not tuple_value_event:
             return False
 
-        # retrieves the list value self length
-        list_value_self_length = len(list_value_self)
-
-        # retrieves the list value event length
-        list_value_event_length = len(list_value_event)
-
-        # in case the list value event length is less or
-        # equal than list value self length
-        if list_value_event_length <= list_value_self_length:
+        # the event is a sub event in case it's strictly longer
+        # and self is a prefix of it (tuple comparison)
+        length = len(tuple_value_self)
+        if len(tuple_value_event) <= length:
             return False
-
-        # iterates over the list value self range
-        for index in range(list_value_self_length):
-            # in case the values of each list are different
-            if not list_value_self[index] == list_value_event[index]:
-                # returns false
-                return False
-
-        # returns true
-        return True
+        return tuple_value_event[:length] == tuple_value_self
 
     def is_event_or_sub_event(self, event):
         """
@@ -7533,15 +7890,59 @@ class Event(object):
         :return: The result of the is event or sub event test.
         """
 
-        # in case the capability is equal or sub capability
-        if self.__eq__(event) or self.is_sub_event(event):
-            # returns true
-            return True
-        # otherwise
-        else:
-            # returns false
+        # retrieves both tuple values and in case any of them
+        # is empty or invalid returns false
+        tuple_value_self = self.tuple_value
+        tuple_value_event = event.tuple_value
+        if not tuple_value_self or not tuple_value_event:
             return False
 
+        # self must be a prefix (or the same) of the event
+        return tuple_value_event[: len(tuple_value_self)] == tuple_value_self
+
+
+def _intern(cls, cache, string_value):
+    """
+    Retrieves the interned instance of the provided (structure)
+    class for the string value from the provided cache, the cache
+    is bounded and once the maximum size is reached new structures
+    are created but no longer cached (the interned ones are kept).
+
+    :type cls: Class
+    :param cls: The structure class (capability or event).
+    :type cache: Dictionary
+    :param cache: The map to be used as the cache of instances.
+    :type string_value: String
+    :param string_value: The string value to be interned.
+    :rtype: Object
+    :return: The interned structure instance.
+    """
+
+    structure = cache.get(string_value, None)
+    if structure:
+        return structure
+    structure = cls(string_value)
+    if len(cache) < INTERN_CACHE_SIZE:
+        cache[string_value] = structure
+    return structure
+
+
+def _super_values(tuple_value):
+    """
+    Builds the tuple with the string values of the value described
+    by the provided tuple and all of its super values (prefixes).
+
+    :type tuple_value: Tuple
+    :param tuple_value: The tuple with the segments of the value.
+    :rtype: Tuple
+    :return: The tuple with the string values of the value and all
+    of its super values, from the most generic to the most specific.
+    """
+
+    return tuple(
+        ".".join(tuple_value[: index + 1]) for index in range(len(tuple_value))
+    )
+
 
 def capability_and_super_capabilites(capability):
     """
@@ -7554,10 +7955,9 @@ def capability_and_super_capabilites(capability):
     :return: The list of the capability and all super capabilities.
     """
 
-    # creates the capability structure from the capability string
-    capability_structure = Capability(capability)
-
-    # returns the list of the capability and all super capabilities
+    # retrieves the (interned) capability structure from the capability
+    # string and returns the list of the capability and all super capabilities
+    capability_structure = Capability.intern(capability)
     return capability_structure.capability_and_super_capabilites()
 
 
@@ -7574,12 +7974,12 @@ def is_capability_or_sub_capability(base_capability, capability):
     :return: The result of the test.
     """
 
-    # creates the base capability structure from
-    # the base capability string
-    base_capability_structure = Capability(base_capability)
+    # retrieves the (interned) base capability structure
+    # from the base capability string
+    base_capability_structure = Capability.intern(base_capability)
 
-    # creates the capability structure from the capability string
-    capability_structure = Capability(capability)
+    # retrieves the (interned) capability structure from the capability string
+    capability_structure = Capability.intern(capability)
 
     # returns the result of the is capability or sub capability test
     return base_capability_structure.is_capability_or_sub_capability(
@@ -7600,8 +8000,12 @@ def is_capability_or_sub_capability_in_list(base_capability, capability_list):
     :return: The result of the test.
     """
 
+    base_capability_structure = Capability.intern(base_capability)
+
     for capability in capability_list:
-        is_valid = is_capability_or_sub_capability(base_capability, capability)
+        is_valid = base_capability_structure.is_capability_or_sub_capability(
+            Capability.intern(capability)
+        )
         if not is_valid:
             continue
         return True
@@ -7636,9 +8040,9 @@ def convert_to_capability_list(capability_list):
             # sets the capability values as the capability itself
             capability_value = capability
 
-        # creates the capability structure from the
-        # capability string
-        capability_structure = Capability(capability_value)
+        # retrieves the (interned) capability structure
+        # from the capability string
+        capability_structure = Capability.intern(capability_value)
 
         # adds the capability structure to the list
         # of capability structures
@@ -7661,12 +8065,12 @@ def is_event_or_sub_event(base_event, event):
     :return: The result of the test.
     """
 
-    # creates the base event structure from
-    # the base event string
-    base_event_structure = Event(base_event)
+    # retrieves the (interned) base event structure
+    # from the base event string
+    base_event_structure = Event.intern(base_event)
 
-    # creates the event structure from the event string
-    event_structure = Event(event)
+    # retrieves the (interned) event structure from the event string
+    event_structure = Event.intern(event)
 
     # returns the result of the is event or sub event test
     return base_event_structure.is_event_or_sub_event(event_structure)
@@ -7703,8 +8107,10 @@ def is_event_or_sub_event_in_list(base_event, event_list):
     :return: The result of the test.
     """
 
+    base_event_structure = Event.intern(base_event)
+
     for event in event_list:
-        is_valid = is_event_or_sub_event(base_event, event)
+        is_valid = base_event_structure.is_event_or_sub_event(Event.intern(event))
         if not is_valid:
             continue
         return True
@@ -7725,8 +8131,10 @@ def is_event_or_super_event_in_list(base_event, event_list):
     :return: The result of the test.
     """
 
+    base_event_structure = Event.intern(base_event)
+
     for event in event_list:
-        is_valid = is_event_or_super_event(base_event, event)
+        is_valid = Event.intern(event).is_event_or_sub_event(base_event_structure)
         if not is_valid:
             continue
         return True
@@ -7734,6 +8142,51 @@ def is_event_or_super_event_in_list(base_event, event_list):
     return False
 
 
+def is_event_or_super_event_in_set(base_event, event_set):
+    """
+    Tests if any of the event in the event set is event or
+    super event of the given base event.
+
+    This is the fast version of the list based test, as it
+    runs one set lookup per depth level of the base event.
+
+    :type base_event: String
+    :param base_event: The base event to be used for test.
+    :type event_set: Set
+    :param event_set: The (compiled) set of events to be tested.
+    :rtype: bool
+    :return: The result of the test.
+    """
+
+    if not event_set:
+        return False
+
+    for event in event_and_super_events(base_event):
+        if not event in event_set:
+            continue
+        return True
+
+    return False
+
+
+def event_and_super_events(event):
+    """
+    Retrieves the sequence of the event and all of its super events,
+    ordered from the most generic to the most specific one.
+
+    The sequence is cached in the interned event structure so
+    it's only computed once per event.
+
+    :type event: String
+    :param event: The event to retrieve the sequence of the event
+    and all of its super events.
+    :rtype: Tuple
+    :return: The sequence of the event and all of its super events.
+    """
+
+    return Event.intern(event).super_values()
+
+
 def get_all_events_or_super_events_in_list(base_event, event_list):
     """
     Retrieves all the events or super events in the list.
@@ -7748,15 +8201,17 @@ def get_all_events_or_super_events_in_list(base_event, event_list):
     :return: The filtered list of events.
     """
 
-    # creates the events or super events list
+    # creates the events or super events list and retrieves
+    # the (interned) base event structure
     events_or_super_events_list = []
+    base_event_structure = Event.intern(base_event)
 
     # iterates over all the events in the events list
     for event in event_list:
         # tests if the event is event or super event
         # of the base event and and adds it to the list
         # in case such validation is successful
-        if not is_event_or_super_event(base_event, event):
+        if not Event.intern(event).is_event_or_sub_event(base_event_structure):
             continue
         events_or_super_events_list.append(event)
 
@@ -7780,16 +8235,49 @@ def convert_to_event_list(event_list):
 
     # iterates over all the events in the event list
     for event in event_list:
-        # creates the event structure from the event
+        # retrieves the (interned) event structure from the event
         # string and adds the event structure to the list
         # of event structures
-        event_structure = Event(event)
+        event_structure = Event.intern(event)
         event_list_structure.append(event_structure)
 
     # returns the list of event structures
     return event_list_structure
 
 
+def _process_events(owner, events):
+    """
+    Processes the provided batch of events (drained from the event
+    queue of the owner) one at a time, in case the processing stops
+    in the middle of the batch (exit event or exception) the remaining
+    events are re-queued at the front of the event queue of the owner.
+
+    :type owner: Object
+    :param owner: The owner of the event queue (and condition) that
+    is going to process the events (eg: plugin manager or thread).
+    :type events: List
+    :param events: The batch of events to be processed in order.
+    :rtype: bool
+    :return: If the exit event has been processed (loop terminated).
+    """
+
+    index = 0
+    try:
+        while index < len(events):
+            event = events[index]
+            index += 1
+            if owner.process_event(event):
+                return True
+        return False
+    finally:
+        if index < len(events):
+            owner.condition.acquire()
+            try:
+                owner.event_queue.extendleft(reversed(events[index:]))
+            finally:
+                owner.condition.release()
+
+
 class PluginThread(threading.Thread):
     """
     The plugin thread class, that is used to encapsulate
@@ -7831,7 +8319,7 @@ class PluginThread(threading.Thread):
     plugin method call """
 
     event_queue = []
-    """ The queue of events to be processed """
+    """ The queue (deque) of events to be processed """
 
     condition = None
     """ The plugin thread condition """
@@ -7850,7 +8338,7 @@ class PluginThread(threading.Thread):
         self.daemon = True
         self.condition = threading.Condition()
 
-        self.event_queue = []
+        self.event_queue = collections.deque()
         self.load_complete = False
 
     def set_load_complete(self, value):
@@ -7891,63 +8379,58 @@ class PluginThread(threading.Thread):
         """
 
         if event.event_name == "exit":
-            if (
-                self.load_plugin_thread and self.load_plugin_thread.isAlive()
-                if hasattr(self.load_plugin_thread, "isAlive")
-                else self.load_plugin_thread.is_alive()
-            ):
-                self.load_plugin_thread.join(DEFAULT_UNLOAD_SYSTEM_TIMEOUT)
-            if (
-                self.end_load_plugin_thread and self.end_load_plugin_thread.isAlive()
-                if hasattr(self.end_load_plugin_thread, "isAlive")
-                else self.end_load_plugin_thread.is_alive()
-            ):
-                self.end_load_plugin_thread.join(DEFAULT_UNLOAD_SYSTEM_TIMEOUT)
-            if (
-                self.unload_plugin_thread and self.unload_plugin_thread.isAlive()
-                if hasattr(self.unload_plugin_thread, "isAlive")
-                else self.unload_plugin_thread.is_alive()
+            for plugin_thread in (
+                self.load_plugin_thread,
+                self.end_load_plugin_thread,
+                self.unload_plugin_thread,
+                self.end_unload_plugin_thread,
             ):
-                self.unload_plugin_thread.join(DEFAULT_UNLOAD_SYSTEM_TIMEOUT)
-            if (
-                self.end_unload_plugin_thread
-                and self.end_unload_plugin_thread.isAlive()
-                if hasattr(self.end_unload_plugin_thread, "isAlive")
-                else self.end_unload_plugin_thread.is_alive()
-            ):
-                self.end_unload_plugin_thread.join(DEFAULT_UNLOAD_SYSTEM_TIMEOUT)
+                if not plugin_thread:
+                    continue
+                is_alive = (
+                    plugin_thread.isAlive()
+                    if hasattr(plugin_thread, "isAlive")
+                    else plugin_thread.is_alive()
+                )
+                if not is_alive:
+                    continue
+                plugin_thread.join(DEFAULT_UNLOAD_SYSTEM_TIMEOUT)
             return True
         elif event.event_name == "load":
-            self.load_plugin_thread = PluginEventThread(
-                self.plugin, self.plugin.load_plugin
-            )
-            self.load_plugin_thread.start()
+            self.load_plugin_thread = self.start_method(self.plugin.load_plugin)
             self.load_complete = True
         elif event.event_name == "lazy_load":
-            self.lazy_load_plugin_thread = PluginEventThread(
-                self.plugin, self.plugin.lazy_load_plugin
+            self.lazy_load_plugin_thread = self.start_method(
+                self.plugin.lazy_load_plugin
             )
-            self.lazy_load_plugin_thread.start()
             self.load_complete = True
         elif event.event_name == "end_load":
-            self.end_load_plugin_thread = PluginEventThread(
-                self.plugin, self.plugin.end_load_plugin
-            )
-            self.end_load_plugin_thread.start()
+            self.end_load_plugin_thread = self.start_method(self.plugin.end_load_plugin)
             self.end_load_complete = True
         elif event.event_name == "unload":
-            self.unload_plugin_thread = PluginEventThread(
-                self.plugin, self.plugin.unload_plugin
-            )
-            self.unload_plugin_thread.start()
+            self.unload_plugin_thread = self.start_method(self.plugin.unload_plugin)
             self.unload_complete = True
         elif event.event_name == "end_unload":
-            self.end_unload_plugin_thread = PluginEventThread(
-                self.plugin, self.plugin.end_unload_plugin
+            self.end_unload_plugin_thread = self.start_method(
+                self.plugin.end_unload_plugin
             )
-            self.end_unload_plugin_thread.start()
             self.end_unload_complete = True
 
+    def start_method(self, method):
+        """
+        Starts the running of the provided (lifecycle) method of
+        the plugin in a new plugin event thread.
+
+        :type method: Method
+        :param method: The plugin method to be run.
+        :rtype: Thread
+        :return: The (joinable) thread running the method.
+        """
+
+        plugin_event_thread = PluginEventThread(self.plugin, method)
+        plugin_event_thread.start()
+        return plugin_event_thread
+
     def run(self):
         """
         Starts running the thread, this should be considered
@@ -7956,16 +8439,19 @@ class PluginThread(threading.Thread):
         """
 
         while True:
+            # waits for events to be available in the queue and then
+            # drains all of them to be processed in batch
             self.condition.acquire()
-            while not len(self.event_queue):
-                self.condition.wait()
-
-            event = self.event_queue.pop(0)
-            if self.process_event(event):
+            try:
+                while not self.event_queue:
+                    self.condition.wait()
+                events = list(self.event_queue)
+                self.event_queue.clear()
+            finally:
                 self.condition.release()
-                return
 
-            self.condition.release()
+            if _process_events(self, events):
+                return
 
 
 class PluginEventThread(threading.Thread):
@@ -8001,6 +8487,18 @@ class PluginEventThread(threading.Thread):
         The method to start running the thread.
         """
 
+        self.execute()
+
+    def execute(self):
+        """
+        Executes the method in the current thread, making sure
+        that the ready semaphore is released in case the method
+        does not release it (avoids dead locks).
+
+        This method may be used directly to run the method in
+        a thread other than the event thread (eg: executor).
+        """
+
         if self.plugin.manager.stop_on_cycle_error:
             # retrieves the original semaphore release count
             original_semaphore_release_count = self.plugin.ready_semaphore_release_count
@@ -8042,3 +8540,234 @@ class PluginEventThread(threading.Thread):
 
             # prints log message
             self.plugin.error("No Semaphore released upon thread call")
+
+
+class PluginExecutorThread(PluginThread):
+    """
+    The executor based version of the plugin thread, that
+    does not use a dedicated (operative system) thread and
+    instead processes the events as they are added, running
+    the lifecycle methods of the plugin in a shared executor.
+
+    The serialization of the events per plugin is ensured by
+    the condition of the plugin thread.
+    """
+
+    executor = None
+    """ The shared executor used to run the plugin methods """
+
+    def __init__(self, plugin, executor):
+        """
+        Constructor of the class.
+
+        :type plugin: Plugin
+        :param plugin: The plugin to be used.
+        :type executor: PluginExecutor
+        :param executor: The shared executor to be used.
+        """
+
+        PluginThread.__init__(self, plugin)
+        self.executor = executor
+
+    def start(self):
+        # no dedicated thread is started, the events are
+        # processed as soon as they're added to the thread
+        pass
+
+    def join(self, timeout=None):
+        # nothing to be joined, as the (possible) pending
+        # methods are joined on the processing of the exit
+        pass
+
+    def is_alive(self):
+        return False
+
+    def add_event(self, event):
+        """
+        Processes the provided event immediately, making sure
+        that the events of the plugin are processed in order.
+
+        :type event: QueueEvent
+        :param event: The event to be processed.
+        """
+
+        self.condition.acquire()
+        try:
+            self.process_event(event)
+        finally:
+            self.condition.release()
+
+    def run(self):
+        pass
+
+    def start_method(self, method):
+        plugin_event_thread = PluginEventThread(self.plugin, method)
+        return self.executor.submit(plugin_event_thread.execute)
+
+
+class PluginExecutor(object):
+    """
+    Shared pool of re-usable worker threads to be used for
+    the running of the lifecycle methods of the plugins.
+
+    As the lifecycle methods of thread based plugins may block
+    for an undefined amount of time (eg: main plugins) new workers
+    are created whenever no idle one is available, the size of
+    the executor bounds the number of idle workers kept.
+    """
+
+    size = DEFAULT_EXECUTOR_SIZE
+    """ The maximum number of idle workers to be kept """
+
+    condition = None
+    """ The condition used to control the access to the
+    tasks queue and the idle workers count """
+
+    tasks = None
+    """ The queue (deque) of tasks pending execution """
+
+    workers = None
+    """ The list of the currently running worker threads """
+
+    idle = 0
+    """ The number of idle workers waiting for tasks """
+
+    running = False
+    """ If the executor is running (accepting tasks) """
+
+    def __init__(self, size=DEFAULT_EXECUTOR_SIZE):
+        """
+        Constructor of the class.
+
+        :type size: int
+        :param size: The maximum number of idle workers to be kept.
+        """
+
+        self.size = size
+        self.condition = threading.Condition()
+        self.tasks = collections.deque()
+        self.workers = []
+        self.idle = 0
+        self.running = True
+
+    def submit(self, method, *args):
+        """
+        Submits the provided method for execution in one of the
+        worker threads of the executor, creating a new worker in
+        case there's no idle one available.
+
+        :type method: Function
+        :param method: The method to be executed.
+        :rtype: PluginTask
+        :return: The (joinable) task for the execution.
+        """
+
+        task = PluginTask(method, args)
+
+        self.condition.acquire()
+        try:
+            if not self.running:
+                raise exceptions.PluginSystemException("executor is not running")
+            self.tasks.append(task)
+            if self.idle >= len(self.tasks):
+                self.condition.notify()
+            else:
+                worker = threading.Thread(target=self._work)
+                worker.daemon = True
+                self.workers.append(worker)
+                worker.start()
+        finally:
+            self.condition.release()
+
+        return task
+
+    def shutdown(self):
+        """
+        Shutdowns the executor, the idle workers are released
+        and the busy ones exit after running their current task.
+        """
+
+        self.condition.acquire()
+        try:
+            self.running = False
+            self.condition.notify_all()
+        finally:
+            self.condition.release()
+
+    def _work(self):
+        current = threading.current_thread()
+
+        while True:
+            self.condition.acquire()
+            try:
+                self.idle += 1
+                try:
+                    while not self.tasks and self.running:
+                        self.condition.wait()
+                finally:
+                    self.idle -= 1
+                if not self.tasks:
+                    self.workers.remove(current)
+                    return
+                task = self.tasks.popleft()
+            finally:
+                self.condition.release()
+
+            # runs the task printing the traceback of any exception
+            # that is raised so that the worker remains usable
+            try:
+                task.run()
+            except Exception:
+                traceback.print_exc()
+
+            # in case there are already enough idle workers the
+            # current one is released (bounded number of idle workers)
+            self.condition.acquire()
+            try:
+                if self.idle >= self.size:
+                    self.workers.remove(current)
+                    return
+            finally:
+                self.condition.release()
+
+
+class PluginTask(object):
+    """
+    Task to be run in the plugin executor, provides a thread
+    like interface (join and alive verification).
+    """
+
+    method = None
+    """ The method to be run by the task """
+
+    args = ()
+    """ The arguments to be passed to the method """
+
+    done = None
+    """ The event to be set once the task is complete """
+
+    def __init__(self, method, args=()):
+        """
+        Constructor of the class.
+
+        :type method: Function
+        :param method: The method to be run by the task.
+        :type args: Tuple
+        :param args: The arguments to be passed to the method.
+        """
+
+        self.method = method
+        self.args = args
+        self.done = threading.Event()
+
+    def run(self):
+        try:
+            self.method(*self.args)
+        finally:
+            self.done.set()
+
+    def join(self, timeout=None):
+        self.done.wait(timeout)
+
+    def is_alive(self):
+        return not self.done.is_set()
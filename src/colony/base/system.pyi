@@ -212,6 +212,10 @@ class PluginManager:
     meta_paths: Incomplete
     stop_on_cycle_error: Incomplete
     whitetest: Incomplete
+    modules_cache: dict
+    test_workers: int
+    config_watcher: Incomplete
+    test_report: str | None
     exec_delay: Incomplete
 
     def __init__(
@@ -239,6 +243,7 @@ class PluginManager:
     def generate_replica_id(self): ...
     def generate_diffusion_scope_id(self): ...
     def start_logger(self, log_level=...) -> None: ...
+    def config_changed(self, name: str, value, previous) -> None: ...
     def load_system(
         self,
         mode: Incomplete | None = None,
@@ -247,7 +252,7 @@ class PluginManager:
     ): ...
     def unload_system(self, thread_safe: bool = True) -> None: ...
     def reload_system(self, thread_safe: bool = True) -> None: ...
-    def main_loop(self, timeout: float = 1.0) -> None: ...
+    def main_loop(self, timeout: float | None = None) -> None: ...
     def add_event(self, event) -> None: ...
     def expand_workspace_path(self) -> None: ...
     def create_workspace_path(self) -> None: ...
@@ -299,6 +304,7 @@ class PluginManager:
         type: Incomplete | None = None,
         unloading_type: Incomplete | None = None,
     ) -> bool: ...
+    def _stop_main_loop(self) -> None: ...
     def _unload_thread_plugins(self) -> None: ...
     def test_plugin_load(self, plugin) -> bool: ...
     def test_dependencies(self, plugin) -> bool: ...
@@ -503,6 +509,9 @@ class OperativeSystemCondition(Condition):
 class Capability:
     list_value: Incomplete
     def __init__(self, string_value: Incomplete | None = None) -> None: ...
+    def __reduce__(self): ...
+    def __copy__(self): ...
+    def __deepcopy__(self, memo): ...
     def __eq__(self, capability): ...
     def __ne__(self, capability): ...
     def capability_and_super_capabilites(self): ...
@@ -512,6 +521,9 @@ class Capability:
 class Event:
     list_value: Incomplete
     def __init__(self, string_value: Incomplete | None = None) -> None: ...
+    def __reduce__(self): ...
+    def __copy__(self): ...
+    def __deepcopy__(self, memo): ...
     def __eq__(self, event): ...
     def __ne__(self, event): ...
     def is_sub_event(self, event): ...
@@ -28,7 +28,78 @@ __copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
 __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
+import os
+import sys
+import time
+import pickle
 import unittest
+import traceback
+
+from . import legacy
+
+SLOWEST_COUNT = 10
+""" The number of tests that are going to be listed in the
+summary of the slowest tests of a (timed) test execution """
+
+
+def flatten_suite(suite):
+    """
+    Flattens the provided (possibly nested) test suite into a
+    list containing the individual test case instances.
+
+    :type suite: TestSuite
+    :param suite: The test suite to be flattened.
+    :rtype: List
+    :return: The list of individual test case instances.
+    """
+
+    tests = []
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            tests.extend(flatten_suite(test))
+        else:
+            tests.append(test)
+    return tests
+
+
+def partition_tests(tests, count):
+    """
+    Partitions the provided sequence of tests into (at most) the
+    provided number of chunks, keeping all the tests of the same
+    test case class in the same chunk so that the class level
+    fixtures (eg: setUpClass) run only once.
+
+    The classes are assigned (largest first) to the chunk with the
+    fewest tests, and the original order is kept inside each chunk.
+
+    :type tests: List
+    :param tests: The sequence of test case instances to be
+    partitioned across the chunks.
+    :type count: int
+    :param count: The maximum number of chunks to be created.
+    :rtype: List
+    :return: The list of (non empty) chunks of tests.
+    """
+
+    groups = dict()
+    order = []
+    for index, test in enumerate(tests):
+        group = groups.get(test.__class__, None)
+        if group == None:
+            group = groups[test.__class__] = []
+            order.append(group)
+        group.append((index, test))
+
+    chunks = [[] for _index in range(max(min(count, len(order)), 1))]
+    for group in sorted(order, key=len, reverse=True):
+        chunk = min(chunks, key=len)
+        chunk.extend(group)
+
+    return [
+        [test for _index, test in sorted(chunk, key=lambda item: item[0])]
+        for chunk in chunks
+        if chunk
+    ]
 
 
 class Test(object):
@@ -78,3 +149,327 @@ class Test(object):
 
         runner = runner or unittest.TextTestRunner(verbosity=verbosity)
         return runner.run(suite)
+
+
+class TimedTestResult(unittest.TextTestResult):
+    """
+    Test result class that besides the default behaviour of
+    the text based result stores a record with the outcome and
+    the duration of each of the executed tests.
+
+    The records are simple (picklable) maps so that they may be
+    transferred between processes for aggregation.
+    """
+
+    records = []
+    """ The sequence of records (maps) describing the outcome
+    and duration of each of the tests that have been executed """
+
+    def __init__(self, *args, **kwargs):
+        unittest.TextTestResult.__init__(self, *args, **kwargs)
+        self.records = []
+        self._started = None
+
+    def startTest(self, test):
+        self._started = time.time()
+        unittest.TextTestResult.startTest(self, test)
+
+    def addSuccess(self, test):
+        unittest.TextTestResult.addSuccess(self, test)
+        self._record(test, "success")
+
+    def addError(self, test, err):
+        unittest.TextTestResult.addError(self, test, err)
+        self._record(test, "error", message=self.errors[-1][1])
+
+    def addFailure(self, test, err):
+        unittest.TextTestResult.addFailure(self, test, err)
+        self._record(test, "failure", message=self.failures[-1][1])
+
+    def addSkip(self, test, reason):
+        unittest.TextTestResult.addSkip(self, test, reason)
+        self._record(test, "skipped", message=reason)
+
+    def addExpectedFailure(self, test, err):
+        unittest.TextTestResult.addExpectedFailure(self, test, err)
+        self._record(test, "success")
+
+    def addUnexpectedSuccess(self, test):
+        unittest.TextTestResult.addUnexpectedSuccess(self, test)
+        self._record(test, "failure", message="unexpected success")
+
+    def _record(self, test, status, message=None):
+        duration = time.time() - self._started if self._started else 0.0
+        self.records.append(
+            dict(
+                name=test.id(),
+                status=status,
+                duration=duration,
+                message=message,
+            )
+        )
+
+
+class TestReport(object):
+    """
+    Aggregated report of a test execution, that may have been
+    split across multiple (worker) processes, containing the
+    records of every executed test.
+    """
+
+    records = []
+    """ The sequence of records (maps) with the outcome and the
+    duration of each of the executed tests """
+
+    duration = 0.0
+    """ The (wall clock) duration in seconds of the complete
+    test execution, as seen by the caller """
+
+    workers = 1
+    """ The number of worker processes that have been used for
+    the execution of the tests """
+
+    def __init__(self, records=None, duration=0.0, workers=1):
+        self.records = records or []
+        self.duration = duration
+        self.workers = workers
+
+    def extend(self, records):
+        self.records.extend(records)
+
+    @property
+    def errors(self):
+        return [record for record in self.records if record["status"] == "error"]
+
+    @property
+    def failures(self):
+        return [record for record in self.records if record["status"] == "failure"]
+
+    @property
+    def skipped(self):
+        return [record for record in self.records if record["status"] == "skipped"]
+
+    def was_successful(self):
+        return not self.errors and not self.failures
+
+    def slowest(self, count=SLOWEST_COUNT):
+        records = sorted(
+            self.records, key=lambda record: record["duration"], reverse=True
+        )
+        return records[:count]
+
+    def summary(self, count=SLOWEST_COUNT):
+        """
+        Generates a textual summary of the report, containing the
+        totals of the execution and the list of the slowest tests.
+
+        :type count: int
+        :param count: The maximum number of (slowest) tests to be
+        listed in the summary.
+        :rtype: String
+        :return: The textual summary of the test execution.
+        """
+
+        lines = []
+        lines.append(
+            "Ran %d tests in %.3fs using %d worker(s)"
+            % (len(self.records), self.duration, self.workers)
+        )
+        lines.append(
+            "%d error(s), %d failure(s), %d skipped"
+            % (len(self.errors), len(self.failures), len(self.skipped))
+        )
+        if self.records:
+            lines.append("Slowest tests:")
+        for record in self.slowest(count=count):
+            lines.append("  %.3fs %s" % (record["duration"], record["name"]))
+        return "\n".join(lines)
+
+    def junit(self, name="colony"):
+        """
+        Serializes the report into the JUnit XML format, so that
+        it may be consumed by the continuous integration tools.
+
+        :type name: String
+        :param name: The name of the test suite to be used in the
+        generated XML document.
+        :rtype: String
+        :return: The JUnit XML document describing the report.
+        """
+
+        # imports the XML utilities on demand as they depend on the
+        # (heavy) network modules that are not required otherwise
+        import xml.sax.saxutils
+
+        quote = xml.sax.saxutils.quoteattr
+        escape = xml.sax.saxutils.escape
+
+        lines = ['<?xml version="1.0" encoding="utf-8"?>']
+        lines.append(
+            '<testsuite name=%s tests="%d" errors="%d" failures="%d" skipped="%d" time="%.3f">'
+            % (
+                quote(name),
+                len(self.records),
+                len(self.errors),
+                len(self.failures),
+                len(self.skipped),
+                self.duration,
+            )
+        )
+        for record in self.records:
+            class_name, _sep, test_name = record["name"].rpartition(".")
+            lines.append(
+                '<testcase classname=%s name=%s time="%.3f">'
+                % (quote(class_name), quote(test_name), record["duration"])
+            )
+            status = record["status"]
+            message = record["message"] or ""
+            if status in ("error", "failure"):
+                lines.append(
+                    "<%s message=%s>%s</%s>"
+                    % (
+                        status,
+                        quote(message.strip().split("\n")[-1]),
+                        escape(message),
+                        status,
+                    )
+                )
+            elif status == "skipped":
+                lines.append("<skipped message=%s/>" % quote(message))
+            lines.append("</testcase>")
+        lines.append("</testsuite>")
+        return "\n".join(lines)
+
+
+class ParallelTestRunner(object):
+    """
+    Test runner that partitions the provided tests across a series
+    of worker processes forked from the current one (that should
+    have the complete plugin system already booted).
+
+    The output of each worker is buffered and written to the stream
+    once the worker finishes, and the records of every worker are
+    aggregated into a single report.
+    """
+
+    workers = 1
+    """ The number of worker processes that are going to be
+    forked for the execution of the tests """
+
+    verbosity = 2
+    """ The amount of verbosity (larger more verbose) to be used
+    by the text based runner of each worker """
+
+    stream = None
+    """ The stream to which the output of the workers and the
+    summary of the execution are going to be written """
+
+    def __init__(self, workers=1, verbosity=2, stream=None):
+        self.workers = workers
+        self.verbosity = verbosity
+        self.stream = stream or sys.stderr
+
+    @classmethod
+    def is_available(cls):
+        return hasattr(os, "fork")
+
+    def run(self, tests):
+        """
+        Runs the provided sequence of tests (test case instances)
+        across the worker processes, returning the aggregated
+        report of the execution.
+
+        In case forking is not available in the current platform
+        the tests are executed in the current process.
+
+        :type tests: List
+        :param tests: The sequence of test case instances that
+        are going to be executed.
+        :rtype: TestReport
+        :return: The aggregated report of the test execution.
+        """
+
+        # partitions the tests in chunks of complete test case classes
+        # (so that the class fixtures run once) one chunk per worker
+        workers = self.workers if self.is_available() else 1
+        chunks = partition_tests(tests, workers) or [[]]
+        workers = len(chunks)
+
+        report = TestReport(workers=workers)
+        initial = time.time()
+
+        if workers == 1:
+            output, records = self._run_chunk(chunks[0])
+            self.stream.write(output)
+            report.extend(records)
+        else:
+            # forks one process per chunk of tests
+            processes = [self._fork(chunk) for chunk in chunks]
+
+            # reads the (pickled) payload of each of the workers, note
+            # that each worker only blocks on its own pipe so reading
+            # them in sequence never deadlocks the execution
+            for chunk, (pid, fd) in zip(chunks, processes):
+                data = self._read(fd)
+                os.waitpid(pid, 0)
+                if data:
+                    output, records = pickle.loads(data)
+                else:
+                    output, records = "", self._crashed(chunk, pid)
+                self.stream.write(output)
+                report.extend(records)
+
+        report.duration = time.time() - initial
+        self.stream.write(report.summary() + "\n")
+        self.stream.flush()
+        return report
+
+    def _run_chunk(self, tests):
+        stream = legacy.StringIO()
+        suite = unittest.TestSuite(tests)
+        runner = unittest.TextTestRunner(
+            stream=stream, verbosity=self.verbosity, resultclass=TimedTestResult
+        )
+        result = runner.run(suite)
+        return stream.getvalue(), result.records
+
+    def _fork(self, chunk):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid:
+            os.close(write_fd)
+            return pid, read_fd
+
+        # runs the chunk of tests in the child process and sends the
+        # result back to the parent, exiting immediately afterwards
+        # (without any kind of cleanup) so that the state inherited
+        # from the parent (plugin system) is not touched
+        code = 1
+        try:
+            os.close(read_fd)
+            data = pickle.dumps(self._run_chunk(chunk))
+            while data:
+                count = os.write(write_fd, data)
+                data = data[count:]
+            code = 0
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            os._exit(code)
+
+    def _read(self, fd):
+        buffer = []
+        while True:
+            data = os.read(fd, 65536)
+            if not data:
+                break
+            buffer.append(data)
+        os.close(fd)
+        return b"".join(buffer)
+
+    def _crashed(self, chunk, pid):
+        message = "worker process %d terminated unexpectedly" % pid
+        return [
+            dict(name=test.id(), status="error", duration=0.0, message=message)
+            for test in chunk
+        ]
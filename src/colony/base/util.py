@@ -94,7 +94,15 @@ class QueueEvent(object):
     event_args = []
     """ The arguments of the event """
 
-    def __init__(self, event_name, event_args=[]):
+    callback = None
+    """ The (optional) callback to be called with the result
+    and the exception (if any) once the event is processed """
+
+    timestamp = None
+    """ The timestamp of the creation of the event, used
+    for the measurement of the dispatch latency """
+
+    def __init__(self, event_name, event_args=[], callback=None):
         """
         Constructor of the class.
 
@@ -102,10 +110,15 @@ class QueueEvent(object):
         :param event_name: The name of the event.
         :type event_args: List
         :param event_args: The arguments of the event.
+        :type callback: Function
+        :param callback: The callback to be called with the result
+        and the exception of the processing of the event.
         """
 
         self.event_name = event_name
         self.event_args = event_args
+        self.callback = callback
+        self.timestamp = time.time()
 
 
 class Plugins(object):
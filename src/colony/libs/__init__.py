@@ -25,207 +25,294 @@ __copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
 __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
-from . import aes_util
-from . import bank_util
-from . import barcode_util
-from . import cache_util
-from . import call_util
-from . import control_util
-from . import country_util
-from . import crypt_util
-from . import encode_util
-from . import file_util
-from . import gtin_util
-from . import host_util
-from . import import_util
-from . import lazy_util
-from . import list_util
-from . import logging_util
-from . import map_util
-from . import math_util
-from . import number_util
-from . import object_util
-from . import observer_util
-from . import os_util
-from . import path_util
-from . import protection_util
-from . import quote_util
-from . import round_util
-from . import scheduling_util
-from . import size_util
-from . import stack_util
-from . import string_buffer_util
-from . import string_util
-from . import structures_util
-from . import test_util
-from . import time_util
-from . import update_thread_util
-from . import verify_util
-from . import version_util
-from . import visitor_util
-from . import xml_util
-
-from .aes_util import AesCipher
-from .barcode_util import encode_2_of_5, encode_code_128, encode_code_39
-from .cache_util import DataCacheMap
-from .call_util import execute_retries, call_safe
-from .control_util import (
-    calculate_tax_number_control_value,
-    calculate_id_number_control_value,
-)
-from .country_util import COUNTRIES, country_get
-from .crypt_util import (
-    password_crypt,
-    password_match,
-    password_strength,
-    md5_crypt,
-    generate_hash_digest_map,
-)
-from .encode_util import encode_two_complement_string, decode_two_complement_string
-from .file_util import (
-    FileRotator,
-    FileContext,
-    TransactionContext,
-    FileImmediateContext,
-    FileTransactionContext,
-)
-from .host_util import (
-    get_hostname,
-    get_hostname_local,
-    get_address_ip4,
-    get_address_ip4_force,
-    get_address_ip4_all,
-    get_address_ip6,
-    get_address_ip6_force,
-    get_address_ip6_all,
-    get_addresses_ip4,
-    get_addresses_ip6,
-    get_addresses_family,
-    get_address_tuples,
-    ip4_address_from_network,
-    ip4_address_to_network,
-    ip6_address_from_network,
-    ip6_address_to_network,
-)
-from .import_util import reload_import
-from .lazy_util import LazyClass, LazyIteratorClass, is_lazy, Lazy, LazyIterator
-from .list_util import list_intersect, list_extend, list_no_duplicates
-from .logging_util import (
-    getLogger,
-    getLevelName,
-    getLevelInt,
-    DummyLogger,
-    StreamHandler,
-    Formatter,
-)
-from .map_util import (
-    map_clean,
-    map_get,
-    map_copy,
-    map_copy_deep,
-    map_duplicate,
-    map_remove,
-    map_extend,
-    map_flatten,
-    map_check_parameters,
-    map_get_value_cast,
-    map_get_values,
-    map_output,
-    map_normalize,
-)
-from .math_util import (
-    ceil_integer,
-    greatest_common_divisor,
-    fast_exponentiation,
-    item_set_total,
-    item_set_percentage,
-)
-from .number_util import get_number_length, get_digit, to_fixed
-from .object_util import (
-    object_attribute_names,
-    object_attribute_values,
-    object_flatten,
-    object_print_list,
-    object_print,
-)
-from .observer_util import (
-    unique,
-    notify,
-    message,
-    action,
-    progress,
-    register_g,
-    unregister_g,
-    notify_g,
-    notify_b,
-    notify_kafka,
-    kafka_config,
-)
-from .os_util import kill_process
-from .path_util import (
-    SEPARATOR,
-    normalize_path,
-    align_path,
-    copy_directory,
-    copy_link,
-    copy_file,
-    remove_directory,
-    link,
-    link_copy,
-    ensure_file_path,
-    is_parent_path,
-    relative_path,
-)
-from .protection_util import public, Protected
-from .quote_util import quote, quote_plus, unquote, unquote_plus, url_encode
-from .round_util import roundi, rounds, roundt, round_apply, round_unapply, round_is_new
-from .scheduling_util import SCHEDULING_MAX, Scheduler
-from .size_util import size_round_unit
-from .stack_util import get_instance_module_directory, get_call_module_directory
-from .string_buffer_util import StringBuffer
-from .string_util import (
-    xor_string_value,
-    to_underscore,
-    to_camelcase,
-    pluralize,
-    capitalize_all,
-    join,
-)
-from .structures_util import (
-    Decimal,
-    JournaledList,
-    OrderedMap,
-    OrderedMapIterator,
-    MultipleValueMap,
-    FormatTuple,
-    FileReference,
-    is_dictionary,
-)
-from .test_util import ColonyTestCase
-from .time_util import (
-    SIMPLE_VALUE,
-    BASIC_VALUE,
-    EXTENDED_VALUE,
-    EXTENDED_SIMPLE_VALUE,
-    MINIMIZE_MULTIPLE,
-    MINIMIZE_UNIQUE,
-    format_seconds_smart,
-    format_seconds,
-    timestamp_datetime,
-)
-from .update_thread_util import UpdateThread
-from .verify_util import (
-    verify,
-    verify_equal,
-    verify_not_equal,
-    verify_type,
-    verify_many,
+import sys
+import importlib
+
+LAZY_IMPORT = sys.version_info >= (3, 7)
+""" If the sub modules of the package should be loaded on demand
+(lazily) using the module level attribute retrieval (PEP 562), this
+is only available for python 3.7+ and so for older versions the
+complete set of sub modules is imported eagerly """
+
+LAZY_MODULES = (
+    "aes_util",
+    "bank_util",
+    "barcode_util",
+    "cache_util",
+    "call_util",
+    "control_util",
+    "country_util",
+    "crypt_util",
+    "encode_util",
+    "file_util",
+    "gtin_util",
+    "host_util",
+    "import_util",
+    "lazy_util",
+    "list_util",
+    "logging_util",
+    "map_util",
+    "math_util",
+    "number_util",
+    "object_util",
+    "observer_util",
+    "os_util",
+    "path_util",
+    "protection_util",
+    "quote_util",
+    "round_util",
+    "scheduling_util",
+    "size_util",
+    "stack_util",
+    "string_buffer_util",
+    "string_util",
+    "structures_util",
+    "test_util",
+    "time_util",
+    "update_thread_util",
+    "verify_util",
+    "version_util",
+    "visitor_util",
+    "xml_util",
 )
-from .version_util import version_cmp, version_is_concrete
-from .visitor_util import visit, dispatch_visit
-from .xml_util import xml_to_dict, dict_to_xml
+""" The names of the sub modules of the package that are going
+to be exposed (and loaded on demand) by the package """
+
+LAZY_NAMES = {
+    "AesCipher": ("aes_util", "AesCipher"),
+    "encode_2_of_5": ("barcode_util", "encode_2_of_5"),
+    "encode_code_128": ("barcode_util", "encode_code_128"),
+    "encode_code_39": ("barcode_util", "encode_code_39"),
+    "encode_2_of_5_many": ("barcode_util", "encode_2_of_5_many"),
+    "encode_code_128_many": ("barcode_util", "encode_code_128_many"),
+    "encode_code_39_many": ("barcode_util", "encode_code_39_many"),
+    "DataCacheMap": ("cache_util", "DataCacheMap"),
+    "execute_retries": ("call_util", "execute_retries"),
+    "call_safe": ("call_util", "call_safe"),
+    "calculate_tax_number_control_value": (
+        "control_util",
+        "calculate_tax_number_control_value",
+    ),
+    "calculate_id_number_control_value": (
+        "control_util",
+        "calculate_id_number_control_value",
+    ),
+    "COUNTRIES": ("country_util", "COUNTRIES"),
+    "country_get": ("country_util", "country_get"),
+    "country_get_many": ("country_util", "country_get_many"),
+    "country_complete": ("country_util", "country_complete"),
+    "CountryIndex": ("country_util", "CountryIndex"),
+    "password_crypt": ("crypt_util", "password_crypt"),
+    "password_crypt_many": ("crypt_util", "password_crypt_many"),
+    "password_match": ("crypt_util", "password_match"),
+    "password_match_many": ("crypt_util", "password_match_many"),
+    "password_strength": ("crypt_util", "password_strength"),
+    "md5_crypt": ("crypt_util", "md5_crypt"),
+    "generate_hash_digest_map": ("crypt_util", "generate_hash_digest_map"),
+    "generate_hash_digest_map_many": ("crypt_util", "generate_hash_digest_map_many"),
+    "encode_two_complement_string": ("encode_util", "encode_two_complement_string"),
+    "decode_two_complement_string": ("encode_util", "decode_two_complement_string"),
+    "encode_two_complement_many": ("encode_util", "encode_two_complement_many"),
+    "decode_two_complement_many": ("encode_util", "decode_two_complement_many"),
+    "FileRotator": ("file_util", "FileRotator"),
+    "FileContext": ("file_util", "FileContext"),
+    "TransactionContext": ("file_util", "TransactionContext"),
+    "FileImmediateContext": ("file_util", "FileImmediateContext"),
+    "FileTransactionContext": ("file_util", "FileTransactionContext"),
+    "PathTrie": ("file_util", "PathTrie"),
+    "get_hostname": ("host_util", "get_hostname"),
+    "get_hostname_local": ("host_util", "get_hostname_local"),
+    "get_address_ip4": ("host_util", "get_address_ip4"),
+    "get_address_ip4_force": ("host_util", "get_address_ip4_force"),
+    "get_address_ip4_all": ("host_util", "get_address_ip4_all"),
+    "get_address_ip6": ("host_util", "get_address_ip6"),
+    "get_address_ip6_force": ("host_util", "get_address_ip6_force"),
+    "get_address_ip6_all": ("host_util", "get_address_ip6_all"),
+    "get_addresses_ip4": ("host_util", "get_addresses_ip4"),
+    "get_addresses_ip6": ("host_util", "get_addresses_ip6"),
+    "get_addresses_family": ("host_util", "get_addresses_family"),
+    "get_address_tuples": ("host_util", "get_address_tuples"),
+    "ip4_address_from_network": ("host_util", "ip4_address_from_network"),
+    "ip4_address_to_network": ("host_util", "ip4_address_to_network"),
+    "ip6_address_from_network": ("host_util", "ip6_address_from_network"),
+    "ip6_address_to_network": ("host_util", "ip6_address_to_network"),
+    "reload_import": ("import_util", "reload_import"),
+    "LazyClass": ("lazy_util", "LazyClass"),
+    "LazyIteratorClass": ("lazy_util", "LazyIteratorClass"),
+    "is_lazy": ("lazy_util", "is_lazy"),
+    "Lazy": ("lazy_util", "Lazy"),
+    "LazyIterator": ("lazy_util", "LazyIterator"),
+    "list_intersect": ("list_util", "list_intersect"),
+    "list_extend": ("list_util", "list_extend"),
+    "list_exclude": ("list_util", "list_exclude"),
+    "list_no_duplicates": ("list_util", "list_no_duplicates"),
+    "getLogger": ("logging_util", "getLogger"),
+    "getLevelName": ("logging_util", "getLevelName"),
+    "getLevelInt": ("logging_util", "getLevelInt"),
+    "DummyLogger": ("logging_util", "DummyLogger"),
+    "StreamHandler": ("logging_util", "StreamHandler"),
+    "Formatter": ("logging_util", "Formatter"),
+    "map_clean": ("map_util", "map_clean"),
+    "map_get": ("map_util", "map_get"),
+    "map_copy": ("map_util", "map_copy"),
+    "map_copy_deep": ("map_util", "map_copy_deep"),
+    "map_duplicate": ("map_util", "map_duplicate"),
+    "map_remove": ("map_util", "map_remove"),
+    "map_extend": ("map_util", "map_extend"),
+    "map_flatten": ("map_util", "map_flatten"),
+    "map_check_parameters": ("map_util", "map_check_parameters"),
+    "map_get_value_cast": ("map_util", "map_get_value_cast"),
+    "map_get_values": ("map_util", "map_get_values"),
+    "map_output": ("map_util", "map_output"),
+    "map_normalize": ("map_util", "map_normalize"),
+    "PersistentMap": ("map_util", "PersistentMap"),
+    "ceil_integer": ("math_util", "ceil_integer"),
+    "greatest_common_divisor": ("math_util", "greatest_common_divisor"),
+    "fast_exponentiation": ("math_util", "fast_exponentiation"),
+    "item_set_total": ("math_util", "item_set_total"),
+    "item_set_percentage": ("math_util", "item_set_percentage"),
+    "get_number_length": ("number_util", "get_number_length"),
+    "get_digit": ("number_util", "get_digit"),
+    "to_fixed": ("number_util", "to_fixed"),
+    "object_attribute_names": ("object_util", "object_attribute_names"),
+    "object_attribute_values": ("object_util", "object_attribute_values"),
+    "object_flatten": ("object_util", "object_flatten"),
+    "object_flatten_compile": ("object_util", "object_flatten_compile"),
+    "FlatteningPlan": ("object_util", "FlatteningPlan"),
+    "object_print_list": ("object_util", "object_print_list"),
+    "object_print": ("object_util", "object_print"),
+    "unique": ("observer_util", "unique"),
+    "notify": ("observer_util", "notify"),
+    "message": ("observer_util", "message"),
+    "action": ("observer_util", "action"),
+    "progress": ("observer_util", "progress"),
+    "register_g": ("observer_util", "register_g"),
+    "unregister_g": ("observer_util", "unregister_g"),
+    "notify_g": ("observer_util", "notify_g"),
+    "notify_b": ("observer_util", "notify_b"),
+    "notify_kafka": ("observer_util", "notify_kafka"),
+    "kafka_config": ("observer_util", "kafka_config"),
+    "notify_logstash": ("observer_util", "notify_logstash"),
+    "logstash_api": ("observer_util", "logstash_api"),
+    "kill_process": ("os_util", "kill_process"),
+    "SEPARATOR": ("path_util", "SEPARATOR"),
+    "normalize_path": ("path_util", "normalize_path"),
+    "align_path": ("path_util", "align_path"),
+    "copy_directory": ("path_util", "copy_directory"),
+    "copy_link": ("path_util", "copy_link"),
+    "copy_file": ("path_util", "copy_file"),
+    "remove_directory": ("path_util", "remove_directory"),
+    "link": ("path_util", "link"),
+    "link_copy": ("path_util", "link_copy"),
+    "ensure_file_path": ("path_util", "ensure_file_path"),
+    "is_parent_path": ("path_util", "is_parent_path"),
+    "relative_path": ("path_util", "relative_path"),
+    "public": ("protection_util", "public"),
+    "Protected": ("protection_util", "Protected"),
+    "quote": ("quote_util", "quote"),
+    "quote_plus": ("quote_util", "quote_plus"),
+    "unquote": ("quote_util", "unquote"),
+    "unquote_plus": ("quote_util", "unquote_plus"),
+    "url_encode": ("quote_util", "url_encode"),
+    "quote_many": ("quote_util", "quote_many"),
+    "UrlDecoder": ("quote_util", "UrlDecoder"),
+    "url_decode": ("quote_util", "url_decode"),
+    "roundi": ("round_util", "roundi"),
+    "rounds": ("round_util", "rounds"),
+    "roundt": ("round_util", "roundt"),
+    "round_apply": ("round_util", "round_apply"),
+    "round_unapply": ("round_util", "round_unapply"),
+    "round_is_new": ("round_util", "round_is_new"),
+    "SCHEDULING_MAX": ("scheduling_util", "SCHEDULING_MAX"),
+    "Scheduler": ("scheduling_util", "Scheduler"),
+    "size_round_unit": ("size_util", "size_round_unit"),
+    "get_instance_module_directory": ("stack_util", "get_instance_module_directory"),
+    "get_call_module_directory": ("stack_util", "get_call_module_directory"),
+    "StringBuffer": ("string_buffer_util", "StringBuffer"),
+    "xor_string_value": ("string_util", "xor_string_value"),
+    "to_underscore": ("string_util", "to_underscore"),
+    "to_camelcase": ("string_util", "to_camelcase"),
+    "pluralize": ("string_util", "pluralize"),
+    "capitalize_all": ("string_util", "capitalize_all"),
+    "join": ("string_util", "join"),
+    "Decimal": ("structures_util", "Decimal"),
+    "JournaledList": ("structures_util", "JournaledList"),
+    "OrderedMap": ("structures_util", "OrderedMap"),
+    "OrderedMapIterator": ("structures_util", "OrderedMapIterator"),
+    "MultipleValueMap": ("structures_util", "MultipleValueMap"),
+    "OrderedSet": ("structures_util", "OrderedSet"),
+    "FormatTuple": ("structures_util", "FormatTuple"),
+    "FileReference": ("structures_util", "FileReference"),
+    "is_dictionary": ("structures_util", "is_dictionary"),
+    "ColonyTestCase": ("test_util", "ColonyTestCase"),
+    "SIMPLE_VALUE": ("time_util", "SIMPLE_VALUE"),
+    "BASIC_VALUE": ("time_util", "BASIC_VALUE"),
+    "EXTENDED_VALUE": ("time_util", "EXTENDED_VALUE"),
+    "EXTENDED_SIMPLE_VALUE": ("time_util", "EXTENDED_SIMPLE_VALUE"),
+    "MINIMIZE_MULTIPLE": ("time_util", "MINIMIZE_MULTIPLE"),
+    "MINIMIZE_UNIQUE": ("time_util", "MINIMIZE_UNIQUE"),
+    "format_seconds_smart": ("time_util", "format_seconds_smart"),
+    "format_seconds": ("time_util", "format_seconds"),
+    "timestamp_datetime": ("time_util", "timestamp_datetime"),
+    "UpdateThread": ("update_thread_util", "UpdateThread"),
+    "verify": ("verify_util", "verify"),
+    "verify_equal": ("verify_util", "verify_equal"),
+    "verify_not_equal": ("verify_util", "verify_not_equal"),
+    "verify_type": ("verify_util", "verify_type"),
+    "verify_many": ("verify_util", "verify_many"),
+    "version_cmp": ("version_util", "version_cmp"),
+    "version_is_concrete": ("version_util", "version_is_concrete"),
+    "visit": ("visitor_util", "visit"),
+    "dispatch_visit": ("visitor_util", "dispatch_visit"),
+    "xml_to_dict": ("xml_util", "xml_to_dict"),
+    "dict_to_xml": ("xml_util", "dict_to_xml"),
+    "xml_to_dict_iter": ("xml_util", "xml_to_dict_iter"),
+    "dict_to_xml_iter": ("xml_util", "dict_to_xml_iter"),
+    "calculate_control_value_bank": ("bank_util", "calculate_control_value"),
+    "calculate_control_value_gtin": ("gtin_util", "calculate_control_value"),
+}
+""" The table associating the public names exported by the package
+with the sub module and attribute that define them, used to load the
+sub modules on demand, this table is maintained by hand and must list
+every public function and class of the sub modules (the completeness
+is verified by the test suite) """
+
+__all__ = list(LAZY_MODULES) + list(LAZY_NAMES)
+""" The complete set of public names of the package, note that
+importing all of them (eg: star import) loads every sub module """
+
+
+def __getattr__(name):
+    """
+    Retrieves the attribute with the provided name from the
+    package, loading the sub module that defines it on demand
+    and caching the value in the package for further access.
+
+    :type name: String
+    :param name: The name of the attribute to be retrieved.
+    :rtype: Object
+    :return: The value of the attribute (either a sub module
+    or one of the names exported by the sub modules).
+    """
+
+    if name in LAZY_MODULES:
+        value = importlib.import_module("." + name, __name__)
+    elif name in LAZY_NAMES:
+        module_name, attribute_name = LAZY_NAMES[name]
+        module = importlib.import_module("." + module_name, __name__)
+        value = getattr(module, attribute_name)
+    else:
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
-from .bank_util import calculate_control_value as calculate_control_value_bank
-from .gtin_util import calculate_control_value as calculate_control_value_gtin
+if not LAZY_IMPORT:
+    for _name in __all__:
+        __getattr__(_name)
 
 from .import_util import __import__
@@ -29,11 +29,15 @@ __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
 import os
+import hmac
+import struct
+import hashlib
 
 from colony.base import legacy, exceptions
 
 try:
     import Crypto.Cipher.AES
+    import Crypto.Util.Counter
 except ImportError:
     Crypto = None
 
@@ -41,6 +45,31 @@ BLOCK_SIZE = 16
 """ The block size to be used for the post operation
 should not be too small or security issues may arise """
 
+STREAM_MAGIC = b"CAE1"
+""" The magic value that prefixes the streams encrypted
+using the streaming (authenticated) mode, includes version """
+
+STREAM_NONCE_SIZE = 8
+""" The size in bytes of the random nonce of the stream, used
+as prefix of the (64 bit) counter of the CTR mode """
+
+STREAM_CHUNK_SIZE = 65536
+""" The default size in bytes of the chunks read from the
+source file-like objects in the streaming mode """
+
+STREAM_MAX_CHUNK_SIZE = 16777216
+""" The maximum size in bytes of the chunks (frames) of the
+stream, bounds the memory used while decrypting a stream
+as the (unauthenticated) sizes are read before the tags """
+
+STREAM_TAG_SIZE = 32
+""" The size in bytes of the HMAC-SHA256 tag that authenticates
+each of the chunks (frames) of the stream """
+
+STREAM_FINAL = 0x80000000
+""" The flag set in the length of the last frame of the stream,
+authenticated so that truncation of the stream is detected """
+
 
 class AesCipher(object):
     """
@@ -77,6 +106,7 @@ class AesCipher(object):
 
         self.key = key or os.urandom(block_size)
         self.block_size = block_size
+        self._cipher = None
 
     def encrypt(self, raw):
         """
@@ -95,7 +125,7 @@ class AesCipher(object):
             raise exceptions.OperationalError(message="PyCrypto is not installed")
 
         raw = self.pad(raw)
-        cipher = Crypto.Cipher.AES.new(self.key, Crypto.Cipher.AES.MODE_ECB)
+        cipher = self._get_cipher()
         return cipher.encrypt(raw)
 
     def decrypt(self, encoded):
@@ -115,10 +145,131 @@ class AesCipher(object):
         if not Crypto:
             raise exceptions.OperationalError(message="PyCrypto is not installed")
 
-        cipher = Crypto.Cipher.AES.new(self.key, Crypto.Cipher.AES.MODE_ECB)
+        cipher = self._get_cipher()
         decoded = cipher.decrypt(encoded)
         return self.unpad(decoded)
 
+    def encrypt_stream(self, source, sink, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Encrypts the contents of the provided source writing the
+        result to the sink, using constant memory (chunk based).
+
+        The authenticated mode used is AES in CTR mode (with the
+        cipher re-used across chunks) and HMAC-SHA256 tags for each
+        chunk (encrypt-then-mac), the last chunk is flagged so that
+        the truncation of the stream is detected.
+
+        :type source: File/Iterable
+        :param source: The file-like object (with read) or the iterable
+        of byte chunks containing the raw contents.
+        :type sink: File/Function
+        :param sink: The file-like object (with write) or the function
+        that is going to receive the encrypted chunks.
+        :type chunk_size: int
+        :param chunk_size: The maximum size of the chunks (frames)
+        of the stream, written to the header of the stream and bounded
+        by the maximum chunk size of the streaming mode.
+        :rtype: int
+        :return: The number of raw bytes that have been encrypted.
+        """
+
+        if not Crypto:
+            raise exceptions.OperationalError(message="PyCrypto is not installed")
+        if chunk_size < 1 or chunk_size > STREAM_MAX_CHUNK_SIZE:
+            raise exceptions.OperationalError(message="Invalid stream chunk size")
+
+        write = sink.write if hasattr(sink, "write") else sink
+        nonce = os.urandom(STREAM_NONCE_SIZE)
+        header = STREAM_MAGIC + nonce + struct.pack(">I", chunk_size)
+        cipher, mac_key = self._get_stream(nonce)
+        write(header)
+
+        # iterates over the chunks of the source with a look-ahead of
+        # one chunk so that the last one is properly flagged as final
+        count = 0
+        index = 0
+        chunks = self._chunks(source, chunk_size)
+        chunk = next(chunks, None)
+        while True:
+            next_chunk = next(chunks, None)
+            chunk = chunk or b""
+            size = len(chunk) | (STREAM_FINAL if next_chunk == None else 0)
+            prefix = struct.pack(">I", size)
+            encrypted = cipher.encrypt(chunk)
+            tag = self._tag(mac_key, header, index, prefix, encrypted)
+            write(prefix + encrypted + tag)
+            count += len(chunk)
+            index += 1
+            if next_chunk == None:
+                break
+            chunk = next_chunk
+
+        return count
+
+    def decrypt_stream(self, source, sink):
+        """
+        Decrypts the contents of the provided source (encrypted
+        using the streaming mode) writing the result to the sink.
+
+        Each chunk is authenticated before being written to the sink
+        and in case the authentication fails (or the stream is
+        truncated) a security error is raised.
+
+        :type source: File/Iterable
+        :param source: The file-like object (with read) or the iterable
+        of byte chunks containing the encrypted contents.
+        :type sink: File/Function
+        :param sink: The file-like object (with write) or the function
+        that is going to receive the decrypted chunks.
+        :rtype: int
+        :return: The number of raw bytes that have been decrypted.
+        """
+
+        if not Crypto:
+            raise exceptions.OperationalError(message="PyCrypto is not installed")
+
+        write = sink.write if hasattr(sink, "write") else sink
+        read = self._reader(source)
+
+        # reads the header of the stream and validates the chunk size
+        # (not yet authenticated) against the maximum one, so that a
+        # forged header is not able to force large reads into memory
+        magic_size = len(STREAM_MAGIC)
+        header = read(magic_size + STREAM_NONCE_SIZE + 4)
+        if not len(header) == magic_size + STREAM_NONCE_SIZE + 4:
+            raise exceptions.SecurityError("truncated stream")
+        if not header[:magic_size] == STREAM_MAGIC:
+            raise exceptions.SecurityError("invalid stream header")
+        (chunk_size,) = struct.unpack(">I", header[-4:])
+        if chunk_size < 1 or chunk_size > STREAM_MAX_CHUNK_SIZE:
+            raise exceptions.SecurityError("invalid stream chunk size")
+        cipher, mac_key = self._get_stream(header[magic_size:-4])
+
+        count = 0
+        index = 0
+        while True:
+            prefix = read(4)
+            if not len(prefix) == 4:
+                raise exceptions.SecurityError("truncated stream")
+            (size,) = struct.unpack(">I", prefix)
+            length = size & ~STREAM_FINAL
+            if length > chunk_size:
+                raise exceptions.SecurityError("invalid stream frame size")
+            encrypted = read(length)
+            tag = read(STREAM_TAG_SIZE)
+            if not len(encrypted) == length or not len(tag) == STREAM_TAG_SIZE:
+                raise exceptions.SecurityError("truncated stream")
+            expected = self._tag(mac_key, header, index, prefix, encrypted)
+            if not hmac.compare_digest(tag, expected):
+                raise exceptions.SecurityError("invalid stream authentication tag")
+            write(cipher.decrypt(encrypted))
+            count += length
+            index += 1
+            if size & STREAM_FINAL:
+                break
+
+        return count
+
     def pad(self, value):
         """
         Adds the PKCS #5 padding to the provided value
@@ -150,7 +301,7 @@ class AesCipher(object):
         """
 
         last = value[-1]
-        pad_size = ord(last)
+        pad_size = legacy.ord(last)
         return value[:-pad_size]
 
     def get_key(self):
@@ -182,3 +333,74 @@ class AesCipher(object):
         """
 
         return self.block_size
+
+    def _get_cipher(self):
+        if self._cipher:
+            return self._cipher
+        self._cipher = Crypto.Cipher.AES.new(self.key, Crypto.Cipher.AES.MODE_ECB)
+        return self._cipher
+
+    def _get_stream(self, nonce):
+        # derives both the encryption and the authentication keys
+        # from the (symmetric) key so that they are independent
+        enc_key = hmac.new(self.key, b"colony.aes.enc", hashlib.sha256).digest()
+        mac_key = hmac.new(self.key, b"colony.aes.mac", hashlib.sha256).digest()
+        enc_key = enc_key[: len(self.key)]
+
+        # creates the CTR mode cipher using the nonce as prefix of
+        # the counter, this cipher is re-used for the complete stream
+        counter = Crypto.Util.Counter.new(64, prefix=nonce, initial_value=0)
+        cipher = Crypto.Cipher.AES.new(
+            enc_key, Crypto.Cipher.AES.MODE_CTR, counter=counter
+        )
+        return cipher, mac_key
+
+    def _tag(self, mac_key, header, index, prefix, encrypted):
+        mac = hmac.new(mac_key, header, hashlib.sha256)
+        mac.update(struct.pack(">Q", index))
+        mac.update(prefix)
+        mac.update(encrypted)
+        return mac.digest()
+
+    def _chunks(self, source, chunk_size):
+        if hasattr(source, "read"):
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        else:
+            for chunk in source:
+                for index in range(0, len(chunk), chunk_size):
+                    yield chunk[index : index + chunk_size]
+
+    def _reader(self, source):
+        # in case the source is a file-like object its read method
+        # is used directly, otherwise creates a reader that buffers
+        # the chunks of the iterable to provide exact sized reads
+        if hasattr(source, "read"):
+            return source.read
+
+        # keeps the current chunk and the offset into it, so that each
+        # read only copies the requested bytes (and never the remaining
+        # buffer) keeping the complete read process linear
+        chunks = iter(source)
+        state = [b"", 0]
+
+        def read(size):
+            parts = []
+            while size > 0:
+                chunk, offset = state
+                if offset == len(chunk):
+                    chunk = next(chunks, None)
+                    if chunk == None:
+                        break
+                    state[0], state[1] = chunk, 0
+                    continue
+                part = chunk[offset : offset + size]
+                state[1] = offset + len(part)
+                size -= len(part)
+                parts.append(part)
+            return b"".join(parts)
+
+        return read
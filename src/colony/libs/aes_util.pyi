@@ -1,4 +1,12 @@
+from typing import Callable, IO, Iterable
+
 BLOCK_SIZE: int
+STREAM_MAGIC: bytes
+STREAM_NONCE_SIZE: int
+STREAM_CHUNK_SIZE: int
+STREAM_MAX_CHUNK_SIZE: int
+STREAM_TAG_SIZE: int
+STREAM_FINAL: int
 
 class AesCipher:
     key: bytes | None
@@ -7,6 +15,17 @@ class AesCipher:
     def __init__(self, key: bytes | None = None, block_size: int = ...): ...
     def encrypt(self, raw: bytes) -> bytes: ...
     def decrypt(self, encoded: bytes) -> bytes: ...
+    def encrypt_stream(
+        self,
+        source: IO[bytes] | Iterable[bytes],
+        sink: IO[bytes] | Callable[[bytes], object],
+        chunk_size: int = ...,
+    ) -> int: ...
+    def decrypt_stream(
+        self,
+        source: IO[bytes] | Iterable[bytes],
+        sink: IO[bytes] | Callable[[bytes], object],
+    ) -> int: ...
     def pad(self, value: bytes) -> bytes: ...
     def unpad(self, value: bytes) -> bytes: ...
     def get_key(self) -> bytes: ...
@@ -59,6 +59,50 @@ START_CODES_CODE_128 = {"A": 103, "B": 104, "C": 105}
 END_CODE_CODE_128 = 106
 """ The end code for code 128 """
 
+SWITCH_CODES_CODE_128 = {"A": 101, "B": 100, "C": 99}
+""" The code 128 codes that switch the current code set
+into each of the code sets (in the middle of the value) """
+
+INTERLEAVED_2_OF_5 = dict(
+    (
+        first + second,
+        "".join(
+            first_letter + second_letter.lower()
+            for first_letter, second_letter in zip(
+                DIGIT_ENCODING_MAP[first], DIGIT_ENCODING_MAP[second]
+            )
+        ),
+    )
+    for first in DIGIT_ENCODING_MAP
+    for second in DIGIT_ENCODING_MAP
+)
+""" The pre-computed table that associates each of the 100
+pairs of digits with its interleaved 2 of 5 representation """
+
+CODE_128_SET_A = dict(
+    (chr(value), value - 32 if value >= 32 else value + 64) for value in range(96)
+)
+""" The table associating each of the characters supported by
+the code set a with its code 128 value """
+
+CODE_128_SET_B = dict((chr(value), value - 32) for value in range(32, 128))
+""" The table associating each of the characters supported by
+the code set b with its code 128 value """
+
+CODE_128_SET_C = dict(("%02d" % value, value) for value in range(100))
+""" The table associating each of the pairs of digits with
+its code 128 value in the code set c """
+
+CODE_128_SETS = dict(A=CODE_128_SET_A, B=CODE_128_SET_B)
+""" The map associating the name of the character based code
+sets with the respective character tables """
+
+CODE_128_CHARACTERS = [
+    legacy.unichr(value + 32 if value < 95 else value + 100) for value in range(107)
+]
+""" The list that associates each code 128 value (index) with
+the character that represents it in the true type font """
+
 
 def encode_2_of_5(string_value):
     """
@@ -146,7 +190,8 @@ def encode_code_128(value, code_set="A"):
     :type code_set: String
     :param code_set: The code set to be used for the encoding
     in code 128, this value should be one of the following:
-    "A", "B" or "C".
+    "A", "B", "C" or "auto" (switches between code sets so
+    that the shortest representation is generated).
     :rtype: String
     :return: The generated code 128 barcode string representation.
     :see: http://en.wikipedia.org/wiki/Code_128
@@ -161,6 +206,8 @@ def encode_code_128(value, code_set="A"):
         character_values = _encode_code_set_b(value)
     elif code_set == "C":
         character_values = _encode_code_set_c(value)
+    elif code_set == "auto":
+        character_values = _encode_code_set_auto(value)
     else:
         raise RuntimeError("Specified code set not supported %s" % code_set)
 
@@ -197,6 +244,125 @@ def encode_code_39(value):
     return "*" + value + "*"
 
 
+def encode_2_of_5_many(values, generator=False):
+    """
+    Encodes the provided sequence of string values into the
+    2 of 5 barcode encoding, using the pre-computed table
+    of interleaved digit pairs.
+
+    The result is the same as calling the single value
+    function for each of the values.
+
+    :type values: Iterable
+    :param values: The sequence of string values to be encoded
+    into the 2 of 5 barcode string representation.
+    :type generator: bool
+    :param generator: If a generator should be returned instead
+    of a list, useful for very large sequences of values.
+    :rtype: List
+    :return: The list (or generator) of the generated 2 of 5
+    barcode string representations.
+    """
+
+    encoded = (_encode_2_of_5_table(value) for value in values)
+    return encoded if generator else list(encoded)
+
+
+def encode_code_128_many(values, code_set="A", generator=False):
+    """
+    Encodes the provided sequence of string values into the
+    code 128 barcode encoding, using the pre-computed tables
+    of the code sets and of the font characters.
+
+    The result is the same as calling the single value
+    function for each of the values.
+
+    :type values: Iterable
+    :param values: The sequence of string values to be encoded
+    into the code 128 barcode string representation.
+    :type code_set: String
+    :param code_set: The code set to be used for the encoding
+    in code 128, this value should be one of the following:
+    "A", "B", "C" or "auto".
+    :type generator: bool
+    :param generator: If a generator should be returned instead
+    of a list, useful for very large sequences of values.
+    :rtype: List
+    :return: The list (or generator) of the generated code 128
+    barcode string representations.
+    """
+
+    if code_set in ("A", "B"):
+        encoded = (_encode_code_128_table(value, code_set) for value in values)
+    elif code_set in ("C", "auto"):
+        encoded = (encode_code_128(value, code_set=code_set) for value in values)
+    else:
+        raise RuntimeError("Specified code set not supported %s" % code_set)
+    return encoded if generator else list(encoded)
+
+
+def encode_code_39_many(values, generator=False):
+    """
+    Encodes the provided sequence of string values into the
+    code 39 barcode encoding.
+
+    :type values: Iterable
+    :param values: The sequence of string values to be encoded
+    into the code 39 barcode string representation.
+    :type generator: bool
+    :param generator: If a generator should be returned instead
+    of a list, useful for very large sequences of values.
+    :rtype: List
+    :return: The list (or generator) of the generated code 39
+    barcode string representations.
+    """
+
+    encoded = ("*" + value + "*" for value in values)
+    return encoded if generator else list(encoded)
+
+
+def _encode_2_of_5_table(string_value):
+    # prepends the zero character in case the value does not
+    # contain an even number of digits and then converts each
+    # pair of digits using the table, falling back to the
+    # reference implementation for invalid values (error)
+    if len(string_value) % 2:
+        string_value = "0" + string_value
+    try:
+        pairs = [
+            INTERLEAVED_2_OF_5[string_value[index : index + 2]]
+            for index in range(0, len(string_value), 2)
+        ]
+    except KeyError:
+        return encode_2_of_5(string_value)
+    return START_CODE_2_OF_5 + "".join(pairs) + END_CODE_2_OF_5
+
+
+def _encode_code_128_table(value, code_set):
+    # converts the complete set of characters using the table of
+    # the code set, falling back to the reference implementation
+    # for the characters not in the table (error or extended)
+    table = CODE_128_SETS[code_set]
+    try:
+        character_values = [table[character] for character in value]
+    except KeyError:
+        return encode_code_128(value, code_set=code_set)
+
+    # calculates the check digit from the start code and the
+    # weighted values and then converts the values into the
+    # final string using the table of font characters
+    start_code = START_CODES_CODE_128[code_set]
+    checksum = start_code
+    for index, character_value in enumerate(character_values):
+        checksum += character_value * (index + 1)
+    characters = CODE_128_CHARACTERS
+    return "".join(
+        [characters[start_code]]
+        + [characters[character_value] for character_value in character_values]
+        + [characters[checksum % 103], characters[END_CODE_CODE_128]]
+    )
+
+
 def _interleave_digits(first_digit, second_digit):
     """
     Interleaves both 2 of 5 encoded digits by creating
@@ -313,9 +479,9 @@ def _encode_code_set_a(string_value):
         # "calculates" the appropriate code 128 code set a
         # for the value and appends it to the character values
         character_code_128_value = (
-            character_ascii_value > 32
-            and character_ascii_value - 32
-            or character_ascii_value + 64
+            character_ascii_value - 32
+            if character_ascii_value >= 32
+            else character_ascii_value + 64
         )
         character_values.append(character_code_128_value)
 
@@ -400,6 +566,113 @@ def _encode_code_set_c(string_value):
     return character_values
 
 
+def _encode_code_set_auto(string_value):
+    """
+    Encodes the provided string value into a list of code 128
+    values switching between the code sets so that the shortest
+    representation is obtained, runs of digits are encoded in
+    the code set c and the remaining characters in either the
+    code set a (control characters) or b (lower case characters).
+
+    :type string_value: String
+    :param string_value: The string value to be converted into the
+    list of code 128 values.
+    :rtype: List
+    :return: The list containing a set of code 128 numeric
+    values representing the requested string.
+    """
+
+    # computes the length of the run of digits starting at each of
+    # the indexes of the string value (from the end to the start)
+    length = len(string_value)
+    runs = [0] * (length + 1)
+    for index in range(length - 1, -1, -1):
+        is_digit = string_value[index] in DIGIT_ENCODING_MAP
+        runs[index] = runs[index + 1] + 1 if is_digit else 0
+
+    # determines the initial code set, the code set c is used in case
+    # the value starts with an even run of at least four digits (or
+    # if the value is composed of only two digits)
+    run = runs[0]
+    if (run >= 4 and run % 2 == 0) or (run == length == 2):
+        code_set = "C"
+    else:
+        code_set = _select_code_set(string_value, 0)
+    character_values = [START_CODES_CODE_128[code_set]]
+
+    index = 0
+    while index < length:
+        run = runs[index]
+
+        # in case the current code set is the code set c the pairs of
+        # digits are encoded, otherwise switches into the best of the
+        # character based code sets for the next characters
+        if code_set == "C":
+            if run >= 2:
+                character_values.append(CODE_128_SET_C[string_value[index : index + 2]])
+                index += 2
+                continue
+            code_set = _select_code_set(string_value, index)
+            character_values.append(SWITCH_CODES_CODE_128[code_set])
+            continue
+
+        # in case there's a run of digits long enough for the switch
+        # to code set c to pay off (four at the end of the value, six
+        # otherwise) switches to it, note that for odd runs the first
+        # digit is encoded in the current code set
+        minimum = 4 if index + run == length else 6
+        if run >= minimum and run % 2 == 0:
+            code_set = "C"
+            character_values.append(SWITCH_CODES_CODE_128[code_set])
+            continue
+
+        # encodes the current character in the current code set, switching
+        # to the other character based code set in case it's not supported
+        character = string_value[index]
+        table = CODE_128_SETS[code_set]
+        if not character in table:
+            code_set = "B" if code_set == "A" else "A"
+            table = CODE_128_SETS[code_set]
+            if not character in table:
+                raise RuntimeError(
+                    "Code set does not support character '%s' " % character
+                )
+            character_values.append(SWITCH_CODES_CODE_128[code_set])
+        character_values.append(table[character])
+        index += 1
+
+    # returns the list containing the encoded values
+    # with the proper code set switches
+    return character_values
+
+
+def _select_code_set(string_value, index):
+    """
+    Selects the character based code set (a or b) that is the
+    best for the characters starting at the provided index, the
+    code set a is only selected in case a control character is
+    found before any lower case character.
+
+    :type string_value: String
+    :param string_value: The string value for which the code set
+    is going to be selected.
+    :type index: int
+    :param index: The index of the string value from which the
+    characters are going to be considered.
+    :rtype: String
+    :return: The selected code set, either "A" or "B".
+    """
+
+    for character in string_value[index:]:
+        if character in CODE_128_SET_B:
+            if not character in CODE_128_SET_A:
+                return "B"
+            continue
+        if character in CODE_128_SET_A:
+            return "A"
+    return "B"
+
+
 def _get_character_string(character_values):
     """
     Converts the provided list of code 128 characters
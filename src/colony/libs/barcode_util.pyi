@@ -1,19 +1,39 @@
-from typing import Literal, Mapping, Sequence
+from typing import Iterable, Iterator, Literal, Mapping, Sequence
 
-CodeSet = Literal["A", "B", "C"]
+CodeSet = Literal["A", "B", "C", "auto"]
 
 DIGIT_ENCODING_MAP: Mapping[str, str]
 START_CODE_2_OF_5: str
 END_CODE_2_OF_5: str
 START_CODES_CODE_128: Mapping[str, int]
 END_CODE_CODE_128: int
+SWITCH_CODES_CODE_128: Mapping[str, int]
+INTERLEAVED_2_OF_5: Mapping[str, str]
+CODE_128_SET_A: Mapping[str, int]
+CODE_128_SET_B: Mapping[str, int]
+CODE_128_SET_C: Mapping[str, int]
+CODE_128_SETS: Mapping[str, Mapping[str, int]]
+CODE_128_CHARACTERS: Sequence[str]
 
 def encode_2_of_5(string_value: str) -> str: ...
 def encode_code_128(value: str, code_set: CodeSet = ...) -> str: ...
 def encode_code_39(value: str) -> str: ...
+def encode_2_of_5_many(
+    values: Iterable[str], generator: bool = ...
+) -> list[str] | Iterator[str]: ...
+def encode_code_128_many(
+    values: Iterable[str], code_set: CodeSet = ..., generator: bool = ...
+) -> list[str] | Iterator[str]: ...
+def encode_code_39_many(
+    values: Iterable[str], generator: bool = ...
+) -> list[str] | Iterator[str]: ...
+def _encode_2_of_5_table(string_value: str) -> str: ...
+def _encode_code_128_table(value: str, code_set: CodeSet) -> str: ...
 def _interleave_digits(first_digit: str, second_digit: str) -> str: ...
 def _calculate_check_digit(character_values: Sequence[str]) -> int: ...
 def _encode_code_set_a(string_value: str) -> Sequence[str]: ...
 def _encode_code_set_b(string_value: str) -> Sequence[str]: ...
 def _encode_code_set_c(string_value: str) -> Sequence[str]: ...
+def _encode_code_set_auto(string_value: str) -> Sequence[int]: ...
+def _select_code_set(string_value: str, index: int) -> CodeSet: ...
 def _get_character_string(character_values: Sequence[str]) -> str: ...
@@ -28,6 +28,12 @@ __copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
 __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
+import re
+import bisect
+import unicodedata
+
+from colony.base import legacy
+
 COUNTRIES = (
     "Afghanistan",
     "Albania",
@@ -435,7 +441,20 @@ tuple containing the ISO 3166 information (two character
 code, three character code and the number code) """
 
 
-def country_get(name, relaxed=True):
+COUNTRY_INVALID = (None, None, None)
+""" The tuple of ISO 3166 information returned for the
+countries that are not found """
+
+COUNTRY_SEPARATOR_REGEX = re.compile(r"[\W_]+", re.UNICODE)
+""" The regular expression that matches the sequences of
+punctuation (and space) characters in the country names """
+
+_COUNTRY_INDEX = None
+""" The lazily built index of the countries, built on the
+first fuzzy retrieval (keeps the import of the module cheap) """
+
+
+def country_get(name, relaxed=True, fuzzy=False):
     """
     Retrieves a tuple containing the complete set of ISO 3166
     information for the country with the provided name.
@@ -453,12 +472,192 @@ def country_get(name, relaxed=True):
     :param relaxed: If the (country) name retrieval should take a
     relaxed approach meaning that it will be first converted into
     a lower cased version to avoid collisions.
+    :type fuzzy: bool
+    :param fuzzy: If the retrieval should use the (lazily built)
+    index of countries, that is insensitive to accents, case and
+    punctuation and that also accepts the ISO 3166 alpha-2, alpha-3
+    and numeric codes as the name of the country.
     :rtype: Tuple
     :return: A tuple containing the ISO 3166 information for the
     request country.
     :see: http://en.wikipedia.org/wiki/ISO_3166
     """
 
+    if fuzzy:
+        return _country_index().get(name)
     if relaxed:
         name = name.lower()
-    return COUNTRIES_ISO.get(name, (None, None, None))
+    return COUNTRIES_ISO.get(name, COUNTRY_INVALID)
+
+
+def country_get_many(names, relaxed=True, fuzzy=False):
+    """
+    Retrieves the tuples of ISO 3166 information for the complete
+    set of provided country names, the repeated names are resolved
+    only once (useful for the normalization of large data sets).
+
+    :type names: List
+    :param names: The sequence of country names (or codes in the
+    fuzzy mode) for which the information is meant to be retrieved.
+    :type relaxed: bool
+    :param relaxed: If the (country) name retrieval should take a
+    relaxed approach (lower cased names).
+    :type fuzzy: bool
+    :param fuzzy: If the retrieval should use the (lazily built)
+    index of countries (see the country get function).
+    :rtype: List
+    :return: The list of tuples containing the ISO 3166 information
+    for each of the provided names (in the same order).
+    """
+
+    cache = dict()
+    results = []
+    for name in names:
+        result = cache.get(name, None)
+        if result == None:
+            result = country_get(name, relaxed=relaxed, fuzzy=fuzzy)
+            cache[name] = result
+        results.append(result)
+    return results
+
+
+def country_complete(prefix, limit=None):
+    """
+    Retrieves the names of the countries that start with the
+    provided prefix, the matching is insensitive to accents, case
+    and punctuation (as in the fuzzy retrieval).
+
+    :type prefix: String
+    :param prefix: The prefix of the country names to be completed.
+    :type limit: int
+    :param limit: The maximum number of names to be returned.
+    :rtype: List
+    :return: The (sorted) list of names of the countries that start
+    with the provided prefix.
+    """
+
+    return _country_index().complete(prefix, limit=limit)
+
+
+class CountryIndex(object):
+    """
+    Index of the countries that allows the retrieval of the ISO 3166
+    information using normalized names (insensitive to accents, case
+    and punctuation) or the ISO codes, and the completion of names
+    from a prefix (using a sorted sequence of names and bisection).
+    """
+
+    mapping = None
+    """ The map associating the normalized names and codes of the
+    countries with their ISO 3166 information """
+
+    keys = None
+    """ The sorted list of normalized country names, to be used
+    in the bisection of the prefix completion """
+
+    names = None
+    """ The list of (display) country names in the same order
+    as the normalized names in the keys list """
+
+    def __init__(self):
+        self.mapping = dict()
+        self.keys = []
+        self.names = []
+
+        entries = []
+        for name in COUNTRIES:
+            key = name.lower()
+            iso = COUNTRIES_ISO[key]
+            normalized = _country_normalize(name)
+            entries.append((normalized, name))
+            self.mapping[key] = iso
+            self.mapping[normalized] = iso
+
+        for iso in legacy.itervalues(COUNTRIES_ISO):
+            for code in iso:
+                self.mapping.setdefault(code.lower(), iso)
+
+        entries.sort()
+        self.keys = [key for key, _name in entries]
+        self.names = [name for _key, name in entries]
+
+    def get(self, name):
+        """
+        Retrieves the ISO 3166 information for the provided country
+        name or code, the fast path tries the lower cased value and
+        only then the complete normalization is performed.
+
+        :type name: String
+        :param name: The name (or code) of the country.
+        :rtype: Tuple
+        :return: The ISO 3166 information of the country.
+        """
+
+        if legacy.is_string(name):
+            result = self.mapping.get(name.lower(), None)
+            if not result == None:
+                return result
+        return self.mapping.get(_country_normalize(name), COUNTRY_INVALID)
+
+    def complete(self, prefix, limit=None):
+        """
+        Retrieves the (display) names of the countries that start
+        with the provided prefix (after normalization).
+
+        :type prefix: String
+        :param prefix: The prefix of the country names.
+        :type limit: int
+        :param limit: The maximum number of names to be returned.
+        :rtype: List
+        :return: The list of names of the countries that start
+        with the provided prefix.
+        """
+
+        prefix = _country_normalize(prefix)
+        index = bisect.bisect_left(self.keys, prefix)
+        results = []
+        while index < len(self.keys) and self.keys[index].startswith(prefix):
+            if not limit == None and len(results) == limit:
+                break
+            results.append(self.names[index])
+            index += 1
+        return results
+
+
+def _country_index():
+    """
+    Retrieves the (global) index of countries, building it
+    in case this is the first time it's requested.
+
+    :rtype: CountryIndex
+    :return: The global index of countries.
+    """
+
+    global _COUNTRY_INDEX
+    if _COUNTRY_INDEX == None:
+        _COUNTRY_INDEX = CountryIndex()
+    return _COUNTRY_INDEX
+
+
+def _country_normalize(name):
+    """
+    Normalizes the provided country name (or code), removing the
+    accents, the case and the punctuation from it, the numeric
+    codes are padded to the three digits of the ISO 3166.
+
+    :type name: String
+    :param name: The country name (or code) to be normalized.
+    :rtype: String
+    :return: The normalized version of the country name.
+    """
+
+    if type(name) == int:
+        return "%03d" % name
+    name = legacy.u(name, force=True)
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(value for value in name if not unicodedata.combining(value))
+    name = name.lower().replace("&", " and ")
+    name = COUNTRY_SEPARATOR_REGEX.sub(" ", name).strip()
+    if name.isdigit():
+        name = name.zfill(3)
+    return name
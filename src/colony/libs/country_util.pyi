@@ -1,8 +1,30 @@
-from typing import Mapping, Sequence
+from re import Pattern
+from typing import Iterable, Mapping, Sequence
 
 COUNTRIES: Sequence[str]
 COUNTRIES_ISO: Mapping[str, tuple[str, str, str]]
 
+COUNTRY_INVALID: tuple[None, None, None]
+COUNTRY_SEPARATOR_REGEX: Pattern[str]
+
 def country_get(
-    name: str, relaxed: bool = ...
+    name: str | int, relaxed: bool = ..., fuzzy: bool = ...
 ) -> tuple[str, str, str] | tuple[None, None, None]: ...
+def country_get_many(
+    names: Iterable[str | int], relaxed: bool = ..., fuzzy: bool = ...
+) -> list[tuple[str, str, str] | tuple[None, None, None]]: ...
+def country_complete(prefix: str, limit: int | None = ...) -> list[str]: ...
+
+class CountryIndex(object):
+    mapping: Mapping[str, tuple[str, str, str]]
+    keys: Sequence[str]
+    names: Sequence[str]
+
+    def __init__(self) -> None: ...
+    def get(
+        self, name: str | int
+    ) -> tuple[str, str, str] | tuple[None, None, None]: ...
+    def complete(self, prefix: str, limit: int | None = ...) -> list[str]: ...
+
+def _country_index() -> CountryIndex: ...
+def _country_normalize(name: str | bytes | int) -> str: ...
@@ -28,10 +28,17 @@ __copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
 __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
+import os
 import re
+import hmac
+import math
 import hashlib
+import binascii
+import threading
+import collections
+import multiprocessing
 
-from colony.base import legacy
+from colony.base import legacy, exceptions
 
 HASH_VALUE = "hash"
 """ The hash value """
@@ -51,6 +58,54 @@ SHA1_VALUE = "sha1"
 SHA256_VALUE = "sha256"
 """ The SHA256 value """
 
+PBKDF2_VALUE = "pbkdf2_sha256"
+""" The PBKDF2 (with SHA256) key derivation value """
+
+SCRYPT_VALUE = "scrypt"
+""" The scrypt key derivation value """
+
+KDF_SET = (PBKDF2_VALUE, SCRYPT_VALUE)
+""" The set of (slow) key derivation functions, that
+embed their parameters and salt in the hash value """
+
+KDF_SEPARATOR = "$"
+""" The separator of the parameters, salt and hash in
+the key derivation based hash values """
+
+KDF_SALT_SIZE = 16
+""" The size in bytes of the random salt generated for
+each of the key derivation based hashes """
+
+PBKDF2_ITERATIONS = 260000
+""" The default number of iterations of the PBKDF2 key
+derivation function """
+
+SCRYPT_N = 16384
+""" The default CPU/memory cost parameter of scrypt """
+
+SCRYPT_R = 8
+""" The default block size parameter of scrypt """
+
+SCRYPT_P = 1
+""" The default parallelization parameter of scrypt """
+
+DIGEST_BUFFER_SIZE = 1048576
+""" The size in bytes of the buffers used in the reading of
+the files for digest calculation, large buffers allow the
+hash functions to release the GIL (parallel hashing) """
+
+DIGEST_BUFFER_COUNT = 3
+""" The number of buffers rotated in the threaded digest
+calculation, allowing reading while the hashing occurs """
+
+DIGEST_WORKERS = 4
+""" The default maximum number of files digested concurrently
+by the batch digest calculation """
+
+CHUNK_FACTOR = 4
+""" The number of chunks per worker process to be used in
+the batch operations, to balance the load of the workers """
+
 MD5_CRYPT_SEPARATOR = "$"
 """ The MD5 crypt separator """
 
@@ -94,12 +149,16 @@ SPECIAL_CHARACTER_REGEX = re.compile(SPECIAL_CHARACTER_REGEX_VALUE)
 """ The special character regex """
 
 
-def password_crypt(password, salt="", hash_method=MD5_VALUE):
+def password_crypt(password, salt="", hash_method=MD5_VALUE, iterations=None):
     """
     Encrypts the given password using the provided hash method.
     An optional salt may be provided for extra security.
     The generated hash is always defined in hexadecimal.
 
+    In case a key derivation function is used as hash method
+    (eg: PBKDF2, scrypt) a random salt is generated and stored
+    together with the parameters in the hash value.
+
     :type password: String
     :param password: The password to be encrypted using
     the hash method.
@@ -109,6 +168,9 @@ def password_crypt(password, salt="", hash_method=MD5_VALUE):
     :type hash_method: String
     :param hash_method: The name of the hash method to be used
     for encryption.
+    :type iterations: int
+    :param iterations: The number of iterations to be used in
+    case the hash method is PBKDF2 (optional).
     :rtype: String
     :return: The generated (complete) hash hexadecimal string.
     """
@@ -126,6 +188,10 @@ def password_crypt(password, salt="", hash_method=MD5_VALUE):
         # sets the hash value as the (base)
         # password word value (plain)
         hash_value = password_word
+    # in case the hash method is a key derivation function
+    # the hash value contains the parameters and the salt
+    elif hash_method_lower in KDF_SET:
+        hash_value = _kdf_crypt(password_word, hash_method_lower, iterations=iterations)
     # otherwise it must be a general hash function
     else:
         # creates the new hash object from the
@@ -188,7 +254,13 @@ def password_match(password_hash, password, salt=""):
     # in case the base password hash is of type plain
     if base_password_hash == PLAIN_VALUE:
         # checks if both passwords match
-        passwords_match = password_word == base_password_value
+        passwords_match = _compare(password_word, base_password_value)
+    # in case the base password hash is a key derivation function
+    # re-derives the hash using the parameters of the value
+    elif base_password_hash in KDF_SET:
+        passwords_match = _kdf_match(
+            password_word, base_password_hash, base_password_value
+        )
     # otherwise it must be a general hash function
     else:
         # creates the new hash object from the
@@ -205,13 +277,76 @@ def password_match(password_hash, password, salt=""):
         # hex digest
         hash_value = hash.hexdigest()
 
-        # checks if both password (hashes) match
-        passwords_match = hash_value == base_password_value
+        # checks if both password (hashes) match, using
+        # a constant time comparison (avoids timing attacks)
+        passwords_match = _compare(hash_value, base_password_value)
 
     # returns if both password match
     return passwords_match
 
 
+def password_crypt_many(
+    passwords, salt="", hash_method=PBKDF2_VALUE, iterations=None, workers=None
+):
+    """
+    Encrypts the given sequence of passwords using the provided
+    hash method, the operation is split in chunks executed by a
+    pool of worker processes (sized to the number of cores).
+
+    This is the preferred strategy for the (re-)hashing of large
+    sets of passwords using (slow) key derivation functions.
+
+    :type passwords: List
+    :param passwords: The sequence of passwords to be encrypted.
+    :type salt: String
+    :param salt: The salt to be used during the encryption
+    process (of every password).
+    :type hash_method: String
+    :param hash_method: The name of the hash method to be used
+    for encryption, defaults to PBKDF2.
+    :type iterations: int
+    :param iterations: The number of iterations to be used in
+    case the hash method is PBKDF2 (optional).
+    :type workers: int
+    :param workers: The number of worker processes to be used,
+    defaults to the number of cores.
+    :rtype: List
+    :return: The list of generated hash strings, in the same
+    order as the provided passwords.
+    """
+
+    items = [(password, salt, hash_method, iterations) for password in passwords]
+    return _map(_password_crypt_item, items, workers=workers)
+
+
+def password_match_many(password_hashes, passwords, salt="", workers=None):
+    """
+    Checks if each of the given password hashes matches the
+    password in the same position, the operation is split in
+    chunks executed by a pool of worker processes.
+
+    :type password_hashes: List
+    :param password_hashes: The sequence of complete password
+    hash strings, in any of the supported formats.
+    :type passwords: List
+    :param passwords: The sequence of passwords for checking.
+    :type salt: String
+    :param salt: The base salt for checking.
+    :type workers: int
+    :param workers: The number of worker processes to be used,
+    defaults to the number of cores.
+    :rtype: List
+    :return: The list with the result of the matching of each
+    of the password hashes.
+    """
+
+    items = [
+        (password_hash, password, salt)
+        for password_hash, password in zip(password_hashes, passwords)
+    ]
+    return _map(_password_match_item, items, workers=workers)
+
+
 def password_strength(password):
     """
     Calculates the "theoretical" password strength
@@ -284,6 +419,101 @@ def password_strength(password):
     return strength_value
 
 
+def _kdf_crypt(password_word, method, iterations=None, kdf_salt=None):
+    password_word = legacy.bytes(password_word, "utf-8", force=True)
+    kdf_salt = kdf_salt or os.urandom(KDF_SALT_SIZE)
+    kdf_salt_hex = legacy.str(binascii.hexlify(kdf_salt))
+
+    if method == PBKDF2_VALUE:
+        iterations = iterations or PBKDF2_ITERATIONS
+        digest = hashlib.pbkdf2_hmac("sha256", password_word, kdf_salt, iterations)
+        parameters = [str(iterations)]
+    else:
+        if not hasattr(hashlib, "scrypt"):
+            raise exceptions.OperationalError(message="scrypt is not available")
+        digest = hashlib.scrypt(
+            password_word, salt=kdf_salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=32
+        )
+        parameters = [str(SCRYPT_N), str(SCRYPT_R), str(SCRYPT_P)]
+
+    digest_hex = legacy.str(binascii.hexlify(digest))
+    return KDF_SEPARATOR.join(parameters + [kdf_salt_hex, digest_hex])
+
+
+def _kdf_match(password_word, method, value):
+    password_word = legacy.bytes(password_word, "utf-8", force=True)
+    parts = value.split(KDF_SEPARATOR)
+
+    try:
+        if method == PBKDF2_VALUE:
+            iterations, kdf_salt_hex, digest_hex = parts
+            kdf_salt = binascii.unhexlify(kdf_salt_hex)
+            digest = hashlib.pbkdf2_hmac(
+                "sha256", password_word, kdf_salt, int(iterations)
+            )
+        else:
+            if not hasattr(hashlib, "scrypt"):
+                raise exceptions.OperationalError(message="scrypt is not available")
+            n, r, p, kdf_salt_hex, digest_hex = parts
+            kdf_salt = binascii.unhexlify(kdf_salt_hex)
+            digest = hashlib.scrypt(
+                password_word,
+                salt=kdf_salt,
+                n=int(n),
+                r=int(r),
+                p=int(p),
+                dklen=len(digest_hex) // 2,
+            )
+    except (ValueError, TypeError, binascii.Error):
+        return False
+
+    return _compare(binascii.hexlify(digest), digest_hex)
+
+
+def _compare(first, second):
+    first = legacy.bytes(first, "utf-8", force=True)
+    second = legacy.bytes(second, "utf-8", force=True)
+    return hmac.compare_digest(first, second)
+
+
+def _password_crypt_item(item):
+    password, salt, hash_method, iterations = item
+    return password_crypt(
+        password, salt=salt, hash_method=hash_method, iterations=iterations
+    )
+
+
+def _password_match_item(item):
+    password_hash, password, salt = item
+    return password_match(password_hash, password, salt=salt)
+
+
+def _map(function, items, workers=None):
+    # determines the number of workers to be used, defaulting to
+    # the number of cores and in case there's a single one (or a
+    # single item) runs the operation in the current process
+    workers = workers or multiprocessing.cpu_count()
+    workers = min(workers, len(items))
+    if workers <= 1:
+        return [function(item) for item in items]
+
+    # sizes the chunks so that each worker receives a series of
+    # chunks, balancing the load without too much communication
+    chunk_size = int(math.ceil(len(items) / float(workers * CHUNK_FACTOR)))
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        result = pool.map(function, items, chunk_size)
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+    return result
+
+
 def md5_crypt(password, salt, magic=DEFAULT_MD5_CRYPT_MAGIC):
     """
     Runs the MD5 crypt algorithm for the given password,
@@ -437,76 +667,211 @@ def md5_crypt(password, salt, magic=DEFAULT_MD5_CRYPT_MAGIC):
     return md5_crypt_value
 
 
-def generate_hash_digest_map(file_path, hash_set=DEFAULT_HASH_SET):
+def generate_hash_digest_map(
+    file_path, hash_set=DEFAULT_HASH_SET, buffer_size=DIGEST_BUFFER_SIZE, threaded=None
+):
     """
     Generates a map containing a set of hash digests generate
     from the file contained in the given file path.
     The set of hash function to be used may be controlled using the
     hash set parameter.
 
+    The file is streamed in large chunks into re-usable buffers and
+    (for large files) each of the hash functions runs in its own
+    thread, as the hash functions release the GIL for large buffers.
+
     :type file_path: String
     :param file_path: The path to the file to be used for hash
     digest calculation.
     :type hash_set: Tuple
     :param hash_set: The set of hash functions to be used.
+    :type buffer_size: int
+    :param buffer_size: The size of the buffers used in the reading
+    of the file contents.
+    :type threaded: bool
+    :param threaded: If each of the hash functions should run in its
+    own thread, by default only for multiple hashes and large files.
     :rtype: Dictionary
     :return: The map containing the hash digest values for the file.
     """
 
     # creates the list to hold the various
     # hash objects
-    hash_list = []
+    hash_list = [hashlib.new(hash_name) for hash_name in hash_set]
 
-    # iterates over the hash set
-    # to create the various hash objects
-    for hash_name in hash_set:
-        # creates the hash object and adds
-        # it to the list of hash objects
-        hash = hashlib.new(hash_name)
-        hash_list.append(hash)
+    # in case the threaded mode is not explicitly set it's used
+    # only if there's more than one hash function and the file
+    # is larger than a single buffer (otherwise no gain)
+    if threaded == None:
+        threaded = len(hash_list) > 1 and os.path.getsize(file_path) > buffer_size
 
-    # opens the file for read
+    # opens the file for read and runs the proper digest strategy
+    # feeding the hash objects with the complete file contents
     file = open(file_path, "rb")
-
     try:
-        # iterates continuously
-        while True:
-            # reads "some" file contents
-            file_contents = file.read(4096)
-
-            # in case the file contents are
-            # not valid (end of file)
-            if not file_contents:
-                # breaks the loop
-                break
-
-            # iterates over all the hash objects
-            # in the hash list to update them
-            for hash in hash_list:
-                # updates the hash object
-                # with the file contents
-                hash.update(file_contents)
+        if threaded:
+            _digest_threaded(file, hash_list, buffer_size)
+        else:
+            _digest(file, hash_list, buffer_size)
     finally:
-        # closes the file
         file.close()
 
-    # creates the map to hold the various
-    # hash digests
+    # creates the map to hold the various hash
+    # digests, by name of the hash (function)
     hash_digest_map = {}
-
-    # iterates over all the hash objects
-    # in the hash list to retrieve the digest
-    # and update the hash digest map
     for hash in hash_list:
-        # retrieves the name of the hash (function)
-        hash_name = hash.name
-
-        # retrieves the hash (hexadecimal) digest
-        hash_digest = hash.hexdigest()
-
-        # updates the hash digest map with the
-        # new hash digest
-        hash_digest_map[hash_name] = hash_digest
+        hash_digest_map[hash.name] = hash.hexdigest()
 
     # returns the hash digest map
     return hash_digest_map
+
+
+def generate_hash_digest_map_many(
+    file_paths, hash_set=DEFAULT_HASH_SET, workers=DIGEST_WORKERS
+):
+    """
+    Generates the maps of hash digests for the complete set of
+    provided file paths, digesting multiple files concurrently
+    using a bounded pool of worker threads.
+
+    :type file_paths: List
+    :param file_paths: The sequence of paths to the files to be
+    used for hash digest calculation.
+    :type hash_set: Tuple
+    :param hash_set: The set of hash functions to be used.
+    :type workers: int
+    :param workers: The maximum number of files to be digested
+    concurrently (worker threads).
+    :rtype: Dictionary
+    :return: The map associating each of the file paths with the
+    map containing the hash digest values for the file.
+    """
+
+    file_paths = collections.deque(file_paths)
+    results = {}
+    errors = []
+    lock = threading.Lock()
+
+    def work():
+        while True:
+            with lock:
+                if not file_paths or errors:
+                    return
+                file_path = file_paths.popleft()
+            try:
+                result = generate_hash_digest_map(
+                    file_path, hash_set=hash_set, threaded=False
+                )
+            except BaseException as exception:
+                with lock:
+                    errors.append(exception)
+                return
+            with lock:
+                results[file_path] = result
+
+    threads = [
+        threading.Thread(target=work)
+        for _index in range(max(min(workers, len(file_paths)), 1))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+    return results
+
+
+def _digest(file, hash_list, buffer_size):
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    while True:
+        count = file.readinto(buffer)
+        if not count:
+            break
+        chunk = view[:count] if legacy.PYTHON_3 else bytes(buffer[:count])
+        for hash in hash_list:
+            hash.update(chunk)
+
+
+def _digest_threaded(file, hash_list, buffer_size):
+    # creates the set of buffers to be rotated, each with a semaphore
+    # that counts the hash threads that have finished processing it
+    # (the buffer may only be re-used once all of them finished)
+    buffers = [bytearray(buffer_size) for _index in range(DIGEST_BUFFER_COUNT)]
+    semaphores = [threading.Semaphore(0) for _index in range(DIGEST_BUFFER_COUNT)]
+    pending = [False] * DIGEST_BUFFER_COUNT
+    conditions = [threading.Condition() for _hash in hash_list]
+    queues = [collections.deque() for _hash in hash_list]
+    errors = []
+
+    def work(hash, condition, queue):
+        while True:
+            with condition:
+                while not queue:
+                    condition.wait()
+                item = queue.popleft()
+            if item == None:
+                return
+            index, count = item
+
+            # in case a previous update failed (in any of the threads)
+            # the chunk is no longer hashed, but the buffer must still
+            # be released so that the reader never blocks on it
+            try:
+                if errors:
+                    continue
+                view = memoryview(buffers[index])
+                chunk = (
+                    view[:count] if legacy.PYTHON_3 else bytes(buffers[index][:count])
+                )
+                hash.update(chunk)
+            except BaseException as exception:
+                errors.append(exception)
+            finally:
+                semaphores[index].release()
+
+    threads = [
+        threading.Thread(target=work, args=(hash, condition, queue))
+        for hash, condition, queue in zip(hash_list, conditions, queues)
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    try:
+        index = 0
+        while not errors:
+            # waits until every hash thread has finished processing
+            # the buffer (in case it's been used) and then reads the
+            # next chunk of the file into it
+            if pending[index]:
+                for _thread in threads:
+                    semaphores[index].acquire()
+            count = file.readinto(buffers[index])
+            if not count:
+                pending[index] = False
+                break
+
+            # dispatches the chunk (buffer and size) to each of the
+            # hash threads and rotates to the next buffer
+            pending[index] = True
+            for condition, queue in zip(conditions, queues):
+                with condition:
+                    queue.append((index, count))
+                    condition.notify()
+            index = (index + 1) % DIGEST_BUFFER_COUNT
+    finally:
+        for condition, queue in zip(conditions, queues):
+            with condition:
+                queue.append(None)
+                condition.notify()
+        for thread in threads:
+            thread.join()
+
+    # re-raises the first of the errors raised by the hash threads
+    # (if any) as the digest is not valid and must not be used
+    if errors:
+        raise errors[0]
@@ -2,7 +2,7 @@ from os import PathLike
 from re import Pattern
 from typing import Literal, Sequence
 
-HashType = Literal["md5", "sha1", "sha256"]
+HashType = Literal["md5", "sha1", "sha256", "pbkdf2_sha256", "scrypt", "plain"]
 
 HASH_VALUE: str
 VALUE_VALUE: str
@@ -10,6 +10,19 @@ PLAIN_VALUE: str
 MD5_VALUE: str
 SHA1_VALUE: str
 SHA256_VALUE: str
+PBKDF2_VALUE: str
+SCRYPT_VALUE: str
+KDF_SET: tuple[str, ...]
+KDF_SEPARATOR: str
+KDF_SALT_SIZE: int
+PBKDF2_ITERATIONS: int
+SCRYPT_N: int
+SCRYPT_R: int
+SCRYPT_P: int
+DIGEST_BUFFER_SIZE: int
+DIGEST_BUFFER_COUNT: int
+DIGEST_WORKERS: int
+CHUNK_FACTOR: int
 MD5_CRYPT_SEPARATOR: str
 DEFAULT_MD5_CRYPT_MAGIC: str
 DEFAULT_HASH_SET: HashType
@@ -26,11 +39,35 @@ LETTER_UPPER_REGEX: Pattern[str]
 SPECIAL_CHARACTER_REGEX: Pattern[str]
 
 def password_crypt(
-    password: str, salt: str = ..., hash_method: HashType = ...
+    password: str,
+    salt: str = ...,
+    hash_method: HashType = ...,
+    iterations: int | None = ...,
 ) -> str: ...
 def password_match(password_hash: str, password: str, salt: str = ...) -> bool: ...
+def password_crypt_many(
+    passwords: Sequence[str],
+    salt: str = ...,
+    hash_method: HashType = ...,
+    iterations: int | None = ...,
+    workers: int | None = ...,
+) -> list[str]: ...
+def password_match_many(
+    password_hashes: Sequence[str],
+    passwords: Sequence[str],
+    salt: str = ...,
+    workers: int | None = ...,
+) -> list[bool]: ...
 def password_strength(password: str) -> int: ...
 def md5_crypt(password: str, salt: str, magic: str = ...) -> str: ...
 def generate_hash_digest_map(
-    file_path: PathLike[str], hash_set: Sequence[str] = ...
-): ...
+    file_path: PathLike[str],
+    hash_set: Sequence[str] = ...,
+    buffer_size: int = ...,
+    threaded: bool | None = ...,
+) -> dict[str, str]: ...
+def generate_hash_digest_map_many(
+    file_paths: Sequence[PathLike[str]],
+    hash_set: Sequence[str] = ...,
+    workers: int = ...,
+) -> dict[PathLike[str], dict[str, str]]: ...
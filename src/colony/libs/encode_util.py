@@ -32,6 +32,10 @@ import binascii
 
 from colony.base import legacy
 
+NATIVE_BYTES = hasattr(int, "to_bytes") and hasattr(int, "from_bytes")
+""" If the native conversion between integers and bytes is
+available (python 3), allowing the fast encoding path """
+
 
 def encode_two_complement_string(long_value):
     """
@@ -48,7 +52,15 @@ def encode_two_complement_string(long_value):
     # in case the long value is zero
     if long_value == 0:
         # returns empty string
-        return ""
+        return b""
+
+    # in case the native conversion is available uses it to encode
+    # the value with the minimum number of bytes that is able to
+    # hold the value and its sign bit (fast path)
+    if NATIVE_BYTES:
+        length = _byte_length(long_value)
+        return long_value.to_bytes(length, "little", signed=True)
+
     # in case the long value is larger
     # than zero
     elif long_value > 0:
@@ -142,6 +154,11 @@ def decode_two_complement_string(data):
         # return zero
         return legacy.LONG(0)
 
+    # in case the native conversion is available uses it to decode
+    # the value directly from the bytes (fast path)
+    if NATIVE_BYTES:
+        return int.from_bytes(data, "little", signed=True)
+
     # converts the (inverted) data to hexadecimal string
     long_value_hexadecimal = binascii.hexlify(data[::-1])
 
@@ -150,7 +167,7 @@ def decode_two_complement_string(data):
     long_value = legacy.LONG(long_value_hexadecimal, 16)
 
     # in case the last digit is 0x80 (negative)
-    if data[-1] >= "\x80":
+    if legacy.ord(data[-1]) >= 0x80:
         # puts the negative indication as the last digit
         long_value -= legacy.LONG(1) << (data_length * 8)
 
@@ -158,6 +175,143 @@ def decode_two_complement_string(data):
     return long_value
 
 
+def encode_two_complement_many(long_values):
+    """
+    Encodes a sequence of longs into a single buffer of two's
+    complement little-endian binary strings, each of them prefixed
+    with its length (as a variable length unsigned integer).
+
+    :type long_values: Iterable
+    :param long_values: The sequence of long values to be encoded.
+    :rtype: String
+    :return: The buffer containing the complete set of length
+    prefixed encoded values.
+    """
+
+    # creates the buffer that is going to hold the complete set
+    # of encoded values and iterates over the values to encode
+    # them, writing each length prefix followed by the value
+    buffer = bytearray()
+    for long_value in long_values:
+        if NATIVE_BYTES:
+            length = _byte_length(long_value) if long_value else 0
+            data = long_value.to_bytes(length, "little", signed=True)
+        else:
+            data = encode_two_complement_string(long_value)
+            length = len(data)
+        if length < 0x80:
+            buffer.append(length)
+        else:
+            buffer += _encode_length(length)
+        buffer += data
+
+    # converts the buffer into an immutable bytes value and
+    # returns it to the caller method
+    return bytes(buffer)
+
+
+def decode_two_complement_many(data):
+    """
+    Decodes a buffer of length prefixed two's complement little-endian
+    binary strings (as generated by the batch encoder) into the
+    sequence of longs.
+
+    :type data: String
+    :param data: The buffer containing the length prefixed values.
+    :rtype: List
+    :return: The list containing the decoded long values.
+    """
+
+    # converts the data into a byte array so that the indexing
+    # returns integers independently of the python version
+    data = bytearray(data)
+    data_length = len(data)
+    long_values = []
+    index = 0
+
+    # iterates over the complete buffer reading the length prefix
+    # and then decoding the value that follows it
+    while index < data_length:
+        length = data[index]
+        index += 1
+        if length >= 0x80:
+            length, index = _decode_length(data, index - 1)
+        if index + length > data_length:
+            raise RuntimeError("Truncated two's complement buffer")
+        value = bytes(data[index : index + length])
+        if NATIVE_BYTES:
+            long_values.append(int.from_bytes(value, "little", signed=True))
+        else:
+            long_values.append(decode_two_complement_string(value))
+        index += length
+
+    # returns the complete set of decoded values
+    return long_values
+
+
+def _byte_length(long_value):
+    """
+    Calculates the minimum number of bytes required to hold the
+    provided value in two's complement representation (including
+    the sign bit).
+
+    :type long_value: int
+    :param long_value: The long value to calculate the length.
+    :rtype: int
+    :return: The number of bytes required for the value.
+    """
+
+    if long_value < 0:
+        long_value = -long_value - 1
+    return long_value.bit_length() // 8 + 1
+
+
+def _encode_length(length):
+    """
+    Encodes the provided length as a variable length unsigned
+    integer (seven bits per byte, least significant first).
+
+    :type length: int
+    :param length: The length to be encoded.
+    :rtype: bytearray
+    :return: The encoded length value.
+    """
+
+    buffer = bytearray()
+    while length >= 0x80:
+        buffer.append((length & 0x7F) | 0x80)
+        length >>= 7
+    buffer.append(length)
+    return buffer
+
+
+def _decode_length(data, index):
+    """
+    Decodes a variable length unsigned integer from the provided
+    data starting at the provided index.
+
+    :type data: bytearray
+    :param data: The data containing the encoded length.
+    :type index: int
+    :param index: The index where the encoded length starts.
+    :rtype: Tuple
+    :return: The decoded length and the index of the first byte
+    after the encoded length.
+    """
+
+    length = 0
+    shift = 0
+    while True:
+        if index >= len(data):
+            raise RuntimeError("Truncated two's complement buffer")
+        byte = data[index]
+        index += 1
+        length |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return length, index
+        shift += 7
+
+
 def _count_nibbles(long_value_hexadecimal):
     """
     Calculates the number of nibbles (4 bit group) from the given
@@ -1,3 +1,12 @@
+from typing import Iterable
+
+NATIVE_BYTES: bool
+
 def encode_two_complement_string(long_value: int) -> bytes: ...
 def decode_two_complement_string(data: bytes) -> int: ...
+def encode_two_complement_many(long_values: Iterable[int]) -> bytes: ...
+def decode_two_complement_many(data: bytes) -> list[int]: ...
+def _byte_length(long_value: int) -> int: ...
+def _encode_length(length: int) -> bytearray: ...
+def _decode_length(data: bytearray, index: int) -> tuple[int, int]: ...
 def _count_nibbles(long_value_hexadecimal: str) -> int: ...
@@ -749,6 +749,14 @@ class FileTransactionContext(FileContext, TransactionContext):
     path_tuples_list = []
     """ The list of path tuples associated with the transaction """
 
+    removed_paths = None
+    """ The index (trie) of the (real) paths that have been
+    removed in the transaction, used for fast removal checks """
+
+    written_paths = None
+    """ The index (trie) of the virtual paths that have been
+    written in the transaction, used for fast existence checks """
+
     access_lock = None
     """ The lock controlling the access to the file transaction """
 
@@ -766,6 +774,8 @@ class FileTransactionContext(FileContext, TransactionContext):
         self.temporary_path = temporary_path or tempfile.mkdtemp()
 
         self.path_tuples_list = []
+        self.removed_paths = PathTrie()
+        self.written_paths = PathTrie()
         self.access_lock = threading.RLock()
 
     def resolve_file_path(self, file_path):
@@ -782,8 +792,11 @@ class FileTransactionContext(FileContext, TransactionContext):
         # retrieves the virtual file path for the file path
         virtual_file_path = self._get_virtual_file_path(file_path)
 
-        # checks if the virtual file path exists
-        virtual_file_path_exists = os.path.exists(virtual_file_path)
+        # checks if the virtual file path exists, avoiding the
+        # file system access in case nothing has been written
+        virtual_file_path_exists = self._is_written_file_path(
+            virtual_file_path
+        ) and os.path.exists(virtual_file_path)
 
         # resolves the file path taking into account the
         # existence of the virtual file path
@@ -812,9 +825,12 @@ class FileTransactionContext(FileContext, TransactionContext):
         removed_file_path = self._is_removed_file_path(file_path)
 
         # tests if both the (real) file path and the virtual
-        # file path exist
+        # file path exist (the virtual file path is only checked
+        # in case something has been written "around" it)
         file_path_exists = os.path.exists(file_path)
-        virtual_file_path_exists = os.path.exists(virtual_file_path)
+        virtual_file_path_exists = self._is_written_file_path(
+            virtual_file_path
+        ) and os.path.exists(virtual_file_path)
 
         # tests if the file path exists, checks the condition
         # that if the (real) file path exists the removed file path
@@ -1161,8 +1177,11 @@ class FileTransactionContext(FileContext, TransactionContext):
         Resets the state of the transaction file.
         """
 
-        # empties the path tuples list
+        # empties the path tuples list and the
+        # indexes of removed and written paths
         self.path_tuples_list = []
+        self.removed_paths = PathTrie()
+        self.written_paths = PathTrie()
 
         # resets the transaction level
         self.transaction_level = 0
@@ -1219,6 +1238,17 @@ class FileTransactionContext(FileContext, TransactionContext):
         # adds the path tuple to the path tuples list
         self.path_tuples_list.append(path_tuple)
 
+        # indexes the path tuple, the removed (real) paths and the
+        # written virtual paths (recursively, as they may refer to
+        # directories) are added to the proper indexes
+        operation = path_tuple[0]
+        if operation == REMOVE_OPERATION:
+            _operation, file_path, _handle_exception, recursive = path_tuple
+            self.removed_paths.add(file_path, recursive=recursive)
+        else:
+            _operation, virtual_file_path, _file_path = path_tuple
+            self.written_paths.add(virtual_file_path, recursive=True)
+
     def _get_virtual_file_path(self, file_path):
         """
         Retrieves the "virtual" file path for the given
@@ -1258,8 +1288,8 @@ class FileTransactionContext(FileContext, TransactionContext):
         If a write operation has been made after a removal
         the file should be accounted as existent.
 
-        This is a very slow operation and should be used carefully
-        otherwise the operation may become clogged.
+        The check uses the index of removed paths and takes
+        time proportional to the depth of the path.
 
         :type file_path: String
         :param file_path: The path to the file to be checked
@@ -1268,42 +1298,30 @@ class FileTransactionContext(FileContext, TransactionContext):
         :return: The result of the file removal check.
         """
 
-        # iterates over all the path tuples in
-        # path tuples list to check for the ones
-        # that may remove the path
-        for path_tuple in self.path_tuples_list:
-            # retrieves the first item from the path
-            # tuple, the operation value
-            operation = path_tuple[0]
-
-            # in case the operation is not of type remove
-            # continues the loop no removal
-            if not operation == REMOVE_OPERATION:
-                continue
-
-            # unpacks the path tuple (for a remove operation)
-            operation, _file_path, _handle_exception, recursive = path_tuple
+        # checks if the file path (or any of its parent paths
+        # in a recursive way) has been removed in the transaction
+        return self.removed_paths.covers(file_path)
 
-            # in case the recursive flag is not set (possibly just a
-            # normal file an not a directory) and the file path does
-            # not matches the one required skips extra verification
-            if not recursive and not file_path == _file_path:
-                continue
+    def _is_written_file_path(self, virtual_file_path):
+        """
+        Checks if the given virtual file path may have been written
+        in the current context, meaning that the path itself, one of
+        its parents or one of its children has been written.
 
-            # checks if the current iteration file path is
-            # a parent path to the path being checked
-            is_parent_path = path_util.is_parent_path(file_path, _file_path)
+        Note that a negative result ensures that the virtual file path
+        does not exist, while a positive one requires a file system
+        verification of existence.
 
-            # in case it's not a parent path continues
-            # the loop no removal detected
-            if not is_parent_path:
-                continue
-
-            # removal detected
-            return True
+        :type virtual_file_path: String
+        :param virtual_file_path: The virtual path to the file to
+        be checked for writing.
+        :rtype: bool
+        :return: The result of the file writing check.
+        """
 
-        # returns false (no removal detected)
-        return False
+        # checks if the virtual file path is related with any
+        # of the (virtual) paths written in the transaction
+        return self.written_paths.intersects(virtual_file_path)
 
     def _process_path_tuple_add(self, path_tuple):
         """
@@ -1418,3 +1436,91 @@ class FileTransactionContext(FileContext, TransactionContext):
             except Exception as exception:
                 if not handle_exception:
                     raise exception
+
+
+class PathTrie(object):
+    """
+    Index of paths organized as a trie of path components, allowing
+    the checks for the paths (and their parents) to be performed in
+    time proportional to the depth of the path.
+
+    Each of the added paths may be recursive, meaning that it also
+    refers the complete set of paths contained in it.
+    """
+
+    root = None
+    """ The root node of the trie, each node is a map associating
+    the path components with the child nodes and the (optional)
+    marker key with the recursive flag of the node """
+
+    MARKER = None
+    """ The key used in the nodes for the marker of an added path,
+    that can't collide with any path component """
+
+    def __init__(self):
+        self.root = dict()
+
+    def add(self, path, recursive=False):
+        """
+        Adds the provided path to the trie, in case the path is
+        already present the recursive flag is merged with the
+        previous one (recursive takes precedence).
+
+        :type path: String
+        :param path: The path to be added to the trie.
+        :type recursive: bool
+        :param recursive: If the path should be considered as
+        recursive (containing the paths inside it).
+        """
+
+        node = self.root
+        for component in self._split(path):
+            node = node.setdefault(component, dict())
+        node[self.MARKER] = node.get(self.MARKER, False) or recursive
+
+    def covers(self, path):
+        """
+        Checks if the provided path is covered by the trie, meaning
+        that either the path itself has been added or any of its
+        parent paths has been added as recursive.
+
+        :type path: String
+        :param path: The path to be checked for coverage.
+        :rtype: bool
+        :return: If the path is covered by the trie.
+        """
+
+        node = self.root
+        for component in self._split(path):
+            if node.get(self.MARKER, False):
+                return True
+            node = node.get(component, None)
+            if node == None:
+                return False
+        return self.MARKER in node
+
+    def intersects(self, path):
+        """
+        Checks if the provided path intersects the trie, meaning that
+        it's covered by it or that any path inside it has been added.
+
+        :type path: String
+        :param path: The path to be checked for intersection.
+        :rtype: bool
+        :return: If the path intersects the trie.
+        """
+
+        node = self.root
+        for component in self._split(path):
+            if node.get(self.MARKER, False):
+                return True
+            node = node.get(component, None)
+            if node == None:
+                return False
+        return True if node else False
+
+    def _split(self, path):
+        # normalizes the path (absolute and with the proper case for
+        # the current platform) and splits it into its components
+        path = os.path.normcase(os.path.abspath(path))
+        return [component for component in path.split(os.sep) if component]
@@ -81,6 +81,8 @@ class FileTransactionContext(FileContext, TransactionContext):
     transaction_level: int
     temporary_path: PathLike[str] | None
     path_tuples_list: list[PathTuple] | None
+    removed_paths: PathTrie | None
+    written_paths: PathTrie | None
     access_lock: Lock | None
 
     def __init__(self, temporary_path: PathLike[str] | None = ...): ...
@@ -90,7 +92,18 @@ class FileTransactionContext(FileContext, TransactionContext):
     def _cleanup(self): ...
     def _add_path_tuple(self, path_tuple: PathTuple): ...
     def _get_virtual_file_path(self, file_path: PathLike[str]): ...
-    def _is_removed_file_path(self, file_path: PathLike[str]): ...
+    def _is_removed_file_path(self, file_path: PathLike[str]) -> bool: ...
+    def _is_written_file_path(self, virtual_file_path: PathLike[str]) -> bool: ...
     def _process_path_tuple_add(self, path_tuple: PathTuple): ...
     def _process_path_tuple_add_no_replace(self, path_tuple: PathTuple): ...
     def _process_path_tuple_remove(self, path_tuple: PathTuple): ...
+
+class PathTrie(object):
+    root: dict | None
+    MARKER: None
+
+    def __init__(self): ...
+    def add(self, path: PathLike[str], recursive: bool = ...): ...
+    def covers(self, path: PathLike[str]) -> bool: ...
+    def intersects(self, path: PathLike[str]) -> bool: ...
+    def _split(self, path: PathLike[str]) -> list[str]: ...
@@ -45,8 +45,11 @@ def list_intersect(first_list, second_list):
     in both lists (intersection).
     """
 
-    # returns the intersection resulting list
-    return [value for value in first_list if value in second_list]
+    # creates the (hash based) set of values of the second list
+    # and uses it to filter the values of the first list, keeping
+    # the order of the values (and duplicates) of the first list
+    second_set = _ValueSet(second_list)
+    return [value for value in first_list if value in second_set]
 
 
 def list_extend(base_list, extension_list, copy_base_list=True):
@@ -75,8 +78,10 @@ def list_extend(base_list, extension_list, copy_base_list=True):
     result_list = copy_base_list and copy.copy(base_list) or base_list
 
     # creates the list of values that are "new" to the base
-    # list (in order to avoid duplicates)
-    filtered_list = [value for value in extension_list if not value in base_list]
+    # list (in order to avoid duplicates), using an hash based
+    # set for the membership verification of the values
+    base_set = _ValueSet(base_list)
+    filtered_list = [value for value in extension_list if not value in base_set]
 
     # extends the result list with the filtered list (new elements)
     result_list.extend(filtered_list)
@@ -109,11 +114,19 @@ def list_exclude(base_list, exclusion_list, copy_base_list=True):
     # copies the base list to create the initial result list (optional)
     result_list = copy_base_list and copy.copy(base_list) or base_list
 
-    # iterates over all the items in the exclusion list
-    # to remove them from the "result" list
-    for exclusion_item in exclusion_list:
-        # removes the exclusion item from  the result list
-        result_list.remove(exclusion_item)
+    # counts the number of times each of the items should be
+    # excluded, so that the first occurrences of each of them
+    # are removed (as it would happen with the remove operation)
+    counter = _ValueCounter(exclusion_list)
+
+    # filters the result list removing the items to be excluded
+    # and then verifies that all of them have been found
+    filtered_list = [value for value in result_list if not counter.consume(value)]
+    counter.ensure()
+
+    # updates the result list with the filtered items (in place
+    # as the base list may not have been copied)
+    result_list[:] = filtered_list
 
     # returns the result list
     return result_list
@@ -121,8 +134,11 @@ def list_exclude(base_list, exclusion_list, copy_base_list=True):
 
 def list_no_duplicates(list):
     """
-    Removes the duplicated values from the given list.
-    This method is expensive and should be used carefully.
+    Removes the duplicated values from the given list,
+    the order of the values (first occurrence) is preserved.
+
+    The verification of duplicates is hash based, only the
+    unhashable values use a (slower) linear verification.
 
     :type list: List
     :param list: The list to heave it's duplicates removed.
@@ -131,14 +147,15 @@ def list_no_duplicates(list):
     """
 
     # creates the initial result list to hold the results
+    # and the set of values that have already been seen
     result_list = []
+    seen = _ValueSet()
 
     # iterates over all the values in the list
     for value in list:
-        # in case the value already exists
-        # in the result list (duplicate)
-        if value in result_list:
-            # continues the loop
+        # in case the value has already been seen
+        # (duplicate) continues the loop
+        if not seen.add(value):
             continue
 
         # adds the value to the result list
@@ -146,3 +163,120 @@ def list_no_duplicates(list):
 
     # returns the result list
     return result_list
+
+
+class _ValueSet(object):
+    """
+    Set of values that uses hashing for the hashable values
+    and falls back to a linear (equality based) verification
+    for the unhashable ones, decided per value.
+    """
+
+    _hashable = None
+    """ The set containing the hashable values """
+
+    _unhashable = None
+    """ The list containing the unhashable values """
+
+    def __init__(self, values=()):
+        self._hashable = set()
+        self._unhashable = []
+        for value in values:
+            self.add(value)
+
+    def __contains__(self, value):
+        try:
+            return value in self._hashable
+        except TypeError:
+            return value in self._unhashable
+
+    def add(self, value):
+        """
+        Adds the provided value to the set in case it's
+        not already present in it.
+
+        :type value: Object
+        :param value: The value to be added to the set.
+        :rtype: bool
+        :return: If the value has been added (was not present).
+        """
+
+        try:
+            if value in self._hashable:
+                return False
+            self._hashable.add(value)
+        except TypeError:
+            if value in self._unhashable:
+                return False
+            self._unhashable.append(value)
+        return True
+
+
+class _ValueCounter(object):
+    """
+    Counter of values that uses hashing for the hashable values
+    and falls back to a linear (equality based) verification
+    for the unhashable ones, decided per value.
+    """
+
+    _hashable = None
+    """ The map associating the hashable values with
+    their (pending) count """
+
+    _unhashable = None
+    """ The list of pairs with the unhashable values
+    and their (pending) count """
+
+    def __init__(self, values=()):
+        self._hashable = dict()
+        self._unhashable = []
+        for value in values:
+            try:
+                self._hashable[value] = self._hashable.get(value, 0) + 1
+            except TypeError:
+                self._increment(value)
+
+    def consume(self, value):
+        """
+        Consumes (decrements) the count of the provided value
+        in case there's a pending count for it.
+
+        :type value: Object
+        :param value: The value to be consumed.
+        :rtype: bool
+        :return: If the value has been consumed.
+        """
+
+        try:
+            count = self._hashable.get(value, 0)
+            if not count:
+                return False
+            self._hashable[value] = count - 1
+            return True
+        except TypeError:
+            for pair in self._unhashable:
+                if not pair[1] or not pair[0] == value:
+                    continue
+                pair[1] -= 1
+                return True
+            return False
+
+    def ensure(self):
+        """
+        Ensures that all of the values have been consumed,
+        raising an error (as in the remove operation) otherwise.
+        """
+
+        pending = [value for value, count in self._hashable.items() if count]
+        pending += [value for value, count in self._unhashable if count]
+        if not pending:
+            return
+        raise ValueError("list.remove(x): x not in list")
+
+    def _increment(self, value):
+        for pair in self._unhashable:
+            if not pair[0] == value:
+                continue
+            pair[1] += 1
+            return
+        self._unhashable.append([value, 1])
@@ -1,4 +1,4 @@
-from typing import Sequence, TypeVar
+from typing import Any, Iterable, Sequence, TypeVar
 
 T = TypeVar("T")
 
@@ -12,3 +12,14 @@ def list_exclude(
     base_list: Sequence[T], exclusion_list: Sequence[T], copy_base_list: bool = ...
 ): ...
 def list_no_duplicates(list: Sequence[T]) -> list[T]: ...
+
+class _ValueSet(object):
+    def __init__(self, values: Iterable[Any] = ...) -> None: ...
+    def __contains__(self, value: Any) -> bool: ...
+    def add(self, value: Any) -> bool: ...
+
+class _ValueCounter(object):
+    def __init__(self, values: Iterable[Any] = ...) -> None: ...
+    def consume(self, value: Any) -> bool: ...
+    def ensure(self): ...
+    def _increment(self, value: Any): ...
@@ -142,7 +142,7 @@ def map_copy_deep(source_map, destiny_map):
         map_copy_deep(source_value, destiny_value)
 
 
-def map_duplicate(item):
+def map_duplicate(item, memo=None):
     """
     Duplicates the provided item (map) creating a new
     structure with duplicated references both for sequences
@@ -151,42 +151,86 @@ def map_duplicate(item):
     This function is useful in order to avoid reference
     overlapping in data structures.
 
+    The duplication is iterative (no recursion for maps and
+    lists) and uses a memo map so that shared references are
+    duplicated only once (preserving aliasing) and cyclic
+    structures are properly handled, immutable items (including
+    tuples of immutable items) are shared instead of copied.
+
     :type item: Object
     :param item: The item to be used as reference for duplication
     this should be a map at the initial call of the function.
+    :type memo: Dictionary
+    :param memo: The map associating the identifier of the already
+    duplicated items with their duplicates, may be shared among
+    multiple calls to preserve the aliasing between them (the
+    duplicated items are kept alive by the memo, as in deepcopy).
     :rtype: item: Object
     :return: The duplicated data structure with all the references
     replicated in the sequences and maps.
     """
 
+    # creates the memo map in case none is provided, this
+    # map is going to be used to avoid duplicating the same
+    # item multiple times (and to handle cycles)
+    memo = dict() if memo == None else memo
+
     # retrieves the type for the current
     # item in order to percolate it appropriately
     _type = type(item)
 
-    # in case the current item is a sequence
-    # must "copy" all of its elements
-    if _type in (list, tuple):
-        return [map_duplicate(value) for value in item]
-
-    # in case the current item is a map
-    # must create a new map with the result
-    # of the copy of all the elements
-    elif _type == dict:
-        # creates the item map to be populated
-        # with the copied values
-        _item = {}
-
-        # iterates over all the items to copy
-        # them and sets them in the new items map
-        for key, value in legacy.iteritems(item):
-            _item[key] = map_duplicate(value)
-        return _item
+    # in case the current item is a tuple the proper tuple
+    # duplication function is used (tuples are immutable)
+    if _type == tuple:
+        return _map_duplicate_tuple(item, memo)
 
-    # otherwise must be a "single" item and the
-    # (reduce) operation must be performed on it
-    else:
+    # otherwise in case it's not a mutable container it must
+    # be a "single" item and it's shared (returned as is)
+    if not _type in (dict, list):
         return item
 
+    # in case the item has already been duplicated
+    # returns the previous duplicate (aliasing)
+    if id(item) in memo:
+        return memo[id(item)]
+
+    # creates the (empty) duplicate for the item and registers
+    # it in the memo before populating it, so that cycles to
+    # the item are resolved against the duplicate
+    result = dict() if _type == dict else []
+    memo[id(item)] = result
+    _map_keep(item, memo)
+
+    # iterates over the stack of pending containers, populating
+    # the duplicate of each of them with the duplicates of their
+    # values, new containers are added to the stack instead of
+    # using a recursion step (avoids stack overflow)
+    stack = [(item, result)]
+    while stack:
+        source, target = stack.pop()
+        is_map = type(source) == dict
+        values = legacy.iteritems(source) if is_map else enumerate(source)
+        for key, value in values:
+            value_type = type(value)
+            if value_type in (dict, list):
+                duplicate = memo.get(id(value), None)
+                if duplicate == None:
+                    duplicate = dict() if value_type == dict else []
+                    memo[id(value)] = duplicate
+                    _map_keep(value, memo)
+                    stack.append((value, duplicate))
+            elif value_type == tuple:
+                duplicate = _map_duplicate_tuple(value, memo)
+            else:
+                duplicate = value
+            if is_map:
+                target[key] = duplicate
+            else:
+                target.append(duplicate)
+
+    # returns the duplicated (root) item
+    return result
+
 
 def map_remove(removal_map, destiny_map):
     """
@@ -213,7 +257,12 @@ def map_remove(removal_map, destiny_map):
 
 
 def map_extend(
-    base_map, extension_map, override=True, recursive=False, copy_base_map=True
+    base_map,
+    extension_map,
+    override=True,
+    recursive=False,
+    copy_base_map=True,
+    persistent=False,
 ):
     """
     Extends the given map with the extension map,
@@ -244,53 +293,80 @@ def map_extend(
     :type copy_base_map: bool
     :param copy_base_map: If the base map should be copied before
     being extended in order to avoid loss of data.
+    :type persistent: bool
+    :param persistent: If a persistent (read only) map sharing the
+    structure of the base map should be returned instead, so that
+    the cost of the extension is proportional to the size of the
+    extension map and not to the size of the base map.
     :rtype: Dictionary
     :return: The map that result of the merge of both maps.
     """
 
+    # in case the persistent mode is requested returns a persistent
+    # map that shares the structure of the base map, no copy of the
+    # base map is performed (cost is proportional to the extension)
+    if persistent:
+        return PersistentMap(
+            base_map, extension_map, override=override, recursive=recursive
+        )
+
     # copies the base map to create the initial result map (optional)
     result_map = copy.copy(base_map) if copy_base_map else base_map
 
-    # iterates over all the keys and values
-    # in the extension map
-    for key, value in legacy.iteritems(extension_map):
-        # in case the override flag is not set and
-        # the key already exists in the result map
-        # must skip the current iteration loop
-        if not override and key in result_map:
-            continue
-
-        # retrieves the data type for the current value in
-        # iteration so that it may be used to determine the
-        # need for the recursive percolated copy/merge
-        value_type = type(value)
-
-        # in case the value is a map and the recursive flag
-        # is set, must try to extend the current item with
-        # the new one, as expected
-        if recursive and value_type == dict:
-            #  tries to retrieve the result map value, so
-            # that it's possible to extend the current value
-            # with the previously existing one, a default map
-            # is created in case it does not exists so that
-            # it's possible to used as the base for population
-            result_map_value = result_map.get(key, {})
-
-            # extends the map that is currently in the result
-            # map with the new value (recursive step), note
-            # that a new map may have been created to be used
-            # as the placeholder of new map values, this avoids
-            # collision between sub-maps (would cause problems)
-            value = map_extend(
-                result_map_value,
-                value,
-                override=override,
-                recursive=recursive,
-                copy_base_map=copy_base_map,
-            )
-
-        # sets the (extension) value in the result map
-        result_map[key] = value
+    # creates the memo map that associates the pair of base and
+    # extension maps with the resulting map, so that aliased (and
+    # cyclic) extension maps are only extended once
+    memo = {(id(base_map), id(extension_map)): result_map}
+
+    # iterates over the stack of pending maps to be extended, new
+    # (recursive) levels are added to the stack instead of using a
+    # recursion step (avoids stack overflow)
+    stack = [(result_map, extension_map)]
+    while stack:
+        target_map, _extension_map = stack.pop()
+
+        # iterates over all the keys and values
+        # in the extension map
+        for key, value in legacy.iteritems(_extension_map):
+            # in case the override flag is not set and
+            # the key already exists in the target map
+            # must skip the current iteration loop
+            if not override and key in target_map:
+                continue
+
+            # retrieves the data type for the current value in
+            # iteration so that it may be used to determine the
+            # need for the recursive percolated copy/merge
+            value_type = type(value)
+
+            # in case the value is a map and the recursive flag
+            # is set, must try to extend the current item with
+            # the new one, as expected
+            if recursive and value_type == dict:
+                # tries to retrieve the target map value, so that
+                # it's possible to extend the current value with the
+                # previously existing one, a default map is created
+                # in case it does not exists so that it's possible to
+                # use it as the base for population, this avoids
+                # collision between sub-maps (would cause problems)
+                base_value = target_map.get(key, None)
+                base_value = base_value if type(base_value) == dict else None
+                pair = (id(base_value), id(value))
+                if pair in memo:
+                    value = memo[pair]
+                else:
+                    if base_value == None:
+                        _value = dict()
+                    elif copy_base_map:
+                        _value = copy.copy(base_value)
+                    else:
+                        _value = base_value
+                    memo[pair] = _value
+                    stack.append((_value, value))
+                    value = _value
+
+            # sets the (extension) value in the target map
+            target_map[key] = value
 
     # returns the result map
     return result_map
@@ -528,6 +604,210 @@ def map_normalize(item, operation=None):
         return operation(item)
 
 
+class PersistentMap(object):
+    """
+    Read only map that overlays an extension map on top of a
+    base map, sharing the structure of both (no copy is made).
+
+    Creating a new (extended) version of a persistent map has a
+    cost proportional to the number of changes, making it suitable
+    for per request overrides of large (configuration) maps.
+
+    Note that the base and extension maps should not be changed
+    after the creation of the persistent map.
+    """
+
+    base_map = None
+    """ The map used as the base (bottom layer) of the persistent
+    map, may be another persistent map """
+
+    extension_map = None
+    """ The map with the values that extend (overlay) the
+    ones of the base map """
+
+    override = True
+    """ If the values of the extension map override the ones
+    that already exist in the base map """
+
+    recursive = False
+    """ If the nested maps of the extension map should extend the
+    nested maps of the base map (instead of replacing them) """
+
+    _cache = None
+    """ The cache of the nested persistent maps created for the
+    recursive extension, indexed by key """
+
+    def __init__(self, base_map, extension_map=None, override=True, recursive=False):
+        self.base_map = base_map
+        self.extension_map = extension_map or dict()
+        self.override = override
+        self.recursive = recursive
+        self._cache = dict()
+
+    def __getitem__(self, key):
+        if key in self._cache:
+            return self._cache[key]
+        if not key in self.extension_map:
+            return self.base_map[key]
+        if not self.override and key in self.base_map:
+            return self.base_map[key]
+        value = self.extension_map[key]
+        if not self.recursive or not type(value) == dict:
+            return value
+        base_value = self.base_map.get(key, None)
+        if not isinstance(base_value, (dict, PersistentMap)):
+            return value
+        value = PersistentMap(
+            base_value, value, override=self.override, recursive=self.recursive
+        )
+        self._cache[key] = value
+        return value
+
+    def __contains__(self, key):
+        return key in self.extension_map or key in self.base_map
+
+    def __iter__(self):
+        return self.keys()
+
+    def __len__(self):
+        return len(self.base_map) + len(
+            [key for key in self.extension_map if not key in self.base_map]
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, PersistentMap):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "<PersistentMap %s>" % repr(self.to_dict())
+
+    def get(self, key, default=None):
+        if not key in self:
+            return default
+        return self[key]
+
+    def keys(self):
+        for key in self.base_map:
+            yield key
+        for key in self.extension_map:
+            if key in self.base_map:
+                continue
+            yield key
+
+    def values(self):
+        for key in self.keys():
+            yield self[key]
+
+    def items(self):
+        for key in self.keys():
+            yield key, self[key]
+
+    def set(self, key, value):
+        """
+        Creates a new persistent map with the provided key set
+        to the provided value, the current map is not changed.
+
+        :type key: Object
+        :param key: The key to be set in the new map.
+        :type value: Object
+        :param value: The value to be associated with the key.
+        :rtype: PersistentMap
+        :return: The new persistent map with the value set.
+        """
+
+        return PersistentMap(self, {key: value})
+
+    def extend(self, extension_map, override=True, recursive=None):
+        """
+        Creates a new persistent map that extends the current one
+        with the provided extension map, sharing the structure of
+        the current map (the cost is proportional to the extension).
+
+        :type extension_map: Dictionary
+        :param extension_map: The map to be used to extend the map.
+        :type override: bool
+        :param override: If a value should be overridden in
+        case it already exists in the current map.
+        :type recursive: bool
+        :param recursive: If the nested maps should be extended,
+        defaults to the recursive mode of the current map.
+        :rtype: PersistentMap
+        :return: The new persistent map extended with the map.
+        """
+
+        recursive = self.recursive if recursive == None else recursive
+        return PersistentMap(
+            self, extension_map, override=override, recursive=recursive
+        )
+
+    def to_dict(self):
+        """
+        Converts the persistent map into a "normal" map, the nested
+        persistent maps are converted as well (nested maps are shared).
+
+        :rtype: Dictionary
+        :return: The map with the complete set of values of the
+        persistent map.
+        """
+
+        result = dict()
+        for key, value in self.items():
+            if isinstance(value, PersistentMap):
+                value = value.to_dict()
+            result[key] = value
+        return result
+
+
+def _map_duplicate_tuple(item, memo):
+    """
+    Duplicates the provided tuple, duplicating each of its
+    items, as tuples are immutable the original tuple is
+    shared (returned) in case none of its items is changed.
+
+    :type item: Tuple
+    :param item: The tuple to be duplicated.
+    :type memo: Dictionary
+    :param memo: The map associating the identifier of the already
+    duplicated items with their duplicates.
+    :rtype: Tuple
+    :return: The duplicated tuple or the original one in case
+    it only contains immutable items.
+    """
+
+    if id(item) in memo:
+        return memo[id(item)]
+    values = [map_duplicate(value, memo) for value in item]
+    changed = any(value is not _value for value, _value in zip(values, item))
+    result = tuple(values) if changed else item
+    memo[id(item)] = result
+    _map_keep(item, memo)
+    return result
+
+
+def _map_keep(item, memo):
+    """
+    Keeps a reference to the provided (duplicated) item in the
+    memo, so that its identifier is not re-used by another item
+    while the memo is alive (would return a stale duplicate).
+
+    :type item: Object
+    :param item: The item that has been duplicated and that
+    should be kept alive while the memo is alive.
+    :type memo: Dictionary
+    :param memo: The map associating the identifier of the already
+    duplicated items with their duplicates.
+    """
+
+    keep = memo.get(id(memo), None)
+    if keep == None:
+        keep = memo[id(memo)] = []
+    keep.append(item)
+
+
 def _map_flatten_pairs(map):
     """
     Retrieves the complete set of linear key to value pairs
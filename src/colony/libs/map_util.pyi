@@ -1,4 +1,4 @@
-from typing import Any, Callable, Generator, Mapping, Sequence, Type, TypeVar
+from typing import Any, Callable, Generator, Iterator, Mapping, Sequence, Type, TypeVar
 
 T = TypeVar("T")
 V = TypeVar("V")
@@ -7,7 +7,7 @@ def map_clean(map: Mapping[Any, Any]): ...
 def map_get(map: Mapping[Any, Any], keys: Sequence[Any] = []): ...
 def map_copy(source_map: Mapping[Any, Any], destiny_map: Mapping[Any, Any]): ...
 def map_copy_deep(source_map: Mapping[Any, Any], destiny_map: Mapping[Any, Any]): ...
-def map_duplicate(item: Any) -> Any: ...
+def map_duplicate(item: Any, memo: dict[int, Any] | None = ...) -> Any: ...
 def map_remove(removal_map: Mapping[Any, Any], destiny_map: Mapping[Any, Any]): ...
 def map_extend(
     base_map: Mapping[Any, Any],
@@ -15,6 +15,7 @@ def map_extend(
     override: bool = ...,
     recursive: bool = ...,
     copy_base_map: bool = ...,
+    persistent: bool = ...,
 ): ...
 def map_flatten(map: Mapping[str, Any]) -> Mapping[str, Any]: ...
 def map_check_parameters(
@@ -30,5 +31,38 @@ def map_output(
     indentation: str = ...,
 ): ...
 def map_normalize(item: T, operation: Callable[[T], Any] | None = ...) -> Any: ...
+
+class PersistentMap(object):
+    base_map: Mapping[Any, Any]
+    extension_map: Mapping[Any, Any]
+    override: bool
+    recursive: bool
+    def __init__(
+        self,
+        base_map: Mapping[Any, Any],
+        extension_map: Mapping[Any, Any] | None = ...,
+        override: bool = ...,
+        recursive: bool = ...,
+    ) -> None: ...
+    def __getitem__(self, key: Any) -> Any: ...
+    def __contains__(self, key: Any) -> bool: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def __len__(self) -> int: ...
+    def get(self, key: Any, default: Any | None = ...) -> Any: ...
+    def keys(self) -> Iterator[Any]: ...
+    def values(self) -> Iterator[Any]: ...
+    def items(self) -> Iterator[tuple[Any, Any]]: ...
+    def set(self, key: Any, value: Any) -> PersistentMap: ...
+    def extend(
+        self,
+        extension_map: Mapping[Any, Any],
+        override: bool = ...,
+        recursive: bool | None = ...,
+    ) -> PersistentMap: ...
+    def to_dict(self) -> dict[Any, Any]: ...
+
+def _map_duplicate_tuple(
+    item: tuple[Any, ...], memo: dict[int, Any]
+) -> tuple[Any, ...]: ...
 def _map_flatten_pairs(map: Mapping[T, V]) -> Generator[tuple[T, V], None, None]: ...
 def _map_reduce(value: Any) -> Any: ...
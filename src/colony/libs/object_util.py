@@ -32,9 +32,6 @@ import copy
 
 from colony.base import legacy
 
-TOPPER_VALUE = "_topper"
-""" The value of the attribute to hold the top values """
-
 LIST_TYPES = (list, tuple)
 """ A tuple with the various list types """
 
@@ -111,16 +108,29 @@ def object_attribute_values(instance, valid_attribute_names=None, strict=True):
     return valid_attribute_values
 
 
-def object_flatten(instance, flattening_map):
+def object_flatten(instance, flattening_map, generator=False):
     """
     Flattens the given instance using the given flattening
     map as reference for the flattening process.
 
+    The flattening map is compiled into a plan before the
+    flattening, in case the same map is going to be used
+    multiple times the plan may be compiled only once (using
+    the object flatten compile function) and provided instead.
+
     :type instance: Object
     :param instance: The instance to be flatten.
     :type flattening_map: Dictionary
     :param flattening_map: Map describing the structure
-    for flattening.
+    for flattening (or the already compiled plan).
+    :type generator: bool
+    :param generator: If the flattened rows should be lazily
+    yielded by a generator, note that in such mode only the
+    names defined in the flattening map are filled with null
+    values (as the complete set of rows is never available)
+    and the instances may be provided as any iterable.
+    :rtype: List
+    :return: The list (or generator) of flatten instances.
     """
 
     # retrieves the type of the instance
@@ -133,18 +143,207 @@ def object_flatten(instance, flattening_map):
         # (in order to be able to work with it)
         instance = [instance]
     # in case the instance is neither an instance
-    # nor a list
-    elif not instance_type in LIST_TYPES:
+    # nor a list (or an iterable in the generator mode)
+    elif not instance_type in LIST_TYPES and not (
+        generator and hasattr(instance, "__iter__")
+    ):
         # raises a runtime error (no valid instance type)
         raise RuntimeError("Invalid instance type")
 
-    # flattens the structure of the instance (list)
-    # using the flattening map (the returned structure
-    # is a list of "flatten" instances)
-    flatten_list = _object_flatten(instance, flattening_map)
+    # compiles the flattening map into a plan in case it's not
+    # already a plan and then uses it to flatten the instances
+    plan = (
+        flattening_map
+        if isinstance(flattening_map, FlatteningPlan)
+        else object_flatten_compile(flattening_map)
+    )
+    return plan.iterate(instance) if generator else plan.flatten(instance)
+
+
+def object_flatten_compile(flattening_map):
+    """
+    Compiles the provided flattening map into a re-usable
+    plan, with the attribute names and relations resolved
+    once so that the flattening of each instance only has
+    to follow the pre-computed steps.
+
+    :type flattening_map: Dictionary
+    :param flattening_map: Map describing the structure
+    for flattening.
+    :rtype: FlatteningPlan
+    :return: The compiled plan for the flattening map.
+    """
+
+    return FlatteningPlan(flattening_map)
+
+
+class FlatteningPlan(object):
+    """
+    The compiled version of a flattening map, where each level
+    of the map is converted into the sequence of leaf attributes
+    (attribute name and target name) and of relations (attribute
+    name and plan for the relation).
+
+    The relations are considered to be "to-many" when the value
+    of the attribute is a sequence and "to-one" otherwise, the
+    sequence attributes not defined in the map are also "to-many"
+    (multiplying the rows) but without any value being set.
+    """
+
+    leaves = ()
+    """ The sequence of tuples with the attribute name and the
+    target name for the leaf values of the level """
+
+    relations = ()
+    """ The sequence of tuples with the attribute name and the
+    plan (level) for each of the relations of the level """
+
+    names = ()
+    """ The complete set of target names defined in the plan,
+    including the ones of the relations (recursively) """
+
+    mapped = ()
+    """ The set of attribute names defined in the level (either
+    as leaves or relations), the remaining sequence attributes
+    of the instances are expanded as empty relations """
+
+    def __init__(self, flattening_map):
+        leaves = []
+        relations = []
+        names = set()
+        mapped = set()
+
+        for key, value in legacy.iteritems(flattening_map):
+            value_type = type(value)
+            mapped.add(key)
+            if value_type == str:
+                leaves.append((key, value))
+                names.add(value)
+            elif value_type == dict:
+                plan = FlatteningPlan(value)
+                relations.append((key, plan))
+                names.update(plan.names)
+
+        self.leaves = tuple(leaves)
+        self.relations = tuple(relations)
+        self.names = frozenset(names)
+        self.mapped = frozenset(mapped)
+
+    def flatten(self, instances):
+        """
+        Flattens the provided sequence of instances, returning the
+        complete list of rows (one per combination of the to-many
+        relations) with the missing values filled with null.
+
+        :type instances: List
+        :param instances: The sequence of instances to be flatten.
+        :rtype: List
+        :return: The list of flatten instances (rows).
+        """
+
+        # generates the complete set of rows and gathers the complete
+        # set of names (keys) that exist in any of them (plus the ones
+        # defined in the plan)
+        rows = list(self._rows(instances))
+        names = set(self.names)
+        for row in rows:
+            names.update(_object_keys(row))
+
+        # sets the missing values of each row as null, so that every
+        # row becomes uniform with the others
+        for row in rows:
+            for name in names:
+                if not _row_has(row, name):
+                    _row_set(row, name, None)
+
+        # returns the list of flatten rows
+        return rows
+
+    def iterate(self, instances):
+        """
+        Lazily flattens the provided sequence of instances, yielding
+        the rows as they're generated so that the complete set of
+        rows never has to be kept in memory.
+
+        Only the names defined in the plan are filled with null.
+
+        :type instances: Iterable
+        :param instances: The sequence of instances to be flatten.
+        :rtype: Generator
+        :return: The generator of flatten instances (rows).
+        """
+
+        names = self.names
+        for row in self._rows(instances):
+            for name in names:
+                if not _row_has(row, name):
+                    _row_set(row, name, None)
+            yield row
+
+    def _rows(self, instances):
+        # iterates over the complete set of (top level) instances to
+        # generate the rows for each of them, each row is a copy of
+        # the instance with the values of the plan set in it
+        for instance in instances:
+            values = self._values(instance)
+            expansions = self._expansions(instance)
+            for expansion in expansions:
+                row = copy.copy(instance)
+                for name, value in legacy.iteritems(values):
+                    _row_set(row, name, value)
+                for name, value in legacy.iteritems(expansion):
+                    _row_set(row, name, value)
+                yield row
+
+    def _values(self, instance, values=None):
+        # gathers the values of the leaves and of the to-one relations
+        # (recursively) of the instance, null and empty values are
+        # ignored, as are the to-many relations
+        values = dict() if values == None else values
+        get = _getter(instance)
+        for key, name in self.leaves:
+            value = get(key)
+            if not value:
+                continue
+            values[name] = value
+        for key, plan in self.relations:
+            value = get(key)
+            if not value or type(value) in LIST_TYPES:
+                continue
+            plan._values(value, values=values)
+        return values
+
+    def _expansions(self, instance):
+        # gathers the list of values for each of the to-many relations
+        # of the instance (one per item of the relation and per each of
+        # the expansions of the item) and then generates their product,
+        # note that the sequence attributes of the instance that are not
+        # defined in the map also multiply the rows (as empty relations)
+        get = _getter(instance)
+        relations = list(self.relations)
+        for key in _object_keys(instance):
+            if key in self.mapped:
+                continue
+            relations.append((key, EMPTY_PLAN))
+        products = []
+        for key, plan in relations:
+            value = get(key)
+            if not type(value) in LIST_TYPES:
+                continue
+            expansions = []
+            for item in value:
+                item_values = plan._values(item)
+                for expansion in plan._expansions(item):
+                    _expansion = dict(expansion)
+                    _expansion.update(item_values)
+                    expansions.append(_expansion)
+            products.append(expansions)
+        return _product(products)
+
 
-    # returns the flatten list
-    return flatten_list
+EMPTY_PLAN = FlatteningPlan(dict())
+""" The plan (with no leaves nor relations) used for the expansion
+of the sequence attributes that are not defined in the map """
 
 
 def object_print_list(instances_list):
@@ -217,359 +416,69 @@ def _object_flatten(instances_list, flattening_map):
     :return: The list of instances in the flatten state.
     """
 
-    # iterates over all the "base" instances
-    for instance in instances_list:
-        # flattens the instance in the to one relations
-        # and the attributes (according to the flattening map)
-        __object_flatten_to_one(instance, instance, flattening_map)
-
-    # flattens the to many relation in the instances
-    # in the given list
-    instances_list = __object_flatten_to_many(instances_list, flattening_map)
-
-    # flushes the "topper" map in the instances list
-    __object_flush_topper(instances_list)
-
-    # flushes the null elements in the instances list
-    __object_flush_null(instances_list)
+    return object_flatten_compile(flattening_map).flatten(instances_list)
 
-    # returns the list of flatten instances
-    return instances_list
 
-
-def __object_flatten_to_one(base_instance, instance, flattening_map):
+def _product(sequences):
     """
-    Auxiliary function that provides the mechanism
-    to "map" the "to-one" relations in the instance
-    according to the flattening map.
+    Generates the (lazy) cartesian product of the provided
+    sequences of values (maps), where each element of the
+    product is the merge of the values of the sequences.
 
-    :type base_instance: Object
-    :param base_instance: The base (top level) instance to
-    be used to set the top level attributes.
-    :type instance: Object
-    :param instance: The current concrete instance in the
-    recursion set.
-    :type flattening_map: Dictionary
-    :param flattening_map: Map describing the structure
-    for flattening.
+    :type sequences: List
+    :param sequences: The list of sequences of maps to be
+    used in the cartesian product.
+    :rtype: Generator
+    :return: The generator of merged maps for the product.
+    :see: http://en.wikipedia.org/wiki/Cartesian_product
     """
 
-    # iterates over all the keys and values
-    # in the flattening map structure
-    for key, value in legacy.iteritems(flattening_map):
-        # retrieves the value type
-        value_type = type(value)
-
-        # tries to retrieves the instance value
-        # sets the value to invalid in case there
-        # is no such instance value (attribute)
-        instance_value = (
-            __object_has_attr(instance, key)
-            and __object_get_attr(instance, key)
-            or None
-        )
-
-        # in case the instance value is not set, must
-        # continue the loop (skips the current iteration)
-        if instance_value == None:
-            continue
+    if not sequences:
+        yield dict()
+        return
 
-        # in case the value if of type string
-        # (a leaf of the flattening structure)
-        if value_type == str:
-            # sets the leaf value in the base instance
-            __object_set_attr(base_instance, value, instance_value)
-        # in case the value is of type dictionary
-        # (defined to one relation)
-        elif value_type == dict:
-            # "flattens" the to one instance relation (recursion)
-            __object_flatten_to_one(base_instance, instance_value, value)
+    for values in sequences[0]:
+        for _values in _product(sequences[1:]):
+            merged = dict(values)
+            merged.update(_values)
+            yield merged
 
 
-def __object_flatten_to_one_map(base_map, instance, flattening_map):
+def _getter(instance):
     """
-    Auxiliary function that provides the mechanism
-    to "map" the "to-one" relations in the instance
-    according to the flattening map.
+    Retrieves the function to be used to get the (optional)
+    attributes of the provided instance, this function is
+    resolved once per instance (not per attribute).
 
-    :type base_map: Dictionary
-    :param base_map: The base (top level) map to
-    be used to set the top level attributes.
     :type instance: Object
-    :param instance: The current concrete instance in the
-    recursion set.
-    :type flattening_map: Dictionary
-    :param flattening_map: Map describing the structure
-    for flattening.
-    """
-
-    # iterates over all the keys and values
-    # in the flattening map structure
-    for key, value in legacy.iteritems(flattening_map):
-        # retrieves the value type
-        value_type = type(value)
-
-        # tries to retrieves the instance value
-        # sets the value to invalid in case there
-        # is no such instance value (attribute)
-        instance_value = (
-            __object_has_attr(instance, key)
-            and __object_get_attr(instance, key)
-            or None
-        )
-
-        # in case the instance value is not set
-        if instance_value == None:
-            # continues the loop
-            continue
-
-        # in case the value if of type string
-        # (a leaf of the flattening structure)
-        if value_type == str:
-            # sets the leaf value in the base map
-            base_map[value] = instance_value
-        # in case the value is of type dictionary
-        # (defined to one relation)
-        elif value_type == dict:
-            # "flattens" the to one instance relation (recursion)
-            __object_flatten_to_one_map(base_map, instance_value, value)
-
-
-def __object_flatten_to_many(instances_list, flattening_map):
-    """
-    Auxiliary function that provides the mechanism
-    to "map" the "to-many" relations in the instance
-    according to the flattening map.
-
-    :type instances_list: List
-    :param instances_list: The list of instances to have
-    the "to-many" relations mapped.
-    :type flattening_map: Dictionary
-    :param flattening_map: Map describing the structure
-    for flattening.
-    :rtype: List
-    :return: The resulting list after the "to-many" operations
-    that include cartesian product.
-    """
-
-    # creates the new instances list
-    new_instances_list = []
-
-    # iterates over all the instance in the instances
-    # list to process the to many relations
-    for instance in instances_list:
-        # creates a new (initial bucket)
-        # with only the initial instance
-        bucket = [instance]
-
-        # retrieves all the attribute names (keys) for the instance
-        attribute_names = __object_keys(instance)
-
-        # retrieves all the to many attribute names of the instance based
-        # on the type being a list type (tuple or list)
-        to_many_attribute_names = [
-            attribute_name
-            for attribute_name in attribute_names
-            if type(__object_get_attr(instance, attribute_name)) in LIST_TYPES
-        ]
-
-        # iterates over all the "to many" attributes
-        # to process the relations
-        for to_many_attribute_name in to_many_attribute_names:
-            # retrieves the to many attribute
-            to_many_attribute = __object_get_attr(instance, to_many_attribute_name)
-
-            # retrieves the (new) flattening map for the to many
-            # attribute
-            _flattening_map = flattening_map.get(to_many_attribute_name, {})
-
-            # flattens the to many attribute (list) and retrieves the list
-            # of to many instances list
-            to_many_intances_list = __object_flatten_to_many(
-                to_many_attribute, _flattening_map
-            )
-
-            # calculates the new bucket (list) based on the product
-            # of the bucket against the to many instances list, this product
-            # is made with the "help" of the new flattening map
-            bucket = __object_flatten_product(
-                bucket, to_many_intances_list, _flattening_map
-            )
-
-        # extends the new instances list with the bucket for
-        # the current instance
-        new_instances_list.extend(bucket)
-
-    # returns the new instances list
-    return new_instances_list
-
-
-def __object_flush_topper(instances_list):
-    """
-    Flushes (clears) the temporary "topper"
-    map in all the instances in the given list.
-
-    :type instances_list: List
-    :param instances_list: The list of instances to have
-    the "topper" map cleared.
-    """
-
-    # iterates over all the instances in the
-    # instances list (to clear the "topper" map)
-    for instance in instances_list:
-        # in case the instance does not
-        # contain the topper map
-        if not __object_has_attr(instance, TOPPER_VALUE):
-            # continues th loop
-            continue
-
-        # retrieves the "topper" map for
-        # the current instance
-        _topper = __object_get_attr(instance, TOPPER_VALUE)
-
-        # iterates over all the "topper" map
-        # items (to set them in the instance)
-        for key, value in legacy.iteritems(_topper):
-            # sets the item in the instance
-            __object_set_attr(instance, key, value)
-
-        # deletes the (temporary) "topper"
-        # map value
-        __object_del_attr(instance, TOPPER_VALUE)
-
-
-def __object_flush_null(instances_list):
-    """
-    Flushes (clears) the elements in the objects
-    which don't have any value defined.
-    This method allows every object to become uniform
-    with the others.
-
-    :type instances_list: List
-    :param instances_list: The list of instances to have
-    the null values flushed.
+    :param instance: The instance to retrieve the getter.
+    :rtype: Function
+    :return: The function that retrieves the attribute with
+    the provided name from the instance (or null).
     """
 
-    # creates the set of instance keys
-    instances_keys = set()
+    if type(instance) == dict:
+        return instance.get
+    return lambda name: getattr(instance, name, None)
 
-    # iterates over all the instances in the
-    # instances list (to clear retrieve the object keys)
-    for instance in instances_list:
-        # retrieves the keys (names) for the instance
-        instance_keys = __object_keys(instance)
-
-        # retrieves the instances keys from the
-        # union of the instance keys element
-        instances_keys = instances_keys.union(instance_keys)
-
-    # iterates over all the instances in
-    # the instance list
-    for instance in instances_list:
-        # iterates over all the instances keys
-        # in the instances keys list
-        for instances_key in instances_keys:
-            # in case the instance already contains
-            # the instances key
-            if __object_has_attr(instance, instances_key):
-                # continues the loop
-                continue
 
-            # sets the object key in the instance
-            # as null (none)
-            __object_set_attr(instance, instances_key, None)
+def _object_keys(instance):
+    if type(instance) == dict:
+        return instance.keys()
+    return getattr(instance, "__dict__", {}).keys()
 
 
-def __object_flatten_product(first_list, second_list, flattening_map):
-    """
-    Provides a special case of the cartesian product of
-    two sets (in this case lists).
-    Both lists are "multiplied" and then using the flattening
-    map the second list item is filtered accordingly.
-
-    :type first_list: List
-    :param first_list: The first (base) list for the cartesian
-    product.
-    :type second_list: List
-    :param second_list: The second list for the cartesian product.
-    :type flattening_map: Dictionary
-    :param flattening_map: Map describing the structure
-    for flattening.
-    :see: http://en.wikipedia.org/wiki/Cartesian_product
-    """
+def _row_has(row, name):
+    if type(row) == dict:
+        return name in row
+    return hasattr(row, name)
 
-    # creates the initial product list
-    product_list = []
-
-    # iterates over all the items in
-    # the first list
-    for first_item in first_list:
-        # iterates over all the items
-        # in the second list
-        for second_item in second_list:
-            # creates a clone of an item
-            # from the first (base) list
-            new_item = copy.copy(first_item)
-
-            # in case the second item contains
-            # the "topper" attribute
-            if __object_has_attr(second_item, TOPPER_VALUE):
-                # retrieves the "topper" attribute
-                # from the second item
-                _topper = __object_get_attr(second_item, TOPPER_VALUE)
-            # otherwise it's a leaf node and a "topper"
-            # map must be created
-            else:
-                # creates a new "topper" map
-                _topper = {}
-
-            # flattens the to one relations in the second item
-            # and puts them in the topper map
-            __object_flatten_to_one_map(_topper, second_item, flattening_map)
-
-            # sets the "topper" map in the new item
-            __object_set_attr(new_item, TOPPER_VALUE, _topper)
-
-            # adds the new item to the product
-            # list
-            product_list.append(new_item)
-
-    # returns the (instance) product
-    # list (result of multiplication)
-    return product_list
-
-
-def __object_has_attr(instance, attribute_name):
-    """
-    Checks if an attribute with the given name
-    exists in the given instance.
-    This method provides an additional layer of abstraction
-    that allows it to be used in objects or in maps.
 
-    :type instance: Object
-    :param instance: The instance to be checked
-    for attribute.
-    :type attribute_name: String
-    :param attribute_name: The name of the attribute
-    to be checked in the instance.
-    :rtype: bool
-    :return: The result of the has attribute testing
-    in the instance.
-    """
-
-    # retrieves the instance type
-    instance_type = type(instance)
-
-    # in case the instance type is dictionary
-    if instance_type == dict:
-        # checks if the attribute name exists in
-        # instance (map)
-        return attribute_name in instance
-    # otherwise the instance is a "normal" instance
+def _row_set(row, name, value):
+    if type(row) == dict:
+        row[name] = value
     else:
-        # calls the normal has attr function
-        # in the instance
-        return hasattr(instance, attribute_name)
+        setattr(row, name, value)
 
 
 def __object_get_attr(instance, attribute_name, default=None, strict=True):
@@ -623,71 +532,6 @@ def __object_get_attr(instance, attribute_name, default=None, strict=True):
             return default
 
 
-def __object_set_attr(instance, attribute_name, attribute):
-    """
-    Sets an attribute with the given name in the
-    given instance.
-    This method provides an additional layer of abstraction
-    that allows it to be used in objects or in maps.
-
-    :type instance: Object
-    :param instance: The instance to retrieve the
-    attribute.
-    :type attribute_name: String
-    :param attribute_name: The name of the attribute
-    to be set in the instance.
-    :type attribute: Object
-    :param attribute: The attribute (value) to be set in
-    the instance.
-    """
-
-    # retrieves the instance type
-    instance_type = type(instance)
-
-    # in case the instance type is dictionary
-    if instance_type == dict:
-        # sets the attribute using the normal
-        # map setter
-        instance[attribute_name] = attribute
-    # otherwise the instance is a "normal" instance
-    else:
-        # uses the typical setattr function to set
-        # the attribute in the instance
-        setattr(instance, attribute_name, attribute)
-
-
-def __object_del_attr(instance, attribute_name):
-    """
-    Deletes the attribute with the given name from the
-    given instance.
-    This method provides an additional layer of abstraction
-    that allows it to be used in objects or in maps.
-
-    :type instance: Object
-    :param instance: The instance to delete the
-    attribute.
-    :type attribute_name: String
-    :param attribute_name: The name of the attribute
-    to be deleted.
-    :rtype: Object
-    :return: The retrieved attribute from the instance.
-    """
-
-    # retrieves the instance type
-    instance_type = type(instance)
-
-    # in case the instance type is dictionary
-    if instance_type == dict:
-        # calls the del operator in the instance
-        # map (dictionary)
-        del instance[attribute_name]
-    # otherwise the instance is a "normal" instance
-    else:
-        # deletes the attribute from the instance
-        # using the delattr function
-        delattr(instance, attribute_name)
-
-
 def __object_keys(instance):
     """
     Retrieves a list with all the instance names (keys),
@@ -1,6 +1,5 @@
-from typing import Any, Mapping, Sequence, Type
+from typing import Any, FrozenSet, Iterable, Iterator, Mapping, Sequence, Tuple, Type
 
-TOPPER_VALUE: str
 LIST_TYPES: Sequence[Type]
 INVALID_ATTRIBUTE_NAMES: Sequence[str]
 VALID_ATTRIBUTE_TYPES: Sequence[Type]
@@ -12,8 +11,23 @@ def object_attribute_values(
     strict: bool = ...,
 ) -> Sequence[Any]: ...
 def object_flatten(
-    instance: Any, flattening_map: Mapping[Any, Any]
-) -> Sequence[Any]: ...
+    instance: Any,
+    flattening_map: Mapping[Any, Any] | FlatteningPlan,
+    generator: bool = ...,
+) -> Sequence[Any] | Iterator[Any]: ...
+def object_flatten_compile(flattening_map: Mapping[Any, Any]) -> FlatteningPlan: ...
+
+class FlatteningPlan(object):
+    leaves: Sequence[Tuple[str, str]]
+    relations: Sequence[Tuple[str, FlatteningPlan]]
+    names: FrozenSet[str]
+    mapped: FrozenSet[str]
+    def __init__(self, flattening_map: Mapping[Any, Any]) -> None: ...
+    def flatten(self, instances: Sequence[Any]) -> Sequence[Any]: ...
+    def iterate(self, instances: Iterable[Any]) -> Iterator[Any]: ...
+
+EMPTY_PLAN: FlatteningPlan
+
 def object_print_list(instances_list: Sequence[Any]): ...
 def object_print(instance: Any): ...
 def _object_flatten(
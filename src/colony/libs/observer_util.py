@@ -63,6 +63,10 @@ LOGSTASH_APIS = {}
 """ Global map that associates hosts (servers) with Logstash API
 clients, to be used to power singleton based retrieval """
 
+NOTIFY_LOGSTASH = config.conf_bind("NOTIFY_LOGSTASH", False, cast=bool)
+""" The compiled accessor for the configuration value that
+controls if the logstash notifications are enabled """
+
 _KAFKA_CONFIG = None
 """ Cache configuration value, to avoid the constant
 building of the Kafka configuration map """
@@ -397,7 +401,7 @@ def logstash_api(host="main"):
     except ImportError:
         return None
 
-    if not config.conf("NOTIFY_LOGSTASH", False, cast=bool):
+    if not NOTIFY_LOGSTASH():
         return None
 
     api = logstash.API()
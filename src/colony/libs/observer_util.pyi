@@ -8,6 +8,8 @@ ACTION_VALUE: str
 PROGRESS_VALUE: str
 GLOBAL_HANDLERS_MAP: HandlersMap
 KAFKA_PRODUCERS: Mapping[str, Any]
+LOGSTASH_APIS: Mapping[str, Any]
+NOTIFY_LOGSTASH: Callable[[], bool]
 _KAFKA_CONFIG: Mapping[str, Any]
 
 def unique() -> int: ...
@@ -31,11 +31,29 @@ __license__ = "Apache License, Version 2.0"
 import os
 import sys
 import stat
+import errno
 import shutil
+import threading
 
 BUFFER_SIZE = 4096
 """ The size of the buffer for file operations """
 
+COPY_BUFFER_SIZE = 1048576
+""" The size of the buffer (and of the chunks) to be used
+in the copy of the file contents """
+
+COPY_WORKERS = 4
+""" The default maximum number of files to be copied
+concurrently (worker threads) in a directory copy """
+
+COPY_FALLBACK_ERRORS = tuple(
+    getattr(errno, name)
+    for name in ("EXDEV", "ENOSYS", "EINVAL", "ENOTSUP", "EOPNOTSUPP", "EBADF")
+    if hasattr(errno, name)
+)
+""" The set of error codes of the kernel side copy operations
+that trigger the fallback to the user space copy """
+
 LONG_PATH_PREFIX = "\\\\?\\"
 """ The windows long path prefix """
 
@@ -129,7 +147,15 @@ def align_path(path):
     return aligned_path
 
 
-def copy_directory(source_path, target_path, replace_files=True, copy_hidden=True):
+def copy_directory(
+    source_path,
+    target_path,
+    replace_files=True,
+    copy_hidden=True,
+    incremental=False,
+    workers=COPY_WORKERS,
+    callback=None,
+):
     """
     Copies the directory in the given source path to the
     target path.
@@ -139,6 +165,10 @@ def copy_directory(source_path, target_path, replace_files=True, copy_hidden=Tru
     It's possible to control the copying of hidden files using the
     optional copy hidden flag parameter.
 
+    The directory tree is walked (iteratively) in a single thread,
+    creating the directories and links, while the files are copied
+    concurrently by a bounded pool of worker threads.
+
     :type source_path: String
     :param source_path: The path to the source directory.
     :type target_path: String
@@ -149,6 +179,17 @@ def copy_directory(source_path, target_path, replace_files=True, copy_hidden=Tru
     :type copy_hidden: bool
     :param copy_hidden: If the files considered by the os to
     be of type hidden should be copied..
+    :type incremental: bool
+    :param incremental: If the files whose size and modification
+    time match the ones of the target files should be skipped, in
+    this mode the modification time of the copied files is preserved.
+    :type workers: int
+    :param workers: The maximum number of files to be copied
+    concurrently (worker threads).
+    :type callback: Function
+    :param callback: Function to be called after each file is
+    processed (copied or skipped) with the number of processed
+    files and the total number of files.
     """
 
     # normalizes both the target and source paths
@@ -171,49 +212,54 @@ def copy_directory(source_path, target_path, replace_files=True, copy_hidden=Tru
         # raises an exception
         raise Exception("Target path is not a directory: '%s'" % target_path)
 
-    # retrieves the directory list from the source path
-    directory_list = os.listdir(source_path)
-
-    # iterates over all the entry names in the
-    # directory list
-    for entry_name in directory_list:
-        # creates the entry full path from the source path
-        # and the entry name and normalizes it
-        entry_full_path = os.path.join(source_path, entry_name)
-        entry_full_path = normalize_path(entry_full_path)
-
-        # creates the target full path and normalizes it
-        target_full_path = os.path.join(target_path, entry_name)
-        target_full_path = normalize_path(target_full_path)
-
-        # retrieve the base name for the current entry
-        # for hidden checking
-        entry_base_name = os.path.basename(entry_full_path)
-
-        # in case the copy hidden flag is not set and the base
-        # name refers a hidden file or directory
-        if not copy_hidden and entry_base_name.startswith("."):
-            # continues the loop (no copy)
-            continue
-
-        # retrieves the mode
-        mode = os.lstat(entry_full_path)[stat.ST_MODE]
-
-        # in case it is a directory
-        if stat.S_ISDIR(mode):
-            # copies the (sub) directory
-            copy_directory(
-                entry_full_path, target_full_path, replace_files, copy_hidden
-            )
-        # in case it is a symbolic link (special
-        # care must be taken in such case)
-        elif stat.S_ISLNK(mode):
-            # copies the symbolic link to the target path
-            copy_link(entry_full_path, target_full_path, replace_files)
-        # otherwise it's a file and must be copied
-        else:
-            # copies the entry to the target path
-            copy_file(entry_full_path, target_full_path, replace_files)
+    # creates the list that is going to hold the files to be
+    # copied and the stack of directories pending to be walked
+    files = []
+    stack = [(source_path, target_path)]
+
+    # iterates over the stack of directories to walk the complete
+    # tree, creating the target directories and copying the links
+    # (the files are gathered to be copied afterwards)
+    while stack:
+        _source_path, _target_path = stack.pop()
+
+        # iterates over all the entries of the current directory,
+        # no extra normalization is required as both paths are
+        # already normalized (only a name is joined)
+        for entry_name, entry_path, mode in _scan_directory(_source_path):
+            # in case the copy hidden flag is not set and the
+            # name refers a hidden file or directory
+            if not copy_hidden and entry_name.startswith("."):
+                # continues the loop (no copy)
+                continue
+
+            # creates the target full path for the entry
+            entry_target_path = os.path.join(_target_path, entry_name)
+
+            # in case it is a directory creates the target directory
+            # and adds it to the stack to be walked
+            if stat.S_ISDIR(mode):
+                if not os.path.isdir(entry_target_path):
+                    os.makedirs(entry_target_path)
+                stack.append((entry_path, entry_target_path))
+            # in case it is a symbolic link (special
+            # care must be taken in such case)
+            elif stat.S_ISLNK(mode):
+                # copies the symbolic link to the target path
+                copy_link(entry_path, entry_target_path, replace_files)
+            # otherwise it's a file and must be copied
+            else:
+                files.append((entry_path, entry_target_path))
+
+    # copies the complete set of gathered files using the
+    # bounded pool of worker threads
+    _copy_files(
+        files,
+        replace_files=replace_files,
+        incremental=incremental,
+        workers=workers,
+        callback=callback,
+    )
 
 
 def copy_link(source_path, target_path, replace_file=True):
@@ -233,7 +279,7 @@ def copy_link(source_path, target_path, replace_file=True):
     """
 
     # checks if the target path (symbolic link) exists
-    target_file_exists = os.path.exists(target_path)
+    target_file_exists = os.path.lexists(target_path)
 
     # in case the replace file flag is not set and the
     # target path (symbolic link) exists (avoids
@@ -242,6 +288,11 @@ def copy_link(source_path, target_path, replace_file=True):
         # returns immediately (no copy)
         return
 
+    # in case the target path (symbolic link) exists it
+    # must be removed so that it can be replaced
+    if target_file_exists:
+        os.remove(target_path)
+
     # reads the link target (path) from the source path
     # and then uses that value to create the link in the
     # target path (link copy)
@@ -270,20 +321,8 @@ def copy_file(source_path, target_path, replace_file=True):
     source_path = normalize_path(source_path)
     target_path = normalize_path(target_path)
 
-    # checks if the target path (file) exists
-    target_file_exists = os.path.exists(target_path)
-
-    # in case the replace file flag is not set and the
-    # target path (file) exists (avoids replacing file)
-    if not replace_file and target_file_exists:
-        # returns immediately (no copy)
-        return
-
-    # opens the source file and the target file, and
-    # copies the file contents from the source file to
-    # the target file
-    with open(source_path, "rb") as source_file, open(target_path, "wb") as target_file:
-        shutil.copyfileobj(source_file, target_file, BUFFER_SIZE)
+    # copies the file between the normalized paths
+    _copy_file(source_path, target_path, replace_file=replace_file)
 
 
 def remove_directory(directory_path):
@@ -313,11 +352,12 @@ def remove_directory(directory_path):
         # problems in various platforms)
         path = normalize_path(path)
 
-        # in case the path is a directory
-        if os.path.isdir(path):
+        # in case the path is a directory (and not a symbolic
+        # link to a directory, that must not be followed)
+        if os.path.isdir(path) and not os.path.islink(path):
             # removes the directory
             remove_directory(path)
-        # otherwise it must be a "normal" file
+        # otherwise it must be a "normal" file (or link)
         else:
             # removes the path
             os.remove(path)
@@ -485,6 +525,258 @@ def is_parent_path(path, parent_path):
         return True
 
 
+def _scan_directory(path):
+    """
+    Scans the directory in the provided path, yielding the name,
+    the path and the mode (not following links) of each entry.
+
+    Uses the scan directory support of the os module (if available)
+    so that most of the times no extra stat operations are required.
+
+    :type path: String
+    :param path: The path to the directory to be scanned.
+    :rtype: Generator
+    :return: Generator that yields tuples with the name, the path
+    and the mode of each of the entries of the directory.
+    """
+
+    # in case there's no scan directory support falls back to the
+    # listing of the directory with a stat operation per entry
+    if not hasattr(os, "scandir"):
+        for name in os.listdir(path):
+            entry_path = os.path.join(path, name)
+            yield name, entry_path, os.lstat(entry_path)[stat.ST_MODE]
+        return
+
+    # scans the directory converting the type information of the
+    # entries (usually available without a stat) into a mode
+    for entry in os.scandir(path):
+        if entry.is_symlink():
+            mode = stat.S_IFLNK
+        elif entry.is_dir(follow_symlinks=False):
+            mode = stat.S_IFDIR
+        else:
+            mode = stat.S_IFREG
+        yield entry.name, entry.path, mode
+
+
+def _copy_files(files, replace_files=True, incremental=False, workers=1, callback=None):
+    """
+    Copies the provided files (pairs of source and target paths)
+    using a bounded pool of worker threads.
+
+    The first error raised by any of the copies is re-raised after
+    the complete set of worker threads is finished.
+
+    :type files: List
+    :param files: The sequence of tuples with the source and the
+    target paths of the files to be copied.
+    :type replace_files: bool
+    :param replace_files: If the files should be replaced
+    in case duplicate files are found.
+    :type incremental: bool
+    :param incremental: If the files whose size and modification
+    time match should be skipped.
+    :type workers: int
+    :param workers: The maximum number of files to be copied
+    concurrently (worker threads).
+    :type callback: Function
+    :param callback: Function to be called after each file is
+    processed with the number of processed files and the total.
+    """
+
+    total = len(files)
+    state = dict(index=0, count=0)
+    errors = []
+    lock = threading.Lock()
+
+    def work():
+        while True:
+            with lock:
+                if state["index"] == total or errors:
+                    return
+                source_path, target_path = files[state["index"]]
+                state["index"] += 1
+            try:
+                _copy_file_incremental(
+                    source_path,
+                    target_path,
+                    replace_file=replace_files,
+                    incremental=incremental,
+                )
+            except BaseException as exception:
+                with lock:
+                    errors.append(exception)
+                return
+            with lock:
+                state["count"] += 1
+                if callback:
+                    callback(state["count"], total)
+
+    # in case a single worker is requested (or there's a single
+    # file) the copy is performed in the current thread
+    if workers <= 1 or total <= 1:
+        work()
+    else:
+        threads = [
+            threading.Thread(target=work) for _index in range(min(workers, total))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def _copy_file(source_path, target_path, replace_file=True):
+    """
+    Copies a file in the given (already normalized) source
+    path to the (already normalized) target path.
+
+    :type source_path: String
+    :param source_path: The path to the source file.
+    :type target_path: String
+    :param target_path: The path to the target file.
+    :type replace_file: bool
+    :param replace_file: If the file should be replaced
+    in existent files is found.
+    """
+
+    # checks if the target path (file) exists
+    target_file_exists = os.path.exists(target_path)
+
+    # in case the replace file flag is not set and the
+    # target path (file) exists (avoids replacing file)
+    if not replace_file and target_file_exists:
+        # returns immediately (no copy)
+        return
+
+    # opens the source file and the target file, and
+    # copies the file contents from the source file to
+    # the target file (using kernel side copy if possible)
+    with open(source_path, "rb") as source_file, open(target_path, "wb") as target_file:
+        _copy_contents(source_file, target_file)
+
+
+def _copy_file_incremental(
+    source_path, target_path, replace_file=True, incremental=False
+):
+    """
+    Copies a file in the given source path to the target path
+    (already normalized), skipping the copy in incremental mode
+    in case the size and the modification time match.
+
+    :type source_path: String
+    :param source_path: The path to the source file.
+    :type target_path: String
+    :param target_path: The path to the target file.
+    :type replace_file: bool
+    :param replace_file: If the file should be replaced
+    in existent files is found.
+    :type incremental: bool
+    :param incremental: If the file should be skipped in case
+    the size and modification time match the target ones.
+    """
+
+    # in case the incremental mode is not active copies
+    # the file using the default strategy
+    if not incremental:
+        _copy_file(source_path, target_path, replace_file=replace_file)
+        return
+
+    # retrieves the stat information of both files, to be
+    # used in the verification of the incremental copy
+    source_stat = os.stat(source_path)
+    try:
+        target_stat = os.stat(target_path)
+    except OSError:
+        target_stat = None
+
+    # in case the target file exists and either it should not be
+    # replaced or it matches the source file (size and modification
+    # time), the copy is skipped
+    if target_stat and (
+        not replace_file
+        or (
+            target_stat.st_size == source_stat.st_size
+            and int(target_stat.st_mtime) == int(source_stat.st_mtime)
+        )
+    ):
+        return
+
+    # copies the file and then updates the access and modification
+    # times of the target file so that it matches the source
+    _copy_file(source_path, target_path, replace_file=replace_file)
+    os.utime(target_path, (source_stat.st_atime, source_stat.st_mtime))
+
+
+def _copy_contents(source_file, target_file):
+    """
+    Copies the contents of the source file into the target file,
+    using kernel side copy (copy file range or send file) in case
+    it's available, avoiding the copy of the data into user space.
+
+    In case the kernel side copy fails (not supported for the
+    files in question) falls back to the user space copy.
+
+    :type source_file: File
+    :param source_file: The file (opened for reading) from which
+    the contents are going to be copied.
+    :type target_file: File
+    :param target_file: The file (opened for writing) into which
+    the contents are going to be copied.
+    """
+
+    # tries to copy the contents using the kernel side operations,
+    # in case they succeed there's nothing more to be done
+    if _copy_contents_kernel(source_file, target_file):
+        return
+
+    # rewinds both files (discarding any partial copy) and copies
+    # the contents using the user space buffered copy
+    source_file.seek(0)
+    target_file.seek(0)
+    target_file.truncate()
+    shutil.copyfileobj(source_file, target_file, COPY_BUFFER_SIZE)
+
+
+def _copy_contents_kernel(source_file, target_file):
+    # retrieves the kernel side copy function to be used, the
+    # send file operation is only used under linux as other
+    # platforms only support sockets as the target
+    if hasattr(os, "copy_file_range"):
+        copy = lambda source, target, count, offset: os.copy_file_range(
+            source, target, count
+        )
+    elif hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        copy = lambda source, target, count, offset: os.sendfile(
+            target, source, offset, count
+        )
+    else:
+        return False
+
+    source = source_file.fileno()
+    target = target_file.fileno()
+    offset = 0
+
+    # copies the contents chunk by chunk until the end of the source
+    # file is reached, the unsupported errors trigger the fallback
+    while True:
+        try:
+            count = copy(source, target, COPY_BUFFER_SIZE, offset)
+        except OSError as exception:
+            if exception.errno in COPY_FALLBACK_ERRORS:
+                return False
+            raise
+        if not count:
+            break
+        offset += count
+
+    return True
+
+
 def _relative_path_windows(path, start_path=CURRENT_DIRECTORY):
     """
     "Calculates" the relative path between the base path
@@ -1,7 +1,10 @@
 from os import PathLike
-from typing import Sequence
+from typing import IO, Callable, Generator, Sequence
 
 BUFFER_SIZE: int
+COPY_BUFFER_SIZE: int
+COPY_WORKERS: int
+COPY_FALLBACK_ERRORS: Sequence[int]
 LONG_PATH_PREFIX: str
 CURRENT_DIRECTORY: str
 PARENT_DIRECTORY: str
@@ -18,6 +21,9 @@ def copy_directory(
     target_path: PathLike[str],
     replace_files: bool = ...,
     copy_hidden: bool = ...,
+    incremental: bool = ...,
+    workers: int = ...,
+    callback: Callable[[int, int], None] | None = ...,
 ) -> None: ...
 def copy_link(
     source_path: PathLike[str], target_path: PathLike[str], replace_file: bool = ...
@@ -35,6 +41,27 @@ def link(
 def link_copy(target_path: PathLike[str], link_path: PathLike[str]): ...
 def ensure_file_path(file_path: PathLike[str], default_file_path: PathLike[str]): ...
 def is_parent_path(path: PathLike[str], parent_path: PathLike[str]) -> bool: ...
+def _scan_directory(
+    path: PathLike[str],
+) -> Generator[tuple[str, PathLike[str], int], None, None]: ...
+def _copy_files(
+    files: Sequence[tuple[PathLike[str], PathLike[str]]],
+    replace_files: bool = ...,
+    incremental: bool = ...,
+    workers: int = ...,
+    callback: Callable[[int, int], None] | None = ...,
+): ...
+def _copy_file(
+    source_path: PathLike[str], target_path: PathLike[str], replace_file: bool = ...
+): ...
+def _copy_file_incremental(
+    source_path: PathLike[str],
+    target_path: PathLike[str],
+    replace_file: bool = ...,
+    incremental: bool = ...,
+): ...
+def _copy_contents(source_file: IO[bytes], target_file: IO[bytes]): ...
+def _copy_contents_kernel(source_file: IO[bytes], target_file: IO[bytes]) -> bool: ...
 def _relative_path_windows(
     path: PathLike[str], start_path: PathLike[str] = ...
 ) -> PathLike[str]: ...
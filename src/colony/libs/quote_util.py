@@ -30,14 +30,17 @@ __license__ = "Apache License, Version 2.0"
 
 from colony.base import legacy
 
-from . import string_buffer_util
-
 QUOTE_SAFE_CHAR = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-"
 """ The string containing all the safe characters to be quoted """
 
 QUOTE_SAFE_MAPS = {}
 """ The map of cached (buffered) safe lists to be quoted """
 
+QUOTE_SAFE_BYTES = {}
+""" The map of cached (buffered) byte strings with the safe
+characters, used to verify (through deletion) if a value
+contains any character that requires quoting """
+
 HEX_TO_CHAR_MAP = dict(
     (legacy.bytes("%02x" % i), legacy.bytes(chr(i))) for i in range(256)
 )
@@ -68,37 +71,15 @@ def quote(string_value, safe="/"):
     if is_unicode:
         string_value = string_value.encode("utf-8")
 
-    # creates the cache key tuple, that is going to be used
-    # to avoid the re-creation of the safe map in every operation
-    cache_key = (safe, QUOTE_SAFE_CHAR)
-
-    try:
-        # in case the cache key is not defined
-        # in the quote safe maps, creates a new entry
-        safe_map = QUOTE_SAFE_MAPS[cache_key]
-    except KeyError:
-        # adds the "base" quote safe characters to the
-        # "safe list"
-        safe += QUOTE_SAFE_CHAR
-
-        # starts the safe map
-        safe_map = {}
-
-        # iterates over all the ascii values
-        for index in range(256):
-            # retrieves the character for the given index,
-            # note that this strategy takes into account the
-            # current version of the python environment
-            character = chr(index)
-            reference = index if legacy.PYTHON_3 else character
-
-            # adds the "valid" character or the safe map entry
-            safe_map[reference] = (
-                character if (character in safe) else ("%%%02X" % index)
-            )
+    # retrieves the safe map and the safe bytes for the requested
+    # safe characters, these values are cached per safe value
+    safe_map, safe_bytes = _quote_tables(safe)
 
-        # sets the safe map in the cache quote safe maps
-        QUOTE_SAFE_MAPS[cache_key] = safe_map
+    # in case every character of the value is safe (nothing remains
+    # after the deletion of the safe characters) the value is returned
+    # unchanged, avoiding the per character resolution (fast path)
+    if not string_value.translate(None, safe_bytes):
+        return string_value.decode("latin-1") if legacy.PYTHON_3 else string_value
 
     # maps the get item method of the map to all the string
     # values to retrieve the valid items
@@ -169,6 +150,8 @@ def unquote(string_value, strict=True):
         string_value = string_value.encode(encoding)
     if strict:
         string_value.decode("ascii")
+    if not b"%" in string_value:
+        return string_value.decode("utf-8") if legacy.PYTHON_3 else string_value
     string_value_splitted = string_value.split(b"%")
 
     # iterates over all the "percentage values" range to decode
@@ -246,43 +229,212 @@ def url_encode(attributes_map=None, attributes_list=None, plus_encoding=False):
     :return: The encoded attributes string.
     """
 
-    # retrieves the quote method to be used
-    quote_method = plus_encoding and quote_plus or quote
-
-    # creates a string buffer to hold the encoded attribute values
-    string_buffer = string_buffer_util.StringBuffer()
-
     # retrieves the reference to the proper items sequence to be used
     # notice that the attributes map has preference to the list version
     items = legacy.iteritems(attributes_map) if attributes_map else attributes_list
 
-    # sets the is first flag, that is going to be used in the iteration
-    # cycle to define the first iteration (exceptional iteration)
-    is_first = True
-
-    # iterates over all the attribute keys and values to be able to
-    # quote their values and append the value to the buffer
-    for attribute_key, attribute_value in items:
-        # quotes both the attribute key and value
-        attribute_key_quoted = quote_method(attribute_key)
-        attribute_value_quoted = quote_method(attribute_value)
-
-        # in case it's is the first iteration
-        if is_first:
-            # unsets the is first flag
-            is_first = False
-        else:
-            # writes the and continuation in the string buffer
-            string_buffer.write("&")
-
-        # adds the quoted key and value strings to the
-        # string buffer
-        string_buffer.write(attribute_key_quoted)
-        string_buffer.write("=")
-        string_buffer.write(attribute_value_quoted)
-
-    # retrieves the encoded attributes from the string buffer
-    encoded_attributes = string_buffer.get_value()
-
-    # returns the encoded attributes
-    return encoded_attributes
+    # quotes the complete set of keys and values at once (single
+    # resolution of the quoting tables) and then joins the pairs
+    # of quoted values into the final encoded attributes string
+    values = quote_many(
+        [value for item in items for value in item], plus_encoding=plus_encoding
+    )
+    iterator = iter(values)
+    return "&".join([key + "=" + value for key, value in zip(iterator, iterator)])
+
+
+def quote_many(values, safe=None, plus_encoding=False):
+    """
+    Quotes the provided sequence of string values according
+    to the URL encoding specification, the quoting tables are
+    resolved only once for the complete sequence of values.
+
+    The result is the same as calling the quote (or the quote
+    plus) function for each of the values.
+
+    :type values: Iterable
+    :param values: The sequence of string values to be quoted.
+    :type safe: String
+    :param safe: The string containing the characters considered
+    safe for quoting, in case it's not defined the default value
+    of the (plus) quote function is used.
+    :type plus_encoding: bool
+    :param plus_encoding: If the plus encoding should be used.
+    :rtype: List
+    :return: The list containing the quoted string values.
+    """
+
+    # resolves the safe characters to be used and retrieves the
+    # tables for them, note that for plus encoding the space is
+    # considered safe and then replaced by the plus sign
+    if safe == None:
+        safe = "" if plus_encoding else "/"
+    if plus_encoding:
+        safe += " "
+    safe_map, safe_bytes = _quote_tables(safe)
+    resolve = safe_map.__getitem__
+
+    # iterates over the complete set of values to quote them, using
+    # the fast path (unchanged value) whenever possible
+    result = []
+    for value in values:
+        if type(value) == legacy.UNICODE:
+            value = value.encode("utf-8")
+        if value.translate(None, safe_bytes):
+            value = "".join(map(resolve, value))
+        elif legacy.PYTHON_3:
+            value = value.decode("latin-1")
+        if plus_encoding:
+            value = value.replace(" ", "+")
+        result.append(value)
+
+    # returns the final list containing the quoted values
+    return result
+
+
+class UrlDecoder(object):
+    """
+    Incremental decoder for URL encoded (form) data, meant to
+    be used for large bodies that are received in chunks.
+
+    The data is fed into the decoder as it's received and the
+    complete pairs of key and value are returned, only the
+    last (incomplete) pair is kept in memory.
+    """
+
+    pending = []
+    """ The list of chunks of data that compose the current
+    (incomplete) pair of key and value """
+
+    strict = True
+    """ If the unquoting operation should be performed using
+    a strict approach (validation for ascii compliance) """
+
+    def __init__(self, strict=True):
+        self.pending = []
+        self.strict = strict
+
+    def feed(self, data):
+        """
+        Feeds the provided chunk of data into the decoder, returning
+        the complete pairs of key and value that have been decoded.
+
+        :type data: String
+        :param data: The chunk of URL encoded data to be decoded.
+        :rtype: List
+        :return: The list of tuples with the key and value of each
+        of the pairs completed by the provided chunk of data.
+        """
+
+        # in case the data is unicode based it must be encoded first
+        # so that the complete processing is done using bytes
+        if type(data) == legacy.UNICODE:
+            data = data.encode("utf-8")
+
+        # in case there's no separator in the chunk the pair is not
+        # complete and the chunk is just stored for latter usage
+        if not b"&" in data:
+            self.pending.append(data)
+            return []
+
+        # splits the data around the separator, joining the first part
+        # with the pending chunks and keeping the last part as pending
+        parts = data.split(b"&")
+        if self.pending:
+            self.pending.append(parts[0])
+            parts[0] = b"".join(self.pending)
+        self.pending = [parts.pop()]
+
+        # decodes the complete set of (non empty) parts, returning the
+        # resulting pairs of key and value to the caller method
+        return [self._decode(part) for part in parts if part]
+
+    def close(self):
+        """
+        Closes the decoder, returning the pairs of key and value that
+        remain to be returned (the last pair of the data).
+
+        :rtype: List
+        :return: The list of tuples with the key and value of the
+        remaining pair (empty in case there's no remaining pair).
+        """
+
+        part = b"".join(self.pending)
+        self.pending = []
+        return [self._decode(part)] if part else []
+
+    def _decode(self, part):
+        key, _separator, value = part.partition(b"=")
+        return (
+            unquote_plus(key, strict=self.strict),
+            unquote_plus(value, strict=self.strict),
+        )
+
+
+def url_decode(data, strict=True):
+    """
+    Decodes the provided URL encoded data (or sequence of chunks
+    of data) into a list of tuples of key and value, this is the
+    reverse operation of the URL encode.
+
+    :type data: String
+    :param data: The URL encoded data or an iterable of chunks of
+    it (eg: file like object with large form data).
+    :type strict: bool
+    :param strict: If the unquoting operation should be performed
+    using a strict approach meaning that all the characters are
+    properly validated for ascii compliance.
+    :rtype: List
+    :return: The list of tuples with the decoded keys and values.
+    """
+
+    # converts the data into a sequence of chunks in case a simple
+    # string value is provided and then feeds the complete set of
+    # chunks into the incremental decoder
+    if legacy.is_string(data, all=True):
+        data = (data,)
+    decoder = UrlDecoder(strict=strict)
+    result = []
+    for chunk in data:
+        result.extend(decoder.feed(chunk))
+    result.extend(decoder.close())
+    return result
+
+
+def _quote_tables(safe):
+    # creates the cache key tuple, that is going to be used
+    # to avoid the re-creation of the safe map in every operation
+    cache_key = (safe, QUOTE_SAFE_CHAR)
+
+    try:
+        # in case the cache key is not defined
+        # in the quote safe maps, creates a new entry
+        return QUOTE_SAFE_MAPS[cache_key], QUOTE_SAFE_BYTES[cache_key]
+    except KeyError:
+        # adds the "base" quote safe characters to the
+        # "safe list"
+        safe += QUOTE_SAFE_CHAR
+
+        # starts the safe map and the list of safe byte values
+        safe_map = {}
+        safe_indexes = []
+
+        # iterates over all the ascii values
+        for index in range(256):
+            # retrieves the character for the given index,
+            # note that this strategy takes into account the
+            # current version of the python environment
+            character = chr(index)
+            reference = index if legacy.PYTHON_3 else character
+
+            # adds the "valid" character or the safe map entry
+            safe_map[reference] = (
+                character if (character in safe) else ("%%%02X" % index)
+            )
+            if character in safe:
+                safe_indexes.append(index)
+
+        # sets the safe map and the safe bytes in the cache
+        QUOTE_SAFE_MAPS[cache_key] = safe_map
+        QUOTE_SAFE_BYTES[cache_key] = bytes(bytearray(safe_indexes))
+        return safe_map, QUOTE_SAFE_BYTES[cache_key]
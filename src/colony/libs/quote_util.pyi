@@ -1,7 +1,8 @@
-from typing import Any, Mapping, Sequence
+from typing import Any, Iterable, Mapping, Sequence
 
 QUOTE_SAFE_CHAR: str
 QUOTE_SAFE_MAPS: Mapping[str, Mapping[Any, str]]
+QUOTE_SAFE_BYTES: Mapping[str, bytes]
 HEX_TO_CHAR_MAP: Mapping[bytes, bytes]
 
 def quote(string_value: str, safe: str = ...) -> str: ...
@@ -13,3 +14,20 @@ def url_encode(
     attributes_list: Sequence[tuple[str, str]] | None = ...,
     plus_encoding: bool = ...,
 ) -> str: ...
+def quote_many(
+    values: Iterable[str], safe: str | None = ..., plus_encoding: bool = ...
+) -> list[str]: ...
+
+class UrlDecoder(object):
+    pending: list[bytes]
+    strict: bool
+
+    def __init__(self, strict: bool = ...): ...
+    def feed(self, data: str | bytes) -> list[tuple[str, str]]: ...
+    def close(self) -> list[tuple[str, str]]: ...
+    def _decode(self, part: bytes) -> tuple[str, str]: ...
+
+def url_decode(
+    data: str | bytes | Iterable[str | bytes], strict: bool = ...
+) -> list[tuple[str, str]]: ...
+def _quote_tables(safe: str) -> tuple[Mapping[Any, str], bytes]: ...
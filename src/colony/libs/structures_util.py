@@ -29,6 +29,7 @@ __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
 import math
+import collections
 
 from colony.base import legacy
 
@@ -676,6 +677,109 @@ class MultipleValueMap(object):
         values.remove(value)
 
 
+class OrderedSet(object):
+    """
+    Set structure that keeps the insertion order of its
+    elements while providing constant time membership
+    tests, insertions and removals.
+
+    The interface of the structure mimics the one of a list
+    so that it may be used as a drop-in replacement for lists
+    that are only appended, removed and tested for membership,
+    note that duplicated insertions are silently ignored.
+    """
+
+    _map = None
+    """ The ordered map to be used internally for the storage
+    of the elements (as keys) in the insertion order """
+
+    def __init__(self, iterable=None):
+        """
+        Constructor of the class.
+
+        :type iterable: Iterable
+        :param iterable: The (optional) iterable to be used to
+        populate the ordered set initially.
+        """
+
+        self._map = collections.OrderedDict()
+        if iterable:
+            self.extend(iterable)
+
+    def __len__(self):
+        return self._map.__len__()
+
+    def __iter__(self):
+        # iterates over a snapshot of the elements so that
+        # the set may be changed during the iteration, just
+        # like it's possible with the list structure
+        return iter(list(self._map))
+
+    def __contains__(self, item):
+        return self._map.__contains__(item)
+
+    def __getitem__(self, index):
+        return list(self._map)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, OrderedSet):
+            other = list(other._map)
+        return list(self._map) == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, list(self._map))
+
+    __hash__ = None
+
+    def append(self, value):
+        """
+        Adds the provided value to the end of the ordered set,
+        in case the value is already present nothing is changed.
+
+        :type value: Object
+        :param value: The (hashable) value to be added.
+        """
+
+        if value in self._map:
+            return
+        self._map[value] = True
+
+    def add(self, value):
+        self.append(value)
+
+    def extend(self, iterable):
+        for value in iterable:
+            self.append(value)
+
+    def remove(self, value):
+        """
+        Removes the provided value from the ordered set raising
+        a value error in case it does not exist (as in list).
+
+        :type value: Object
+        :param value: The value to be removed.
+        """
+
+        if not value in self._map:
+            raise ValueError("value not in ordered set")
+        del self._map[value]
+
+    def discard(self, value):
+        self._map.pop(value, None)
+
+    def index(self, value):
+        return list(self._map).index(value)
+
+    def clear(self):
+        self._map.clear()
+
+    def copy(self):
+        return OrderedSet(self._map)
+
+
 class FormatTuple(object):
     """
     Tuple based structure that may be used to represent
@@ -1,5 +1,5 @@
 from os import PathLike
-from typing import Any, Iterator, Mapping, Sequence, TypeVar
+from typing import Any, Iterable, Iterator, Mapping, Sequence, TypeVar
 
 T = TypeVar("T")
 K = TypeVar("K")
@@ -55,6 +55,21 @@ class MultipleValueMap[K, V]:
     def iterkeys(self) -> Iterator[K]: ...
     def unset(self, key: K, value: V): ...
 
+class OrderedSet[T]:
+    def __init__(self, iterable: Iterable[T] | None = ...): ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[T]: ...
+    def __contains__(self, item: object) -> bool: ...
+    def __getitem__(self, index: int) -> T: ...
+    def append(self, value: T): ...
+    def add(self, value: T): ...
+    def extend(self, iterable: Iterable[T]): ...
+    def remove(self, value: T): ...
+    def discard(self, value: T): ...
+    def index(self, value: T) -> int: ...
+    def clear(self): ...
+    def copy(self) -> OrderedSet[T]: ...
+
 class FormatTuple:
     format_string: str
     arguments: Sequence[Any]
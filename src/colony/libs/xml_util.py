@@ -28,7 +28,8 @@ __copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
 __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
-import xml.dom.minidom
+import xml.dom
+import xml.etree.ElementTree
 
 from colony.base import legacy
 
@@ -48,11 +49,102 @@ def xml_to_dict(data):
     :return: The dictionary representation of the XML data.
     """
 
+    # in case the provided data is an already parsed (DOM) node
+    # converts it directly, there's no parsing to be done
     if isinstance(data, xml.dom.Node):
-        node = data
+        return _node_to_dict(data)
+
+    # parses the XML data using the element tree parser, keeping
+    # track of the namespace prefixes so that the names of the
+    # elements are the qualified ones (as in the DOM)
+    if legacy.is_bytes(data):
+        source = legacy.BytesIO(data)
     else:
-        node = xml.dom.minidom.parseString(data)
-    return _node_to_dict(node)
+        source = legacy.StringIO(data)
+    namespaces = dict()
+    iterator = xml.etree.ElementTree.iterparse(source, events=("start-ns",))
+    for _event, (prefix, uri) in iterator:
+        namespaces[uri] = prefix
+    root = iterator.root
+
+    # converts the root element into the dictionary representation,
+    # the name of the root element is used as the top level key
+    names = dict()
+    name = _element_name(root.tag, namespaces, names)
+    return {name: _element_to_dict(root, namespaces, names)}
+
+
+def xml_to_dict_iter(source, path):
+    """
+    Converts the XML document in the provided source into a
+    sequence of dictionaries, one for each element that matches
+    the provided path (eg: every item of a catalog).
+
+    The document is parsed incrementally and the elements are
+    discarded as soon as they're converted, so that the memory
+    usage remains flat for documents of any size.
+
+    :type source: String/File
+    :param source: The path to the XML file or a file like object
+    from which the XML document is going to be read.
+    :type path: String
+    :param path: The slash separated path of element names that
+    should be matched (from the end), for instance "item" matches
+    every item element and "items/item" matches only the item
+    elements that are direct children of an items element.
+    :rtype: Generator
+    :return: The generator that yields the dictionary (or string)
+    representation of each of the matched elements.
+    """
+
+    # splits the path into its names, the last of them is the name
+    # of the elements that are going to be matched (candidates)
+    path = path.strip("/").split("/")
+    path_length = len(path)
+    target = path[-1]
+
+    # starts the stack of the currently open elements (and their
+    # names) and the number of open candidate elements, elements
+    # inside candidates must be kept until the candidate ends
+    elements = []
+    stack = []
+    candidates = 0
+
+    namespaces = dict()
+    names = dict()
+    events = ("start", "end", "start-ns")
+    iterator = xml.etree.ElementTree.iterparse(source, events=events)
+    for event, value in iterator:
+        if event == "start":
+            name = _element_name(value.tag, namespaces, names)
+            elements.append(value)
+            stack.append(name)
+            if name == target:
+                candidates += 1
+        elif event == "end":
+            name = stack[-1]
+            is_candidate = name == target
+            if is_candidate:
+                candidates -= 1
+
+            # in case the element matches the complete path (from the
+            # end) it's converted and yielded to the caller
+            if is_candidate and stack[-path_length:] == path:
+                yield _element_to_dict(value, namespaces, names)
+
+            # in case the element is not inside a candidate element it's
+            # not going to be required anymore and so it's cleared and
+            # removed from its parent (memory remains flat)
+            if not candidates:
+                value.clear()
+                if len(elements) > 1:
+                    elements[-2].remove(value)
+
+            elements.pop()
+            stack.pop()
+        else:
+            prefix, uri = value
+            namespaces[uri] = prefix
 
 
 def dict_to_xml(contents, encoding="utf-8"):
@@ -71,17 +163,84 @@ def dict_to_xml(contents, encoding="utf-8"):
     given dictionary in a linear fashion.
     """
 
-    buffer = []
+    return legacy.u("").join(dict_to_xml_iter(contents, encoding=encoding))
+
+
+def dict_to_xml_iter(contents, encoding="utf-8"):
+    """
+    Converts the provided dictionary structure into a sequence
+    of XML string chunks, meant to be used for large outputs
+    that should be written (eg: to a file) as they're generated.
+
+    Values that are sequences (lists, tuples or generators)
+    are converted into repeated elements with the same name.
+
+    :type contents: Dictionary
+    :param contents: The dictionary that is going to be
+    converted into the XML string chunks.
+    :type encoding: String
+    :param encoding: The string encoding to be used if
+    necessary to decode byte base string elements.
+    :rtype: Generator
+    :return: The generator that yields the XML string chunks
+    that compose the representation of the dictionary.
+    """
+
     for key in sorted(legacy.keys(contents)):
         value = contents[key]
-        if isinstance(value, dict):
-            value = dict_to_xml(value, encoding=encoding)
-        elif legacy.is_bytes(value):
-            value = value.decode(encoding)
-        elif value == None:
-            value = legacy.u("")
-        buffer.append(legacy.u("<%s>%s</%s>") % (key, value, key))
-    return legacy.u("").join(buffer)
+        if isinstance(value, (list, tuple)) or legacy.is_generator(value):
+            values = value
+        else:
+            values = (value,)
+        for value in values:
+            if isinstance(value, dict):
+                yield legacy.u("<%s>") % key
+                for chunk in dict_to_xml_iter(value, encoding=encoding):
+                    yield chunk
+                yield legacy.u("</%s>") % key
+                continue
+            elif legacy.is_bytes(value):
+                value = value.decode(encoding)
+            elif value == None:
+                value = legacy.u("")
+            yield legacy.u("<%s>%s</%s>") % (key, value, key)
+
+
+def _element_to_dict(element, namespaces, names):
+    # converts the element emulating the DOM based conversion, where
+    # both the text nodes and the child elements are processed in
+    # the order of the document (the last text node prevails)
+    contents = None
+    text = element.text
+    if text and text.strip():
+        contents = text.strip()
+    for child in element:
+        if not contents:
+            contents = dict()
+        name = _element_name(child.tag, namespaces, names)
+        contents[name] = _element_to_dict(child, namespaces, names)
+        tail = child.tail
+        if tail and tail.strip():
+            contents = tail.strip()
+    return contents
+
+
+def _element_name(tag, namespaces, names):
+    # tries to retrieve the name from the cache of names, this is
+    # the most common situation as names are repeated a lot
+    name = names.get(tag, None)
+    if name:
+        return name
+
+    # converts the element tree (universal) name into the qualified
+    # name (with the prefix) as it was defined in the document
+    name = tag
+    if tag[0] == "{":
+        uri, local = tag[1:].split("}", 1)
+        prefix = namespaces.get(uri, None)
+        name = prefix + ":" + local if prefix else local
+    names[tag] = name
+    return name
 
 
 def _node_to_dict(node):
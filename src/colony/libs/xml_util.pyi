@@ -1,5 +1,19 @@
-from typing import Mapping
+from typing import IO, Any, Iterator, Mapping
 from xml.dom import Node
+from xml.etree.ElementTree import Element
 
-def xml_to_dict(data: str | Node) -> Mapping[str, Mapping | str]: ...
-def dict_to_xml(contents: Mapping[str, Mapping | str], encoding: str = ...) -> str: ...
+def xml_to_dict(data: str | bytes | Node) -> Mapping[str, Mapping | str]: ...
+def xml_to_dict_iter(
+    source: str | IO[bytes], path: str
+) -> Iterator[Mapping[str, Mapping | str] | str | None]: ...
+def dict_to_xml(contents: Mapping[str, Any], encoding: str = ...) -> str: ...
+def dict_to_xml_iter(
+    contents: Mapping[str, Any], encoding: str = ...
+) -> Iterator[str]: ...
+def _element_to_dict(
+    element: Element, namespaces: Mapping[str, str], names: dict[str, str]
+) -> Mapping[str, Mapping | str] | str | None: ...
+def _element_name(
+    tag: str, namespaces: Mapping[str, str], names: dict[str, str]
+) -> str: ...
+def _node_to_dict(node: Node) -> Mapping[str, Mapping | str] | str | None: ...
@@ -0,0 +1,419 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import os
+import json
+import shutil
+import zipfile
+import tempfile
+import threading
+
+import colony
+import colony_adm
+
+try:
+    import appier
+except ImportError:
+    appier = None
+
+try:
+    import http.server as server
+except ImportError:
+    import BaseHTTPServer as server
+
+
+class RepoHandler(server.BaseHTTPRequestHandler):
+    """
+    Request handler for the local (stand-in) colony repository
+    that serves the package listing, information and contents.
+    """
+
+    def do_GET(self):
+        path, _sep, query = self.path.partition("?")
+        params = colony.legacy.parse_qs(query)
+        self.server.requests.append(path)
+
+        if path == "/packages":
+            filters = params.get("filters", [])
+            packages = [
+                dict(name=name, identifier=package["id"])
+                for name, package in self.server.packages.items()
+                if "name:equals:%s" % name in filters
+                or "identifier:equals:%s" % package["id"] in filters
+            ]
+            return self.send(json.dumps(packages), "application/json")
+
+        parts = path.split("/")
+        package = self.server.packages.get(parts[2], None)
+        if not package:
+            return self.send_error(404)
+
+        if len(parts) == 4 and parts[3] == "info":
+            versions = self.server.versions.get(parts[2], {})
+            version = params.get("version", [None])[0]
+            package = versions.get(version, package)
+            return self.send(json.dumps(package), "application/json")
+
+        return self.send(self.server.contents[parts[2]], "application/octet-stream")
+
+    def send(self, data, content_type):
+        if colony.legacy.is_unicode(data):
+            data = data.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AdmTest(colony.ColonyTestCase):
+    """
+    Class that tests the package administration operations
+    against a local (stand-in) colony repository.
+    """
+
+    def setUp(self):
+        colony.ColonyTestCase.setUp(self)
+
+        self.path = tempfile.mkdtemp()
+        self.cwd = os.getcwd()
+        self.home = os.environ.get("COLONY_HOME", None)
+        self.repo_url = colony.conf("REPO_URL", None)
+
+        os.makedirs(os.path.join(self.path, "colony"))
+        os.makedirs(os.path.join(self.path, "plugins"))
+        os.environ["COLONY_HOME"] = self.path
+        os.chdir(self.path)
+
+        self.server = server.HTTPServer(("127.0.0.1", 0), RepoHandler)
+        self.server.packages = dict()
+        self.server.versions = dict()
+        self.server.contents = dict()
+        self.server.requests = []
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+        url = "http://127.0.0.1:%d/" % self.server.server_address[1]
+        colony.conf_s("REPO_URL", url)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+        os.chdir(self.cwd)
+        if self.home == None:
+            del os.environ["COLONY_HOME"]
+        else:
+            os.environ["COLONY_HOME"] = self.home
+        if self.repo_url == None:
+            colony.conf_r("REPO_URL")
+        else:
+            colony.conf_s("REPO_URL", self.repo_url)
+        shutil.rmtree(self.path)
+
+        colony.ColonyTestCase.tearDown(self)
+
+    def add_package(
+        self, name, version="1.0.0", timestamp=1, dependencies=(), files=None
+    ):
+        files = files or {"%s/__init__.py" % name: b"version = 1\n"}
+        dependencies = [
+            dict(id="pt.hive.%s" % dependency, version=_version, type="plugin")
+            for dependency, _version in dependencies
+        ]
+        package = dict(
+            id="pt.hive.%s" % name,
+            name=name,
+            short_name=name,
+            type="plugin",
+            version=version,
+            timestamp=timestamp,
+            dependencies=dependencies,
+        )
+
+        buffer = colony.legacy.BytesIO()
+        file = zipfile.ZipFile(buffer, mode="w")
+        try:
+            for _name, contents in files.items():
+                file.writestr("resources/" + _name, contents)
+            file.writestr("spec.json", json.dumps(package))
+        finally:
+            file.close()
+
+        self.server.packages[name] = package
+        self.server.versions.setdefault(name, {})[version] = package
+        self.server.contents[name] = buffer.getvalue()
+
+    def test_plan(self):
+        if appier == None:
+            self.skipTest("Skipping test: appier unavailable")
+
+        self.add_package("base")
+        self.add_package("json", dependencies=(("base", "x.x.x"),))
+        self.add_package("http", dependencies=(("base", "1.0.0"), ("json", None)))
+        self.add_package("rest", dependencies=(("http", None), ("json", None)))
+
+        plan = colony_adm._plan([dict(name="rest")])
+        keys = [item["key"] for item in plan]
+
+        self.assertEqual(
+            keys, ["pt.hive.base", "pt.hive.json", "pt.hive.http", "pt.hive.rest"]
+        )
+        self.assertEqual(self.server.requests.count("/packages/base/info"), 1)
+        self.assertEqual(self.server.requests.count("/packages/json/info"), 1)
+
+    def test_plan_pinned(self):
+        if appier == None:
+            self.skipTest("Skipping test: appier unavailable")
+
+        self.add_package("base", version="1.0.0")
+        self.add_package("base", version="2.0.0")
+        self.add_package("json", dependencies=(("base", None),))
+        self.add_package("core", dependencies=(("base", "1.0.0"),))
+        self.add_package("http", dependencies=(("core", None),))
+        self.add_package("rest", dependencies=(("json", None), ("http", None)))
+
+        plan = colony_adm._plan([dict(name="rest")])
+        keys = [item["key"] for item in plan]
+        versions = dict((item["key"], item["info"]["version"]) for item in plan)
+
+        self.assertEqual(keys.count("pt.hive.base"), 1)
+        self.assertEqual(versions["pt.hive.base"], "1.0.0")
+        self.assertLess(keys.index("pt.hive.base"), keys.index("pt.hive.core"))
+        self.assertLess(keys.index("pt.hive.base"), keys.index("pt.hive.json"))
+
+    def test_plan_conflict(self):
+        if appier == None:
+            self.skipTest("Skipping test: appier unavailable")
+
+        self.add_package("base")
+        self.add_package("json", dependencies=(("base", "1.0.0"),))
+        self.add_package("http", dependencies=(("base", "2.0.0"),))
+
+        self.assertRaises(
+            RuntimeError,
+            lambda: colony_adm._plan([dict(name="json"), dict(name="http")]),
+        )
+
+    def test_install(self):
+        if appier == None:
+            self.skipTest("Skipping test: appier unavailable")
+
+        self.add_package("base", files={"base/__init__.py": b"base = 1\n"})
+        self.add_package(
+            "json",
+            dependencies=(("base", None),),
+            files={"json/__init__.py": b"json = 1\n", "json/util/__init__.py": b""},
+        )
+
+        plan = colony_adm._install_many([dict(name="json")], jobs=2)
+        self.assertEqual(len(plan), 2)
+
+        plugins_path = os.path.join(self.path, "plugins")
+        self.assertEqual(
+            sorted(os.listdir(plugins_path)), ["base_plugin", "json_plugin"]
+        )
+
+        init_path = os.path.join(plugins_path, "json_plugin", "json", "__init__.py")
+        file = open(init_path, "rb")
+        try:
+            self.assertEqual(file.read(), b"json = 1\n")
+        finally:
+            file.close()
+
+        spec_path = os.path.join(plugins_path, "json_plugin", "spec.json")
+        file = open(spec_path, "rb")
+        try:
+            spec = json.loads(file.read().decode("utf-8"))
+        finally:
+            file.close()
+        self.assertEqual(spec["short_name"], "json")
+        self.assertEqual(spec["timestamp"], 1)
+
+        requests = len(self.server.requests)
+        plan = colony_adm._install_many([dict(name="json")])
+        self.assertEqual([item["installed"] for item in plan], [True, True])
+        self.assertEqual(self.server.requests.count("/packages/json"), 1)
+        self.assertEqual(len(self.server.requests), requests + 4)
+
+        self.add_package("json", timestamp=2, files={"json/__init__.py": b"json = 2\n"})
+        colony_adm._install_many([dict(name="json")], upgrade=True)
+
+        file = open(init_path, "rb")
+        try:
+            self.assertEqual(file.read(), b"json = 2\n")
+        finally:
+            file.close()
+        self.assertEqual(
+            sorted(os.listdir(plugins_path)), ["base_plugin", "json_plugin"]
+        )
+        self.assertFalse(
+            os.path.exists(os.path.join(plugins_path, "json_plugin", "json", "util"))
+        )
+
+    def test_build(self):
+        target = os.path.join(self.path, "build")
+        json_path = self.add_descriptor(
+            "json", {"json/__init__.py": b"json = 1\n" * 100, "json/logo.png": b"png"}
+        )
+
+        names = colony_adm._build_many([json_path], jobs=1, target=target)
+        self.assertEqual(names, [os.path.join(target, "json.cpx")])
+        self.assertTrue(os.path.exists(os.path.join(target, ".cpm_build.json")))
+        self.assertFalse(os.path.exists(os.path.join(self.path, ".cpm_build.json")))
+
+        file = zipfile.ZipFile(names[0], mode="r")
+        try:
+            infos = dict((info.filename, info) for info in file.infolist())
+            self.assertEqual(
+                sorted(infos.keys()),
+                ["resources/json/__init__.py", "resources/json/logo.png", "spec.json"],
+            )
+            self.assertEqual(
+                infos["resources/json/__init__.py"].compress_type, zipfile.ZIP_DEFLATED
+            )
+            self.assertEqual(
+                infos["resources/json/logo.png"].compress_type, zipfile.ZIP_STORED
+            )
+            self.assertEqual(file.read("resources/json/logo.png"), b"png")
+        finally:
+            file.close()
+
+        self.write(names[0], b"marker")
+        colony_adm._build_many([json_path], jobs=1, target=target)
+        self.assertEqual(self.read(names[0]), b"marker")
+
+        colony_adm._build_many([json_path], jobs=1, force=True, target=target)
+        self.assertTrue(zipfile.is_zipfile(names[0]))
+
+        self.write(names[0], b"marker")
+        self.write(os.path.join(self.path, "src", "json", "__init__.py"), b"json = 2\n")
+        colony_adm._build_many([json_path], jobs=1, target=target)
+        file = zipfile.ZipFile(names[0], mode="r")
+        try:
+            self.assertEqual(file.read("resources/json/__init__.py"), b"json = 2\n")
+        finally:
+            file.close()
+
+    def test_build_manifest(self):
+        target = os.path.join(self.path, "build")
+        json_path = self.add_descriptor("json", {"json/__init__.py": b"json = 1\n"})
+        http_path = self.add_descriptor("http", {"http/__init__.py": b"http = 1\n"})
+
+        colony_adm._build_many([json_path, http_path], jobs=2, target=target)
+        manifest_path = os.path.join(target, ".cpm_build.json")
+        manifest = colony_adm._load_manifest(manifest_path)
+        entry = manifest["packages"][os.path.abspath(json_path)]
+        self.assertEqual(entry["name"], "json.cpx")
+        self.assertEqual(
+            list(entry["files"].keys()),
+            [os.path.abspath(os.path.join(self.path, "src", "json", "__init__.py"))],
+        )
+        self.assertEqual(len(manifest["packages"]), 2)
+
+        colony_adm._save_manifest(manifest, manifest_path)
+        self.assertEqual(colony_adm._load_manifest(manifest_path), manifest)
+        self.assertFalse(os.path.exists(manifest_path + ".tmp"))
+
+        os.remove(http_path)
+        colony_adm._build_many([json_path], jobs=1, target=target)
+        manifest = colony_adm._load_manifest(manifest_path)
+        self.assertEqual(
+            list(manifest["packages"].keys()), [os.path.abspath(json_path)]
+        )
+
+        self.write(
+            manifest_path,
+            json.dumps(dict(packages={"json.cpx": "0"}, files={})).encode("utf-8"),
+        )
+        self.assertEqual(colony_adm._load_manifest(manifest_path), dict(packages={}))
+        self.write(manifest_path, b"invalid")
+        self.assertEqual(colony_adm._load_manifest(manifest_path), dict(packages={}))
+
+    def test_zip_directory(self):
+        if not hasattr(os, "symlink"):
+            self.skipTest("Skipping test: symbolic links unavailable")
+
+        base_path = os.path.join(self.path, "instance")
+        os.makedirs(os.path.join(base_path, "meta"))
+        os.makedirs(os.path.join(self.path, "shared"))
+        self.write(os.path.join(base_path, "meta", "info.json"), b"{}")
+        self.write(os.path.join(self.path, "shared", "logo.png"), b"png")
+        os.symlink(os.path.join(self.path, "shared"), os.path.join(base_path, "shared"))
+
+        buffer = colony.legacy.BytesIO()
+        file = zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED)
+        try:
+            count, size = colony_adm._zip_directory(base_path, "/", file)
+        finally:
+            file.close()
+
+        file = zipfile.ZipFile(buffer, mode="r")
+        try:
+            names = sorted(name.lstrip("/") for name in file.namelist())
+        finally:
+            file.close()
+        self.assertEqual(names, ["meta/info.json", "shared/logo.png"])
+        self.assertEqual((count, size), (2, 5))
+
+    def add_descriptor(self, name, files):
+        base_path = os.path.join(self.path, "src")
+        for _name, contents in files.items():
+            path = os.path.join(base_path, _name)
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            self.write(path, contents)
+        descriptor = dict(
+            id="pt.hive.%s" % name,
+            type="plugin",
+            version="1.0.0",
+            resources=sorted(files.keys()),
+        )
+        path = os.path.join(base_path, "%s_plugin.json" % name)
+        self.write(path, json.dumps(descriptor).encode("utf-8"))
+        return path
+
+    def read(self, path):
+        file = open(path, "rb")
+        try:
+            return file.read()
+        finally:
+            file.close()
+
+    def write(self, path, data):
+        file = open(path, "wb")
+        try:
+            file.write(data)
+        finally:
+            file.close()
@@ -28,7 +28,12 @@ __copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
 __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
+import os
+import time
+import shutil
+import tempfile
 import unittest
+import threading
 
 import colony
 
@@ -115,3 +120,238 @@ class ConfigTest(unittest.TestCase):
             self.assertEqual(len(ctx["configs"]), 2)
 
             self.assertEqual(mock_open.return_value.close.call_count, 1)
+
+    def test_bind(self):
+        ctx = colony.conf_ctx()
+        values = []
+
+        bind = colony.conf_bind("ENABLED", False, cast=bool, ctx=ctx)
+        bind.subscribe(lambda value, previous: values.append((value, previous)))
+
+        self.assertEqual(bind(), False)
+        self.assertEqual(colony.conf_bind("ENABLED", False, cast=bool, ctx=ctx), bind)
+        self.assertNotEqual(colony.conf_bind("ENABLED", True, cast=bool, ctx=ctx), bind)
+
+        colony.conf_s("ENABLED", "1", ctx=ctx)
+        self.assertEqual(bind(), True)
+        self.assertEqual(bind.get(), True)
+        self.assertEqual(values, [(True, False)])
+
+        colony.conf_s("ENABLED", "true", ctx=ctx)
+        self.assertEqual(bind(), True)
+        self.assertEqual(values, [(True, False)])
+
+        colony.conf_r("ENABLED", ctx=ctx)
+        self.assertEqual(bind(), False)
+        self.assertEqual(values, [(True, False), (False, True)])
+
+        bind = colony.conf_bind("AGE", cast="int", ctx=ctx)
+        self.assertEqual(bind(), None)
+        with colony.conf_override("BIND_AGE", "10"):
+            self.assertEqual(colony.conf_bind("BIND_AGE", cast=int)(), 10)
+        self.assertEqual(colony.conf_bind("BIND_AGE", cast=int)(), None)
+
+    def test_subscribe(self):
+        ctx = colony.conf_ctx()
+        changes = []
+
+        def listener(name, value, previous):
+            changes.append((name, value, previous))
+
+        colony.conf_subscribe(listener, ctx=ctx)
+        colony.conf_s("NAME", "colony", ctx=ctx)
+        colony.conf_s("NAME", "colony", ctx=ctx)
+        colony.conf_s("NAME", "hive", ctx=ctx)
+        colony.conf_r("NAME", ctx=ctx)
+        colony.conf_unsubscribe(listener, ctx=ctx)
+        colony.conf_s("NAME", "colony", ctx=ctx)
+
+        self.assertEqual(
+            changes,
+            [
+                ("NAME", "colony", None),
+                ("NAME", "hive", "colony"),
+                ("NAME", None, "hive"),
+            ],
+        )
+
+    def test_prefix(self):
+        ctx = colony.conf_ctx()
+
+        colony.conf_s("DB_HOST", "localhost", ctx=ctx)
+        colony.conf_s("DB_PORT", "5432", ctx=ctx)
+        colony.conf_s("APP_PORT", "8080", ctx=ctx)
+
+        self.assertEqual(
+            colony.conf_prefix("DB_", ctx=ctx),
+            dict(DB_HOST="localhost", DB_PORT="5432"),
+        )
+        self.assertEqual(
+            colony.conf_suffix("_PORT", ctx=ctx),
+            dict(DB_PORT="5432", APP_PORT="8080"),
+        )
+
+        colony.conf_s("DB_NAME", "colony", ctx=ctx)
+        colony.conf_r("DB_HOST", ctx=ctx)
+        colony.conf_s("APP_PORT", "8081", ctx=ctx)
+
+        self.assertEqual(
+            colony.conf_prefix("DB_", ctx=ctx),
+            dict(DB_PORT="5432", DB_NAME="colony"),
+        )
+        self.assertEqual(
+            colony.conf_suffix("_PORT", ctx=ctx),
+            dict(DB_PORT="5432", APP_PORT="8081"),
+        )
+
+        colony.conf_d(ctx=ctx)["DB_USER"] = "root"
+        colony.conf_refresh(ctx=ctx)
+        self.assertEqual(len(colony.conf_prefix("DB_", ctx=ctx)), 3)
+
+    def test_prefix_concurrent(self):
+        ctx = colony.conf_ctx()
+        errors = []
+
+        def writer():
+            try:
+                for index in range(2000):
+                    colony.conf_s("CONCURRENT_%d" % index, str(index), ctx=ctx)
+                    colony.conf_r("CONCURRENT_%d" % (index // 2), ctx=ctx)
+            except Exception as exception:
+                errors.append(exception)
+
+        def reader():
+            try:
+                for index in range(2000):
+                    colony.conf_prefix("CONCURRENT_%d" % (index % 50), ctx=ctx)
+                    colony.conf_suffix("_%d" % (index % 50), ctx=ctx)
+                    colony.conf_bind("CONCURRENT_%d" % index, ctx=ctx)
+                    callback = lambda name, value, previous: None
+                    colony.conf_subscribe(callback, ctx=ctx)
+                    colony.conf_unsubscribe(callback, ctx=ctx)
+            except Exception as exception:
+                errors.append(exception)
+
+        threads = [threading.Thread(target=target) for target in (writer, reader)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            colony.conf_prefix("CONCURRENT_1999", ctx=ctx),
+            dict(CONCURRENT_1999="1999"),
+        )
+
+    def test_watch(self):
+        path = tempfile.mkdtemp()
+        json_path = os.path.join(path, "colony.json")
+        env_path = os.path.join(path, ".env")
+
+        try:
+            with open(json_path, "wb") as file:
+                file.write(b'{"WATCH_A": "1", "WATCH_B": "2"}')
+            with open(env_path, "wb") as file:
+                file.write(b"WATCH_C=3\n")
+
+            ctx = colony.conf_ctx()
+            ctx["config_f"] = []
+            colony.base.config.load_file(name=json_path, ctx=ctx)
+            colony.base.config.load_dot_env(name=env_path, ctx=ctx)
+
+            changes = []
+            colony.conf_subscribe(
+                lambda name, value, previous: changes.append((name, value)), ctx=ctx
+            )
+            watcher = colony.ConfWatcher(ctx=ctx)
+
+            self.assertEqual(watcher.check(), [])
+            self.assertEqual(changes, [])
+
+            stat = os.stat(json_path)
+            with open(json_path, "wb") as file:
+                file.write(b'{"WATCH_A": "10", "WATCH_D": "4"}')
+            os.utime(json_path, (stat.st_atime, stat.st_mtime + 10))
+
+            self.assertEqual(watcher.check(), [json_path])
+            self.assertEqual(colony.conf("WATCH_A", ctx=ctx), "10")
+            self.assertEqual(colony.conf("WATCH_B", ctx=ctx), None)
+            self.assertEqual(colony.conf("WATCH_C", ctx=ctx), "3")
+            self.assertEqual(colony.conf("WATCH_D", ctx=ctx), "4")
+            self.assertEqual(
+                sorted(changes),
+                [("WATCH_A", "10"), ("WATCH_B", None), ("WATCH_D", "4")],
+            )
+            self.assertEqual(watcher.check(), [])
+
+            watcher = colony.conf_watch(interval=0.01, ctx=ctx)
+            try:
+                self.assertEqual(colony.conf_watch(ctx=ctx), watcher)
+                with open(env_path, "wb") as file:
+                    file.write(b"WATCH_C=30\n")
+                os.utime(env_path, (stat.st_atime, stat.st_mtime + 20))
+                for _index in range(500):
+                    if colony.conf("WATCH_C", ctx=ctx) == "30":
+                        break
+                    time.sleep(0.01)
+                self.assertEqual(colony.conf("WATCH_C", ctx=ctx), "30")
+            finally:
+                colony.conf_unwatch(ctx=ctx)
+            watcher.join(10.0)
+            self.assertEqual(watcher.is_alive(), False)
+        finally:
+            shutil.rmtree(path)
+
+    def test_watch_precedence(self):
+        path = tempfile.mkdtemp()
+        json_path = os.path.join(path, "colony.json")
+        include_path = os.path.join(path, "include.json")
+        env_path = os.path.join(path, ".env")
+
+        try:
+            with open(json_path, "wb") as file:
+                file.write(
+                    b'{"PRECEDENCE_X": "json", "PRECEDENCE_Y": "1", '
+                    b'"PRECEDENCE_Z": "json", "$include": "include.json"}'
+                )
+            with open(include_path, "wb") as file:
+                file.write(b'{"PRECEDENCE_I": "include"}')
+            with open(env_path, "wb") as file:
+                file.write(b"PRECEDENCE_X=env\nPRECEDENCE_Z=env\n")
+
+            ctx = colony.conf_ctx()
+            ctx["config_f"] = []
+            configs = dict(colony.conf_d())
+            colony.base.config.load_file(name=json_path, ctx=ctx)
+            colony.base.config.load_dot_env(name=env_path, ctx=ctx)
+
+            self.assertEqual(colony.conf_d(), configs)
+            self.assertEqual(colony.conf("PRECEDENCE_I", ctx=ctx), "include")
+            self.assertEqual(colony.conf("PRECEDENCE_X", ctx=ctx), "env")
+
+            watcher = colony.ConfWatcher(ctx=ctx)
+
+            stat = os.stat(json_path)
+            with open(json_path, "wb") as file:
+                file.write(
+                    b'{"PRECEDENCE_X": "json", "PRECEDENCE_Y": "2", '
+                    b'"PRECEDENCE_Z": "json", "$include": "include.json"}'
+                )
+            os.utime(json_path, (stat.st_atime, stat.st_mtime + 10))
+
+            self.assertEqual(watcher.check(), [json_path])
+            self.assertEqual(colony.conf("PRECEDENCE_X", ctx=ctx), "env")
+            self.assertEqual(colony.conf("PRECEDENCE_Y", ctx=ctx), "2")
+            self.assertEqual(colony.conf("PRECEDENCE_I", ctx=ctx), "include")
+
+            stat = os.stat(env_path)
+            with open(env_path, "wb") as file:
+                file.write(b"PRECEDENCE_X=env\n")
+            os.utime(env_path, (stat.st_atime, stat.st_mtime + 10))
+
+            self.assertEqual(watcher.check(), [env_path])
+            self.assertEqual(colony.conf("PRECEDENCE_X", ctx=ctx), "env")
+            self.assertEqual(colony.conf("PRECEDENCE_Z", ctx=ctx), "json")
+        finally:
+            shutil.rmtree(path)
@@ -0,0 +1,127 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import os
+import sys
+import inspect
+import importlib
+import subprocess
+
+import colony
+
+
+class LegacyTest(colony.ColonyTestCase):
+    """
+    Class that tests the legacy compatibility module and the
+    lazy loading of the heavy modules.
+    """
+
+    def test_lazy_attributes(self):
+        """
+        Tests that the lazily loaded legacy attributes resolve
+        to the expected (network and serialization) values.
+        """
+
+        self.assertNotEqual(colony.legacy.Request, None)
+        self.assertNotEqual(colony.legacy.HTTPHandler, None)
+        self.assertNotEqual(colony.legacy.HTTPConnection, None)
+        self.assertNotEqual(colony.legacy.HTTPSConnection, None)
+        self.assertEqual(issubclass(colony.legacy.HTTPError, Exception), True)
+        self.assertEqual(colony.legacy.cPickle.loads(colony.legacy.cPickle.dumps(1)), 1)
+        self.assertNotEqual(colony.legacy.HTMLParser.HTMLParser, None)
+
+        self.assertRaises(AttributeError, lambda: colony.legacy.not_defined)
+
+    def test_lazy_names(self):
+        """
+        Tests that every lazily exported libs name resolves both
+        from the libs package and from the colony package.
+        """
+
+        for name in colony.libs.__all__:
+            value = getattr(colony.libs, name)
+            self.assertEqual(getattr(colony, name), value)
+
+        self.assertEqual(
+            colony.calculate_control_value_gtin,
+            colony.libs.gtin_util.calculate_control_value,
+        )
+        self.assertRaises(AttributeError, lambda: colony.libs.not_defined)
+
+    def test_lazy_complete(self):
+        """
+        Tests that every public function and class defined in the
+        libs sub modules is exported through the lazy names table.
+        """
+
+        exported = set(colony.libs.LAZY_NAMES.values())
+
+        for module_name in colony.libs.LAZY_MODULES:
+            module = importlib.import_module("colony.libs." + module_name)
+            for name, value in module.__dict__.items():
+                if name.startswith("_"):
+                    continue
+                if not inspect.isfunction(value) and not inspect.isclass(value):
+                    continue
+                if not value.__module__ == module.__name__:
+                    continue
+                self.assertEqual(
+                    (module_name, name) in exported,
+                    True,
+                    "%s.%s missing from LAZY_NAMES" % (module_name, name),
+                )
+
+    def test_lazy_import(self):
+        """
+        Tests that importing the colony package does not load the
+        heavy libs sub modules (only for lazy import environments).
+        """
+
+        if not colony.legacy.LAZY_IMPORT:
+            self.skipTest("Lazy import is not available")
+
+        path = os.path.dirname(os.path.dirname(os.path.abspath(colony.__file__)))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = path
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, colony; print(' '.join(sorted(sys.modules)))",
+            ],
+            env=env,
+        )
+        modules = output.decode("utf-8").split()
+
+        self.assertEqual("colony" in modules, True)
+        self.assertEqual("colony.libs.country_util" in modules, False)
+        self.assertEqual("colony.libs.xml_util" in modules, False)
+        self.assertEqual("xml.dom.minidom" in modules, False)
+        self.assertEqual("urllib.request" in modules, False)
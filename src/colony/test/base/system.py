@@ -28,6 +28,15 @@ __copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
 __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
+import os
+import copy
+import pickle
+import time
+import shutil
+import logging
+import tempfile
+import threading
+
 import colony
 
 try:
@@ -35,6 +44,11 @@ try:
 except ImportError:
     mock = None
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
 
 class PluginManagerTest(colony.ColonyTestCase):
     """
@@ -63,3 +77,535 @@ class PluginManagerTest(colony.ColonyTestCase):
             plugin_manager.resolve_string_value("%plugin_path:pt.hive.main%"),
             ["hello_path"],
         )
+
+    def test_inject_allowed_many(self):
+        plugin_manager = colony.PluginManager()
+
+        class HostPlugin(colony.Plugin):
+            id = "pt.hive.test.host"
+            name = "Host"
+            version = "1.0.0"
+            short_name = "host"
+            capabilities_allowed = ["controller"]
+
+        class ControllerPlugin(colony.Plugin):
+            name = "Controller"
+            version = "1.0.0"
+            capabilities = ["controller"]
+
+        host = HostPlugin(plugin_manager)
+        host.load_plugin()
+
+        controllers = []
+        for index in range(1000):
+            controller = ControllerPlugin(plugin_manager)
+            controller.id = "pt.hive.test.controller_%d" % index
+            controller.short_name = "controller_%d" % index
+            controllers.append(controller)
+
+        for controller in controllers:
+            plugin_manager._inject_allowed(host, controller, "controller")
+        for controller in controllers:
+            plugin_manager._inject_allowed(host, controller, "controller")
+
+        self.assertEqual(len(host.allowed_loaded_capability), 1000)
+        self.assertEqual(len(host.controller_plugins), 1000)
+        self.assertEqual(len(host.controller), 1000)
+        self.assertEqual(host.controller_plugins[0], controllers[0])
+        self.assertEqual(host.controller_plugins[-1], controllers[-1])
+        self.assertEqual(
+            (controllers[10], "controller") in host.allowed_loaded_capability, True
+        )
+
+        for controller in controllers:
+            host.unload_allowed(controller, "controller")
+
+        self.assertEqual(len(host.allowed_loaded_capability), 0)
+        self.assertEqual(len(host.controller_plugins), 0)
+        self.assertEqual(host.controller, {})
+        self.assertRaises(
+            colony.PluginSystemException,
+            lambda: host.unload_allowed(controllers[0], "controller"),
+        )
+
+    def test_main_loop(self):
+        plugin_manager = colony.PluginManager()
+        values = []
+
+        thread = threading.Thread(target=plugin_manager.main_loop)
+        thread.daemon = True
+        thread.start()
+
+        for index in range(100):
+            plugin_manager.add_event(
+                colony.QueueEvent("execute", [values.append, index])
+            )
+        plugin_manager.add_event(colony.QueueEvent("exit"))
+        thread.join(10.0)
+
+        self.assertEqual(thread.is_alive(), False)
+        self.assertEqual(values, list(range(100)))
+        self.assertEqual(len(plugin_manager.event_queue), 0)
+        self.assertEqual(plugin_manager.dispatch_latency >= 0.0, True)
+        self.assertEqual(
+            plugin_manager.dispatch_latency_max >= plugin_manager.dispatch_latency,
+            True,
+        )
+
+    def test_main_loop_interrupted(self):
+        plugin_manager = colony.PluginManager()
+        values = []
+
+        def fail():
+            raise RuntimeError("failure")
+
+        plugin_manager.add_event(colony.QueueEvent("execute", [values.append, 1]))
+        plugin_manager.add_event(colony.QueueEvent("execute", [fail]))
+        plugin_manager.add_event(colony.QueueEvent("execute", [values.append, 2]))
+        plugin_manager.add_event(colony.QueueEvent("exit"))
+        plugin_manager.add_event(colony.QueueEvent("execute", [values.append, 3]))
+
+        self.assertRaises(RuntimeError, plugin_manager.main_loop)
+        self.assertEqual(values, [1])
+        self.assertEqual(len(plugin_manager.event_queue), 3)
+
+        plugin_manager.main_loop()
+        self.assertEqual(values, [1, 2])
+        self.assertEqual(len(plugin_manager.event_queue), 1)
+
+        plugin_manager.event_queue.clear()
+        thread = threading.Thread(target=plugin_manager.main_loop)
+        thread.daemon = True
+        thread.start()
+        plugin_manager._stop_main_loop()
+        thread.join(10.0)
+
+        self.assertEqual(thread.is_alive(), False)
+        self.assertEqual(plugin_manager.main_loop_active, False)
+
+    def test_main_loop_idle(self):
+        if os.name == "nt" or not colony.legacy.PYTHON_3:
+            self.skipTest("Skipping test: main loop wait is bounded")
+
+        plugin_manager = colony.PluginManager()
+        timeouts = []
+        values = []
+
+        wait = plugin_manager.condition.wait
+
+        def counted(timeout=None):
+            timeouts.append(timeout)
+            return wait(timeout)
+
+        plugin_manager.condition.wait = counted
+
+        thread = threading.Thread(target=plugin_manager.main_loop)
+        thread.daemon = True
+        thread.start()
+
+        time.sleep(colony.base.system.MAIN_LOOP_TIMEOUT * 1.5)
+        self.assertEqual(timeouts, [None])
+
+        plugin_manager.add_event(colony.QueueEvent("execute", [values.append, 1]))
+        time.sleep(0.5)
+        self.assertEqual(values, [1])
+        self.assertEqual(len(timeouts), 2)
+
+        plugin_manager._stop_main_loop()
+        thread.join(10.0)
+
+        self.assertEqual(thread.is_alive(), False)
+
+    def test_execute_async(self):
+        if asyncio == None:
+            self.skipTest("Skipping test: asyncio unavailable")
+
+        plugin_manager = colony.PluginManager()
+
+        thread = threading.Thread(target=plugin_manager.main_loop)
+        thread.daemon = True
+        thread.start()
+
+        loop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(loop)
+            result = loop.run_until_complete(
+                plugin_manager.execute_async(lambda a, b: a + b, 1, 2)
+            )
+            self.assertEqual(result, 3)
+            self.assertRaises(
+                ZeroDivisionError,
+                loop.run_until_complete,
+                plugin_manager.execute_async(lambda: 1 // 0),
+            )
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+            plugin_manager.add_event(colony.QueueEvent("exit"))
+            thread.join(10.0)
+
+        self.assertEqual(thread.is_alive(), False)
+
+    def test_get_all_modules(self):
+        plugin_manager = colony.PluginManager()
+        path = tempfile.mkdtemp()
+
+        try:
+            open(os.path.join(path, "a_plugin.py"), "wb").close()
+            open(os.path.join(path, "b_system.py"), "wb").close()
+
+            modules = plugin_manager.get_all_modules(path, suffix="plugin")
+            self.assertEqual(modules, ["a_plugin"])
+            self.assertEqual(len(plugin_manager.modules_cache), 1)
+
+            cache_key = path + ":plugin"
+            mtime, _modules = plugin_manager.modules_cache[cache_key]
+            plugin_manager.modules_cache[cache_key] = (mtime, ["cached_plugin"])
+            modules = plugin_manager.get_all_modules(path, suffix="plugin")
+            self.assertEqual(modules, ["cached_plugin"])
+
+            plugin_manager.modules_cache[cache_key] = (mtime - 10, ["cached_plugin"])
+            modules = plugin_manager.get_all_modules(path, suffix="plugin")
+            self.assertEqual(modules, ["a_plugin"])
+        finally:
+            shutil.rmtree(path)
+
+    def test_config_changed(self):
+        plugin_manager = colony.PluginManager()
+
+        with colony.conf_override("BLACKLIST", "pt.hive.a;pt.hive.b"):
+            plugin_manager.config_changed("BLACKLIST", "pt.hive.a;pt.hive.b", None)
+            self.assertEqual(plugin_manager.blacklist, ["pt.hive.a", "pt.hive.b"])
+
+        plugin_manager.config_changed("BLACKLIST", None, "pt.hive.a;pt.hive.b")
+        self.assertEqual(plugin_manager.blacklist, [])
+
+        logger = logging.getLogger("colony.test.config")
+        handler = logging.StreamHandler()
+        logger.addHandler(handler)
+        plugin_manager.logger = logger
+        try:
+            plugin_manager.config_changed("LEVEL", "ERROR", "INFO")
+            self.assertEqual(handler.level, logging.ERROR)
+            plugin_manager.config_changed("LEVEL", "DEBUG", "ERROR")
+            self.assertEqual(handler.level, logging.DEBUG)
+            self.assertEqual(logger.level, logging.DEBUG)
+        finally:
+            logger.removeHandler(handler)
+
+    def test_run_test(self):
+        class SampleTest(colony.ColonyTestCase):
+
+            def test_valid(self):
+                self.assertEqual(self.plugin.id, "pt.hive.test.sample")
+
+            def test_invalid(self):
+                self.assertEqual(self.valid, True)
+
+        class SampleBundle(colony.Test):
+
+            def get_bundle(self):
+                return (SampleTest,)
+
+        class SamplePlugin(object):
+            id = "pt.hive.test.sample"
+            name = "Sample"
+            short_name = "sample"
+            version = "1.0.0"
+
+            def __init__(self):
+                self.test = SampleBundle(self)
+
+            def is_loaded(self):
+                return True
+
+        plugin = SamplePlugin()
+        plugin_manager = colony.PluginManager()
+        plugin_manager.get_plugins_by_capability = lambda capability: [plugin]
+
+        file, path = tempfile.mkstemp()
+        os.close(file)
+
+        try:
+            for workers in (1, 2):
+                plugin_manager.test_workers = workers
+                plugin_manager.test_report = path
+
+                SampleTest.valid = True
+                self.assertEqual(plugin_manager.run_test(verbosity=0), True)
+
+                SampleTest.valid = False
+                self.assertEqual(
+                    plugin_manager.run_test(verbosity=0, raise_e=False), False
+                )
+                self.assertRaises(
+                    colony.ColonyException,
+                    lambda: plugin_manager.run_test(verbosity=0),
+                )
+
+                plugin_manager.whitetest = ["pt.hive.test.other"]
+                self.assertEqual(plugin_manager.run_test(verbosity=0), True)
+                plugin_manager.whitetest = []
+
+                plugin_manager.blacktest = ["sample"]
+                self.assertEqual(plugin_manager.run_test(verbosity=0), True)
+                plugin_manager.blacktest = []
+
+                SampleTest.valid = False
+                plugin_manager.run_test(verbosity=0, raise_e=False)
+                with open(path, "rb") as file:
+                    data = file.read()
+                self.assertEqual(b'tests="2"' in data, True)
+                self.assertEqual(b'failures="1"' in data, True)
+        finally:
+            os.remove(path)
+
+
+class PluginTest(colony.ColonyTestCase):
+    """
+    Test case for the verification of the base plugin
+    class and its event generation and handling.
+    """
+
+    def test_generate_event(self):
+        plugin_manager = colony.PluginManager()
+
+        class SourcePlugin(colony.Plugin):
+            id = "pt.hive.test.source"
+            name = "Source"
+            version = "1.0.0"
+            events_fired = ["entity.changed", "other"]
+
+        class TargetPlugin(colony.Plugin):
+            name = "Target"
+            version = "1.0.0"
+            events_handled = ["entity"]
+
+            def event_handler(self, event_name, *event_args):
+                self.received.append((event_name, event_args))
+
+        source = SourcePlugin(plugin_manager)
+        source.loaded = True
+
+        for _index in range(100):
+            source.generate_event("entity.changed.save", [1])
+            source.generate_event("unknown.event", [1])
+
+        targets = []
+        for index in range(50):
+            target = TargetPlugin(plugin_manager)
+            target.id = "pt.hive.test.target_%d" % index
+            target.received = []
+            target.loaded = True
+            target.register_all_handled_events_plugin(source)
+            targets.append(target)
+
+        for _index in range(1000):
+            source.generate_event("entity.changed.save", [1])
+            source.generate_event("entity", [1])
+            source.generate_event("other.value", [1])
+
+        for target in targets:
+            self.assertEqual(len(target.received), 1000)
+            self.assertEqual(target.received[0], ("entity.changed.save", (1,)))
+
+        self.assertEqual(colony.base.system.event_and_super_events(""), ())
+        self.assertEqual(
+            colony.base.system.event_and_super_events("a.b.c"), ("a", "a.b", "a.b.c")
+        )
+        self.assertEqual(
+            colony.base.system.is_event_or_super_event_in_set(
+                "entity.changed.save", source.events_fired_set
+            ),
+            True,
+        )
+        self.assertEqual(
+            colony.base.system.is_event_or_super_event_in_set(
+                "entity", source.events_fired_set
+            ),
+            False,
+        )
+
+
+class CapabilityTest(colony.ColonyTestCase):
+    """
+    Test case for the verification of the (interned) capability
+    and event structures and their comparison helpers.
+    """
+
+    def test_intern(self):
+        capability = colony.Capability.intern("web.mvc.controller")
+        self.assertEqual(
+            capability is colony.Capability.intern("web.mvc.controller"), True
+        )
+        self.assertEqual(capability, colony.Capability("web.mvc.controller"))
+        self.assertEqual(capability.tuple_value, ("web", "mvc", "controller"))
+        self.assertEqual(capability.list_value, ["web", "mvc", "controller"])
+        self.assertEqual(hash(capability), hash(("web", "mvc", "controller")))
+        self.assertRaises(AttributeError, setattr, capability, "string_value", "x")
+
+        event = colony.Event.intern("entity.changed")
+        self.assertEqual(event is colony.Event.intern("entity.changed"), True)
+        self.assertEqual(event, colony.Event("entity.changed"))
+        self.assertEqual(event.super_values(), ("entity", "entity.changed"))
+        self.assertNotEqual(event, None)
+        self.assertNotEqual(colony.Event(""), colony.Event(""))
+
+        self.assertEqual(capability.__eq__("web.mvc.controller"), NotImplemented)
+        self.assertEqual(event.__ne__(None), NotImplemented)
+        self.assertEqual(capability == "web.mvc.controller", False)
+        self.assertEqual(capability != "web.mvc.controller", True)
+
+    def test_copy(self):
+        capability = colony.Capability.intern("web.mvc.controller")
+        event = colony.Event("entity.changed")
+
+        self.assertEqual(copy.copy(capability) is capability, True)
+        self.assertEqual(copy.deepcopy(capability) is capability, True)
+        self.assertEqual(copy.deepcopy([event])[0] is event, True)
+
+        for structure in (capability, event):
+            result = pickle.loads(pickle.dumps(structure))
+            self.assertEqual(result, structure)
+            self.assertEqual(result.__class__, structure.__class__)
+            self.assertEqual(result.tuple_value, structure.tuple_value)
+            self.assertEqual(result.super_values(), structure.super_values())
+
+    def test_intern_bounded(self):
+        cache = colony.base.system.EVENT_CACHE
+        size = colony.base.system.INTERN_CACHE_SIZE
+        previous = dict(cache)
+        cache.clear()
+
+        try:
+            event = colony.Event.intern("bounded.first")
+            for index in range(size + 10):
+                colony.Event.intern("bounded.event_%d" % index)
+
+            self.assertEqual(len(cache), size)
+            self.assertEqual(colony.Event.intern("bounded.first") is event, True)
+            self.assertEqual(
+                colony.Event.intern("bounded.last"), colony.Event("bounded.last")
+            )
+            self.assertEqual("bounded.last" in cache, False)
+        finally:
+            cache.clear()
+            cache.update(previous)
+
+    def test_comparison(self):
+        self.assertEqual(
+            colony.base.system.is_capability_or_sub_capability("web", "web.mvc"), True
+        )
+        self.assertEqual(
+            colony.base.system.is_capability_or_sub_capability("web", "web"), True
+        )
+        self.assertEqual(
+            colony.base.system.is_capability_or_sub_capability("web.mvc", "web"), False
+        )
+        self.assertEqual(
+            colony.base.system.is_capability_or_sub_capability("web", "webs"), False
+        )
+        self.assertEqual(
+            colony.base.system.is_capability_or_sub_capability("", "web"), False
+        )
+        self.assertEqual(
+            colony.base.system.capability_and_super_capabilites("a.b.c"),
+            ["a", "a.b", "a.b.c"],
+        )
+        self.assertEqual(
+            colony.base.system.is_event_or_super_event_in_list(
+                "entity.changed.save", ["other", "entity.changed"]
+            ),
+            True,
+        )
+        self.assertEqual(
+            colony.base.system.is_event_or_sub_event_in_list(
+                "entity.changed", ["entity"]
+            ),
+            False,
+        )
+        self.assertEqual(
+            colony.base.system.get_all_events_or_super_events_in_list(
+                "a.b.c", ["a", "a.b.c", "a.c", "a.b.c.d"]
+            ),
+            ["a", "a.b.c"],
+        )
+        self.assertEqual(
+            colony.Capability("web").is_sub_capability(colony.Capability("web.mvc")),
+            True,
+        )
+        self.assertEqual(
+            colony.Capability("web").is_sub_capability(colony.Capability("web")),
+            False,
+        )
+
+
+class PluginExecutorTest(colony.ColonyTestCase):
+    """
+    Test case for the verification of the shared plugin executor
+    and of the executor based plugin thread.
+    """
+
+    def test_submit(self):
+        executor = colony.PluginExecutor(2)
+        values = []
+
+        for index in range(100):
+            task = executor.submit(values.append, index)
+            task.join(10.0)
+            self.assertEqual(task.is_alive(), False)
+
+        self.assertEqual(values, list(range(100)))
+        self.assertEqual(len(executor.workers) <= 2, True)
+
+        executor.shutdown()
+        self.assertRaises(colony.PluginSystemException, executor.submit, values.append)
+
+    def test_blocking(self):
+        executor = colony.PluginExecutor(1)
+        event = threading.Event()
+
+        tasks = [executor.submit(event.wait, 10.0) for _index in range(4)]
+        self.assertEqual(len(executor.workers), 4)
+        self.assertEqual(all(task.is_alive() for task in tasks), True)
+
+        event.set()
+        for task in tasks:
+            task.join(10.0)
+            self.assertEqual(task.is_alive(), False)
+
+        executor.shutdown()
+
+    def test_plugin_thread(self):
+        plugin_manager = colony.PluginManager()
+        executor = colony.PluginExecutor(2)
+        calls = []
+
+        class ThreadPlugin(colony.Plugin):
+            id = "pt.hive.test.thread"
+            name = "Thread"
+            version = "1.0.0"
+
+            def load_plugin(self):
+                calls.append("load")
+                self.release_ready_semaphore()
+
+            def end_load_plugin(self):
+                calls.append("end_load")
+
+        plugin = ThreadPlugin(plugin_manager)
+        plugin_thread = colony.PluginExecutorThread(plugin, executor)
+        plugin_thread.start()
+
+        plugin_thread.add_event(colony.QueueEvent("load"))
+        plugin.acquire_ready_semaphore()
+        plugin_thread.add_event(colony.QueueEvent("end_load"))
+        plugin.acquire_ready_semaphore()
+        plugin_thread.add_event(colony.QueueEvent("exit"))
+        plugin_thread.join()
+
+        self.assertEqual(calls, ["load", "end_load"])
+        self.assertEqual(plugin_thread.is_alive(), False)
+        self.assertEqual(len(executor.workers) <= 2, True)
+
+        executor.shutdown()
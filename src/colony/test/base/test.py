@@ -0,0 +1,135 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import colony
+import unittest
+
+import xml.dom.minidom
+
+import colony
+
+
+def sample_case():
+    class SampleTest(unittest.TestCase):
+
+        def test_success(self):
+            self.assertEqual(1, 1)
+
+        def test_failure(self):
+            self.assertEqual(1, 2)
+
+        def test_error(self):
+            raise RuntimeError("sample error")
+
+        @unittest.skip("sample skip")
+        def test_skip(self):
+            pass
+
+    return SampleTest
+
+
+class ParallelTestRunnerTest(colony.ColonyTestCase):
+    """
+    Class that tests the parallel (forked) test runner and
+    the aggregated test report.
+    """
+
+    def test_run(self):
+        loader = unittest.TestLoader()
+        tests = colony.base.test.flatten_suite(
+            loader.loadTestsFromTestCase(sample_case())
+        )
+        tests += colony.base.test.flatten_suite(
+            loader.loadTestsFromTestCase(sample_case())
+        )
+        self.assertEqual(len(tests), 8)
+
+        for workers in (1, 2):
+            stream = colony.legacy.StringIO()
+            runner = colony.ParallelTestRunner(
+                workers=workers, verbosity=0, stream=stream
+            )
+            report = runner.run(tests)
+
+            self.assertEqual(len(report.records), 8)
+            self.assertEqual(len(report.errors), 2)
+            self.assertEqual(len(report.failures), 2)
+            self.assertEqual(len(report.skipped), 2)
+            self.assertEqual(report.was_successful(), False)
+            self.assertEqual(report.errors[0]["name"].endswith("test_error"), True)
+            self.assertEqual("sample error" in report.errors[0]["message"], True)
+            self.assertEqual("Slowest tests:" in stream.getvalue(), True)
+
+            if runner.is_available():
+                self.assertEqual(report.workers, workers)
+
+    def test_partition(self):
+        loader = unittest.TestLoader()
+        first = colony.base.test.flatten_suite(
+            loader.loadTestsFromTestCase(sample_case())
+        )
+        second = colony.base.test.flatten_suite(
+            loader.loadTestsFromTestCase(sample_case())
+        )
+        tests = [test for pair in zip(first, second) for test in pair]
+
+        chunks = colony.base.test.partition_tests(tests, 2)
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(sorted(len(chunk) for chunk in chunks), [4, 4])
+        for chunk in chunks:
+            self.assertEqual(len(set(test.__class__ for test in chunk)), 1)
+            indexes = [tests.index(test) for test in chunk]
+            self.assertEqual(indexes, sorted(indexes))
+
+        chunks = colony.base.test.partition_tests(tests, 4)
+        self.assertEqual(len(chunks), 2)
+        chunks = colony.base.test.partition_tests(tests, 1)
+        self.assertEqual(chunks, [tests])
+        self.assertEqual(colony.base.test.partition_tests([], 2), [])
+
+    def test_junit(self):
+        report = colony.TestReport(
+            records=[
+                dict(name="a.B.test_c", status="success", duration=0.5, message=None),
+                dict(name="a.B.test_d", status="failure", duration=1.5, message="<x>"),
+            ],
+            duration=2.0,
+        )
+
+        document = xml.dom.minidom.parseString(report.junit())
+        suite = document.documentElement
+        self.assertEqual(suite.getAttribute("tests"), "2")
+        self.assertEqual(suite.getAttribute("failures"), "1")
+        cases = suite.getElementsByTagName("testcase")
+        self.assertEqual(cases[0].getAttribute("classname"), "a.B")
+        self.assertEqual(cases[1].getAttribute("name"), "test_d")
+        failure = cases[1].getElementsByTagName("failure")[0]
+        self.assertEqual(failure.firstChild.data, "<x>")
+        self.assertEqual(report.slowest(count=1)[0]["name"], "a.B.test_d")
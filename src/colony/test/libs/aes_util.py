@@ -0,0 +1,168 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import os
+import struct
+
+import colony
+
+
+class AesCipherTest(colony.ColonyTestCase):
+    """
+    Class that tests the AES cipher and its streaming
+    (authenticated) mode.
+    """
+
+    def test_pad(self):
+        cipher = colony.AesCipher(key=b"0123456789abcdef")
+        self.assertEqual(cipher.pad(b"hello"), b"hello" + b"\x0b" * 11)
+        self.assertEqual(cipher.unpad(cipher.pad(b"hello")), b"hello")
+        self.assertEqual(cipher.unpad(cipher.pad(b"")), b"")
+
+    def test_encrypt(self):
+        if not colony.libs.aes_util.Crypto:
+            self.skipTest("Skipping test: PyCrypto unavailable")
+
+        cipher = colony.AesCipher()
+        encrypted = cipher.encrypt(b"hello world")
+        self.assertEqual(len(encrypted), 16)
+        self.assertEqual(cipher.decrypt(encrypted), b"hello world")
+        self.assertEqual(cipher.decrypt(cipher.encrypt(b"")), b"")
+
+    def test_stream(self):
+        if not colony.libs.aes_util.Crypto:
+            self.skipTest("Skipping test: PyCrypto unavailable")
+
+        cipher = colony.AesCipher()
+        data = os.urandom(100000)
+
+        for chunk_size in (1, 1000, 65536, 200000):
+            source = colony.legacy.BytesIO(data)
+            sink = colony.legacy.BytesIO()
+            count = cipher.encrypt_stream(
+                source, sink, chunk_size=max(chunk_size, 4096)
+            )
+            self.assertEqual(count, len(data))
+
+            encrypted = sink.getvalue()
+            chunks = [
+                encrypted[index : index + chunk_size]
+                for index in range(0, len(encrypted), chunk_size)
+            ]
+            result = []
+            count = cipher.decrypt_stream(iter(chunks), result.append)
+            self.assertEqual(count, len(data))
+            self.assertEqual(b"".join(result), data)
+
+        chunks = [b"hello", b"", b" ", b"world"]
+        sink = colony.legacy.BytesIO()
+        cipher.encrypt_stream(chunks, sink)
+        result = colony.legacy.BytesIO()
+        cipher.decrypt_stream(colony.legacy.BytesIO(sink.getvalue()), result)
+        self.assertEqual(result.getvalue(), b"hello world")
+
+        sink = colony.legacy.BytesIO()
+        self.assertEqual(cipher.encrypt_stream([], sink), 0)
+        result = colony.legacy.BytesIO()
+        cipher.decrypt_stream(colony.legacy.BytesIO(sink.getvalue()), result)
+        self.assertEqual(result.getvalue(), b"")
+
+    def test_stream_tampered(self):
+        if not colony.libs.aes_util.Crypto:
+            self.skipTest("Skipping test: PyCrypto unavailable")
+
+        cipher = colony.AesCipher()
+        sink = colony.legacy.BytesIO()
+        cipher.encrypt_stream(
+            colony.legacy.BytesIO(b"x" * 10000), sink, chunk_size=4096
+        )
+        encrypted = sink.getvalue()
+
+        tampered = bytearray(encrypted)
+        tampered[20] ^= 0x01
+        self.assertRaises(
+            colony.SecurityError,
+            lambda: cipher.decrypt_stream([bytes(tampered)], lambda data: None),
+        )
+
+        self.assertRaises(
+            colony.SecurityError,
+            lambda: cipher.decrypt_stream([encrypted[:-1]], lambda data: None),
+        )
+
+        frame = 4 + 4096 + colony.libs.aes_util.STREAM_TAG_SIZE
+        header = len(colony.libs.aes_util.STREAM_MAGIC) + 8 + 4
+        self.assertRaises(
+            colony.SecurityError,
+            lambda: cipher.decrypt_stream(
+                [encrypted[: header + frame]], lambda data: None
+            ),
+        )
+
+        forged = encrypted[:header] + struct.pack(">I", 0x7FFFFFFF)
+        self.assertRaises(
+            colony.SecurityError,
+            lambda: cipher.decrypt_stream([forged], lambda data: None),
+        )
+
+        forged = encrypted[: header - 4] + struct.pack(">I", 0x7FFFFFFF)
+        self.assertRaises(
+            colony.SecurityError,
+            lambda: cipher.decrypt_stream([forged], lambda data: None),
+        )
+
+        other = colony.AesCipher()
+        self.assertRaises(
+            colony.SecurityError,
+            lambda: other.decrypt_stream([encrypted], lambda data: None),
+        )
+
+    def test_stream_large(self):
+        if not colony.libs.aes_util.Crypto:
+            self.skipTest("Skipping test: PyCrypto unavailable")
+
+        cipher = colony.AesCipher(key=os.urandom(32))
+        data = os.urandom(1048576)
+        chunks = [data] * 16
+        sizes = []
+        encrypted = []
+
+        def sink(value):
+            sizes.append(len(value))
+            encrypted.append(value)
+
+        count = cipher.encrypt_stream(iter(chunks), sink)
+        self.assertEqual(count, 16 * 1048576)
+        self.assertEqual(max(sizes), 4 + 65536 + 32)
+
+        result = []
+        count = cipher.decrypt_stream([b"".join(encrypted)], result.append)
+        self.assertEqual(count, 16 * 1048576)
+        self.assertEqual(b"".join(result), data * 16)
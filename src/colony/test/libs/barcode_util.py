@@ -28,6 +28,8 @@ __copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
 __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
+import random
+
 import colony
 
 
@@ -89,6 +91,17 @@ class BarcodeTest(colony.ColonyTestCase):
             encoded_value, colony.legacy.u("\xcd,BXL\xce", encoding="unicode_escape")
         )
 
+        # encodes a value containing a space using the code set a, the
+        # space must be encoded as the value zero (and not as the FNC3
+        # value), which also changes the checksum character
+        self.assertEqual(
+            colony.libs.barcode_util._encode_code_set_a("A B"), [103, 33, 0, 34]
+        )
+        encoded_value = colony.encode_code_128("A B", "A")
+        self.assertEqual(
+            encoded_value, colony.legacy.u("\xcbA B@\xce", encoding="unicode_escape")
+        )
+
         # encodes using an invalid code set, should raise a runtime error
         # indicating the issue associated with the invalid code set
         self.assert_raises(RuntimeError, lambda: colony.encode_code_128("123456", "D"))
@@ -102,3 +115,103 @@ class BarcodeTest(colony.ColonyTestCase):
         # that the encoded value is the expected one
         encoded_value = colony.encode_code_39("123456")
         self.assertEqual(encoded_value, "*123456*")
+
+    def test_code_128_auto(self):
+        """
+        Tests the code 128 barcode generation algorithm with
+        the automatic switching between code sets.
+        """
+
+        # encodes a value composed only by digits and verifies that
+        # the code set c is used (same as the explicit code set c)
+        encoded_value = colony.encode_code_128("123456", "auto")
+        self.assertEqual(encoded_value, colony.encode_code_128("123456", "C"))
+
+        # encodes a value that starts with characters and ends with
+        # a run of digits, the switch to the code set c must be used
+        # resulting in a shorter representation
+        encoded_value = colony.encode_code_128("AB123456", "auto")
+        self.assertEqual(
+            encoded_value,
+            colony.legacy.u("\xccAB\xc7,BX:\xce", encoding="unicode_escape"),
+        )
+        self.assertEqual(len(encoded_value), 9)
+        self.assertEqual(len(colony.encode_code_128("AB123456", "B")), 11)
+
+        # encodes a value with an odd run of digits, the first digit
+        # should be encoded in the code set b before the switch
+        encoded_value = colony.encode_code_128("12345", "auto")
+        self.assertEqual(
+            encoded_value,
+            colony.legacy.u("\xcc1\xc77MU\xce", encoding="unicode_escape"),
+        )
+
+        # encodes a value that contains both lower case and control
+        # characters, requiring switches between code sets a and b
+        encoded_value = colony.encode_code_128("ab\x01c", "auto")
+        self.assertEqual(
+            encoded_value,
+            colony.legacy.u("\xccab\xc9a\xc8c/\xce", encoding="unicode_escape"),
+        )
+
+    def test_many(self):
+        """
+        Tests the batch barcode generation functions, making sure
+        that the results are the same as the single value ones.
+        """
+
+        encoded_values = colony.encode_2_of_5_many(["123456", "54321"])
+        self.assertEqual(
+            encoded_values,
+            [colony.encode_2_of_5("123456"), colony.encode_2_of_5("54321")],
+        )
+
+        encoded_values = colony.encode_code_128_many(["123456", "AB12"], "B")
+        self.assertEqual(
+            encoded_values,
+            [
+                colony.encode_code_128("123456", "B"),
+                colony.encode_code_128("AB12", "B"),
+            ],
+        )
+
+        encoded_values = colony.encode_code_39_many(["123456"], generator=True)
+        self.assertEqual(next(encoded_values), "*123456*")
+        self.assertRaises(StopIteration, lambda: next(encoded_values))
+
+        self.assert_raises(RuntimeError, lambda: colony.encode_2_of_5_many(["12a4"]))
+        self.assert_raises(
+            RuntimeError, lambda: colony.encode_code_128_many(["abc"], "A")
+        )
+        self.assert_raises(
+            RuntimeError, lambda: colony.encode_code_128_many(["123456"], "D")
+        )
+
+    def test_many_random(self):
+        """
+        Tests the batch barcode generation functions over a large
+        set of random values, verifying that the results are the
+        same as the ones of the single value functions.
+        """
+
+        digits = [
+            "".join(random.choice("0123456789") for _index in range(20))
+            for _index in range(1000)
+        ]
+        characters = [
+            "".join(random.choice("ABCXYZ 0123456789") for _index in range(20))
+            for _index in range(1000)
+        ]
+
+        encoded_values = colony.encode_2_of_5_many(digits)
+        self.assertEqual(
+            encoded_values, [colony.encode_2_of_5(value) for value in digits]
+        )
+
+        for code_set in ("A", "B", "C"):
+            values = characters if code_set in ("A", "B") else digits
+            encoded_values = colony.encode_code_128_many(values, code_set)
+            self.assertEqual(
+                encoded_values,
+                [colony.encode_code_128(value, code_set) for value in values],
+            )
@@ -60,3 +60,89 @@ class CountryTest(colony.ColonyTestCase):
         # fails, retrieving invalid results
         result = colony.country_get("PT")
         self.assertEqual(result, (None, None, None))
+
+    def test_get_fuzzy(self):
+        """
+        Tests the get country function in the fuzzy mode, with
+        both normalized names and ISO codes.
+        """
+
+        result = colony.country_get("PT", fuzzy=True)
+        self.assertEqual(result, ("PT", "PRT", "620"))
+
+        result = colony.country_get("prt", fuzzy=True)
+        self.assertEqual(result, ("PT", "PRT", "620"))
+
+        result = colony.country_get("620", fuzzy=True)
+        self.assertEqual(result, ("PT", "PRT", "620"))
+
+        result = colony.country_get(4, fuzzy=True)
+        self.assertEqual(result, ("AF", "AFG", "004"))
+
+        result = colony.country_get("  PORTUGAL! ", fuzzy=True)
+        self.assertEqual(result, ("PT", "PRT", "620"))
+
+        result = colony.country_get("Guinea Bissau", fuzzy=True)
+        self.assertEqual(result, ("GW", "GNB", "624"))
+
+        result = colony.country_get(colony.legacy.u("São Tomé & Príncipe"), fuzzy=True)
+        self.assertEqual(result, ("ST", "STP", "678"))
+
+        result = colony.country_get("Antigua and Deps", fuzzy=True)
+        self.assertEqual(result, ("AG", "ATG", "028"))
+
+        result = colony.country_get("Atlantis", fuzzy=True)
+        self.assertEqual(result, (None, None, None))
+
+    def test_get_many(self):
+        """
+        Tests the batch get country function.
+        """
+
+        result = colony.country_get_many(["portugal", "PT", "spain"])
+        self.assertEqual(
+            result, [("PT", "PRT", "620"), (None, None, None), ("ES", "ESP", "724")]
+        )
+
+        result = colony.country_get_many(
+            ["portugal", "PT", colony.legacy.u("España")], fuzzy=True
+        )
+        self.assertEqual(
+            result, [("PT", "PRT", "620"), ("PT", "PRT", "620"), (None, None, None)]
+        )
+
+    def test_complete(self):
+        """
+        Tests the completion of country names from prefixes.
+        """
+
+        result = colony.country_complete("ba")
+        self.assertEqual(result, ["Bahamas", "Bahrain", "Bangladesh", "Barbados"])
+
+        result = colony.country_complete("Bo", limit=2)
+        self.assertEqual(result, ["Bolivia", "Bosnia Herzegovina"])
+
+        result = colony.country_complete("port")
+        self.assertEqual(result, ["Portugal"])
+
+        result = colony.country_complete("atlantis")
+        self.assertEqual(result, [])
+
+    def test_get_many_repeated(self):
+        """
+        Tests the batch get country function in the fuzzy mode
+        with a large number of (repeated) values.
+        """
+
+        values = ["Portugal", "pt", "Spain ", "FRANCE", "germany!"] * 2000
+
+        result = colony.country_get_many(values, fuzzy=True)
+        self.assertEqual(len(result), 10000)
+        self.assertEqual(result[0], result[5])
+        self.assertEqual(result[-1], ("DE", "DEU", "276"))
+
+        values = ["country-%d" % index for index in range(1000)]
+
+        result = colony.country_get_many(values, fuzzy=True)
+        self.assertEqual(len(result), 1000)
+        self.assertEqual(result[0], (None, None, None))
@@ -28,6 +28,12 @@ __copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
 __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
+import io
+import os
+import hashlib
+import tempfile
+import threading
+
 import colony
 
 
@@ -69,3 +75,136 @@ class CryptTest(colony.ColonyTestCase):
         result = colony.md5_crypt(colony.legacy.u("密码"), colony.legacy.u("01234567"))
         self.assertEqual(type(result), colony.legacy.UNICODE)
         self.assertEqual(result, "$1$01234567$MUE6EDF7dbbvoFo3c.Oj1.")
+
+    def test_password_crypt(self):
+        """
+        Tests the password crypt and match functions using both
+        the simple hash methods and the key derivation functions.
+        """
+
+        result = colony.password_crypt("password", "salt", hash_method="sha256")
+        self.assertEqual(result.startswith("{sha256}"), True)
+        self.assertEqual(colony.password_match(result, "password", "salt"), True)
+        self.assertEqual(colony.password_match(result, "password"), False)
+
+        result = colony.password_crypt("password", hash_method="plain")
+        self.assertEqual(result, "{plain}password")
+        self.assertEqual(colony.password_match(result, "password"), True)
+
+        result = colony.password_crypt(
+            "password", "salt", hash_method="pbkdf2_sha256", iterations=1000
+        )
+        self.assertEqual(result.startswith("{pbkdf2_sha256}1000$"), True)
+        self.assertEqual(colony.password_match(result, "password", "salt"), True)
+        self.assertEqual(colony.password_match(result, "password"), False)
+        self.assertNotEqual(
+            colony.password_crypt("password", hash_method="pbkdf2_sha256"), result
+        )
+
+        self.assertEqual(colony.password_match("{pbkdf2_sha256}1$x", "password"), False)
+        self.assertEqual(colony.password_match("invalid", "password"), False)
+
+    def test_password_crypt_many(self):
+        """
+        Tests the batch password crypt and match functions, that
+        split the operation across multiple worker processes.
+        """
+
+        passwords = ["password%d" % index for index in range(16)]
+
+        for workers in (1, 2):
+            results = colony.password_crypt_many(
+                passwords, iterations=1000, workers=workers
+            )
+            self.assertEqual(len(results), 16)
+            self.assertEqual(
+                colony.password_match_many(results, passwords, workers=workers),
+                [True] * 16,
+            )
+            self.assertEqual(
+                colony.password_match_many(
+                    results, list(reversed(passwords)), workers=workers
+                ),
+                [False] * 16,
+            )
+
+        results = colony.password_crypt_many(passwords[:2], hash_method="md5")
+        self.assertEqual(results[0], colony.password_crypt("password0"))
+        self.assertEqual(
+            colony.password_match_many(results, passwords[:2]), [True, True]
+        )
+
+    def test_generate_hash_digest_map(self):
+        """
+        Tests the generation of the hash digest map for files, using
+        both the sequential and the threaded strategies.
+        """
+
+        data = os.urandom(100000)
+        file, file_path = tempfile.mkstemp()
+        os.write(file, data)
+        os.close(file)
+
+        try:
+            expected = dict(
+                md5=hashlib.md5(data).hexdigest(),
+                sha1=hashlib.sha1(data).hexdigest(),
+                sha256=hashlib.sha256(data).hexdigest(),
+            )
+
+            result = colony.generate_hash_digest_map(file_path)
+            self.assertEqual(result, expected)
+
+            for threaded in (True, False):
+                result = colony.generate_hash_digest_map(
+                    file_path, buffer_size=4096, threaded=threaded
+                )
+                self.assertEqual(result, expected)
+
+            result = colony.generate_hash_digest_map(
+                file_path, hash_set=("sha256",), threaded=True
+            )
+            self.assertEqual(result, dict(sha256=expected["sha256"]))
+
+            result = colony.generate_hash_digest_map_many([file_path] * 3, workers=2)
+            self.assertEqual(result, {file_path: expected})
+
+            self.assertRaises(
+                (IOError, OSError),
+                lambda: colony.generate_hash_digest_map_many(
+                    [file_path, file_path + ".missing"]
+                ),
+            )
+        finally:
+            os.remove(file_path)
+
+    def test_generate_hash_digest_map_error(self):
+        """
+        Tests that a failure in one of the hash threads is raised
+        to the caller instead of blocking the reading of the file.
+        """
+
+        class FailingHash(object):
+            def update(self, chunk):
+                raise ValueError("hash failure")
+
+        data = os.urandom(100000)
+        hash = hashlib.sha256()
+        errors = []
+
+        def digest():
+            try:
+                colony.libs.crypt_util._digest_threaded(
+                    io.BytesIO(data), [hash, FailingHash()], 1024
+                )
+            except ValueError as exception:
+                errors.append(exception)
+
+        thread = threading.Thread(target=digest)
+        thread.daemon = True
+        thread.start()
+        thread.join(10.0)
+
+        self.assertEqual(thread.is_alive(), False)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(str(errors[0]), "hash failure")
@@ -0,0 +1,83 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import colony
+
+
+class EncodeTest(colony.ColonyTestCase):
+    """
+    Class that tests the two's complement encoding
+    and decoding functions.
+    """
+
+    def test_encode_two_complement_string(self):
+        self.assertEqual(colony.encode_two_complement_string(0), b"")
+        self.assertEqual(colony.encode_two_complement_string(1), b"\x01")
+        self.assertEqual(colony.encode_two_complement_string(127), b"\x7f")
+        self.assertEqual(colony.encode_two_complement_string(128), b"\x80\x00")
+        self.assertEqual(colony.encode_two_complement_string(300), b"\x2c\x01")
+        self.assertEqual(colony.encode_two_complement_string(-1), b"\xff")
+        self.assertEqual(colony.encode_two_complement_string(-128), b"\x80")
+        self.assertEqual(colony.encode_two_complement_string(-129), b"\x7f\xff")
+        self.assertEqual(colony.encode_two_complement_string(-256), b"\x00\xff")
+
+    def test_decode_two_complement_string(self):
+        self.assertEqual(colony.decode_two_complement_string(b""), 0)
+        self.assertEqual(colony.decode_two_complement_string(b"\x01"), 1)
+        self.assertEqual(colony.decode_two_complement_string(b"\x80\x00"), 128)
+        self.assertEqual(colony.decode_two_complement_string(b"\x2c\x01"), 300)
+        self.assertEqual(colony.decode_two_complement_string(b"\xff"), -1)
+        self.assertEqual(colony.decode_two_complement_string(b"\x7f\xff"), -129)
+
+        for value in (2**64, -(2**64), 2**200 + 17, -(2**200) - 17):
+            data = colony.encode_two_complement_string(value)
+            self.assertEqual(colony.decode_two_complement_string(data), value)
+
+    def test_two_complement_many(self):
+        values = [0, 1, -1, 127, 128, -128, -129, 2**64, -(2**1100), 2**1100 - 1]
+
+        data = colony.encode_two_complement_many(values)
+        self.assertEqual(data[:4], b"\x00\x01\x01\x01")
+        self.assertEqual(colony.decode_two_complement_many(data), values)
+
+        data = colony.encode_two_complement_many([])
+        self.assertEqual(data, b"")
+        self.assertEqual(colony.decode_two_complement_many(data), [])
+
+        data = colony.encode_two_complement_many([2**1100])
+        self.assertEqual(data[:2], b"\x8a\x01")
+        self.assertEqual(colony.decode_two_complement_many(data), [2**1100])
+
+        self.assert_raises(
+            RuntimeError, lambda: colony.decode_two_complement_many(b"\x02\x01")
+        )
+        self.assert_raises(
+            RuntimeError, lambda: colony.decode_two_complement_many(b"\x8a")
+        )
@@ -0,0 +1,138 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import os
+import tempfile
+
+import colony
+
+
+class FileTest(colony.ColonyTestCase):
+    """
+    Class that tests the file utility functions and
+    the file transaction context.
+    """
+
+    def setUp(self):
+        colony.ColonyTestCase.setUp(self)
+        self.base_path = tempfile.mkdtemp()
+        self.context = colony.FileTransactionContext()
+        self.context.open()
+
+    def tearDown(self):
+        colony.ColonyTestCase.tearDown(self)
+        self.context.rollback()
+        colony.remove_directory(self.base_path)
+
+    def test_path_trie(self):
+        """
+        Tests the path trie, both for the coverage and
+        for the intersection of paths.
+        """
+
+        trie = colony.PathTrie()
+        trie.add(os.path.join(self.base_path, "directory"), recursive=True)
+        trie.add(os.path.join(self.base_path, "file.txt"))
+
+        self.assertEqual(trie.covers(os.path.join(self.base_path, "directory")), True)
+        self.assertEqual(
+            trie.covers(os.path.join(self.base_path, "directory", "file.txt")), True
+        )
+        self.assertEqual(trie.covers(os.path.join(self.base_path, "file.txt")), True)
+        self.assertEqual(
+            trie.covers(os.path.join(self.base_path, "file.txt", "other.txt")), False
+        )
+        self.assertEqual(trie.covers(os.path.join(self.base_path, "dir")), False)
+        self.assertEqual(trie.covers(self.base_path), False)
+
+        self.assertEqual(trie.intersects(self.base_path), True)
+        self.assertEqual(
+            trie.intersects(os.path.join(self.base_path, "directory", "file.txt")),
+            True,
+        )
+        self.assertEqual(trie.intersects(os.path.join(self.base_path, "other")), False)
+
+    def test_transaction(self):
+        """
+        Tests the existence checks of the file transaction context,
+        including the write after remove semantics.
+        """
+
+        directory_path = os.path.join(self.base_path, "directory")
+        file_path = os.path.join(directory_path, "file.txt")
+        os.makedirs(directory_path)
+        with open(file_path, "wb") as file:
+            file.write(b"original")
+
+        self.assertEqual(self.context.exists_file_path(file_path), True)
+        self.assertEqual(self.context.read_file(file_path), b"original")
+
+        self.context.remove_directory(directory_path)
+        self.assertEqual(self.context.exists_file_path(file_path), False)
+
+        self.context.write_file(file_path, b"changed")
+        self.assertEqual(self.context.exists_file_path(file_path), True)
+        self.assertEqual(self.context.read_file(file_path), b"changed")
+
+        self.context.remove_file(file_path)
+        self.assertEqual(self.context.exists_file_path(file_path), False)
+
+        other_path = os.path.join(self.base_path, "other.txt")
+        self.context.write_file(other_path, b"other")
+        self.context.commit()
+
+        self.assertEqual(os.path.exists(other_path), True)
+        self.assertEqual(self.context.removed_paths.covers(file_path), False)
+
+    def test_transaction_many(self):
+        """
+        Tests the existence checks of a file transaction context
+        with a large number of pending removals.
+        """
+
+        paths = [
+            os.path.join(
+                self.base_path, "directory-%d" % (index % 100), "file-%d" % index
+            )
+            for index in range(2000)
+        ]
+
+        for path in paths:
+            self.context.remove_file(path, handle_exception=True)
+        self.context.remove_directory(
+            os.path.join(self.base_path, "removed"), handle_exception=True
+        )
+
+        for path in paths:
+            self.assertEqual(self.context._is_removed_file_path(path), True)
+            self.assertEqual(self.context.exists_file_path(path), False)
+
+        path = os.path.join(self.base_path, "removed", "file.txt")
+        self.assertEqual(self.context._is_removed_file_path(path), True)
@@ -0,0 +1,112 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Hive Colony Framework
+# Copyright (c) 2008-2024 Hive Solutions Lda.
+#
+# This file is part of Hive Colony Framework
+#
+# Hive Colony Framework is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by the Apache
+# Foundation, either version 2.0 of the License, or (at your option) any
+# later version.
+#
+# Hive Colony Framework is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# Apache License for more details.
+#
+# You should have received a copy of the Apache License along with
+# Hive Colony Framework If not, see <http://www.apache.org/licenses/>.
+
+__author__ = "João Magalhães <joamag@hive.pt>"
+""" The author(s) of the module """
+
+__copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
+""" The copyright for the module """
+
+__license__ = "Apache License, Version 2.0"
+""" The license for the module """
+
+import colony
+
+
+class ListTest(colony.ColonyTestCase):
+    """
+    Class that tests the utility functions that
+    are associated with list manipulation.
+    """
+
+    def test_list_no_duplicates(self):
+        """
+        Tests the removal of duplicates from lists, including
+        lists with unhashable values.
+        """
+
+        result = colony.list_no_duplicates([3, 1, 3, 2, 1])
+        self.assertEqual(result, [3, 1, 2])
+
+        result = colony.list_no_duplicates([1, [1], 2, [1], dict(a=1), dict(a=1), 1])
+        self.assertEqual(result, [1, [1], 2, dict(a=1)])
+
+        result = colony.list_no_duplicates([])
+        self.assertEqual(result, [])
+
+    def test_list_intersect(self):
+        """
+        Tests the intersection of lists, making sure that the
+        order of the first list is preserved.
+        """
+
+        result = colony.list_intersect([1, 2, [3], 3, 2], [2, [3]])
+        self.assertEqual(result, [2, [3], 2])
+
+        result = colony.list_intersect([1, 2], [])
+        self.assertEqual(result, [])
+
+    def test_list_exclude(self):
+        """
+        Tests the exclusion of items from lists, with the first
+        occurrence of each item being removed.
+        """
+
+        result = colony.list_exclude([1, 2, 1, [3], 3], [1, [3]])
+        self.assertEqual(result, [2, 1, 3])
+
+        base_list = [1, 2]
+        result = colony.list_exclude(base_list, [2], copy_base_list=False)
+        self.assertEqual(result, [1])
+        self.assertEqual(base_list, [1])
+
+        self.assertRaises(ValueError, lambda: colony.list_exclude([1], [2]))
+
+    def test_list_extend(self):
+        """
+        Tests the extension of lists, making sure that values
+        already present in the base list are not added.
+        """
+
+        base_list = [1, [2]]
+        result = colony.list_extend(base_list, [[2], 3, 1])
+        self.assertEqual(result, [1, [2], 3])
+        self.assertEqual(base_list, [1, [2]])
+
+    def test_list_large(self):
+        """
+        Tests the list operations with lists of 100k elements
+        (with a large number of duplicates).
+        """
+
+        values = [("copy", "path-%d" % (index % 50000)) for index in range(100000)]
+        others = values[::2]
+
+        result = colony.list_no_duplicates(values)
+        self.assertEqual(len(result), 50000)
+        self.assertEqual(result[0], ("copy", "path-0"))
+
+        result = colony.list_intersect(values, others)
+        self.assertEqual(len(result), 50000)
+
+        result = colony.list_exclude(values, others)
+        self.assertEqual(len(result), 50000)
+        self.assertEqual(result[0], ("copy", "path-1"))
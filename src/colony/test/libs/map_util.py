@@ -58,3 +58,127 @@ class MapTest(colony.ColonyTestCase):
         self.assertEqual(map_flat["name"], "name")
         self.assertEqual(map_flat["father.name"], "name_father")
         self.assertEqual(map_flat["sons"], MAP_STRUCTURE["sons"])
+
+    def test_map_duplicate(self):
+        """
+        Tests the duplication of maps, making sure that aliasing
+        and cycles are preserved and that immutable values are shared.
+        """
+
+        shared = dict(name="shared")
+        structure = dict(
+            first=shared,
+            second=shared,
+            sequence=[shared, (1, 2), (1, [2])],
+            father=dict(MAP_STRUCTURE["father"]),
+        )
+        structure["self"] = structure
+
+        result = colony.map_duplicate(structure)
+        self.assertEqual(result["first"], shared)
+        self.assertNotEqual(id(result["first"]), id(shared))
+        self.assertEqual(id(result["first"]), id(result["second"]))
+        self.assertEqual(id(result["sequence"][0]), id(result["first"]))
+        self.assertEqual(id(result["self"]), id(result))
+        self.assertEqual(id(result["sequence"][1]), id(structure["sequence"][1]))
+        self.assertEqual(result["sequence"][2], (1, [2]))
+        self.assertNotEqual(
+            id(result["sequence"][2][1]), id(structure["sequence"][2][1])
+        )
+        self.assertEqual(result["father"], MAP_STRUCTURE["father"])
+
+        result = colony.map_duplicate(MAP_STRUCTURE)
+        self.assertEqual(result, MAP_STRUCTURE)
+        self.assertNotEqual(id(result["sons"]), id(MAP_STRUCTURE["sons"]))
+
+        deep = []
+        current = deep
+        for _index in range(100000):
+            value = []
+            current.append(value)
+            current = value
+        result = colony.map_duplicate(deep)
+        self.assertEqual(len(result), 1)
+
+        memo = dict()
+        for index in range(2000):
+            value = dict(index=index, items=[index], pair=(index, [index]))
+            result = colony.map_duplicate(value, memo=memo)
+            self.assertEqual(result, value)
+
+    def test_map_extend(self):
+        """
+        Tests the (recursive) extension of maps, both in the
+        copy and in the persistent modes.
+        """
+
+        base_map = dict(a=dict(b=dict(c=1, d=2), e=3), f=4)
+        extension_map = dict(a=dict(b=dict(c=10, z=5)), g=1)
+
+        result = colony.map_extend(base_map, extension_map, recursive=True)
+        self.assertEqual(result, dict(a=dict(b=dict(c=10, d=2, z=5), e=3), f=4, g=1))
+        self.assertEqual(base_map, dict(a=dict(b=dict(c=1, d=2), e=3), f=4))
+
+        result = colony.map_extend(
+            base_map, extension_map, override=False, recursive=True
+        )
+        self.assertEqual(result, dict(a=dict(b=dict(c=1, d=2), e=3), f=4, g=1))
+
+        result = colony.map_extend(base_map, extension_map)
+        self.assertEqual(result, dict(a=dict(b=dict(c=10, z=5)), f=4, g=1))
+
+        cyclic = dict()
+        cyclic["self"] = cyclic
+        result = colony.map_extend(dict(), cyclic, recursive=True)
+        self.assertEqual(id(result["self"]["self"]), id(result["self"]))
+
+        result = colony.map_extend(
+            base_map, extension_map, recursive=True, persistent=True
+        )
+        self.assertEqual(isinstance(result, colony.PersistentMap), True)
+        self.assertEqual(result["a"]["b"]["c"], 10)
+        self.assertEqual(result["a"]["b"]["d"], 2)
+        self.assertEqual(result["a"]["e"], 3)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(sorted(result), ["a", "f", "g"])
+        self.assertEqual(
+            result.to_dict(), dict(a=dict(b=dict(c=10, d=2, z=5), e=3), f=4, g=1)
+        )
+
+        _result = result.set("f", 5)
+        self.assertEqual(_result["f"], 5)
+        self.assertEqual(result["f"], 4)
+        self.assertEqual(_result.get("missing", 0), 0)
+
+        _result = result.extend(dict(a=dict(e=30)))
+        self.assertEqual(_result["a"]["e"], 30)
+        self.assertEqual(_result["a"]["b"]["c"], 10)
+        self.assertEqual(result["a"]["e"], 3)
+
+    def test_map_extend_large(self):
+        """
+        Tests the per request override of a large map, using both
+        the copy and the persistent (structural sharing) modes.
+        """
+
+        base_map = dict(
+            (
+                "section-%d" % index,
+                dict(("key-%d" % value, value) for value in range(100)),
+            )
+            for index in range(1000)
+        )
+        extension_map = {"section-10": {"key-10": -1}}
+
+        result = colony.map_extend(base_map, extension_map, recursive=True)
+        self.assertEqual(result["section-10"]["key-10"], -1)
+        self.assertEqual(result["section-10"]["key-11"], 11)
+        self.assertEqual(base_map["section-10"]["key-10"], 10)
+
+        result = colony.map_extend(
+            base_map, extension_map, recursive=True, persistent=True
+        )
+        self.assertEqual(result["section-10"]["key-10"], -1)
+        self.assertEqual(result["section-10"]["key-11"], 11)
+        self.assertEqual(len(result), 1000)
+        self.assertEqual(base_map["section-10"]["key-10"], 10)
@@ -48,3 +48,163 @@ class ObjectTest(colony.ColonyTestCase):
         result = colony.object_attribute_names(dict(a=2, b=1, c=colony.Decimal(2.0)))
         result.sort()
         self.assertEqual(result, ["a", "b", "c"])
+
+    def test_object_flatten(self):
+        """
+        Tests the object flatten function, with both to-one
+        and to-many relations in the flattening map.
+        """
+
+        instances = [
+            dict(
+                name="first",
+                owner=dict(name="owner", city=dict(name="city")),
+                lines=[
+                    dict(sku="a", parts=[dict(number=1), dict(number=2)]),
+                    dict(sku="b"),
+                ],
+            ),
+            dict(name="second", owner=None, lines=[dict(sku="c")]),
+            dict(name="third", lines=[]),
+        ]
+        flattening_map = dict(
+            name="label",
+            owner=dict(name="owner_name", city=dict(name="city_name")),
+            lines=dict(sku="line_sku", parts=dict(number="part_number")),
+        )
+
+        result = colony.object_flatten(instances, flattening_map)
+        result = [
+            (
+                row["label"],
+                row["owner_name"],
+                row["city_name"],
+                row["line_sku"],
+                row["part_number"],
+            )
+            for row in result
+        ]
+        self.assertEqual(
+            result,
+            [
+                ("first", "owner", "city", "a", 1),
+                ("first", "owner", "city", "a", 2),
+                ("first", "owner", "city", "b", None),
+                ("second", None, None, "c", None),
+            ],
+        )
+        self.assertEqual(len(instances[0]["lines"]), 2)
+        self.assertEqual("label" in instances[0], False)
+
+        result = colony.object_flatten(
+            dict(name="single", lines=[dict(sku="a")]), flattening_map
+        )
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["label"], "single")
+        self.assertEqual(result[0]["owner_name"], None)
+
+        self.assertRaises(
+            RuntimeError, lambda: colony.object_flatten("invalid", flattening_map)
+        )
+
+    def test_object_flatten_many(self):
+        """
+        Tests the object flatten function with multiple to-many
+        relations, making sure that the values of every relation
+        are present in the resulting rows.
+        """
+
+        instance = dict(
+            lines=[dict(sku="a"), dict(sku="b")],
+            payments=[dict(method="card"), dict(method="cash")],
+        )
+        flattening_map = dict(lines=dict(sku="sku"), payments=dict(method="method"))
+
+        result = colony.object_flatten(instance, flattening_map)
+        result = [(row["sku"], row["method"]) for row in result]
+        self.assertEqual(
+            result, [("a", "card"), ("a", "cash"), ("b", "card"), ("b", "cash")]
+        )
+
+    def test_object_flatten_unmapped(self):
+        """
+        Tests the object flatten function with sequence attributes
+        that are not defined in the flattening map, which multiply
+        the rows without setting any (flattened) value.
+        """
+
+        instances = [
+            dict(
+                name="a",
+                tags=[dict(value="x"), dict(value="y")],
+                extra=[dict(value=1, parts=[dict(), dict()]), dict(value=2)],
+            )
+        ]
+        flattening_map = dict(name="name", tags=dict(value="tag"))
+
+        result = colony.object_flatten(instances, flattening_map)
+        self.assertEqual(len(result), 6)
+        self.assertEqual([row["tag"] for row in result], ["x", "x", "x", "y", "y", "y"])
+        self.assertEqual(set(row["name"] for row in result), set(["a"]))
+        self.assertEqual("value" in result[0], False)
+
+        result = colony.object_flatten(
+            dict(name="b", extra=["first", "second"]), flattening_map
+        )
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0]["tag"], None)
+
+        result = colony.object_flatten(
+            dict(name="c", tags=["first", "second"]), dict(name="name", tags="tags")
+        )
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["tags"], ["first", "second"])
+
+    def test_object_flatten_generator(self):
+        """
+        Tests the object flatten function in the generator mode
+        using a previously compiled plan.
+        """
+
+        plan = colony.object_flatten_compile(
+            dict(name="label", lines=dict(sku="line_sku"))
+        )
+        self.assertEqual(isinstance(plan, colony.FlatteningPlan), True)
+        self.assertEqual(plan.names, frozenset(("label", "line_sku")))
+
+        instances = (
+            dict(name="instance-%d" % index, lines=[dict(sku="a"), dict(sku=None)])
+            for index in range(3)
+        )
+        result = colony.object_flatten(instances, plan, generator=True)
+        self.assertEqual(next(result)["line_sku"], "a")
+        rows = list(result)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["line_sku"], None)
+        self.assertEqual(rows[-1]["label"], "instance-2")
+
+    def test_object_flatten_large(self):
+        """
+        Tests the flattening of a larger number of instances using
+        a compiled plan, in both the list and generator modes.
+        """
+
+        instances = [
+            dict(
+                name="instance-%d" % index,
+                owner=dict(name="owner-%d" % index),
+                lines=[dict(sku="sku-%d" % value) for value in range(10)],
+            )
+            for index in range(100)
+        ]
+        plan = colony.object_flatten_compile(
+            dict(name="label", owner=dict(name="owner_name"), lines=dict(sku="sku"))
+        )
+
+        result = colony.object_flatten(instances, plan)
+        self.assertEqual(len(result), 1000)
+        self.assertEqual(result[-1]["sku"], "sku-9")
+        self.assertEqual(result[-1]["owner_name"], "owner-99")
+
+        rows = list(colony.object_flatten(instances, plan, generator=True))
+        self.assertEqual(rows, result)
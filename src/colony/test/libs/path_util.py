@@ -30,6 +30,7 @@ __license__ = "Apache License, Version 2.0"
 
 import os
 import tempfile
+
 import colony
 
 
@@ -81,3 +82,110 @@ class PathTest(colony.ColonyTestCase):
             with open(deep_target_path, "rb") as file:
                 content = file.read()
             self.assertEqual(content, default_content)
+
+    def test_copy_directory(self):
+        """
+        Tests the copy of directories, including the incremental
+        mode and the reporting of progress.
+        """
+
+        source_path = tempfile.mkdtemp()
+        target_path = tempfile.mkdtemp()
+
+        try:
+            for index in range(10):
+                directory_path = os.path.join(source_path, "directory-%d" % index)
+                os.makedirs(directory_path)
+                with open(os.path.join(directory_path, "file.txt"), "wb") as file:
+                    file.write(b"content-%d" % index)
+            with open(os.path.join(source_path, ".hidden"), "wb") as file:
+                file.write(b"hidden")
+            with open(os.path.join(source_path, "large.bin"), "wb") as file:
+                file.write(os.urandom(3 * 1048576 + 17))
+            if hasattr(os, "symlink"):
+                os.symlink("directory-0", os.path.join(source_path, "link"))
+
+            calls = []
+            colony.copy_directory(
+                source_path,
+                target_path,
+                workers=4,
+                callback=lambda count, total: calls.append((count, total)),
+            )
+            self.assertEqual(calls[-1], (12, 12))
+            self.assertEqual([count for count, _total in calls], list(range(1, 13)))
+
+            for name in ("directory-9/file.txt", ".hidden", "large.bin"):
+                with open(os.path.join(source_path, name), "rb") as file:
+                    source_contents = file.read()
+                with open(os.path.join(target_path, name), "rb") as file:
+                    target_contents = file.read()
+                self.assertEqual(target_contents, source_contents)
+            if hasattr(os, "symlink"):
+                self.assertEqual(
+                    os.path.islink(os.path.join(target_path, "link")), True
+                )
+
+            _target_path = os.path.join(target_path, "directory-0", "file.txt")
+            with open(_target_path, "wb") as file:
+                file.write(b"changed")
+            os.utime(_target_path, (0, 0))
+            colony.copy_directory(source_path, target_path, incremental=True)
+            with open(_target_path, "rb") as file:
+                self.assertEqual(file.read(), b"content-0")
+
+            with open(_target_path, "wb") as file:
+                file.write(b"content-x")
+            _source_path = os.path.join(source_path, "directory-0", "file.txt")
+            _stat = os.stat(_source_path)
+            os.utime(_target_path, (_stat.st_atime, _stat.st_mtime))
+            colony.copy_directory(source_path, target_path, incremental=True)
+            with open(_target_path, "rb") as file:
+                self.assertEqual(file.read(), b"content-x")
+
+            hidden_path = tempfile.mkdtemp()
+            try:
+                colony.copy_directory(source_path, hidden_path, copy_hidden=False)
+                self.assertEqual(
+                    os.path.exists(os.path.join(hidden_path, ".hidden")), False
+                )
+            finally:
+                colony.remove_directory(hidden_path)
+        finally:
+            colony.remove_directory(source_path)
+            colony.remove_directory(target_path)
+
+    def test_copy_directory_many(self):
+        """
+        Tests the copy of a directory tree with a larger number
+        of (small) files, both in the full and incremental modes.
+        """
+
+        source_path = tempfile.mkdtemp()
+        target_path = tempfile.mkdtemp()
+
+        try:
+            for index in range(5):
+                directory_path = os.path.join(source_path, "directory-%d" % index)
+                os.makedirs(directory_path)
+                for _index in range(20):
+                    file_path = os.path.join(directory_path, "file-%d.txt" % _index)
+                    with open(file_path, "wb") as file:
+                        file.write(b"x" * 1024)
+
+            colony.copy_directory(source_path, target_path, incremental=True)
+            file_path = os.path.join(target_path, "directory-4", "file-19.txt")
+            with open(file_path, "rb") as file:
+                self.assertEqual(file.read(), b"x" * 1024)
+
+            calls = []
+            colony.copy_directory(
+                source_path,
+                target_path,
+                incremental=True,
+                callback=lambda count, total: calls.append((count, total)),
+            )
+            self.assertEqual(calls[-1], (100, 100))
+        finally:
+            colony.remove_directory(source_path)
+            colony.remove_directory(target_path)
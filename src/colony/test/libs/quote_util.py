@@ -165,3 +165,72 @@ class QuoteTest(colony.ColonyTestCase):
 
         result = colony.url_encode(attributes_list=items, plus_encoding=True)
         self.assertEqual(result, "message=Hello+World&mensagem=Ol%C3%A1+Mundo")
+
+        result = colony.url_encode(attributes_map=dict(message="Olá"))
+        self.assertEqual(result, "message=Ol%C3%A1")
+
+    def test_quote_many(self):
+        """
+        Tests the batch quoting operation, making sure that the results
+        are the same as the ones of the single value functions.
+        """
+
+        values = ["Hello World", "Olá Mundo", "你好世界", "hello/world", ""]
+
+        result = colony.quote_many(values)
+        self.assertEqual(result, [colony.quote(value) for value in values])
+
+        result = colony.quote_many(values, plus_encoding=True)
+        self.assertEqual(result, [colony.quote_plus(value) for value in values])
+
+        result = colony.quote_many(values, safe="")
+        self.assertEqual(result, [colony.quote(value, safe="") for value in values])
+
+        result = colony.quote_many(["hello_world-1.0"])
+        self.assertEqual(result, ["hello_world-1.0"])
+
+        result = colony.quote_many(values, plus_encoding=True)
+        self.assertEqual(
+            result, [colony.legacy.quote_plus(value, safe="") for value in values]
+        )
+
+    def test_url_decode(self):
+        """
+        Tests the URL decoding operation both for complete values
+        and for (incremental) sequences of chunks of data.
+        """
+
+        result = colony.url_decode("message=Hello+World&mensagem=Ol%C3%A1+Mundo")
+        self.assertEqual(
+            result, [("message", "Hello World"), ("mensagem", "Olá Mundo")]
+        )
+
+        result = colony.url_decode("a=1&&b&c=")
+        self.assertEqual(result, [("a", "1"), ("b", ""), ("c", "")])
+
+        result = colony.url_decode("a=1&b=%C3%A1&a=2")
+        expected = colony.legacy.parse_qs("a=1&b=%C3%A1&a=2", keep_blank_values=True)
+        self.assertEqual(
+            dict(result), dict((key, values[-1]) for key, values in expected.items())
+        )
+
+        data = colony.url_encode(
+            attributes_list=[
+                ("key%d" % index, "value %d" % index) for index in range(100)
+            ],
+            plus_encoding=True,
+        )
+        for size in (1, 3, 16, 1024):
+            decoder = colony.UrlDecoder()
+            result = []
+            for index in range(0, len(data), size):
+                result.extend(decoder.feed(data[index : index + size]))
+            result.extend(decoder.close())
+            self.assertEqual(
+                result, [("key%d" % index, "value %d" % index) for index in range(100)]
+            )
+
+        decoder = colony.UrlDecoder()
+        self.assertEqual(decoder.feed(b"message=Hello"), [])
+        self.assertEqual(decoder.feed(b"+World&"), [("message", "Hello World")])
+        self.assertEqual(decoder.close(), [])
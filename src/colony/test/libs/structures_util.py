@@ -453,3 +453,56 @@ class OrderedMapTest(colony.ColonyTestCase):
             # increments the index counter
             # (new iteration)
             index += 1
+
+
+class OrderedSetTest(colony.ColonyTestCase):
+    """
+    Class that tests the ordered set structure.
+    """
+
+    def test_basic(self):
+        """
+        Tests the basic list like operations of the ordered set
+        making sure that the insertion order is kept and that
+        duplicated values are ignored.
+        """
+
+        ordered_set = colony.OrderedSet()
+        ordered_set.append(3)
+        ordered_set.append(1)
+        ordered_set.append(2)
+        ordered_set.append(1)
+
+        self.assertEqual(len(ordered_set), 3)
+        self.assertEqual(ordered_set, [3, 1, 2])
+        self.assertEqual(list(ordered_set), [3, 1, 2])
+        self.assertEqual(ordered_set[0], 3)
+        self.assertEqual(ordered_set[-1], 2)
+        self.assertEqual(ordered_set.index(2), 2)
+        self.assertEqual(1 in ordered_set, True)
+        self.assertEqual(4 in ordered_set, False)
+
+        ordered_set.remove(1)
+        self.assertEqual(ordered_set, [3, 2])
+        self.assertRaises(ValueError, ordered_set.remove, 1)
+
+        ordered_set.discard(1)
+        ordered_set.discard(3)
+        self.assertEqual(ordered_set, [2])
+
+        ordered_set.clear()
+        self.assertEqual(len(ordered_set), 0)
+        self.assertEqual(bool(ordered_set), False)
+
+    def test_iteration(self):
+        """
+        Tests that the ordered set may be changed while being
+        iterated, just like it's possible with a list.
+        """
+
+        ordered_set = colony.OrderedSet([("a", 1), ("b", 2), ("c", 3)])
+
+        for value in ordered_set:
+            ordered_set.remove(value)
+
+        self.assertEqual(ordered_set, [])
@@ -28,6 +28,8 @@ __copyright__ = "Copyright (c) 2008-2024 Hive Solutions Lda."
 __license__ = "Apache License, Version 2.0"
 """ The license for the module """
 
+import os
+import tempfile
 import xml.dom.minidom
 
 import colony
@@ -96,6 +98,63 @@ class XmlTest(colony.ColonyTestCase):
             </person>"""))
         self.assertEqual(result, dict(person=dict(name="Hello World", age="32")))
 
+    def test_xml_to_dict_namespaces(self):
+        """
+        Verifies that the qualified names (with prefix) of the elements
+        are used in the conversion, as in the DOM based conversion.
+        """
+
+        data = """<ns:person xmlns:ns="urn:person" xmlns="urn:default">
+            <ns:name>Hello World</ns:name>
+            <age>32</age>
+        </ns:person>"""
+        result = colony.xml_to_dict(data)
+        self.assertEqual(result, {"ns:person": {"ns:name": "Hello World", "age": "32"}})
+        self.assertEqual(result, colony.xml_to_dict(xml.dom.minidom.parseString(data)))
+
+        result = colony.xml_to_dict(data.encode("utf-8"))
+        self.assertEqual(result, {"ns:person": {"ns:name": "Hello World", "age": "32"}})
+
+    def test_xml_to_dict_iter(self):
+        """
+        Verifies the streaming conversion of XML documents, where each
+        of the elements matching the path is yielded.
+        """
+
+        data = b"""<catalog>
+            <meta><item>ignored</item></meta>
+            <items>
+                <item><id>1</id><name>First</name></item>
+                <item><id>2</id><name>Second</name></item>
+                <item><id>3</id></item>
+            </items>
+        </catalog>"""
+
+        result = list(
+            colony.xml_to_dict_iter(colony.legacy.BytesIO(data), "items/item")
+        )
+        self.assertEqual(
+            result,
+            [
+                dict(id="1", name="First"),
+                dict(id="2", name="Second"),
+                dict(id="3"),
+            ],
+        )
+
+        result = list(colony.xml_to_dict_iter(colony.legacy.BytesIO(data), "item"))
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result[0], "ignored")
+
+        file = tempfile.NamedTemporaryFile(suffix=".xml", delete=False)
+        try:
+            file.write(data)
+            file.close()
+            result = list(colony.xml_to_dict_iter(file.name, "/catalog/items/item"))
+            self.assertEqual(len(result), 3)
+        finally:
+            os.remove(file.name)
+
     def test_dict_to_xml(self):
         """
         Verifies a series of conditions associated with dictionary
@@ -136,3 +195,27 @@ class XmlTest(colony.ColonyTestCase):
             result,
             colony.legacy.u("<person><age>32</age><name>你好世界</name></person>"),
         )
+
+    def test_dict_to_xml_iter(self):
+        """
+        Verifies the streaming conversion of dictionaries into XML
+        string chunks, including sequences of repeated elements.
+        """
+
+        contents = dict(person=dict(name="Hello World", age="32"))
+        result = list(colony.dict_to_xml_iter(contents))
+        self.assertEqual(
+            result,
+            ["<person>", "<age>32</age>", "<name>Hello World</name>", "</person>"],
+        )
+        self.assertEqual("".join(result), colony.dict_to_xml(contents))
+
+        items = (dict(id=str(index)) for index in range(3))
+        result = colony.dict_to_xml(dict(items=dict(item=items)))
+        self.assertEqual(
+            result,
+            "<items><item><id>0</id></item><item><id>1</id></item><item><id>2</id></item></items>",
+        )
+
+        result = colony.dict_to_xml(dict(tag=["a", "b"]))
+        self.assertEqual(result, "<tag>a</tag><tag>b</tag>")
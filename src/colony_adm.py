@@ -32,9 +32,12 @@ import re
 import os
 import sys
 import glob
+import time
 import shutil
+import hashlib
 import zipfile
 import tempfile
+import compileall
 
 import colony
 
@@ -60,6 +63,58 @@ EXTENSIONS = dict(bundle=".cbx", plugin=".cpx", config=".ccx")
 """ The map associating the various types of
 colony packages with the associated extension """
 
+STORED_EXTENSIONS = (
+    ".cbx",
+    ".cpx",
+    ".ccx",
+    ".zip",
+    ".jar",
+    ".egg",
+    ".whl",
+    ".gz",
+    ".tgz",
+    ".bz2",
+    ".xz",
+    ".7z",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".webp",
+    ".ico",
+    ".woff",
+    ".woff2",
+    ".mp3",
+    ".mp4",
+    ".ogg",
+    ".pdf",
+)
+""" The sequence of file extensions for contents that are
+already compressed and that should be stored as is (no
+deflate) in the generated archives, as compressing them
+again is pure processor waste with no size gain """
+
+BUILD_MANIFEST = ".cpm_build.json"
+""" The name of the manifest file (stored in the output
+directory) that keeps the content hashes of the inputs of
+each built package, used to skip unchanged packages """
+
+BUILD_BUFFER_SIZE = 65536
+""" The size of the buffer (in bytes) used while reading
+the files to compute their content hashes """
+
+INSTALL_JOBS = 4
+""" The default maximum number of concurrent requests
+(resolution and download) used by the install operations """
+
+DOWNLOAD_BUFFER_SIZE = 65536
+""" The size of the buffer (in bytes) used to stream the
+downloaded packages from the network into the disk """
+
+COMPILE_DIRECTORIES = ("libraries", "meta", "plugins")
+""" The directories of the instance (relative to the manager
+path) that contain python sources to be pre-compiled """
+
 REMOVALS = ("colony.egg-info", "EGG-INFO")
 """ The list of paths to be removed because there's
 no use for them in the target colony instance """
@@ -107,6 +162,9 @@ def help():
         "  cpm cleanup <target>         Cleans the current instance removing extra files"
     )
     print("  cpm pack <target>            Packs the current instance into a .zip file")
+    print(
+        "  cpm compile <target> <jobs>  Pre-compiles the python sources of the instance (in parallel)"
+    )
     print(
         "  cpm generate [target] <...>  Generates a .json descriptor file for the provided python "
         "file and then runs the build operation for the generated .json file, effectively build the package item"
@@ -261,6 +319,39 @@ def pack():
     _pack(target)
 
 
+def compile():
+    # retrieves the current working directory (cwd)
+    # in order to be used in as fallback case
+    cwd = os.getcwd()
+
+    # in case there are enough arguments for the
+    # deduction of the target path uses the provided
+    # parameters otherwise used the default name
+    # for the target path
+    if len(sys.argv) > 2:
+        target = sys.argv[2]
+    else:
+        target = resolve_manager(cwd)
+
+    # retrieves the number of jobs (worker processes) to be used
+    # in the compilation, zero means the number of processors
+    jobs = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    # in case not target was expanded the current directory
+    # is used (assumes) the administration file is stored
+    # at the same location as the colony instance
+    target = target or os.path.normpath(os.path.dirname(__file__))
+
+    # in case not target path is defined must raise
+    # a runtime error, because it's not possible to proceed
+    if not target:
+        raise RuntimeError("No instance found")
+
+    # runs the compile command on the target path so that
+    # the python sources are byte compiled ahead of startup
+    _compile(target, jobs=jobs)
+
+
 def generate():
     # in case there're not enough arguments to be
     # able to retrieve the specification file raises
@@ -283,11 +374,18 @@ def build():
     if len(sys.argv) < 3:
         raise RuntimeError("No descriptor provided")
 
+    # retrieves the number of jobs (worker processes) to be used
+    # for the build of independent packages and the flag that
+    # controls if unchanged packages should be rebuilt anyway
+    # and the (optional) target directory for the packages
+    jobs = colony.conf("BUILD_JOBS", 0, cast=int)
+    force = colony.conf("BUILD_FORCE", False, cast=bool)
+    target = colony.conf("BUILD_TARGET", None)
+
     # retrieves the descriptor file from the arguments and
     # uses it to run the build structure
     descriptors = sys.argv[2:]
-    for descriptor in descriptors:
-        _build(descriptor)
+    _build_many(descriptors, jobs=jobs, force=force, target=target)
 
 
 def deploy():
@@ -315,8 +413,7 @@ def install():
     # as reference, note that these names may contain an
     # optional version value attached to them
     names = sys.argv[2:]
-    for name in names:
-        _install(name)
+    _install_many([dict(name=name) for name in names])
 
 
 def require():
@@ -460,17 +557,45 @@ def _pack(path):
 
     # opens the archive path as a zip file for writing and
     # then writes the current "instance" directory into the zip
+    # measuring the time taken for the throughput report
+    initial = time.time()
     file = zipfile.ZipFile(
         archive_path, mode="w", compression=zipfile.ZIP_DEFLATED, allowZip64=True
     )
     try:
-        _zip_directory(path, "/", file)
+        count, size = _zip_directory(path, "/", file)
     finally:
         file.close()
+    elapsed = time.time() - initial
 
     # prints a message about the packing operation that has just
     # been performed on the current running colony instance
     output("Packed %s into %s" % (path, archive_path))
+    output(_throughput(count, size, elapsed))
+
+
+def _compile(path, jobs=0):
+    # prints an information message about the compilation
+    # that is going to be performed for the instance
+    output("Compiling '%s' python sources" % path)
+
+    # iterates over the complete set of directories that contain
+    # python sources and compiles them, using multiple workers in
+    # case that's supported by the current python version (3.5+)
+    result = True
+    for name in COMPILE_DIRECTORIES:
+        directory = os.path.join(path, name)
+        if not os.path.exists(directory):
+            continue
+        if sys.version_info >= (3, 5):
+            result &= bool(compileall.compile_dir(directory, quiet=1, workers=jobs))
+        else:
+            result &= bool(compileall.compile_dir(directory, quiet=1))
+
+    # in case any of the compilations failed raises an error
+    # indicating the problem to the caller process
+    if not result:
+        raise RuntimeError("Failed to compile some of the python sources")
 
 
 def _generate(path, build=True, delete=True):
@@ -682,7 +807,7 @@ def _generate_config(path):
     return descriptor_path
 
 
-def _build(path, short_name=True):
+def _build_package(path, short_name=True, entry=None, force=False, target=None):
     # imports the JSON module so that it's possible
     # to parse the colony descriptor file
     import json
@@ -728,11 +853,51 @@ def _build(path, short_name=True):
     # then creates the name of the file from the id
     resources_directory = os.path.dirname(path)
     name = base_name + extension if short_name else id + extension
+    _name = os.path.join(target, name) if target else name
+
+    # computes the digest of the complete set of inputs of the
+    # package (descriptor and resources contents) re-using the
+    # hashes of the files that have not changed since last build
+    # (as stored in the manifest entry of the package)
+    entry = entry or dict()
+    cache = entry.get("files", None)
+    stamps = dict()
+    hash = hashlib.sha256()
+    hash.update(data.encode("utf-8"))
+    size = len(data)
+    for resource in resources:
+        _resource = os.path.join(resources_directory, resource)
+        digest, _size = _hash_file(_resource, stamps=stamps, cache=cache)
+        hash.update(resource.encode("utf-8") + b":" + digest.encode("utf-8"))
+        size += _size
+    digest = hash.hexdigest()
+
+    # creates the result structure that describes the build,
+    # the stamps are returned so that they may be persisted
+    # in the manifest entry of the package (descriptor path)
+    result = dict(
+        key=os.path.abspath(path),
+        name=_name,
+        digest=digest,
+        size=size,
+        count=len(resources) + 1,
+        stamps=stamps,
+        skipped=False,
+    )
+
+    # in case the package already exists and its inputs are the
+    # same as the ones of the previous build there's nothing to
+    # be done and the package is skipped (incremental build)
+    unchanged = entry.get("name", None) == name and entry.get("digest", None) == digest
+    if not force and unchanged and os.path.exists(_name):
+        output("Skipped %s (unchanged)" % _name)
+        result["skipped"] = True
+        return result
 
     # opens the target zip file to be used in write
     # mode (it's going to receive the data)
     file = zipfile.ZipFile(
-        name, mode="w", compression=zipfile.ZIP_DEFLATED, allowZip64=True
+        _name, mode="w", compression=zipfile.ZIP_DEFLATED, allowZip64=True
     )
 
     try:
@@ -745,7 +910,7 @@ def _build(path, short_name=True):
             # the resource into the target file
             _resource = os.path.join(resources_directory, resource)
             _relative = "resources/" + resource
-            file.write(_resource, _relative)
+            file.write(_resource, _relative, compress_type=_compress_type(_resource))
 
         # writes the specification file into the packing file
         # to be used as meta data information
@@ -755,9 +920,100 @@ def _build(path, short_name=True):
         # descriptors and to flush the pending data
         file.close()
 
+    # prints a message about the package that has just been
+    # built and returns the result structure to the caller
+    output("Built %s" % _name)
+    return result
+
+
+def _build(path, short_name=True, manifest=None, force=False, target=None):
+    # runs the build of the package (using its entry from the
+    # manifest) and in case a manifest has been provided updates
+    # it with the new build values
+    packages = manifest["packages"] if manifest else dict()
+    entry = packages.get(os.path.abspath(path), None)
+    result = _build_package(
+        path, short_name=short_name, entry=entry, force=force, target=target
+    )
+    if not manifest == None:
+        _update_manifest(manifest, result)
+
     # returns the generated package name to the caller method
     # as this is the resulting object for the operation
-    return name
+    return result["name"]
+
+
+def _build_many(paths, short_name=True, jobs=0, force=False, target=None):
+    # imports the multiprocessing module lazily as it's only
+    # required when more than one package is going to be built
+    import multiprocessing
+
+    # makes sure that the target directory of the packages exists
+    # and loads the build manifest stored next to the packages,
+    # then starts the timer for the throughput report
+    if target and not os.path.isdir(target):
+        os.makedirs(target)
+    manifest_path = os.path.join(target, BUILD_MANIFEST) if target else BUILD_MANIFEST
+    manifest = _load_manifest(manifest_path)
+    packages = manifest["packages"]
+    initial = time.time()
+
+    # determines the number of worker processes to be used, zero
+    # means the number of processors available, note that the
+    # pool is only used when there's more than one package
+    jobs = jobs or multiprocessing.cpu_count()
+    jobs = min(jobs, len(paths))
+
+    # builds the complete set of packages, in parallel across
+    # processes in case there's more than one job (packages are
+    # independent) or sequentially otherwise, note that each task
+    # only receives the manifest entry of its own package
+    tasks = [
+        (path, short_name, packages.get(os.path.abspath(path), None), force, target)
+        for path in paths
+    ]
+    if jobs > 1:
+        pool = multiprocessing.Pool(jobs)
+        try:
+            results = pool.map(_build_task, tasks)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [_build_task(task) for task in tasks]
+
+    # prunes the entries of the packages whose descriptors no longer
+    # exist, updates the manifest with the results of the builds and
+    # persists it so that the next build is able to skip packages
+    for key in list(packages.keys()):
+        if not os.path.exists(key):
+            del packages[key]
+    for result in results:
+        _update_manifest(manifest, result)
+    _save_manifest(manifest, manifest_path)
+
+    # calculates the values for the throughput report, taking into
+    # account only the packages that have been effectively built
+    elapsed = time.time() - initial
+    built = [result for result in results if not result["skipped"]]
+    count = sum(result["count"] for result in built)
+    size = sum(result["size"] for result in built)
+    output("Built %d packages (%d skipped)" % (len(built), len(results) - len(built)))
+    output(_throughput(count, size, elapsed))
+
+    # returns the names of the packages (in the same order as
+    # the provided paths) to the caller method
+    return [result["name"] for result in results]
+
+
+def _update_manifest(manifest, result):
+    # replaces the entry of the package (by descriptor path) so that
+    # the stamps of files that are no longer inputs are dropped
+    manifest.setdefault("packages", dict())[result["key"]] = dict(
+        name=os.path.basename(result["name"]),
+        digest=result["digest"],
+        files=result["stamps"],
+    )
 
 
 def _deploy(path, timestamp=None):
@@ -767,87 +1023,137 @@ def _deploy(path, timestamp=None):
     # to be used for some of the path resolution processes
     cwd = os.getcwd()
 
-    # creates a new temporary directory path where the contents of
-    # the package file are going to be extracted
-    temp_path = tempfile.mkdtemp()
-
-    # reads the package (zip file) and then extracts the complete
-    # set of it's contents into the temporary directory so that they
-    # may be manipulated and then properly used
+    # opens the package (zip file) for reading, its contents are
+    # going to be extracted directly into the target tree
     file = zipfile.ZipFile(path, mode="r")
     try:
-        file.extractall(temp_path)
-    finally:
-        file.close()
-
-    # retrieves the path of the specification file and reads it's JSON
-    # contents so that it's possible to retrieve more information about
-    # the package that is currently being deployed
-    spec_path = os.path.join(temp_path, "spec.json")
-    file = open(spec_path, "rb")
-    try:
-        data = file.read()
+        # reads the contents of the specification file directly from
+        # the package so that it's possible to retrieve more information
+        # about the package that is currently being deployed
+        data = file.read("spec.json")
+
+        # decodes the "raw" data using the default JSON encoding
+        # and then runs the proper JSON decoding/loading
+        data = data.decode("utf-8")
+        descriptor = json.loads(data)
+
+        # attaches the timestamp to the descriptor map in case it's been defined
+        # by the passing arguments, this is required for compliance
+        descriptor["timestamp"] = timestamp
+
+        # retrieves the proper type from the descriptor and uses it to calculate
+        # both the target value and the suffix that are going to be used in the
+        # deployment operation to be performed (as expected)
+        type = descriptor.get("type", "plugin")
+        if type == "plugin":
+            target = "plugins"
+            suffix = "_plugin"
+        elif type == "config":
+            target = "meta"
+            suffix = "_config"
+        else:
+            raise RuntimeError("invalid package type")
+
+        # resolves the associated manager path and then uses it to
+        # gather the path where the package is going to be deployed
+        manager_path = resolve_manager(cwd)
+        target_path = os.path.join(manager_path, target)
+
+        # retrieves some of the descriptor information and uses it to create
+        # the reference to the target path of the package deployment and
+        # to the staging path (same directory and so same file system) where
+        # the contents are going to be extracted before the final rename
+        short_name = descriptor["short_name"]
+        short_path = os.path.join(target_path, short_name + suffix)
+        stage_path = short_path + ".%d.tmp" % os.getpid()
+        spec_path = os.path.join(stage_path, "spec.json")
+
+        # extracts the resources part of the package directly into the
+        # staging path and then writes the descriptor into the info based
+        # file that is going to be used as a meta information provider,
+        # in case of failure the staging path is removed (no partial state)
+        if os.path.exists(stage_path):
+            shutil.rmtree(stage_path)
+        os.makedirs(stage_path)
+        try:
+            _extract(file, "resources/", stage_path)
+            descriptor_s = json.dumps(descriptor)
+            is_unicode = colony.legacy.is_unicode(descriptor_s)
+            if is_unicode:
+                descriptor_s = descriptor_s.encode("utf-8")
+            _file = open(spec_path, "wb")
+            try:
+                _file.write(descriptor_s)
+            finally:
+                _file.close()
+        except Exception:
+            shutil.rmtree(stage_path, ignore_errors=True)
+            raise
     finally:
         file.close()
-    os.remove(spec_path)
 
-    # decodes the "raw" data using the default JSON encoding
-    # and then runs the proper JSON decoding/loading
-    data = data.decode("utf-8")
-    descriptor = json.loads(data)
-
-    # attaches the timestamp to the descriptor map in case it's been defined
-    # by the passing arguments, this is required for compliance
-    descriptor["timestamp"] = timestamp
-
-    # retrieves the proper type from the descriptor and uses it to calculate
-    # both the target value and the suffix that are going to be used in the
-    # deployment operation to be performed (as expected)
-    type = descriptor.get("type", "plugin")
-    if type == "plugin":
-        target = "plugins"
-        suffix = "_plugin"
-    elif type == "config":
-        target = "meta"
-        suffix = "_config"
-    else:
-        RuntimeError("invalid package type")
+    # replaces the target deployment path with the staging one using
+    # renames, in case the target already exists (must be an upgrade)
+    # it's replaced as a whole avoiding any overlapping of files
+    _replace(stage_path, short_path)
 
-    # resolves the associated manager path and then uses it to
-    # gather the path where the package is going to be deployed
-    manager_path = resolve_manager(cwd)
-    target_path = os.path.join(manager_path, target)
 
-    # retrieves some of the descriptor information and uses it to create
-    # the reference to the target path of the package deployment
-    short_name = descriptor["short_name"]
-    short_path = os.path.join(target_path, short_name + suffix)
-    spec_path = os.path.join(short_path, "spec.json")
-    resources_path = os.path.join(temp_path, "resources")
+def _extract(file, prefix, path):
+    # normalizes the target path so that it can be used for the
+    # verification of the paths of the extracted members
+    path = os.path.abspath(path)
 
-    # in case the target deployment path already exists (must be an upgrade)
-    # it must be removed to avoid overlapping in files, this is considered
-    # to be a safe operation only for upgrade operations
-    if os.path.exists(short_path):
-        shutil.rmtree(short_path)
+    # iterates over the complete set of members of the zip file that
+    # are under the requested prefix, streaming their contents into
+    # the target path (no intermediate copy of the package)
+    for info in file.infolist():
+        name = info.filename
+        if not name.startswith(prefix):
+            continue
+        name = name[len(prefix) :]
+        if not name or name.endswith("/"):
+            continue
 
-    # moves the resources part of the package into the target path for the
-    # package in the manager tree and then removes the temporary path
-    shutil.move(resources_path, short_path)
-    shutil.rmtree(temp_path)
+        # builds the target path for the member and verifies that it's
+        # contained in the target path (avoids path traversal)
+        _path = os.path.abspath(os.path.join(path, name))
+        if not _path.startswith(path + os.sep):
+            raise RuntimeError("Invalid package entry '%s'" % info.filename)
+
+        # creates the parent directory of the member in case it does
+        # not exist and then copies the contents in chunks
+        directory = os.path.dirname(_path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        source = file.open(info)
+        try:
+            target = open(_path, "wb")
+            try:
+                shutil.copyfileobj(source, target, DOWNLOAD_BUFFER_SIZE)
+            finally:
+                target.close()
+        finally:
+            source.close()
+
+
+def _replace(source, target):
+    # in case the target does not exist a simple rename is enough
+    # and the operation is atomic (same file system)
+    if not os.path.exists(target):
+        os.rename(source, target)
+        return
 
-    # dumps the current descriptor object for the item that is going to be
-    # deployed and then writes the contents of it into the info based file
-    # that is going to be used as a meta information provid3er
-    descriptor_s = json.dumps(descriptor)
-    is_unicode = colony.legacy.is_unicode(descriptor_s)
-    if is_unicode:
-        descriptor_s = descriptor_s.encode("utf-8")
-    file = open(spec_path, "wb")
+    # otherwise moves the previous target out of the way, renames
+    # the source into its place and only then removes the previous
+    # contents, restoring them in case the rename fails
+    previous = target + ".%d.old" % os.getpid()
+    os.rename(target, previous)
     try:
-        file.write(descriptor_s)
-    finally:
-        file.close()
+        os.rename(source, target)
+    except Exception:
+        os.rename(previous, target)
+        raise
+    shutil.rmtree(previous)
 
 
 def _info(path):
@@ -889,18 +1195,161 @@ def _info_config(descriptor):
 
 
 def _install(name=None, id=None, version=None, upgrade=False):
+    # runs the install operation for the single package, using the
+    # planner so that the dependencies are resolved and downloaded
+    # before the deployment of the package
+    return _install_many([dict(name=name, id=id, version=version)], upgrade=upgrade)
+
+
+def _install_many(requests, upgrade=False, jobs=None):
+    # retrieves the maximum number of concurrent requests that are
+    # going to be used for both the resolution and the download
+    jobs = jobs or colony.conf("INSTALL_JOBS", INSTALL_JOBS, cast=int)
+
+    # resolves the complete dependency graph for the requested packages
+    # obtaining the plan, a topologically sorted sequence of packages
+    # where each package comes after its dependencies
+    plan = _plan(requests, upgrade=upgrade, jobs=jobs)
+
+    # prints a message about the packages that are already installed
+    # and filters them out of the set of packages to be installed
+    pending = []
+    for item in plan:
+        if item["installed"]:
+            output("Package %s is already installed, skipping" % item["description"])
+            continue
+        pending.append(item)
+
+    # in case there's nothing remaining to be installed returns the
+    # plan immediately as there's nothing else to be done
+    if not pending:
+        return plan
+
+    # creates a new temporary directory for the package files that
+    # are going to be downloaded, in parallel and streamed to disk
+    temp_path = tempfile.mkdtemp()
+    try:
+        _download_many(pending, temp_path, jobs=jobs)
+
+        # runs the deployment process for each of the downloaded packages
+        # respecting the order of the plan (dependencies first)
+        for item in pending:
+            _deploy(item["path"], timestamp=item["info"]["timestamp"])
+            output("Finished installing %s" % item["description"])
+    finally:
+        shutil.rmtree(temp_path)
+
+    # returns the plan that has been executed to the caller method
+    # so that it may be used for reporting purposes
+    return plan
+
+
+def _plan(requests, upgrade=False, jobs=INSTALL_JOBS):
+    # starts the map that associates the identifier of the package
+    # with the resolved item and the list of the root items
+    resolved = dict()
+    roots = []
+
+    # iterates over the levels of the dependency graph (breadth first)
+    # resolving each level concurrently, note that each package is
+    # only resolved once (deduplication) and that any pinned version
+    # must be consistent along the complete graph
+    level = [dict(request, parent=None) for request in requests]
+    while level:
+        # groups the requests of the current level by the identifier of
+        # the package, so that each package is requested only once, note
+        # that requests for already resolved packages are linked directly
+        groups = []
+        scheduled = dict()
+        for request in level:
+            id = request.get("id", None)
+            version = _version(request.get("version", None))
+            item = resolved.get(id, None) if id else None
+            if item and _pin(item, version):
+                _link(roots, request, item)
+                continue
+            group = scheduled.get(id, None) if id else None
+            if group:
+                group["version"] = _merge(id, group["version"], version)
+                group["requests"].append(request)
+                continue
+            group = dict(
+                name=request.get("name", None),
+                id=id,
+                version=version,
+                requests=[request],
+            )
+            if id:
+                scheduled[id] = group
+            groups.append(group)
+
+        # resolves the groups of the level concurrently, with bounded
+        # concurrency, gathering the information of the packages
+        items = _map_threads(
+            lambda group: _resolve(group, upgrade=upgrade), groups, jobs
+        )
+
+        # registers the resolved items in the graph (a pinned version
+        # replaces a previously resolved non pinned one) scheduling
+        # their dependencies for the next level of the resolution
+        level = []
+        for group, item in zip(groups, items):
+            previous = resolved.get(item["key"], None)
+            version = item["info"]["version"] if item["pinned"] else None
+            if previous and _pin(previous, version):
+                item = previous
+            else:
+                if previous:
+                    _relink(roots, resolved, previous, item)
+                resolved[item["key"]] = item
+                for dependency in item["info"].get("dependencies", []):
+                    if dependency["type"] in ("package",):
+                        continue
+                    level.append(
+                        dict(
+                            id=dependency["id"],
+                            version=dependency["version"],
+                            parent=item,
+                        )
+                    )
+            for request in group["requests"]:
+                _link(roots, request, item)
+
+    # sorts the resolved items topologically (dependencies first) using
+    # a depth first post order traversal from the root items
+    plan = []
+    visited = set()
+
+    def visit(item):
+        if item["key"] in visited:
+            return
+        visited.add(item["key"])
+        for child in item["children"]:
+            visit(child)
+        plan.append(item)
+
+    for item in roots:
+        visit(item)
+
+    # returns the final plan (sequence of items) for the installation
+    # of the complete set of requested packages
+    return plan
+
+
+def _resolve(request, upgrade=False):
     import appier
 
-    # verifies if the provided version string is wildcard based and
-    # for such situations invalidated the version value (sets to invalid)
-    if version == "x.x.x":
-        version = None
+    # retrieves the various values of the request and verifies if the
+    # provided version string is wildcard based (invalidates it)
+    name = request.get("name", None)
+    id = request.get("id", None)
+    version = _version(request.get("version", None))
 
     # constructs the proper description string taking into account
     # if the name or the id has been provided and then prints a
-    # message about the installation operation that is going to start
+    # message about the resolution operation that is going to start
     description = name or id
-    output("Installing package %s" % description)
+    output("Resolving package %s" % description)
 
     # creates the map containing the various parameters that are
     # going to be sent as part of the filtering process for the
@@ -952,49 +1401,147 @@ def _install(name=None, id=None, version=None, upgrade=False):
     url = repo_url + "packages/%s/info" % package["name"]
     info = appier.get(url, params=dict(version=version))
 
-    # verifies if the package is already installed under the current
-    # system and if that's the case returns immediately as there's
-    # nothing remaining to be done for such situation
-    if _exists(info, upgrade=upgrade):
-        output("Package %s is already installed, skipping" % description)
+    # returns the resolved item for the package, verifying if the package
+    # is already installed under the current system (nothing to be done)
+    return dict(
+        key=package["identifier"],
+        description=description,
+        repo_url=repo_url,
+        info=info,
+        pinned=True if version else False,
+        installed=_exists(info, upgrade=upgrade),
+        children=[],
+    )
+
+
+def _link(roots, request, item):
+    # registers the item as a child of the parent of the request
+    # or as a root in case the request has no parent (top level)
+    parent = request.get("parent", None)
+    children = parent["children"] if parent else roots
+    if any(child is item for child in children):
         return
+    children.append(item)
+
+
+def _relink(roots, resolved, previous, item):
+    # re-points every link (root or child) to the previous item
+    # into the new item, so that the previous (replaced) item is
+    # no longer reachable from the graph, avoiding duplicates
+    sequences = [roots] + [
+        other["children"] for other in colony.legacy.values(resolved)
+    ]
+    for children in sequences:
+        if not any(child is previous for child in children):
+            continue
+        exists = any(child is item for child in children)
+        children[:] = [
+            item if child is previous else child
+            for child in children
+            if not (exists and child is previous)
+        ]
+
+
+def _pin(item, version):
+    # verifies if the resolved item satisfies the requested version,
+    # raising an error in case the item's version has been pinned
+    # to a different value (conflict) in the graph
+    current = item["info"]["version"]
+    if not version or version == current:
+        return True
+    if item["pinned"]:
+        raise RuntimeError(
+            "Version conflict for %s (%s and %s)" % (item["key"], current, version)
+        )
+    return False
+
+
+def _merge(id, version, other):
+    # merges two requested versions for the same package, they
+    # must be the same in case both of them are pinned
+    if version and other and not version == other:
+        raise RuntimeError("Version conflict for %s (%s and %s)" % (id, version, other))
+    return version or other
+
+
+def _version(version):
+    # verifies if the provided version string is wildcard based and
+    # for such situations invalidates the version value
+    if version == "x.x.x":
+        return None
+    return version
+
+
+def _download_many(items, path, jobs=INSTALL_JOBS):
+    # runs the download of the complete set of items concurrently with
+    # bounded concurrency, each package is stored under the provided path
+    _map_threads(lambda item: _download(item, path), items, jobs)
 
-    # runs the dependencies operation for the current package information
-    # this operation should be able to install all the requirements for
-    # the current package in transit (avoid package corruption)
-    try:
-        indent()
-        _dependencies(info, upgrade=upgrade)
-    finally:
-        unindent()
 
+def _download(item, path):
     # prints information about the starting of the package download, this
     # is required for the user to be notified about such action
-    output("Downloading %s" % description)
+    info = item["info"]
+    output("Downloading %s" % item["description"])
 
     # creates the proper package retrieval URL and runs the remote get request
-    # to try to retrieve the package contents of so that they are installed
-    url = repo_url + "packages/%s" % info["short_name"]
-    data = appier.get(url, params=dict(version=info["version"]))
-
-    # creates a new temporary directory for the new bundle file that is going
-    # to be created and stores it under such directory (for deployment)
-    temp_path = tempfile.mkdtemp()
-    target_path = os.path.join(temp_path, "%s.cbx" % info["short_name"])
-    file = open(target_path, "wb")
+    # streaming the package contents into a file under the provided path
+    # in chunks so that the package is never completely loaded in memory
+    query = colony.legacy.urlencode(dict(version=info["version"]))
+    url = item["repo_url"] + "packages/%s?%s" % (info["short_name"], query)
+    target_path = os.path.join(path, "%s.cbx" % info["short_name"])
+    response = colony.legacy.urlopen(url)
     try:
-        file.write(data)
+        file = open(target_path, "wb")
+        try:
+            shutil.copyfileobj(response, file, DOWNLOAD_BUFFER_SIZE)
+        finally:
+            file.close()
     finally:
-        file.close()
-
-    # runs the deployment process for the package bundle that has been retrieved
-    # and then removes the temporary directory path, as it's no longer required
-    _deploy(target_path, timestamp=info["timestamp"])
-    shutil.rmtree(temp_path)
-
-    # prints a message about the end of the installation process for the current
-    # package, this will allow the user to be aware of the end of operation
-    output("Finished installing %s" % description)
+        response.close()
+
+    # updates the item with the path to the downloaded package so that
+    # it may be used latter for the deployment
+    item["path"] = target_path
+    return target_path
+
+
+def _map_threads(callable, items, jobs):
+    # imports the threading module lazily as it's only required
+    # for the concurrent operations (eg: install)
+    import threading
+
+    # starts the list of results with the proper size and the list
+    # that is going to hold the errors raised by the workers
+    results = [None] * len(items)
+    errors = []
+    indexes = list(range(len(items)))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if not indexes or errors:
+                    return
+                index = indexes.pop(0)
+            try:
+                results[index] = callable(items[index])
+            except Exception as exception:
+                with lock:
+                    errors.append(exception)
+
+    # creates the (bounded) set of worker threads, starts them and
+    # waits for their completion, re-raising the first error
+    threads = [
+        threading.Thread(target=worker) for _index in range(min(jobs, len(items)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
 
 
 def _require(path, upgrade=False):
@@ -1016,8 +1563,7 @@ def _require(path, upgrade=False):
     # operation for each one of the dependency requests
     lines = contents.split("\n")
     lines = [line.strip() for line in lines if line.strip()]
-    for line in lines:
-        _install(line, upgrade=upgrade)
+    _install_many([dict(name=line) for line in lines], upgrade=upgrade)
 
 
 def _upgrade():
@@ -1054,10 +1600,8 @@ def _upgrade():
 
     # iterates over both the plugins and the configs to try to upgrade
     # the complete set of items as requested by the operation
-    for plugin in plugins:
-        _install(plugin, upgrade=True)
-    for config in configs:
-        _install(config, upgrade=True)
+    names = plugins + configs
+    _install_many([dict(name=name) for name in names], upgrade=True)
 
 
 def _upload(path, repo="colony", generate=True, delete=True):
@@ -1222,14 +1766,6 @@ def _exists(info, upgrade=False):
     return True
 
 
-def _dependencies(info, upgrade=False):
-    dependencies = info.get("dependencies", [])
-    for dependency in dependencies:
-        if dependency["type"] in ("package",):
-            continue
-        _install(id=dependency["id"], version=dependency["version"], upgrade=upgrade)
-
-
 def _fitler_resources(resources, exclusion=(".pyc", ".temp", ".tmp")):
     filtered = []
     for resource in resources:
@@ -1323,28 +1859,147 @@ def _zip_directory(path, relative, file):
     # immediately to avoid any problem, the provided
     # zip file is not going to contain of the data
     if not os.path.isdir(path):
-        return
+        return 0, 0
+
+    # starts the counters for the number of files and for
+    # the number of bytes written into the zip file
+    count = 0
+    size = 0
+
+    # walks the complete directory tree (single pass over the
+    # file system) writing each of the files into the zip with
+    # the proper relative path and compression type, note that
+    # symbolic links to directories are followed (included)
+    for base, _directories, files in os.walk(path, followlinks=True):
+        _base = os.path.relpath(base, path)
+        _base = relative if _base == "." else os.path.join(relative, _base)
+        for entry in files:
+            _path = os.path.join(base, entry)
+            _relative = os.path.join(_base, entry)
+            file.write(_path, _relative, compress_type=_compress_type(_path))
+            count += 1
+            size += os.path.getsize(_path)
+
+    # returns the number of files and bytes that have been
+    # written into the zip file, for reporting purposes
+    return count, size
+
+
+def _compress_type(path):
+    # retrieves the extension of the provided path and in case
+    # it's one of the already compressed ones the contents are
+    # stored as is, otherwise the default deflate is used
+    extension = os.path.splitext(path)[1].lower()
+    if extension in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _hash_file(path, stamps=None, cache=None):
+    # retrieves the stat information on the file and uses
+    # it to try to re-use a previously computed hash for the
+    # very same file (modification time and size match)
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    stamp = cache.get(key, None) if cache else None
+    if stamp and stamp[0] == stat.st_mtime and stamp[1] == stat.st_size:
+        digest = stamp[2]
+    else:
+        hash = hashlib.sha256()
+        file = open(path, "rb")
+        try:
+            while True:
+                data = file.read(BUILD_BUFFER_SIZE)
+                if not data:
+                    break
+                hash.update(data)
+        finally:
+            file.close()
+        digest = hash.hexdigest()
+
+    # updates the stamps map with the values for the current
+    # file so that they may be persisted in the manifest
+    if not stamps == None:
+        stamps[key] = [stat.st_mtime, stat.st_size, digest]
+    return digest, stat.st_size
+
+
+def _throughput(count, size, elapsed):
+    # converts the size into megabytes and calculates the
+    # rate of the operation avoiding divisions by zero
+    megabytes = size / (1024.0 * 1024.0)
+    rate = megabytes / elapsed if elapsed > 0.0 else 0.0
+    return "Processed %d files (%.2f MB) in %.2f seconds (%.2f MB/s)" % (
+        count,
+        megabytes,
+        elapsed,
+        rate,
+    )
 
-    # retrieves the list of entries for the path to
-    # be compressed into the zip
-    entries = os.listdir(path)
 
-    # iterates over the list of entries to zip them
-    # or enter in a new recursion level
-    for entry in entries:
-        # create the fill entry path by joining the entry
-        # name to the (base) path of the directory and
-        # then creates also the relative path
-        _path = os.path.join(path, entry)
-        _relative = os.path.join(relative, entry)
+def _load_manifest(path=None):
+    # imports the JSON module so that it's possible
+    # to parse the build manifest file
+    import json
 
-        # checks if the path is a directory and in such case runs
-        # the recursion step, otherwise writes the file directly
-        # into the "target" zip file
-        if os.path.isdir(_path):
-            _zip_directory(_path, _relative, file)
-        else:
-            file.write(_path, _relative)
+    # resolves the path to the manifest (current directory
+    # by default) and in case it does not exist or is not
+    # valid returns an empty manifest structure
+    path = path or BUILD_MANIFEST
+    if not os.path.exists(path):
+        return dict(packages=dict())
+    try:
+        file = open(path, "rb")
+        try:
+            manifest = json.loads(file.read().decode("utf-8"))
+        finally:
+            file.close()
+    except ValueError:
+        return dict(packages=dict())
+
+    # filters the package entries keeping only the valid ones
+    # (in the expected format) so that they may be safely used
+    packages = manifest.get("packages", None)
+    packages = packages if isinstance(packages, dict) else dict()
+    packages = dict(
+        (key, value) for key, value in packages.items() if isinstance(value, dict)
+    )
+    return dict(packages=packages)
+
+
+def _save_manifest(manifest, path=None):
+    import json
+
+    # writes the manifest to a temporary file and then renames
+    # it to the final path so that a crash never leaves a
+    # partially written (corrupted) manifest behind
+    path = path or BUILD_MANIFEST
+    data = json.dumps(manifest, sort_keys=True)
+    temp_path = path + ".tmp"
+    file = open(temp_path, "wb")
+    try:
+        file.write(data.encode("utf-8"))
+    finally:
+        file.close()
+
+    # uses the atomic replace operation when available (python 3)
+    # otherwise falls back to a remove and rename (not atomic)
+    if hasattr(os, "replace"):
+        os.replace(temp_path, path)
+    else:
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(temp_path, path)
+
+
+def _build_task(arguments):
+    # unpacks the arguments of the task and runs the
+    # build of the package, this function is meant to be
+    # executed in a worker process of the pool
+    path, short_name, entry, force, target = arguments
+    return _build_package(
+        path, short_name=short_name, entry=entry, force=force, target=target
+    )
 
 
 def main():
@@ -31,7 +31,9 @@ __license__ = "Apache License, Version 2.0"
 import os
 import sys
 import glob
+import json
 import getopt
+import hashlib
 import warnings
 
 import colony
@@ -79,6 +81,28 @@ DEFAULT_LOGGER_PATH = "log"
 PLUGIN_PATHS_FILE = "plugins.pth"
 """ The colony plugin paths file """
 
+SNAPSHOT_FILE = "var/startup.json"
+""" The path (relative to the manager path) of the file that
+stores the startup snapshot (resolved configuration) """
+
+SNAPSHOT_VERSION = 1
+""" The version of the startup snapshot format, snapshots
+with a different version are considered invalid """
+
+SNAPSHOT_CONF = (
+    "MODE",
+    "LEVEL",
+    "LAYOUT_MODE",
+    "RUN_MODE",
+    "LIBRARY_PATH",
+    "META_PATH",
+    "PLUGINS_PATH",
+    "PLUGIN_PATH",
+)
+""" The names of the configuration values that condition the
+resolution of the startup configuration and that are part of
+the key of the startup snapshot """
+
 # registers the ignore flag in the deprecation warnings so that
 # no message with this kind of warning is printed (clean console)
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -128,6 +152,8 @@ def run(
     prefix_paths=[],
     daemon_pid=None,
     daemon_file_path=None,
+    modules_cache=None,
+    boot_callback=None,
 ):
     """
     Starts the loading of the plugin manager. This should be the
@@ -183,6 +209,12 @@ def run(
     :param daemon_pid: The pid of the daemon process running the instance of plugin manager.
     :type daemon_file_path: String
     :param daemon_file_path: The file path to the daemon file, for information control.
+    :type modules_cache: Dictionary
+    :param modules_cache: The (previously cached) map of modules per plugin
+    path to be used by the plugin manager (eg: restored from a snapshot).
+    :type boot_callback: Function
+    :param boot_callback: The function to be called with the plugin manager
+    once the boot process has been successfully completed.
     :rtype: int
     :return: The return code.
     """
@@ -244,6 +276,12 @@ def run(
         daemon_file_path=daemon_file_path,
     )
 
+    # in case there's a modules cache defined (restored from a previous
+    # execution) sets it in the plugin manager avoiding the listing of
+    # the plugin directories that have not been changed since
+    if modules_cache:
+        plugin_manager.modules_cache = modules_cache
+
     # resolves the string based level into the proper integer
     # that describes the logging level and then uses that value
     # to start the logging infra-structure of colony
@@ -253,7 +291,10 @@ def run(
     # creates the callback function to be used in the process of
     # printing the branding information text to the standard output
     # informing the end user about the current environment
-    callback = lambda: print_information()
+    def callback():
+        print_information()
+        if boot_callback:
+            boot_callback(plugin_manager)
 
     # starts and loads the plugin system, this is a blocking
     # call and the flow control is only returned at the end of
@@ -384,34 +425,71 @@ def execute(cwd=None, force_exit=True):
         else:
             assert False, "unhandled option"
 
-    # parses the configuration options, retrieving the various values that
-    # control the execution of the plugin system
-    (
+    # builds the sequence of inputs of the configuration parsing, these
+    # are going to be used both for parsing and for the snapshot key
+    inputs = (
+        cwd,
         mode,
+        config_file_path,
         level,
         layout_mode,
         run_mode,
-        stop_on_cycle_error,
-        prefix_paths,
         daemon_file_path,
         logger_path,
         library_path,
         meta_path,
         plugin_path,
-    ) = parse_configuration(
-        cwd,
+        manager_path,
+    )
+
+    # in case the startup snapshot mode is enabled tries to restore the
+    # resolved configuration from a previous (successful) boot, this is
+    # only possible in case none of the inputs has changed since then
+    use_snapshot = colony.conf("STARTUP_SNAPSHOT", False, cast=bool)
+    snapshot_key = build_snapshot_key(inputs) if use_snapshot else None
+    snapshot = load_snapshot(manager_path, snapshot_key) if use_snapshot else None
+
+    # in case a valid snapshot has been restored uses its values, making
+    # sure that the configuration directory is added to the system path
+    # otherwise parses the configuration options, retrieving the various
+    # values that control the execution of the plugin system
+    if snapshot:
+        configuration = snapshot["configuration"]
+        stamps = snapshot["stamps"]
+        modules_cache = snapshot["modules"]
+        config_dir = snapshot["config_dir"]
+        config_dir and sys.path.insert(0, config_dir)
+    else:
+        stamps = dict(files=[], directories=[]) if use_snapshot else None
+        modules_cache = None
+        configuration = parse_configuration(*inputs, stamps=stamps)
+    (
         mode,
-        config_file_path,
         level,
         layout_mode,
         run_mode,
+        stop_on_cycle_error,
+        prefix_paths,
         daemon_file_path,
         logger_path,
         library_path,
         meta_path,
         plugin_path,
-        manager_path,
-    )
+    ) = configuration
+
+    # creates the callback to be called once the boot is complete that
+    # saves the startup snapshot (if enabled) for the next executions
+    def boot_callback(plugin_manager):
+        if not use_snapshot:
+            return
+        save_snapshot(
+            manager_path,
+            snapshot_key,
+            configuration,
+            stamps,
+            plugin_manager.modules_cache,
+            previous=snapshot,
+        )
 
     # configures the system using the layout mode, the run mode
     # and the  manager path
@@ -455,6 +533,8 @@ def execute(cwd=None, force_exit=True):
         prefix_paths=prefix_paths,
         daemon_pid=daemon_pid,
         daemon_file_path=daemon_file_path,
+        modules_cache=modules_cache,
+        boot_callback=boot_callback,
     )
 
     # in case the return code is not success or the force
@@ -476,6 +556,7 @@ def parse_configuration(
     meta_path,
     plugin_path,
     manager_path,
+    stamps=None,
 ):
     """
     Parses the configuration using the given values as default values.
@@ -513,6 +594,9 @@ def parse_configuration(
     locations separated by a semi-column.
     :type manager_path: String
     :param manager_path: The path to the plugin system.
+    :type stamps: Dictionary
+    :param stamps: The map to be populated with the files and the
+    directories used in the parsing (for snapshot validation).
     :rtype: Tuple
     :return: The tuple with the values parsed value.
     """
@@ -530,6 +614,11 @@ def parse_configuration(
     # in case the configuration directory path is valid inserts it into the system path
     config_dir and sys.path.insert(0, config_dir)
 
+    # in case the stamps are being gathered registers the configuration
+    # directory so that it's restored together with the snapshot
+    if not stamps == None:
+        stamps["config_dir"] = config_dir
+
     # retrieves the configuration file base path from the configuration file path
     config_file_base_path = os.path.basename(config_file_path)
 
@@ -546,6 +635,12 @@ def parse_configuration(
 
         config = module
 
+    # in case the stamps are being gathered registers both the source
+    # file of the configuration module and the plugin paths file
+    if not stamps == None:
+        stamps["files"].append(_module_file(config))
+        stamps["files"].append(manager_path + "/config/general/" + PLUGIN_PATHS_FILE)
+
     # retrieves the contents of the configuration file that has just
     # been loaded, this is the default operation to be performed
     names = dir(config)
@@ -620,11 +715,15 @@ def parse_configuration(
     # retrieves the current prefix paths
     current_prefix_paths = prefix_paths[layout_mode]
 
+    # creates the list that is going to hold the reference path
+    # patterns in case the stamps are meant to be gathered
+    patterns = None if stamps == None else []
+
     # retrieves the extra library path as the dereferenced values
     # from the colony configuration library path list and adds the
     # extra library path to the library path
     extra_library_path = convert_reference_path_list(
-        cwd, manager_path, current_prefix_paths, library_path_list
+        cwd, manager_path, current_prefix_paths, library_path_list, patterns=patterns
     )
     library_path += extra_library_path
 
@@ -632,7 +731,7 @@ def parse_configuration(
     # from the colony configuration meta path list and adds the
     # extra meta path to the meta path
     extra_meta_path = convert_reference_path_list(
-        cwd, manager_path, current_prefix_paths, meta_path_list
+        cwd, manager_path, current_prefix_paths, meta_path_list, patterns=patterns
     )
     meta_path += extra_meta_path
 
@@ -645,10 +744,16 @@ def parse_configuration(
     # from the colony configuration plugin path list and adds the
     # extra plugin path to the plugin path
     extra_plugin_path = convert_reference_path_list(
-        cwd, manager_path, current_prefix_paths, plugin_path_list
+        cwd, manager_path, current_prefix_paths, plugin_path_list, patterns=patterns
     )
     plugin_path += extra_plugin_path
 
+    # in case the stamps are being gathered registers the complete set
+    # of directories listed in the resolution of the reference patterns
+    if not stamps == None:
+        for pattern in patterns:
+            stamps["directories"].extend(_glob_directories(pattern))
+
     return (
         mode,
         level,
@@ -665,7 +770,7 @@ def parse_configuration(
 
 
 def convert_reference_path_list(
-    cwd, manager_path, current_prefix_paths, reference_path_list
+    cwd, manager_path, current_prefix_paths, reference_path_list, patterns=None
 ):
     """
     Converts the given list of reference paths. The reference
@@ -682,6 +787,9 @@ def convert_reference_path_list(
     :param current_prefix_paths: The prefix paths currently in use.
     :type reference_path_list: List
     :param reference_path_list: The list of reference paths.
+    :type patterns: List
+    :param patterns: The list to be populated with the (dereferenced)
+    patterns resolved through glob (optional).
     :rtype: String
     :return: A string converted reference path containing all
     the dereferenced paths.
@@ -729,6 +837,8 @@ def convert_reference_path_list(
         # a list of paths from the resolved "wildcard" them iterates over
         # these paths to add them to the converted reference path
         dereferenced_paths = glob.glob(dereferenced_path)
+        if not patterns == None:
+            patterns.append(dereferenced_path)
         for dereferenced_path in dereferenced_paths:
             # resolves the dereferenced path as an absolute path and
             # adds it to the converted reference string path (linear
@@ -795,6 +905,133 @@ def load_plugin_paths_file(manager_path):
     return plugin_paths_string_value
 
 
+def build_snapshot_key(inputs):
+    """
+    Builds the key of the startup snapshot for the provided inputs
+    of the configuration parsing, the key also takes into account
+    the versions of colony and python and the environment based
+    configuration values that condition the parsing.
+
+    :type inputs: Tuple
+    :param inputs: The sequence of inputs of the configuration parsing.
+    :rtype: String
+    :return: The (hexadecimal) digest that identifies the inputs.
+    """
+
+    values = dict(
+        version=SNAPSHOT_VERSION,
+        colony=colony.VERSION,
+        python=sys.version,
+        inputs=list(inputs),
+        conf=[colony.conf(name) for name in SNAPSHOT_CONF],
+    )
+    data = json.dumps(values, sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def load_snapshot(manager_path, key):
+    """
+    Loads the startup snapshot for the manager in the provided path
+    in case it's valid for the provided key and none of the files and
+    directories used for its creation changed since then.
+
+    :type manager_path: String
+    :param manager_path: The path to the manager.
+    :type key: String
+    :param key: The key that identifies the inputs of the snapshot.
+    :rtype: Dictionary
+    :return: The snapshot values or an invalid value in case there's
+    no valid snapshot available.
+    """
+
+    snapshot_path = os.path.join(manager_path, SNAPSHOT_FILE)
+    if not os.path.exists(snapshot_path):
+        return None
+
+    try:
+        file = open(snapshot_path, "rb")
+        try:
+            data = file.read()
+        finally:
+            file.close()
+        snapshot = json.loads(data.decode("utf-8"))
+    except (IOError, OSError, ValueError):
+        return None
+
+    if not snapshot.get("version", None) == SNAPSHOT_VERSION:
+        return None
+    if not snapshot.get("key", None) == key:
+        return None
+    if not _valid_stamps(snapshot["stamps"]):
+        return None
+
+    return snapshot
+
+
+def save_snapshot(
+    manager_path, key, configuration, stamps, modules_cache, previous=None
+):
+    """
+    Saves the startup snapshot for the manager in the provided path,
+    the write operation is atomic (temporary file and rename).
+
+    In case the previous snapshot is provided and no changes exist
+    in the values to be saved, no write operation is performed.
+
+    :type manager_path: String
+    :param manager_path: The path to the manager.
+    :type key: String
+    :param key: The key that identifies the inputs of the snapshot.
+    :type configuration: Tuple
+    :param configuration: The resolved configuration values.
+    :type stamps: Dictionary
+    :param stamps: The files and directories used in the resolution,
+    either as paths (new) or as stamps (restored snapshot).
+    :type modules_cache: Dictionary
+    :param modules_cache: The map of modules per plugin path.
+    :type previous: Dictionary
+    :param previous: The previously restored snapshot (if any).
+    """
+
+    snapshot = dict(
+        version=SNAPSHOT_VERSION,
+        key=key,
+        configuration=list(configuration),
+        config_dir=stamps.get("config_dir", None),
+        stamps=dict(
+            files=[
+                _stamp_file(value) if colony.legacy.is_string(value) else value
+                for value in stamps["files"]
+            ],
+            directories=[
+                _stamp_directory(value) if colony.legacy.is_string(value) else value
+                for value in stamps["directories"]
+            ],
+        ),
+        modules=modules_cache,
+    )
+    snapshot["stamps"]["config_dir"] = snapshot["config_dir"]
+    data = json.dumps(snapshot, sort_keys=True)
+
+    if previous and json.loads(data) == previous:
+        return
+
+    snapshot_path = os.path.join(manager_path, SNAPSHOT_FILE)
+    snapshot_dir = os.path.dirname(snapshot_path)
+    if not os.path.exists(snapshot_dir):
+        os.makedirs(snapshot_dir)
+
+    temporary_path = snapshot_path + ".tmp"
+    file = open(temporary_path, "wb")
+    try:
+        file.write(data.encode("utf-8"))
+    finally:
+        file.close()
+    if os.name == "nt" and os.path.exists(snapshot_path):
+        os.remove(snapshot_path)
+    os.rename(temporary_path, snapshot_path)
+
+
 def configure_system(layout_mode, run_mode, manager_path):
     """
     Configures the system for the given attributes.
@@ -822,6 +1059,78 @@ def configure_system(layout_mode, run_mode, manager_path):
     sys.path.insert(0, library_path)
 
 
+def _module_file(module):
+    file_path = os.path.abspath(module.__file__)
+    base_path, extension = os.path.splitext(file_path)
+    if extension in (".pyc", ".pyo") and os.path.exists(base_path + ".py"):
+        file_path = base_path + ".py"
+    return file_path
+
+
+def _stamp_file(file_path):
+    if not os.path.exists(file_path):
+        return [file_path, None, None, None]
+    stat = os.stat(file_path)
+    return [file_path, stat.st_mtime, stat.st_size, _hash_file(file_path)]
+
+
+def _stamp_directory(path):
+    if not os.path.exists(path):
+        return [path, None]
+    return [path, os.stat(path).st_mtime]
+
+
+def _hash_file(file_path):
+    file = open(file_path, "rb")
+    try:
+        data = file.read()
+    finally:
+        file.close()
+    return hashlib.sha256(data).hexdigest()
+
+
+def _valid_stamps(stamps):
+    # verifies that each of the files is either equally missing or
+    # has the same modification time and size, in case only the
+    # modification time changed the (content) hash is compared
+    for file_path, mtime, size, digest in stamps["files"]:
+        if not os.path.exists(file_path):
+            if mtime == None:
+                continue
+            return False
+        if mtime == None:
+            return False
+        stat = os.stat(file_path)
+        if not stat.st_size == size:
+            return False
+        if stat.st_mtime == mtime:
+            continue
+        if not _hash_file(file_path) == digest:
+            return False
+
+    # verifies that each of the directories has the same modification
+    # time, meaning that no entry was added or removed from them
+    for path, mtime in stamps["directories"]:
+        if not _stamp_directory(path)[1] == mtime:
+            return False
+
+    return True
+
+
+def _glob_directories(pattern):
+    # retrieves the directory part of the pattern and in case it has
+    # no "wildcard" values it's the only directory listed by glob
+    # otherwise the deepest "static" directory and the matched ones
+    # are the directories that have been listed
+    directory = os.path.dirname(pattern)
+    if not glob.has_magic(directory):
+        return [directory]
+    static = directory
+    while glob.has_magic(static):
+        static = os.path.dirname(static)
+    return [static] + sorted(glob.glob(directory))
+
+
 def main():
     """
     Execution function for the colony infra-structure may be used